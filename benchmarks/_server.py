@@ -0,0 +1,73 @@
+"""
+Shared helper: run the stand-in API server in a separate process
+
+Keeping the server out of the benchmark process stops its handler threads
+from competing with the client for the GIL, which would otherwise dominate
+the numbers on small machines.
+
+The server lives with the tests (tests/fake_server.py), outside the
+installed package; its helpers are re-exported here for the benchmarks.
+"""
+
+import multiprocessing
+import sys
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "tests"))
+
+from fake_server import FakeMailSafeProServer, fake_result, make_self_signed_cert  # noqa: E402
+
+__all__ = [
+    "FakeMailSafeProServer", "fake_result", "make_self_signed_cert",
+    "server_handle", "server_process",
+]
+
+
+STAT_NAMES = (
+    "connections_opened", "handshakes", "streams_opened", "total_requests",
+    "request_bytes_received", "response_bytes_sent",
+)
+
+
+def _serve(conn: Any, kwargs: dict) -> None:
+    server = FakeMailSafeProServer(**kwargs).start()
+    conn.send(server.url)
+    # Answer stats requests until the parent asks us to stop
+    while conn.recv() == "stats":
+        conn.send({name: getattr(server, name) for name in STAT_NAMES})
+    server.stop()
+
+
+class ServerProcess:
+    """Handle on a server running in a child process"""
+
+    def __init__(self, conn: Any, url: str):
+        self._conn = conn
+        self.url = url
+
+    def stats(self) -> Dict[str, int]:
+        """The server's connection, handshake, stream, request and byte counters"""
+        self._conn.send("stats")
+        return self._conn.recv()
+
+
+@contextmanager
+def server_handle(**kwargs: Any) -> Iterator[ServerProcess]:
+    """Start FakeMailSafeProServer(**kwargs) in a child process"""
+    parent, child = multiprocessing.Pipe()
+    process = multiprocessing.Process(target=_serve, args=(child, kwargs), daemon=True)
+    process.start()
+    try:
+        yield ServerProcess(parent, parent.recv())
+    finally:
+        parent.send("stop")
+        process.join(timeout=5)
+
+
+@contextmanager
+def server_process(**kwargs: Any) -> Iterator[str]:
+    """Start FakeMailSafeProServer(**kwargs) in a child process and yield its URL"""
+    with server_handle(**kwargs) as server:
+        yield server.url
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Async Client Benchmark
+======================
+Compares AsyncMailSafePro against the sync client driven from a thread
+executor, both talking to a local stand-in server with fixed latency.
+
+    python benchmarks/bench_async_client.py --requests 1000 --latency 0.05
+"""
+
+import argparse
+import asyncio
+import time
+
+from mailsafepro import AsyncMailSafePro, MailSafePro
+
+from _server import server_process
+
+
+async def run_thread_executor(base_url: str, emails: list) -> float:
+    """Current workaround: push blocking validate() calls into the default executor"""
+    client = MailSafePro(api_key="key_bench", base_url=base_url)
+    loop = asyncio.get_running_loop()
+
+    start = time.perf_counter()
+    await asyncio.gather(
+        *(loop.run_in_executor(None, client.validate, email) for email in emails)
+    )
+    return time.perf_counter() - start
+
+
+async def run_async_client(base_url: str, emails: list, max_connections: int) -> float:
+    """Native asyncio client over one pooled connection set"""
+    async with AsyncMailSafePro(
+        api_key="key_bench",
+        base_url=base_url,
+        max_connections=max_connections,
+    ) as client:
+        start = time.perf_counter()
+        await asyncio.gather(*(client.validate(email) for email in emails))
+        return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=1000)
+    parser.add_argument("--latency", type=float, default=0.05)
+    parser.add_argument("--max-connections", type=int, default=50)
+    args = parser.parse_args()
+
+    emails = [f"user{i}@example.com" for i in range(args.requests)]
+
+    print("=" * 70)
+    print(f"{args.requests} validations, {args.latency * 1000:.0f}ms server latency")
+    print("=" * 70)
+
+    with server_process(latency=args.latency) as url:
+        elapsed = asyncio.run(run_thread_executor(url, emails))
+        print(f"  Thread executor:   {elapsed:7.2f}s  {args.requests / elapsed:8.0f} req/s")
+
+        elapsed = asyncio.run(run_async_client(url, emails, args.max_connections))
+        print(f"  AsyncMailSafePro:  {elapsed:7.2f}s  {args.requests / elapsed:8.0f} req/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Batch Response Memory Benchmark
+===============================
+Peak Python memory while consuming one /batch response of growing size,
+decoded whole (validate_batch) vs. incrementally (validate_batch_stream).
+
+    python benchmarks/bench_batch_stream.py --sizes 1000 5000 10000
+"""
+
+import argparse
+import time
+import tracemalloc
+
+from mailsafepro import MailSafePro
+
+from _server import server_process
+
+
+def measure(consume) -> tuple:
+    """Run consume() and return (valid count, peak MiB, seconds)"""
+    tracemalloc.start()
+    start = time.perf_counter()
+    valid = consume()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return valid, peak / 2 ** 20, elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 5000, 10000])
+    parser.add_argument("--no-raw-dns", dest="include_raw_dns", action="store_false")
+    args = parser.parse_args()
+
+    with server_process() as url:
+        client = MailSafePro(api_key="key_bench", base_url=url)
+
+        def whole(emails):
+            batch = client.validate_batch(emails, include_raw_dns=args.include_raw_dns)
+            return sum(1 for r in batch.results if r.valid)
+
+        def streamed(emails):
+            stream = client.validate_batch_stream(emails, include_raw_dns=args.include_raw_dns)
+            with stream:
+                return sum(1 for r in stream if r.valid)
+
+        # Warm up the connection outside the measurements
+        whole(["warmup@example.com"])
+
+        print("=" * 70)
+        print("Peak traced memory while consuming one /batch response")
+        print("=" * 70)
+        print(f"  {'results':>8}  {'validate_batch':>22}  {'validate_batch_stream':>22}")
+
+        for size in args.sizes:
+            emails = [f"user{i}@example.com" for i in range(size)]
+            _, whole_peak, whole_time = measure(lambda: whole(emails))
+            _, stream_peak, stream_time = measure(lambda: streamed(emails))
+            print(
+                f"  {size:>8}  {whole_peak:8.1f} MiB {whole_time:7.2f}s"
+                f"    {stream_peak:8.1f} MiB {stream_time:7.2f}s"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Canonical Value Benchmark
+=========================
+Memory held by enum-like strings (status, suggested_action, provider, DNS
+record status, ...) in results decoded from a large synthetic /batch body,
+and the time to group the results, with canonical values vs. a fresh string
+per field as json.loads() produces them.
+
+    python benchmarks/bench_canonical_values.py --results 100000
+"""
+
+import argparse
+import dataclasses
+import functools
+import json
+import random
+import time
+import tracemalloc
+from collections import Counter
+
+from mailsafepro import ValidationResult
+from mailsafepro.decoding import compile_decoder
+
+from _server import fake_result
+
+
+DOMAINS = ("gmail.com", "yahoo.com", "outlook.com", "icloud.com", "example.com")
+
+
+def plain_decoder(model: type):
+    """model.from_dict compiled without canonical values, sections included"""
+    specs = tuple(
+        dataclasses.replace(
+            spec,
+            canonical=False,
+            section=spec.section and plain_decoder(spec.section.__self__),
+        )
+        for spec in model.FIELDS
+    )
+    return functools.partial(compile_decoder(specs, model.__name__), model)
+
+
+def build_body(count: int, seed: int = 5) -> bytes:
+    rng = random.Random(seed)
+    results = []
+    for i in range(count):
+        prefix = "invalid" if rng.random() < 0.2 else "user"
+        results.append(fake_result(f"{prefix}{i}@{rng.choice(DOMAINS)}", include_raw_dns=True))
+    return json.dumps({"count": count, "results": results}).encode()
+
+
+def measure(body: bytes, decode) -> tuple:
+    """(bytes per result held after the response is dropped, results)"""
+    tracemalloc.start()
+    items = json.loads(body)["results"]
+    results = [decode(data) for data in items]
+    del items
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return current / len(results), results
+
+
+def group_by(results: list) -> float:
+    """Seconds to count results by status, action and provider"""
+    start = time.perf_counter()
+    Counter(r.status for r in results)
+    Counter((r.suggested_action, r.provider_analysis.provider) for r in results)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--results", type=int, default=100000)
+    args = parser.parse_args()
+
+    body = build_body(args.results)
+
+    print("=" * 70)
+    print(f"{args.results:,} results decoded from a {len(body) / 2 ** 20:.1f} MiB /batch body")
+    print("=" * 70)
+    print(f"  {'values':<12} {'bytes/result':>12} {'group-by ms':>12}")
+
+    decoders = (
+        ("fresh", plain_decoder(ValidationResult)),
+        ("canonical", ValidationResult.from_dict),
+    )
+    for name, decode in decoders:
+        per_result, results = measure(body, decode)
+        print(f"  {name:<12} {per_result:>12.0f} {group_by(results) * 1000:>12.1f}")
+        del results
+
+
+if __name__ == "__main__":
+    main()
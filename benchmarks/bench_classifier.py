@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Offline Classifier Benchmark
+============================
+Lookup throughput of the offline classifier (DomainSet membership,
+classify() and classify_many()) on a traffic mix where ``--plain`` of the
+addresses are disposable, no-reply or role addresses, and the effect on
+validate_batch() against the stand-in API, where only the disposable ones
+are answered offline.
+
+    python benchmarks/bench_classifier.py --emails 100000 --plain 0.2
+"""
+
+import argparse
+import random
+import time
+
+from mailsafepro import MailSafePro, OfflineClassifier
+from mailsafepro.classifier import BUILTIN_DISPOSABLE_DOMAINS
+
+from _server import server_process
+
+
+REGULAR_DOMAINS = ("gmail.com", "outlook.com", "yahoo.com", "example.com", "corp.example.org")
+
+
+def build_traffic(count: int, plain: float, seed: int = 11) -> list:
+    rng = random.Random(seed)
+    emails = []
+    for i in range(count):
+        roll = rng.random()
+        if roll < plain / 2:
+            emails.append(f"user{i}@{rng.choice(BUILTIN_DISPOSABLE_DOMAINS)}")
+        elif roll < plain:
+            prefix = rng.choice(("noreply", "no-reply", "donotreply", "info", "support."))
+            emails.append(f"{prefix}{i}@example.com")
+        else:
+            emails.append(f"user{i}@{rng.choice(REGULAR_DOMAINS)}")
+    return emails
+
+
+def rate(repeat: int, count: int, fn) -> float:
+    """Best lookups per second over ``repeat`` runs"""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return count / best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--emails", type=int, default=100000)
+    parser.add_argument("--plain", type=float, default=0.2)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    classifier = OfflineClassifier()
+    emails = build_traffic(args.emails, args.plain)
+    domains = [email.rpartition("@")[2] for email in emails]
+    disposable = classifier.disposable_domains
+    n = len(emails)
+
+    print("=" * 70)
+    print(f"Offline classifier, {n:,} emails, {args.plain:.0%} disposable/no-reply/role")
+    print("=" * 70)
+    rows = (
+        ("DomainSet membership", lambda: [d in disposable for d in domains]),
+        ("classify()", lambda: [classifier.classify(e) for e in emails]),
+        ("classify_many()", lambda: classifier.classify_many(emails)),
+        ("results_for()", lambda: classifier.results_for(emails)),
+    )
+    for name, fn in rows:
+        print(f"  {name:<22} {rate(args.repeat, n, fn) / 1e6:6.2f} M lookups/s")
+
+    batch = emails[:10000]
+    with server_process(latency=0.05) as url:
+        print(f"\n  validate_batch of {len(batch):,} emails (50 ms API latency):")
+        for name, local in (("API only", None), ("offline classifier", classifier)):
+            client = MailSafePro(api_key="key_bench", base_url=url, classifier=local)
+            client.validate_batch(batch[:10])  # open the connection
+            start = time.perf_counter()
+            result = client.validate_batch(batch)
+            elapsed = time.perf_counter() - start
+            offline = sum(1 for r in result.results if r.locally_decided)
+            sent = len(batch) - offline
+            print(f"    {name:<20} {elapsed * 1000:7.1f} ms, {sent:,} sent to the API")
+            client.close()
+
+
+if __name__ == "__main__":
+    main()
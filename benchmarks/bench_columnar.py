@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Columnar Analytics Benchmark
+============================
+Time to answer typical report questions over many results with Python loops
+over ValidationResult objects vs. ResultColumns (NumPy when installed, else
+the stdlib array backend):
+
+- fraction of results with status == "risky"
+- 10-bin risk_score histogram
+- reject list (emails whose suggested_action is "reject")
+- mean risk_score per provider
+
+    python benchmarks/bench_columnar.py --results 200000 --repeat 5
+"""
+
+import argparse
+import random
+import time
+from collections import defaultdict
+
+from mailsafepro import BatchResult, ResultColumns
+from mailsafepro.columnar import numpy
+
+from _server import fake_result
+
+STATUSES = ("deliverable", "risky", "undeliverable", "unknown")
+ACTIONS = ("accept", "review", "monitor", "reject")
+PROVIDERS = ("gmail", "outlook", "yahoo", "icloud", "corp", "other")
+
+
+def build_results(count: int) -> list:
+    rng = random.Random(7)
+    results = []
+    for i in range(count):
+        data = fake_result(f"user{i}@{rng.choice(PROVIDERS)}.com")
+        data["status"] = rng.choice(STATUSES)
+        data["suggested_action"] = rng.choice(ACTIONS)
+        data["risk_score"] = rng.random()
+        results.append(data)
+    return BatchResult.from_dict({"results": results}).results
+
+
+def report_loops(results: list) -> tuple:
+    risky = sum(1 for r in results if r.status == "risky") / len(results)
+    histogram = [0] * 10
+    for r in results:
+        histogram[min(int(r.risk_score * 10), 9)] += 1
+    rejects = [r.email for r in results if r.suggested_action == "reject"]
+    totals, counts = defaultdict(float), defaultdict(int)
+    for r in results:
+        totals[r.provider_analysis.provider] += r.risk_score
+        counts[r.provider_analysis.provider] += 1
+    means = {provider: totals[provider] / counts[provider] for provider in totals}
+    return risky, histogram, len(rejects), means
+
+
+def report_columns(columns: ResultColumns) -> tuple:
+    risky = columns.count(columns.mask(("status", "==", "risky"))) / len(columns)
+    histogram, _ = columns.histogram("risk_score", bins=10)
+    rejects = columns.emails(columns.mask(("suggested_action", "==", "reject")))
+    means = columns.group_by("provider", "risk_score", "mean")
+    return risky, histogram, len(rejects), means
+
+
+def best_of(repeat: int, fn, *args) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn(*args)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--results", type=int, default=200000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    results = build_results(args.results)
+
+    print("=" * 70)
+    print(f"Report over {args.results} results, best of {args.repeat}")
+    print("=" * 70)
+
+    loops = best_of(args.repeat, report_loops, results)
+    print(f"  {'Python loops over objects':<34} {loops * 1000:>9.1f} ms")
+
+    backends = [False] + ([True] if numpy is not None else [])
+    for use_numpy in backends:
+        start = time.perf_counter()
+        columns = ResultColumns.from_results(results, use_numpy=use_numpy)
+        build = time.perf_counter() - start
+        report = best_of(args.repeat, report_columns, columns)
+        name = "numpy" if use_numpy else "array"
+        print(
+            f"  {'ResultColumns (' + name + ')':<34} {report * 1000:>9.1f} ms"
+            f"  ({loops / report:.1f}x, one-off build {build * 1000:.0f} ms)"
+        )
+
+    if numpy is None:
+        print("\n  numpy not installed: only the stdlib array backend was measured")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Body Compression Benchmark
+==========================
+Bytes on the wire for a 10,000-email ``/batch`` request with
+``include_raw_dns=True`` and its response, uncompressed and with gzip/zstd
+request bodies against a stand-in server that compresses responses. Also
+reports the client's CPU time per batch and the transfer time those bytes
+would take on a link of ``--mbps`` megabits per second.
+
+    python benchmarks/bench_compression.py --emails 10000 --mbps 50
+"""
+
+import argparse
+import time
+
+from mailsafepro import BodyCompression, MailSafePro
+from mailsafepro.compression import zstandard
+
+from _server import server_handle
+
+
+def measure(server, emails: list, compression, repeat: int) -> tuple:
+    """(request bytes, response bytes, client CPU seconds) per batch"""
+    client = MailSafePro(api_key="key_bench", base_url=server.url, compression=compression)
+    client.validate("warm@example.com")  # open the connection
+    before = server.stats()
+    cpu = float("inf")
+    try:
+        for _ in range(repeat):
+            start = time.process_time()
+            client.validate_batch(emails, include_raw_dns=True)
+            cpu = min(cpu, time.process_time() - start)
+    finally:
+        client.close()
+    after = server.stats()
+    sent = (after["request_bytes_received"] - before["request_bytes_received"]) // repeat
+    received = (after["response_bytes_sent"] - before["response_bytes_sent"]) // repeat
+    return sent, received, cpu
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--emails", type=int, default=10000)
+    parser.add_argument("--mbps", type=float, default=50.0)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    emails = [f"user{i}@example{i % 50}.com" for i in range(args.emails)]
+    configs = [
+        ("uncompressed", None),
+        ("gzip level 1", BodyCompression(level=1)),
+        ("gzip (default)", BodyCompression()),
+    ]
+    if zstandard is not None:
+        configs.append(("zstd (default)", BodyCompression(encoding="zstd")))
+
+    print("=" * 78)
+    print(f"/batch of {args.emails:,} emails with include_raw_dns, link at {args.mbps:g} Mbit/s")
+    print("=" * 78)
+    print(
+        f"  {'Request body':<16} {'Sent':>10} {'Received':>12} "
+        f"{'Transfer':>10} {'Client CPU':>11}"
+    )
+
+    with server_handle() as plain, server_handle(compress_responses=True) as compressing:
+        for name, compression in configs:
+            server = plain if compression is None else compressing
+            sent, received, cpu = measure(server, emails, compression, args.repeat)
+            transfer = (sent + received) * 8 / (args.mbps * 1e6)
+            print(
+                f"  {name:<16} {sent / 1024:8.1f} KB {received / 1024:10.1f} KB "
+                f"{transfer * 1000:7.0f} ms {cpu * 1000:8.0f} ms"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+Response Decoding Benchmark
+===========================
+Parsing throughput (results/sec) of already-JSON-decoded responses into
+ValidationResult and LazyValidationResult objects, for sparse, typical and
+fully populated responses.
+
+    python benchmarks/bench_decode.py --results 20000 --repeat 5
+"""
+
+import argparse
+import time
+
+from mailsafepro import LazyValidationResult, ValidationResult
+
+from _server import fake_result
+
+
+def sparse(email: str) -> dict:
+    return {"email": email, "valid": True, "status": "deliverable"}
+
+
+def typical(email: str) -> dict:
+    return fake_result(email)
+
+
+def full(email: str) -> dict:
+    data = fake_result(email, check_smtp=True, include_raw_dns=True)
+    data["dns_security"]["dkim"] = {"status": "valid", "selector": "s1", "key_length": 2048}
+    data["spam_trap_check"] = {"checked": True, "is_spam_trap": False, "confidence": 0.9}
+    data["email_type"] = {"is_role_email": True, "role_type": "admin", "confidence": 0.8}
+    data["security"] = {"checked": True, "in_breach": True, "breach_count": 2,
+                        "recent_breaches": ["a", "b"]}
+    data["suggested_fixes"] = {"typo_detected": False}
+    return data
+
+
+def results_per_second(responses: list, result_type: type, repeat: int) -> float:
+    from_dict = result_type.from_dict
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for data in responses:
+            from_dict(data)
+        best = min(best, time.perf_counter() - start)
+    return len(responses) / best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--results", type=int, default=20000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    print("=" * 70)
+    print(f"Results/sec over {args.results} results, best of {args.repeat}")
+    print("=" * 70)
+    print(f"  {'response':<10} {'ValidationResult':>18} {'LazyValidationResult':>22}")
+
+    for name, make in (("sparse", sparse), ("typical", typical), ("full", full)):
+        responses = [make(f"user{i}@example.com") for i in range(args.results)]
+        eager = results_per_second(responses, ValidationResult, args.repeat)
+        lazy = results_per_second(responses, LazyValidationResult, args.repeat)
+        print(f"  {name:<10} {eager:>18,.0f} {lazy:>22,.0f}")
+
+
+if __name__ == "__main__":
+    main()
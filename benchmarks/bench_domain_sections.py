@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Domain Section Sharing Benchmark
+================================
+Bytes per result and decode time for a batch dominated by a few free-mail
+domains, decoded with include_raw_dns data through plain from_dict() and
+through a DomainSectionCache sharing provider and DNS sections per domain.
+
+    python benchmarks/bench_domain_sections.py --results 10000
+"""
+
+import argparse
+import random
+import time
+import tracemalloc
+
+from mailsafepro import DomainSectionCache, LazyValidationResult, ValidationResult
+
+from _server import fake_result
+
+
+# Share of a typical B2C list per domain; the rest are one-off corporate domains
+DOMAIN_MIX = (("gmail.com", 0.55), ("yahoo.com", 0.15), ("outlook.com", 0.12), ("icloud.com", 0.08))
+
+
+def build_responses(count: int, seed: int = 3) -> list:
+    rng = random.Random(seed)
+    responses = []
+    for i in range(count):
+        roll = rng.random()
+        domain = f"corp{i}.example.com"
+        for name, share in DOMAIN_MIX:
+            if roll < share:
+                domain = name
+                break
+            roll -= share
+        responses.append(fake_result(f"user{i}@{domain}", include_raw_dns=True))
+    return responses
+
+
+def measure(responses: list, decode) -> tuple:
+    """(bytes per result, seconds) for decoding every response"""
+    tracemalloc.start()
+    results = [decode(data) for data in responses]
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del results
+
+    start = time.perf_counter()
+    [decode(data) for data in responses]
+    return current / len(responses), time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--results", type=int, default=10000)
+    args = parser.parse_args()
+
+    responses = build_responses(args.results)
+    domains = len({data["email"].rpartition("@")[2] for data in responses})
+
+    print("=" * 70)
+    print(f"{args.results:,} results with DNS sections, {domains:,} distinct domains")
+    print("=" * 70)
+    print(f"  {'decoder':<28} {'bytes/result':>12} {'ms':>8}")
+
+    for kind, result_type in (("eager", ValidationResult), ("lazy", LazyValidationResult)):
+        rows = (
+            ("from_dict", result_type.from_dict),
+            ("DomainSectionCache", DomainSectionCache().decoder(result_type, False)),
+        )
+        for name, decode in rows:
+            per_result, elapsed = measure(responses, decode)
+            print(f"  {kind + ' ' + name:<28} {per_result:>12.0f} {elapsed * 1000:>8.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+HTTP/2 Transport Benchmark
+==========================
+200 concurrent validations over TLS against a local HTTP/2-capable stand-in
+server, with each client over HTTP/1.1 and over HTTP/2. Reports the
+connections and TLS handshakes the server saw, the throughput and the
+client's CPU time per request (on a single-core host, the stand-in server
+competes for the same CPU, so throughput there reflects total CPU cost).
+
+    python benchmarks/bench_http2.py --requests 2000 --concurrency 200
+"""
+
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+
+from mailsafepro import AsyncMailSafePro, MailSafePro
+
+from _server import make_self_signed_cert, server_handle
+
+
+def run_sync(url: str, emails: list, concurrency: int, http2: bool) -> float:
+    client = MailSafePro(api_key="key_bench", base_url=url, http2=http2)
+    try:
+        start = time.perf_counter()
+        client.validate_many(emails, workers=concurrency)
+        return time.perf_counter() - start
+    finally:
+        client.close()
+
+
+def run_async(url: str, emails: list, concurrency: int, http2: bool) -> float:
+    async def scenario() -> float:
+        async with AsyncMailSafePro(
+            api_key="key_bench", base_url=url, http2=http2,
+            max_connections=concurrency, max_keepalive_connections=concurrency,
+        ) as client:
+            slots = asyncio.Semaphore(concurrency)
+
+            async def one(email: str) -> None:
+                async with slots:
+                    await client.validate(email)
+
+            start = time.perf_counter()
+            await asyncio.gather(*(one(email) for email in emails))
+            return time.perf_counter() - start
+
+    return asyncio.run(scenario())
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=200)
+    parser.add_argument("--latency", type=float, default=0.05)
+    args = parser.parse_args()
+
+    emails = [f"user{i}@example.com" for i in range(args.requests)]
+
+    with tempfile.TemporaryDirectory() as directory:
+        certfile, keyfile = make_self_signed_cert(directory)
+        # Trusted by requests (sync client) and httpx (async client)
+        os.environ["REQUESTS_CA_BUNDLE"] = os.environ["SSL_CERT_FILE"] = certfile
+
+        print("=" * 70)
+        print(
+            f"{args.requests} validations, {args.concurrency} concurrent, "
+            f"{args.latency * 1000:.0f}ms latency, TLS"
+        )
+        print("=" * 70)
+        print(
+            f"  {'client':<16} {'connections':>11} {'handshakes':>10} "
+            f"{'req/s':>8} {'client CPU ms/req':>18}"
+        )
+
+        for name, run, http2 in (
+            ("sync HTTP/1.1", run_sync, False),
+            ("sync HTTP/2", run_sync, True),
+            ("async HTTP/1.1", run_async, False),
+            ("async HTTP/2", run_async, True),
+        ):
+            with server_handle(
+                latency=args.latency, http2=True, certfile=certfile, keyfile=keyfile
+            ) as server:
+                cpu = time.process_time()
+                elapsed = run(server.url, emails, args.concurrency, http2)
+                cpu = time.process_time() - cpu
+                stats = server.stats()
+            print(
+                f"  {name:<16} {stats['connections_opened']:>11} {stats['handshakes']:>10} "
+                f"{args.requests / elapsed:>8.0f} {cpu / args.requests * 1000:>18.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+JSON Codec Benchmark
+====================
+Time to encode /batch request bodies and decode /batch response bodies of
+100, 1k and 10k emails with each installed JSON codec. The "requests" row is
+what the client did before serializers: ``json.dumps`` for the body and
+``response.json()``, which first decodes the bytes to text.
+
+    python benchmarks/bench_json.py --repeat 5
+"""
+
+import argparse
+import gc
+import json
+import time
+
+from mailsafepro.serialization import (
+    OrjsonSerializer,
+    StdlibJSONSerializer,
+    UjsonSerializer,
+    orjson,
+    ujson,
+)
+
+from _server import fake_result
+
+SIZES = (100, 1000, 10000)
+
+
+class RequestsDefault:
+    """The pre-serializer path through requests"""
+
+    name = "requests"
+
+    def dumps(self, obj):
+        return json.dumps(obj).encode("utf-8")
+
+    def loads(self, data):
+        return json.loads(data.decode("utf-8"))
+
+
+def best_of(repeat: int, fn, arg) -> float:
+    # Like timeit, keep the cyclic GC out of the measurement: decoding
+    # allocates enough containers to trigger collections at random points
+    gc.disable()
+    try:
+        best = float("inf")
+        for _ in range(repeat):
+            start = time.perf_counter()
+            fn(arg)
+            best = min(best, time.perf_counter() - start)
+        return best
+    finally:
+        gc.enable()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    codecs = [RequestsDefault(), StdlibJSONSerializer()]
+    if orjson is not None:
+        codecs.append(OrjsonSerializer())
+    if ujson is not None:
+        codecs.append(UjsonSerializer())
+
+    payloads = {}
+    for size in SIZES:
+        emails = [f"user{i}@example.com" for i in range(size)]
+        request = {"emails": emails, "check_smtp": False, "include_raw_dns": False}
+        response = {
+            "count": size,
+            "valid_count": size,
+            "invalid_count": 0,
+            "results": [
+                fake_result(email, check_smtp=True, include_raw_dns=True) for email in emails
+            ],
+        }
+        payloads[size] = (request, json.dumps(response).encode("utf-8"))
+
+    print("=" * 70)
+    print(f"/batch JSON encode / decode, best of {args.repeat} (ms)")
+    print("=" * 70)
+    header = "".join(f"{f'{size:,} emails':>20}" for size in SIZES)
+    print(f"  {'codec':<10}{header}")
+
+    for codec in codecs:
+        cells = []
+        for size in SIZES:
+            request, body = payloads[size]
+            encode = best_of(args.repeat, codec.dumps, request)
+            decode = best_of(args.repeat, codec.loads, body)
+            cells.append(f"{encode * 1000:.2f} / {decode * 1000:.1f}")
+        print(f"  {codec.name:<10}" + "".join(f"{cell:>20}" for cell in cells))
+
+    print(f"\n  Response body at 10k: {len(payloads[10000][1]) / 2 ** 20:.1f} MiB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Lazy Result Benchmark
+=====================
+Cost of turning a decoded 10k-result /batch response into a BatchResult with
+eager ValidationResult vs. LazyValidationResult objects, for a bulk job that
+only reads valid, status and risk_score.
+
+    python benchmarks/bench_lazy_results.py --results 10000 --repeat 5
+"""
+
+import argparse
+import time
+import tracemalloc
+
+from mailsafepro import BatchResult, LazyValidationResult, ValidationResult
+
+from _server import fake_result
+
+
+def build_response(count: int) -> dict:
+    results = []
+    for i in range(count):
+        data = fake_result(f"user{i}@example.com", check_smtp=True, include_raw_dns=True)
+        data["spam_trap_check"] = {"checked": True, "is_spam_trap": False, "confidence": 0.9}
+        data["email_type"] = {"is_role_email": False}
+        data["security"] = {"checked": True, "in_breach": False, "breach_count": 0}
+        results.append(data)
+    return {"count": count, "valid_count": count, "results": results}
+
+
+def bulk_job(response: dict, result_type: type) -> int:
+    """Parse, then read only the fields a bulk job uses"""
+    batch = BatchResult.from_dict(response, result_type)
+    return sum(
+        1 for r in batch.results
+        if r.valid and r.status == "deliverable" and r.risk_score < 0.5
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--results", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    response = build_response(args.results)
+
+    print("=" * 70)
+    print(f"BatchResult.from_dict on {args.results} results, reading 3 top-level fields")
+    print("=" * 70)
+
+    for name, result_type in (("ValidationResult", ValidationResult),
+                              ("LazyValidationResult", LazyValidationResult)):
+        times = []
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            bulk_job(response, result_type)
+            times.append(time.perf_counter() - start)
+
+        tracemalloc.start()
+        batch = BatchResult.from_dict(response, result_type)
+        allocated, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        del batch
+
+        print(
+            f"  {name:<22} {min(times) * 1000:8.1f} ms   "
+            f"{allocated / 2 ** 20:6.1f} MiB allocated"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+Result Memory Benchmark
+=======================
+Bytes per ValidationResult (including its nested section objects) for sparse,
+typical and fully populated API responses, measured with tracemalloc.
+
+    python benchmarks/bench_model_memory.py --results 20000
+"""
+
+import argparse
+import tracemalloc
+
+from mailsafepro import LazyValidationResult, ValidationResult
+
+from _server import fake_result
+
+
+def sparse(email: str) -> dict:
+    return {"email": email, "valid": True, "status": "deliverable"}
+
+
+def typical(email: str) -> dict:
+    return fake_result(email)
+
+
+def full(email: str) -> dict:
+    data = fake_result(email, check_smtp=True, include_raw_dns=True)
+    data["dns_security"]["dkim"] = {"status": "valid", "selector": "s1", "key_length": 2048}
+    data["spam_trap_check"] = {"checked": True, "is_spam_trap": False, "confidence": 0.9}
+    data["email_type"] = {"is_role_email": True, "role_type": "admin", "confidence": 0.8}
+    data["security"] = {"checked": True, "in_breach": True, "breach_count": 2,
+                        "recent_breaches": ["a", "b"]}
+    data["suggested_fixes"] = {"typo_detected": False}
+    return data
+
+
+def bytes_per_result(responses: list, result_type: type, touch: bool) -> float:
+    """Memory held by results built from already-decoded responses"""
+    tracemalloc.start()
+    results = [result_type.from_dict(data) for data in responses]
+    if touch:
+        # Reading every section materializes lazy results
+        for result in results:
+            result.smtp, result.dns_security, result.metadata, result.breach_info
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del results
+    return current / len(responses)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--results", type=int, default=20000)
+    args = parser.parse_args()
+
+    print("=" * 70)
+    print(f"Bytes per result over {args.results} results (strings shared with the response)")
+    print("=" * 70)
+    print(f"  {'response':<10} {'eager':>10} {'lazy':>10} {'lazy, all read':>16}")
+
+    for name, make in (("sparse", sparse), ("typical", typical), ("full", full)):
+        responses = [make(f"user{i}@example.com") for i in range(args.results)]
+        eager = bytes_per_result(responses, ValidationResult, touch=False)
+        lazy = bytes_per_result(responses, LazyValidationResult, touch=False)
+        lazy_touched = bytes_per_result(responses, LazyValidationResult, touch=True)
+        print(f"  {name:<10} {eager:>10.0f} {lazy:>10.0f} {lazy_touched:>16.0f}")
+
+
+if __name__ == "__main__":
+    main()
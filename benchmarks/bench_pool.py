@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Connection Pool Benchmark
+=========================
+``--threads`` threads calling validate() against a local TLS stand-in
+server. First, the latency of the first burst of requests from a cold
+client vs. one that called warmup(). Then steady-state p50/p99 latency and
+the pool_stats() counters (new connections, discards) for the default
+pool, a pool sized to the thread count, and a blocking default-size pool.
+
+    python benchmarks/bench_pool.py --threads 32 --requests 3200
+"""
+
+import argparse
+import os
+import statistics
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from mailsafepro import MailSafePro
+
+from _server import make_self_signed_cert, server_handle
+
+
+def timed_calls(client: MailSafePro, emails: list, threads: int) -> list:
+    """Latency of each validate() call, in seconds"""
+    def call(email: str) -> float:
+        start = time.perf_counter()
+        client.validate(email)
+        return time.perf_counter() - start
+
+    with ThreadPoolExecutor(threads) as executor:
+        return list(executor.map(call, emails))
+
+
+def percentiles(latencies: list) -> str:
+    cuts = statistics.quantiles(latencies, n=100)
+    return f"p50 {cuts[49] * 1000:6.1f} ms  p99 {cuts[98] * 1000:6.1f} ms"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--threads", type=int, default=32)
+    parser.add_argument("--requests", type=int, default=3200)
+    parser.add_argument("--latency", type=float, default=0.02)
+    args = parser.parse_args()
+
+    directory = tempfile.TemporaryDirectory()
+    certfile, keyfile = make_self_signed_cert(directory.name)
+    os.environ["REQUESTS_CA_BUNDLE"] = certfile
+    threads = args.threads
+    burst = [f"first{i}@example.com" for i in range(threads)]
+    emails = [f"user{i}@example.com" for i in range(args.requests)]
+
+    with server_handle(latency=args.latency, certfile=certfile, keyfile=keyfile) as server:
+        print("=" * 72)
+        print(
+            f"First {threads} requests from {threads} threads, TLS, "
+            f"{args.latency * 1000:g} ms API latency"
+        )
+        print("=" * 72)
+        for name, warm in (("cold client", False), ("after warmup()", True)):
+            client = MailSafePro(api_key="key_bench", base_url=server.url, pool_size=threads)
+            if warm:
+                client.warmup()
+            before = client.pool_stats()["new_connections"]
+            latencies = timed_calls(client, burst, threads)
+            opened = client.pool_stats()["new_connections"] - before
+            print(f"  {name:<16} {percentiles(latencies)}  {opened:3d} handshakes during burst")
+            client.close()
+
+        print()
+        print("=" * 72)
+        print(f"{len(emails):,} requests from {threads} threads")
+        print("=" * 72)
+        configs = (
+            ("default pool (10)", {}),
+            (f"pool_size={threads}", {"pool_size": threads}),
+            ("pool_block=True (10)", {"pool_block": True}),
+        )
+        for name, options in configs:
+            client = MailSafePro(api_key="key_bench", base_url=server.url, **options)
+            latencies = timed_calls(client, emails, threads)
+            stats = client.pool_stats()
+            print(
+                f"  {name:<21} {percentiles(latencies)}  "
+                f"{stats['new_connections']:5d} new, {stats['discarded']:5d} discarded"
+            )
+            client.close()
+
+    directory.cleanup()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Batch Pre-flight Benchmark
+==========================
+validate_batch() on an upload with blank rows, stray whitespace, duplicates
+and syntax failures, with and without the local pre-flight stage. Reports
+the cost of the stage itself and the emails and request bytes it saved.
+
+    python benchmarks/bench_preflight.py --emails 10000 --garbage 0.1
+"""
+
+import argparse
+import random
+import time
+
+from mailsafepro import MailSafePro, preflight
+
+from _server import server_process
+
+
+def build_upload(count: int, garbage: float, seed: int = 7) -> list:
+    """Realistic dirty upload: ``garbage`` of the rows are blank, broken or repeated"""
+    rng = random.Random(seed)
+    rows = []
+    for i in range(count):
+        roll = rng.random()
+        if roll >= garbage:
+            rows.append(f"user{i}@Example.com")
+        elif roll < garbage * 0.2:
+            rows.append("")
+        elif roll < garbage * 0.4:
+            rows.append(f"user{i}@example")
+        elif roll < garbage * 0.6:
+            rows.append(f"  user{i}@example.com \r")
+        else:
+            rows.append(rows[rng.randrange(len(rows))] if rows else "dup@example.com")
+    return rows
+
+
+def best_of(repeat: int, fn) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--emails", type=int, default=10000)
+    parser.add_argument("--garbage", type=float, default=0.1)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    emails = build_upload(args.emails, args.garbage)
+    report = preflight(emails).report
+
+    print("=" * 70)
+    print(
+        f"validate_batch on {args.emails:,} emails, {args.garbage:.0%} garbage, "
+        f"best of {args.repeat}"
+    )
+    print("=" * 70)
+    alone = best_of(args.repeat, lambda: preflight(emails))
+    print(f"  pre-flight stage alone: {alone * 1000:.1f} ms")
+    print(
+        f"  sent {report.sent:,} of {report.total:,}: {report.rejected:,} rejected, "
+        f"{report.duplicates:,} duplicates, {report.bytes_saved / 1024:.1f} KiB saved"
+    )
+
+    with server_process() as url:
+        client = MailSafePro(api_key="key_bench", base_url=url)
+        client.validate_batch(emails[:10])  # open the connection
+
+        for name, enabled in (("raw list", False), ("pre-flight", True)):
+            elapsed = best_of(args.repeat, lambda: client.validate_batch(emails, preflight=enabled))
+            print(f"  {name:<12} {elapsed * 1000:8.1f} ms")
+
+        client.close()
+
+
+if __name__ == "__main__":
+    main()
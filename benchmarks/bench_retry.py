@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Retry Policy Benchmark
+======================
+``--threads`` threads calling validate() against a local stand-in server
+that answers 503 beyond ``--capacity`` concurrent requests, so most first
+attempts fail while the load lasts. For no retries, retries without a
+budget, the default retry budget, and the budget plus a per-call deadline,
+reports the calls that succeeded, the requests the server had to answer
+per call (retry amplification), and p50/p99/max call latency.
+
+    python benchmarks/bench_retry.py --threads 32 --calls 1600 --capacity 4
+"""
+
+import argparse
+import statistics
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from mailsafepro import MailSafePro, RetryPolicy
+from mailsafepro.exceptions import EmailValidatorError
+
+from _server import server_handle
+
+
+def timed_calls(client: MailSafePro, emails: list, threads: int) -> list:
+    """(succeeded, seconds) for each validate() call"""
+    def call(email: str) -> tuple:
+        start = time.perf_counter()
+        try:
+            client.validate(email)
+            ok = True
+        except EmailValidatorError:
+            ok = False
+        return ok, time.perf_counter() - start
+
+    with ThreadPoolExecutor(threads) as executor:
+        return list(executor.map(call, emails))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--threads", type=int, default=32)
+    parser.add_argument("--calls", type=int, default=1600)
+    parser.add_argument("--capacity", type=int, default=4)
+    parser.add_argument("--latency", type=float, default=0.01)
+    parser.add_argument("--base-delay", type=float, default=0.05)
+    args = parser.parse_args()
+
+    emails = [f"user{i}@example.com" for i in range(args.calls)]
+    base = args.base_delay
+    configs = (
+        ("no retries", RetryPolicy(max_retries=0)),
+        ("3 retries, no budget", RetryPolicy(base_delay=base, budget_ratio=1, budget_burst=10**9)),
+        ("3 retries, 20% budget", RetryPolicy(base_delay=base)),
+        ("budget + 0.5s deadline", RetryPolicy(base_delay=base, deadline=0.5)),
+    )
+
+    print("=" * 86)
+    print(
+        f"{args.calls:,} calls from {args.threads} threads, server capacity {args.capacity}, "
+        f"backoff from {base * 1000:g} ms"
+    )
+    print("=" * 86)
+    print(f"  {'Policy':<24} {'Succeeded':>9} {'Req/call':>9} {'p50':>9} {'p99':>9} {'max':>9}")
+
+    with server_handle(capacity=args.capacity, latency=args.latency) as server:
+        for name, policy in configs:
+            client = MailSafePro(
+                api_key="key_bench",
+                base_url=server.url,
+                coalesce_requests=False,
+                pool_size=args.threads,
+                retry_policy=policy,
+            )
+            before = server.stats()["total_requests"]
+            outcomes = timed_calls(client, emails, args.threads)
+            sent = server.stats()["total_requests"] - before
+            client.close()
+
+            succeeded = sum(ok for ok, _ in outcomes) / len(outcomes)
+            latencies = [seconds * 1000 for _, seconds in outcomes]
+            cuts = statistics.quantiles(latencies, n=100)
+            print(
+                f"  {name:<24} {succeeded:9.1%} {sent / len(outcomes):9.2f} "
+                f"{cuts[49]:6.0f} ms {cuts[98]:6.0f} ms {max(latencies):6.0f} ms"
+            )
+
+
+if __name__ == "__main__":
+    main()
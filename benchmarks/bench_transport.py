@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+Transport Overhead Benchmark
+============================
+Client CPU time per sequential validate() call against a local stand-in
+server, through the ``requests`` session and through the lean urllib3
+transport (``lean_transport=True``), with the response cache and request
+coalescing off so every call is a request. Process CPU time excludes the
+server, which runs in a child process; the best of ``--repeat`` rounds is
+reported, along with the wall-clock time per call.
+
+    python benchmarks/bench_transport.py --calls 2000 --repeat 5
+"""
+
+import argparse
+import time
+
+from mailsafepro import MailSafePro
+
+from _server import server_handle
+
+
+def measure(url: str, lean: bool, calls: int, repeat: int) -> tuple:
+    """(CPU µs, wall µs) per validate() call"""
+    client = MailSafePro(
+        api_key="key_bench", base_url=url, coalesce_requests=False, lean_transport=lean
+    )
+    client.validate("warm@example.com")  # open the connection
+    emails = [f"user{i}@example.com" for i in range(calls)]
+    best_cpu = best_wall = float("inf")
+    try:
+        for _ in range(repeat):
+            cpu, wall = time.process_time(), time.perf_counter()
+            for email in emails:
+                client.validate(email)
+            best_cpu = min(best_cpu, time.process_time() - cpu)
+            best_wall = min(best_wall, time.perf_counter() - wall)
+    finally:
+        client.close()
+    return best_cpu / calls * 1e6, best_wall / calls * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--calls", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    print("=" * 64)
+    print(f"{args.calls:,} sequential validate() calls, best of {args.repeat}")
+    print("=" * 64)
+    print(f"  {'Transport':<20} {'Client CPU/call':>16} {'Wall/call':>12}")
+
+    with server_handle() as server:
+        results = {}
+        for name, lean in (("requests.Session", False), ("lean (urllib3)", True)):
+            cpu, wall = measure(server.url, lean, args.calls, args.repeat)
+            results[name] = cpu
+            print(f"  {name:<20} {cpu:13.0f} µs {wall:9.0f} µs")
+
+    session, lean = results.values()
+    print(
+        f"\n  Lean transport saves {session - lean:.0f} µs ({1 - lean / session:.0%}) "
+        "of client CPU per call"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -7,8 +7,25 @@ __author__ = "MailSafePro Team"
 __license__ = "MIT"
 
 from .client import MailSafePro
+from .async_client import AsyncMailSafePro
+from .cache import CacheBackend, DomainSectionCache, ResultCache, SQLiteCache, TieredCache
+from .classifier import DomainSet, OfflineClassifier
+from .columnar import ResultColumns
+from .compression import BodyCompression, TransferStats
+from .concurrency import AdaptiveConcurrencyLimiter
+from .files import FileJobSummary
+from .http2 import HTTP2Adapter
+from .pool import PooledHTTPAdapter, PoolStats
+from .transport import LeanTransport
+from .preflight import PreflightBatch, PreflightReport, preflight
+from .ratelimit import TokenBucket
+from .retry import RetryPolicy
+from .serialization import JSONSerializer, StdlibJSONSerializer, default_serializer
+from .streaming import BatchResultStream
 from .models import (
     ValidationResult,
+    LazyValidationResult,
+    ValidationFailure,
     BatchResult,
     SMTPInfo,
     DNSInfo,
@@ -35,7 +52,35 @@ from .exceptions import (
 
 __all__ = [
     "MailSafePro",
+    "AsyncMailSafePro",
+    "CacheBackend",
+    "ResultCache",
+    "SQLiteCache",
+    "TieredCache",
+    "DomainSectionCache",
+    "DomainSet",
+    "OfflineClassifier",
+    "TokenBucket",
+    "RetryPolicy",
+    "PreflightBatch",
+    "PreflightReport",
+    "preflight",
+    "JSONSerializer",
+    "StdlibJSONSerializer",
+    "default_serializer",
+    "BatchResultStream",
+    "ResultColumns",
+    "AdaptiveConcurrencyLimiter",
+    "HTTP2Adapter",
+    "PooledHTTPAdapter",
+    "PoolStats",
+    "LeanTransport",
+    "BodyCompression",
+    "TransferStats",
+    "FileJobSummary",
     "ValidationResult",
+    "LazyValidationResult",
+    "ValidationFailure",
     "BatchResult",
     "SMTPInfo",
     "DNSInfo",
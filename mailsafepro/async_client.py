@@ -0,0 +1,817 @@
+"""
+MailSafePro Async Client - asyncio API client with pooled keep-alive connections
+"""
+
+import asyncio
+import itertools
+import logging
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Union
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover - optional dependency
+    httpx = None  # type: ignore[assignment]
+
+from .cache import DomainSectionCache, cache_key
+from .concurrency import AdaptiveConcurrencyLimiter
+from .classifier import OfflineClassifier
+from .compression import BodyCompression, CompressedBody
+from .client import (
+    MailSafePro,
+    _merge_batch,
+    _raise_for_api_error,
+    _retry_after,
+)
+from .http2 import _require_http2
+from .exceptions import (
+    EmailValidatorError,
+    AuthenticationError,
+    ValidationError,
+    NetworkError,
+)
+from .models import ValidationResult, LazyValidationResult, BatchResult
+from .preflight import preflight as run_preflight
+from .ratelimit import TokenBucket
+from .retry import RetryPolicy
+from .serialization import JSONSerializer, default_serializer
+from .singleflight import AsyncSingleFlight
+from .utils import validate_email_format, validate_file_path
+
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncMailSafePro:
+    """
+    Asynchronous Python SDK for Email Validation API
+
+    Mirrors :class:`MailSafePro` on top of a single pooled ``httpx.AsyncClient``,
+    so thousands of validations can be in flight on one event loop without a
+    thread per request. Requires the ``async`` extra (``httpx``).
+
+    Args:
+        api_key: API key for authentication (optional if using JWT)
+        base_url: Base URL of the API (default: production)
+        timeout: Request timeout in seconds (default: 30)
+        max_retries: Maximum number of retries for failed requests (default: 3;
+            ignored when ``retry_policy`` is given)
+        enable_logging: Enable debug logging (default: False)
+        max_connections: Maximum number of open connections (default: 100)
+        max_keepalive_connections: Maximum idle keep-alive connections (default: 100)
+        coalesce_requests: Share one request between concurrent identical
+            validate() calls (default: True)
+        rate_limiter: Client-side token bucket shared by all requests
+            (default: None, no client-side limiting)
+        concurrency_limiter: Adaptive limit on concurrent requests, raised
+            while the API keeps up and cut on 429/5xx or rising latency
+            (default: None, only max_connections applies)
+        lazy_results: Return LazyValidationResult objects, which build
+            nested sections only when accessed (default: False)
+        serializer: JSON codec for request and response bodies (default:
+            orjson or ujson when installed, else the standard library)
+        classifier: Answer addresses at disposable domains
+            offline, without an API call (default: None, send everything)
+        domain_cache: Share provider and DNS sections between results for
+            the same domain, and skip include_raw_dns for domains resolved
+            recently (default: None)
+        http2: Multiplex requests over HTTP/2 connections, falling back to
+            HTTP/1.1 for servers without HTTP/2 (default: False; requires
+            the ``http2`` extra)
+        compression: Compress large request bodies and record the bytes
+            saved per request (default: None, send bodies as-is)
+        retry_policy: Backoff, retry budget and deadlines for retries
+            (default: a RetryPolicy with ``max_retries``); share one
+            between clients to share its budget
+
+    Examples:
+        >>> async with AsyncMailSafePro(api_key="key_xxx") as validator:
+        ...     results = await asyncio.gather(
+        ...         *(validator.validate(email) for email in emails)
+        ...     )
+
+        >>> # JWT authentication
+        >>> validator = await AsyncMailSafePro.login(
+        ...     username="user@example.com",
+        ...     password="your_password"
+        ... )
+    """
+
+    DEFAULT_BASE_URL = MailSafePro.DEFAULT_BASE_URL
+    USER_AGENT = MailSafePro.USER_AGENT
+
+    # httpcore scans every pooled connection on each request event, so the
+    # per-request cost of one large pool grows with its size. Connections are
+    # split across pools of at most this many and used round-robin.
+    POOL_SHARD_SIZE = 10
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        base_url: Optional[str] = None,
+        timeout: int = 30,
+        max_retries: int = 3,
+        enable_logging: bool = False,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 100,
+        coalesce_requests: bool = True,
+        rate_limiter: Optional[TokenBucket] = None,
+        concurrency_limiter: Optional[AdaptiveConcurrencyLimiter] = None,
+        lazy_results: bool = False,
+        serializer: Optional[JSONSerializer] = None,
+        classifier: Optional[OfflineClassifier] = None,
+        domain_cache: Optional[DomainSectionCache] = None,
+        http2: bool = False,
+        compression: Optional[BodyCompression] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+    ):
+        """Initialize AsyncMailSafePro client with API key"""
+        if httpx is None:
+            raise ImportError(
+                "AsyncMailSafePro requires httpx. "
+                "Install it with: pip install 'mailsafepro-sdk[async]'"
+            )
+        if http2:
+            _require_http2()
+
+        self.base_url = (base_url or self.DEFAULT_BASE_URL).rstrip("/")
+        self.timeout = timeout
+        self.retry_policy = retry_policy or RetryPolicy(max_retries=max_retries)
+        self.max_retries = self.retry_policy.max_retries
+        self.max_connections = max_connections
+        self.max_keepalive_connections = max_keepalive_connections
+        self.rate_limiter = rate_limiter
+        self.concurrency_limiter = concurrency_limiter
+        self._result_type = LazyValidationResult if lazy_results else ValidationResult
+        self.serializer = serializer or default_serializer()
+        self.classifier = classifier
+        self.domain_cache = domain_cache
+        self.http2 = http2
+        self.compression = compression
+        self._api_key = api_key
+        self._single_flight = AsyncSingleFlight() if coalesce_requests else None
+
+        # JWT token management
+        self._access_token: Optional[str] = None
+        self._refresh_token: Optional[str] = None
+        self._token_expires_at: Optional[datetime] = None
+        self._token_lock: Optional[asyncio.Lock] = None
+        self._slots: Optional[asyncio.Semaphore] = None
+
+        # Setup logging
+        if enable_logging:
+            logging.basicConfig(level=logging.DEBUG)
+            logger.setLevel(logging.DEBUG)
+
+        self._clients = self._create_clients()
+        self._client_cycle = itertools.cycle(self._clients)
+
+        logger.debug(f"AsyncMailSafePro initialized: base_url={self.base_url}")
+
+    def _create_clients(self) -> List["httpx.AsyncClient"]:
+        """Create the shared async HTTP clients, one per connection pool shard"""
+        if self.http2:
+            # Streams are multiplexed over a handful of connections, so one
+            # pool never grows large enough to need sharding
+            return [self._create_client(self.max_connections, self.max_keepalive_connections)]
+
+        shards = max(1, -(-self.max_connections // self.POOL_SHARD_SIZE))
+        per_shard = -(-self.max_connections // shards)
+        keepalive_per_shard = -(-self.max_keepalive_connections // shards)
+        return [self._create_client(per_shard, keepalive_per_shard) for _ in range(shards)]
+
+    def _create_client(
+        self,
+        max_connections: int,
+        max_keepalive_connections: int,
+    ) -> "httpx.AsyncClient":
+        """Create one async HTTP client and its connection pool"""
+        limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+        )
+
+        # No transport-level retries: failed connections and retryable
+        # statuses are all retried in _retrying() per retry_policy
+        transport = httpx.AsyncHTTPTransport(limits=limits, http2=self.http2)
+
+        # Content-Type is left to httpx so JSON and multipart bodies both work
+        return httpx.AsyncClient(
+            transport=transport,
+            timeout=self.timeout,
+            headers={
+                "User-Agent": self.USER_AGENT,
+                "Accept": "application/json",
+            },
+        )
+
+    async def __aenter__(self) -> "AsyncMailSafePro":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close all pooled connections"""
+        for client in self._clients:
+            await client.aclose()
+
+    def _next_client(self) -> "httpx.AsyncClient":
+        return next(self._client_cycle)
+
+    @classmethod
+    async def login(
+        cls,
+        username: str,
+        password: str,
+        base_url: Optional[str] = None,
+        timeout: int = 30,
+        max_retries: int = 3,
+        enable_logging: bool = False,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 100,
+        **options: Any,
+    ) -> "AsyncMailSafePro":
+        """
+        Create AsyncMailSafePro instance with JWT authentication
+
+        Args:
+            username: User email address
+            password: User password
+            base_url: Base URL of the API
+            timeout: Request timeout in seconds
+            max_retries: Maximum number of retries
+            enable_logging: Enable debug logging
+            max_connections: Maximum number of open connections
+            max_keepalive_connections: Maximum idle keep-alive connections
+            **options: Additional constructor options
+
+        Returns:
+            AsyncMailSafePro instance with JWT tokens
+
+        Raises:
+            AuthenticationError: If login fails
+
+        Examples:
+            >>> validator = await AsyncMailSafePro.login(
+            ...     username="user@example.com",
+            ...     password="secure_password"
+            ... )
+            >>> result = await validator.validate("test@example.com")
+        """
+        instance = cls(
+            base_url=base_url,
+            timeout=timeout,
+            max_retries=max_retries,
+            enable_logging=enable_logging,
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            **options,
+        )
+
+        try:
+            response = await instance._post_auth(
+                "/auth/login",
+                json={"email": username, "password": password},
+            )
+
+            if response.status_code == 401:
+                raise AuthenticationError("Invalid credentials")
+
+            response.raise_for_status()
+            instance._store_tokens(response.json())
+
+            logger.info(f"Successfully logged in as {username}")
+            return instance
+
+        except (httpx.HTTPError, NetworkError) as e:
+            await instance.aclose()
+            raise AuthenticationError(f"Login failed: {str(e)}") from e
+        except AuthenticationError:
+            await instance.aclose()
+            raise
+
+    async def logout(self) -> None:
+        """
+        Logout and invalidate JWT session
+
+        Raises:
+            AuthenticationError: If not authenticated with JWT
+        """
+        if not self._access_token:
+            raise AuthenticationError("Not authenticated with JWT")
+
+        try:
+            headers = await self._get_auth_headers()
+            response = await self._post_auth("/auth/logout", headers=headers)
+            response.raise_for_status()
+
+            logger.info("Successfully logged out")
+
+        except (httpx.HTTPError, NetworkError) as e:
+            logger.error(f"Logout failed: {str(e)}")
+
+        finally:
+            # Clear tokens even if logout request fails
+            self._access_token = None
+            self._refresh_token = None
+            self._token_expires_at = None
+
+    def _store_tokens(self, data: Dict[str, Any]) -> None:
+        """Store tokens from a login/refresh response"""
+        self._access_token = data.get("access_token")
+        self._refresh_token = data.get("refresh_token")
+
+        # Token expiration (default 15 minutes - 1 minute buffer)
+        expires_in = data.get("expires_in", 900)
+        self._token_expires_at = datetime.now() + timedelta(seconds=max(expires_in - 60, 0))
+
+    def _token_expired(self) -> bool:
+        return self._token_expires_at is not None and datetime.now() >= self._token_expires_at
+
+    async def _refresh_access_token(self) -> None:
+        """Refresh access token using refresh token"""
+        if not self._refresh_token:
+            raise AuthenticationError("No refresh token available")
+
+        try:
+            response = await self._post_auth(
+                "/auth/refresh",
+                headers={"Authorization": f"Bearer {self._refresh_token}"},
+            )
+
+            if response.status_code == 401:
+                raise AuthenticationError("Refresh token expired, please login again")
+
+            response.raise_for_status()
+            self._store_tokens(response.json())
+
+            logger.debug("Access token refreshed successfully")
+
+        except (httpx.HTTPError, NetworkError) as e:
+            raise AuthenticationError(f"Token refresh failed: {str(e)}") from e
+
+    async def _get_auth_headers(self) -> Dict[str, str]:
+        """Get authentication headers (API Key or JWT)"""
+        if self._access_token:
+            if self._token_expired():
+                # Created lazily so the lock binds to the running loop
+                if self._token_lock is None:
+                    self._token_lock = asyncio.Lock()
+
+                async with self._token_lock:
+                    # Another task may have refreshed while we waited
+                    if self._token_expired():
+                        logger.debug("Token expired, refreshing...")
+                        await self._refresh_access_token()
+
+            return {"Authorization": f"Bearer {self._access_token}"}
+
+        if self._api_key:
+            return {"X-API-Key": self._api_key}
+
+        raise AuthenticationError("No authentication method configured")
+
+    async def _make_request(
+        self,
+        method: str,
+        endpoint: str,
+        **kwargs
+    ) -> Dict[str, Any]:
+        """
+        Make HTTP request with error handling and retries
+
+        Args:
+            method: HTTP method (GET, POST, etc.)
+            endpoint: API endpoint path
+            **kwargs: Additional arguments for httpx
+
+        Returns:
+            Response data as dictionary
+
+        Raises:
+            Various EmailValidatorError subclasses
+        """
+        url = f"{self.base_url}{endpoint}"
+        headers = {**(await self._get_auth_headers()), **kwargs.pop("headers", {})}
+
+        # Encoded once up front; retries resend the same bytes (compressed
+        # afresh on each attempt, as the body is sent)
+        body: Union[bytes, CompressedBody, None] = None
+        if "json" in kwargs:
+            body = kwargs["content"] = self.serializer.dumps(kwargs.pop("json"))
+            headers["Content-Type"] = "application/json"
+            if self.compression is not None:
+                body = self.compression.encode(body)
+                if isinstance(body, CompressedBody):
+                    headers["Content-Encoding"] = body.encoding
+
+        deadline = kwargs.pop("deadline", None)
+
+        async def send(timeout: Any) -> "httpx.Response":
+            if self.rate_limiter is not None:
+                await self.rate_limiter.acquire_async()
+
+            if isinstance(body, CompressedBody):
+                kwargs["content"] = body.aiter()
+
+            return await self._send_request(method, url, headers, timeout=timeout, **kwargs)
+
+        response = await self._retrying(send, deadline, paced=self.rate_limiter is not None)
+
+        _raise_for_api_error(response)
+
+        if response.is_error:
+            raise EmailValidatorError(
+                f"Request failed: {response.status_code} {response.reason_phrase}"
+            )
+
+        if self.compression is not None:
+            self.compression.record(
+                response.url.path,
+                body,
+                len(response.content),
+                response.num_bytes_downloaded,
+            )
+
+        try:
+            data: Dict[str, Any] = self.serializer.loads(response.content)
+        except ValueError as e:
+            raise EmailValidatorError(f"Invalid JSON response: {str(e)}") from e
+        return data
+
+    async def _retrying(
+        self,
+        send: Callable[[Any], Awaitable["httpx.Response"]],
+        deadline: Optional[float] = None,
+        paced: bool = False,
+    ) -> "httpx.Response":
+        """
+        Await ``send(timeout)`` until it returns a final response
+
+        Same rules as :meth:`MailSafePro._retrying`: responses with a
+        retryable status and NetworkErrors are retried as ``retry_policy``
+        decides, and once it gives up the last response is returned or the
+        last NetworkError raised.
+        """
+        call = self.retry_policy.begin(deadline)
+        while True:
+            try:
+                response = await send(call.timeout(self.timeout))
+            except NetworkError:
+                cause = "network"
+                delay = call.next_delay(cause)
+                if delay is None:
+                    raise
+            else:
+                status = response.status_code
+                if status not in self.retry_policy.retry_statuses:
+                    call.finish()
+                    return response
+                cause = str(status)
+                # A 429 under a rate limiter has penalized it, and the
+                # limiter holds the next attempt instead of a sleep here
+                delay = call.next_delay(
+                    cause, _retry_after(response), deferred=paced and status == 429
+                )
+                if delay is None:
+                    return response
+                await response.aclose()
+
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Retry {call.retries} after {cause} in {delay:.2f}s")
+            if delay > 0:
+                await asyncio.sleep(delay)
+
+    async def _post_auth(self, endpoint: str, **kwargs: Any) -> "httpx.Response":
+        """POST to an auth endpoint, retried like any request"""
+        url = f"{self.base_url}{endpoint}"
+
+        async def send(timeout: Any) -> "httpx.Response":
+            try:
+                return await self._next_client().post(url, timeout=timeout, **kwargs)
+            except httpx.TimeoutException as e:
+                raise NetworkError(f"Request timeout: {str(e)}") from e
+            except httpx.TransportError as e:
+                raise NetworkError(f"Connection error: {str(e)}") from e
+
+        return await self._retrying(send)
+
+    def _connection_slots(self) -> asyncio.Semaphore:
+        """Semaphore queueing requests for a connection"""
+        # Queue callers here rather than inside the connection pool, whose
+        # bookkeeping cost grows with the number of waiting requests.
+        # Created lazily so the semaphore binds to the running loop.
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self.max_connections)
+        return self._slots
+
+    async def _send_request(
+        self,
+        method: str,
+        url: str,
+        headers: Dict[str, str],
+        **kwargs
+    ) -> "httpx.Response":
+        """Send one attempt, holding a connection slot and a concurrency slot"""
+        limiter = self.concurrency_limiter
+        started = await limiter.acquire_async() if limiter is not None else 0.0
+
+        try:
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("%s %s", method, url)
+            async with self._connection_slots():
+                response = await self._next_client().request(
+                    method, url, headers=headers, **kwargs
+                )
+
+        except httpx.TimeoutException as e:
+            error = NetworkError(f"Request timeout: {str(e)}")
+            if limiter is not None:
+                limiter.release_error(started, error)
+            raise error from e
+
+        except httpx.TransportError as e:
+            error = NetworkError(f"Connection error: {str(e)}")
+            if limiter is not None:
+                limiter.release_error(started, error)
+            raise error from e
+
+        except BaseException:
+            if limiter is not None:
+                limiter.release(started, sample=False)
+            raise
+
+        status = response.status_code
+        if limiter is not None:
+            limiter.release(started, dropped=status == 429 or status >= 500)
+        if status == 429 and self.rate_limiter is not None:
+            self.rate_limiter.penalize(_retry_after(response))
+
+        return response
+
+    async def validate(
+        self,
+        email: str,
+        check_smtp: bool = False,
+        include_raw_dns: bool = False,
+        priority: str = "standard",
+        deadline: Optional[float] = None,
+    ) -> ValidationResult:
+        """
+        Validate a single email address
+
+        Args:
+            email: Email address to validate
+            check_smtp: Perform SMTP mailbox verification (requires PREMIUM plan)
+            include_raw_dns: Include raw DNS records in response (requires PREMIUM plan)
+            priority: Validation priority level ("low", "standard", "high")
+            deadline: Seconds for the call, retries included (default: the
+                retry policy's); coalesced callers share the first caller's
+
+        Returns:
+            ValidationResult object with validation details
+
+        Raises:
+            ValidationError: If email format is invalid
+            QuotaExceededError: If daily quota is exceeded
+            AuthenticationError: If authentication fails
+
+        Examples:
+            >>> result = await validator.validate("user@example.com")
+            >>> print(f"Valid: {result.valid}, Risk: {result.risk_score}")
+        """
+        validate_email_format(email)
+
+        if self.classifier is not None:
+            local = self.classifier.result_for(email)
+            if local is not None:
+                return local
+
+        if self._single_flight is None:
+            return await self._fetch_result(email, check_smtp, include_raw_dns, priority, deadline)
+
+        # Concurrent identical calls await this one instead of sending their own
+        key = cache_key(email, check_smtp, include_raw_dns, priority)
+        result: ValidationResult = await self._single_flight.do(
+            key, self._fetch_result, email, check_smtp, include_raw_dns, priority, deadline
+        )
+        return result
+
+    async def _fetch_result(
+        self,
+        email: str,
+        check_smtp: bool,
+        include_raw_dns: bool,
+        priority: str,
+        deadline: Optional[float] = None,
+    ) -> ValidationResult:
+        """POST to /validate/email"""
+        payload = {
+            "email": email,
+            "check_smtp": check_smtp,
+            "include_raw_dns": self._send_raw_dns([email], include_raw_dns),
+            "priority": priority,
+        }
+
+        data = await self._make_request(
+            "POST", "/validate/email", json=payload, deadline=deadline
+        )
+        if self.domain_cache is None:
+            return self._result_type.from_dict(data)
+        return self.domain_cache.decode(data, self._result_type, fill_dns=include_raw_dns)
+
+    async def validate_batch(
+        self,
+        emails: List[str],
+        check_smtp: bool = False,
+        include_raw_dns: bool = False,
+        batch_size: int = 100,
+        concurrent_requests: int = 5,
+        preflight: bool = False,
+        deadline: Optional[float] = None,
+    ) -> BatchResult:
+        """
+        Validate multiple email addresses in batch
+
+        Args:
+            emails: List of email addresses to validate (max 10,000)
+            check_smtp: Perform SMTP verification for all emails
+            include_raw_dns: Include raw DNS records in responses
+            batch_size: Number of emails per batch (1-1000)
+            concurrent_requests: Maximum concurrent validation requests (1-50)
+            preflight: Strip, syntax-check and deduplicate the emails locally
+                and send only the unique well-formed ones (see
+                MailSafePro.validate_batch)
+            deadline: Seconds for the request, retries included (default:
+                the retry policy's)
+
+        Returns:
+            BatchResult object with validation results
+
+        Raises:
+            ValidationError: If batch is invalid or too large
+            QuotaExceededError: If daily quota is exceeded
+        """
+        if not emails:
+            raise ValidationError("Email list cannot be empty")
+
+        if preflight:
+            plan = run_preflight(emails, batch_size)
+            logger.debug(f"Batch pre-flight: {plan.report}")
+            fetched = None
+            if plan.emails:
+                fetched = await self.validate_batch(
+                    plan.emails, check_smtp, include_raw_dns, batch_size, concurrent_requests,
+                    deadline=deadline,
+                )
+            return plan.merge(fetched)
+
+        if len(emails) > MailSafePro.MAX_BATCH_SIZE:
+            raise ValidationError("Cannot process more than 10,000 emails in a single batch")
+
+        if self.classifier is not None:
+            results = self.classifier.results_for(emails)
+            misses = [email for email, result in zip(emails, results) if result is None]
+            if len(misses) < len(emails):
+                fetched = None
+                if misses:
+                    fetched = await self._send_batch(
+                        misses, check_smtp, include_raw_dns, batch_size, concurrent_requests,
+                        deadline,
+                    )
+                    fetched_results = iter(fetched.results)
+                    results = [
+                        next(fetched_results, None) if result is None else result
+                        for result in results
+                    ]
+                return _merge_batch(results, fetched)
+
+        return await self._send_batch(
+            emails, check_smtp, include_raw_dns, batch_size, concurrent_requests, deadline
+        )
+
+    async def _send_batch(
+        self,
+        emails: List[str],
+        check_smtp: bool,
+        include_raw_dns: bool,
+        batch_size: int,
+        concurrent_requests: int,
+        deadline: Optional[float] = None,
+    ) -> BatchResult:
+        """POST one chunk to the /batch endpoint"""
+        payload = {
+            "emails": emails,
+            "check_smtp": check_smtp,
+            "include_raw_dns": self._send_raw_dns(emails, include_raw_dns),
+            "batch_size": batch_size,
+            "concurrent_requests": concurrent_requests,
+        }
+
+        data = await self._make_request("POST", "/batch", json=payload, deadline=deadline)
+        if self.domain_cache is None:
+            return BatchResult.from_dict(data, self._result_type)
+        return BatchResult.from_dict(
+            data, decode=self.domain_cache.decoder(self._result_type, fill_dns=include_raw_dns)
+        )
+
+    def _send_raw_dns(self, emails: List[str], include_raw_dns: bool) -> bool:
+        """include_raw_dns to send: False if the domain cache has fresh DNS for all emails"""
+        if not include_raw_dns or self.domain_cache is None:
+            return include_raw_dns
+        return not self.domain_cache.all_fresh(emails)
+
+    async def validate_file(
+        self,
+        file_path: Union[str, Path],
+        column: Optional[str] = None,
+        check_smtp: bool = False,
+        include_raw_dns: bool = False,
+    ) -> BatchResult:
+        """
+        Validate emails from CSV or TXT file
+
+        Args:
+            file_path: Path to CSV or TXT file
+            column: Column name for CSV files (optional, auto-detects if not provided)
+            check_smtp: Perform SMTP verification for all emails
+            include_raw_dns: Include raw DNS records in responses
+
+        Returns:
+            BatchResult object with validation results
+
+        Raises:
+            ValidationError: If file is invalid or too large
+            FileNotFoundError: If file doesn't exist
+            QuotaExceededError: If daily quota is exceeded
+        """
+        file_path = validate_file_path(file_path)
+
+        # Files are capped at 5MB by validate_file_path, so reading up front is cheap
+        files = {"file": (file_path.name, file_path.read_bytes())}
+
+        data_params = {
+            "check_smtp": str(check_smtp).lower(),
+            "include_raw_dns": str(include_raw_dns).lower(),
+        }
+
+        if column:
+            data_params["column"] = column
+
+        response_data = await self._make_request(
+            "POST",
+            "/batch/upload",
+            files=files,
+            data=data_params,
+        )
+
+        return BatchResult.from_dict(response_data, self._result_type)
+
+    async def get_quota(self) -> Dict[str, Any]:
+        """
+        Get current API quota and usage
+
+        Returns:
+            Dictionary with quota information
+        """
+        return await self._make_request("GET", "/v1/quota")
+
+    def coalescing_stats(self) -> Dict[str, int]:
+        """
+        Get counters for coalesced validate() calls
+
+        Returns:
+            Dictionary with executed and coalesced call counts and keys in
+            flight (empty if coalescing is disabled)
+        """
+        if self._single_flight is None:
+            return {}
+        return self._single_flight.stats()
+
+    def concurrency_stats(self) -> Dict[str, Any]:
+        """
+        Get the adaptive concurrency limiter's current limit and latency
+
+        Returns:
+            Dictionary from AdaptiveConcurrencyLimiter.stats() (empty if no
+            concurrency limiter is configured)
+        """
+        if self.concurrency_limiter is None:
+            return {}
+        return self.concurrency_limiter.stats()
+
+    def retry_stats(self) -> Dict[str, Any]:
+        """
+        Get retry counters and the remaining retry budget
+
+        Returns:
+            Dictionary from RetryPolicy.stats() (shared with every client
+            using the same policy)
+        """
+        return self.retry_policy.stats()
+
+    def __repr__(self) -> str:
+        auth_type = "JWT" if self._access_token else "API Key"
+        return f"<AsyncMailSafePro(auth={auth_type}, base_url={self.base_url})>"
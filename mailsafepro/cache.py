@@ -0,0 +1,753 @@
+"""
+Client-side caching of validation results
+"""
+
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import FrozenInstanceError, fields, is_dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Type, Union
+
+from .decoding import compile_decoder
+from .models import (
+    _SECTIONS,
+    DNSInfo,
+    LazyValidationResult,
+    ProviderAnalysis,
+    ValidationResult,
+)
+from .utils import normalize_email
+
+
+def cache_key(
+    email: str,
+    check_smtp: bool = False,
+    include_raw_dns: bool = False,
+    priority: str = "standard",
+) -> str:
+    """
+    Build the cache key for an email and its validation options
+
+    Args:
+        email: Email address (normalized before use)
+        check_smtp: SMTP verification flag
+        include_raw_dns: Raw DNS flag
+        priority: Validation priority level
+
+    Returns:
+        String key, stable across processes
+    """
+    return f"{normalize_email(email)}|{int(check_smtp)}|{int(include_raw_dns)}|{priority}"
+
+
+class CacheBackend:
+    """
+    Interface for ValidationResult cache backends
+
+    Backends map the string keys produced by :func:`cache_key` to results and
+    handle expiry themselves. Implementations must be safe to share between
+    threads. Use :class:`TieredCache` to stack backends.
+    """
+
+    def get(self, key: str) -> Optional[ValidationResult]:
+        """Return the cached result for ``key``, or None if missing or expired"""
+        raise NotImplementedError
+
+    def set(self, key: str, result: ValidationResult) -> None:
+        """Store ``result`` under ``key``"""
+        raise NotImplementedError
+
+    def delete(self, key: str) -> None:
+        """Remove ``key`` if present"""
+        raise NotImplementedError
+
+    def clear(self) -> None:
+        """Remove all entries"""
+        raise NotImplementedError
+
+    def stats(self) -> Dict[str, Any]:
+        """Get backend counters"""
+        raise NotImplementedError
+
+
+class ResultCache(CacheBackend):
+    """
+    Thread-safe in-memory LRU cache for ValidationResults with per-entry TTL
+
+    Args:
+        max_entries: Maximum number of cached results before LRU eviction
+        ttl: Seconds a result stays valid after being stored
+        clock: Monotonic time source (overridable for tests)
+
+    Examples:
+        >>> cache = ResultCache(max_entries=50_000, ttl=3600)
+        >>> validator = MailSafePro(api_key="key_xxx", cache=cache)
+        >>> validator.validate("user@example.com")  # network round trip
+        >>> validator.validate("user@example.com")  # served from cache
+        >>> cache.stats()["hits"]
+        1
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 10000,
+        ttl: float = 3600.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        if ttl <= 0:
+            raise ValueError("ttl must be positive")
+
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, Tuple[float, ValidationResult]]" = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+
+    def get(self, key: str) -> Optional[ValidationResult]:
+        """Return the cached result for ``key``, or None if missing or expired"""
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry is None:
+                self._misses += 1
+                return None
+
+            expires_at, result = entry
+            if self._clock() >= expires_at:
+                del self._entries[key]
+                self._expirations += 1
+                self._misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return result
+
+    def set(self, key: str, result: ValidationResult) -> None:
+        """Store ``result`` under ``key``, evicting the least recently used entries"""
+        with self._lock:
+            self._entries[key] = (self._clock() + self.ttl, result)
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def delete(self, key: str) -> None:
+        """Remove ``key`` if present"""
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Remove all entries (counters are kept)"""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Get cache counters
+
+        Returns:
+            Dictionary with hits, misses, evictions, expirations and size
+        """
+        with self._lock:
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "expirations": self._expirations,
+                "size": len(self._entries),
+            }
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def __repr__(self) -> str:
+        return f"<ResultCache(size={len(self)}, max_entries={self.max_entries}, ttl={self.ttl})>"
+
+
+class SQLiteCache(CacheBackend):
+    """
+    Persistent ValidationResult cache in a SQLite database (WAL mode)
+
+    Safe to share between threads and between processes on the same host:
+    every thread gets its own connection and WAL lets readers proceed while
+    one process writes. Expired rows are ignored on read and removed by
+    :meth:`compact`, which also trims the table to ``max_entries`` (oldest
+    first). Compaction runs automatically every ``compact_every`` writes.
+
+    Args:
+        path: Database file path (created if missing)
+        ttl: Seconds a result stays valid after being stored
+        max_entries: Row count that compaction trims the table down to
+        compact_every: Writes between automatic compactions (0 disables)
+        busy_timeout: Seconds to wait for another process's write lock
+        lazy_results: Return LazyValidationResult objects, as a client with
+            ``lazy_results=True`` does (default: False)
+        clock: Wall-clock time source (shared across processes)
+
+    Examples:
+        >>> disk = SQLiteCache("/var/cache/mailsafepro.db", ttl=86400)
+        >>> validator = MailSafePro(
+        ...     api_key="key_xxx",
+        ...     cache=TieredCache(ResultCache(max_entries=10_000), disk),
+        ... )
+    """
+
+    _SCHEMA = (
+        "CREATE TABLE IF NOT EXISTS results ("
+        " key TEXT PRIMARY KEY,"
+        " expires_at REAL NOT NULL,"
+        " value TEXT NOT NULL)",
+        "CREATE INDEX IF NOT EXISTS results_expires_at ON results (expires_at)",
+    )
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        ttl: float = 86400.0,
+        max_entries: int = 1_000_000,
+        compact_every: int = 10000,
+        busy_timeout: float = 30.0,
+        lazy_results: bool = False,
+        clock: Callable[[], float] = time.time,
+    ):
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        if ttl <= 0:
+            raise ValueError("ttl must be positive")
+
+        self.path = Path(path)
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.compact_every = compact_every
+        self.busy_timeout = busy_timeout
+        self._result_type = LazyValidationResult if lazy_results else ValidationResult
+        self._clock = clock
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._writes_since_compact = 0
+
+        connection = self._connection()
+        with connection:
+            for statement in self._SCHEMA:
+                connection.execute(statement)
+
+    def _connection(self) -> sqlite3.Connection:
+        """Per-thread connection, opened on first use"""
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = sqlite3.connect(str(self.path), timeout=self.busy_timeout)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            self._local.connection = connection
+        return connection
+
+    def get(self, key: str) -> Optional[ValidationResult]:
+        row = self._connection().execute(
+            "SELECT value FROM results WHERE key = ? AND expires_at > ?",
+            (key, self._clock()),
+        ).fetchone()
+
+        with self._lock:
+            if row is None:
+                self._misses += 1
+                return None
+            self._hits += 1
+
+        return self._result_type.from_dict(json.loads(row[0]))
+
+    def set(self, key: str, result: ValidationResult) -> None:
+        self.set_many([(key, result)])
+
+    def set_many(self, items: Iterable[Tuple[str, ValidationResult]]) -> None:
+        """Store several results in a single transaction"""
+        expires_at = self._clock() + self.ttl
+        rows = [(key, expires_at, json.dumps(result.to_dict())) for key, result in items]
+        self._write_rows(rows)
+
+    def _write_rows(self, rows: List[Tuple[str, float, str]]) -> None:
+        connection = self._connection()
+        with connection:
+            connection.executemany(
+                "INSERT OR REPLACE INTO results (key, expires_at, value) VALUES (?, ?, ?)",
+                rows,
+            )
+
+        with self._lock:
+            self._writes_since_compact += len(rows)
+            due = 0 < self.compact_every <= self._writes_since_compact
+            if due:
+                self._writes_since_compact = 0
+
+        if due:
+            self.compact()
+
+    def delete(self, key: str) -> None:
+        connection = self._connection()
+        with connection:
+            connection.execute("DELETE FROM results WHERE key = ?", (key,))
+
+    def clear(self) -> None:
+        connection = self._connection()
+        with connection:
+            connection.execute("DELETE FROM results")
+
+    def compact(self) -> int:
+        """
+        Delete expired rows and trim the table to ``max_entries``
+
+        Returns:
+            Number of rows removed
+        """
+        connection = self._connection()
+        with connection:
+            removed = connection.execute(
+                "DELETE FROM results WHERE expires_at <= ?", (self._clock(),)
+            ).rowcount
+            removed += connection.execute(
+                "DELETE FROM results WHERE key IN ("
+                " SELECT key FROM results ORDER BY expires_at DESC LIMIT -1 OFFSET ?)",
+                (self.max_entries,),
+            ).rowcount
+        return removed
+
+    def export(self, path: Union[str, Path]) -> int:
+        """
+        Write all live entries to a JSON Lines file for :meth:`warm_from`
+
+        Args:
+            path: Output file path
+
+        Returns:
+            Number of entries written
+        """
+        rows = self._connection().execute(
+            "SELECT key, expires_at, value FROM results WHERE expires_at > ?",
+            (self._clock(),),
+        )
+
+        count = 0
+        with open(path, "w", encoding="utf-8") as f:
+            for key, expires_at, value in rows:
+                entry = {"key": key, "expires_at": expires_at, "value": json.loads(value)}
+                f.write(json.dumps(entry) + "\n")
+                count += 1
+        return count
+
+    def warm_from(self, path: Union[str, Path], batch_size: int = 5000) -> int:
+        """
+        Bulk-load entries from a file written by :meth:`export`
+
+        Entries keep their original expiry; already expired ones are skipped.
+
+        Args:
+            path: JSON Lines export file
+            batch_size: Rows inserted per transaction
+
+        Returns:
+            Number of entries loaded
+        """
+        now = self._clock()
+        loaded = 0
+        rows: List[Tuple[str, float, str]] = []
+
+        with open(path, "r", encoding="utf-8") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                entry = json.loads(line)
+                if entry["expires_at"] <= now:
+                    continue
+                rows.append((entry["key"], entry["expires_at"], json.dumps(entry["value"])))
+                if len(rows) >= batch_size:
+                    self._write_rows(rows)
+                    loaded += len(rows)
+                    rows = []
+
+        if rows:
+            self._write_rows(rows)
+            loaded += len(rows)
+
+        return loaded
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Get cache counters
+
+        Returns:
+            Dictionary with this process's hits and misses and the shared row count
+        """
+        size = self._connection().execute("SELECT COUNT(*) FROM results").fetchone()[0]
+        with self._lock:
+            return {"hits": self._hits, "misses": self._misses, "size": size}
+
+    def close(self) -> None:
+        """Close this thread's connection"""
+        connection = getattr(self._local, "connection", None)
+        if connection is not None:
+            connection.close()
+            self._local.connection = None
+
+    def __repr__(self) -> str:
+        return f"<SQLiteCache(path={str(self.path)!r}, ttl={self.ttl})>"
+
+
+class TieredCache(CacheBackend):
+    """
+    Stack of cache backends, fastest first
+
+    Reads walk the tiers in order; a hit in a lower tier is copied into the
+    tiers above it. Writes go to every tier.
+
+    Args:
+        *tiers: Backends ordered from fastest to slowest
+
+    Examples:
+        >>> cache = TieredCache(ResultCache(), SQLiteCache("results.db"))
+    """
+
+    def __init__(self, *tiers: CacheBackend):
+        if not tiers:
+            raise ValueError("TieredCache needs at least one tier")
+        self.tiers = tiers
+
+    def get(self, key: str) -> Optional[ValidationResult]:
+        for i, tier in enumerate(self.tiers):
+            result = tier.get(key)
+            if result is not None:
+                for upper in self.tiers[:i]:
+                    upper.set(key, result)
+                return result
+        return None
+
+    def set(self, key: str, result: ValidationResult) -> None:
+        for tier in self.tiers:
+            tier.set(key, result)
+
+    def delete(self, key: str) -> None:
+        for tier in self.tiers:
+            tier.delete(key)
+
+    def clear(self) -> None:
+        for tier in self.tiers:
+            tier.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get counters for every tier
+
+        Returns:
+            Dictionary with a ``tiers`` list of per-backend stats
+        """
+        return {"tiers": [tier.stats() for tier in self.tiers]}
+
+    def __repr__(self) -> str:
+        return f"<TieredCache(tiers={list(self.tiers)!r})>"
+
+
+# ValidationResult fields except the domain-level sections, for decoding the
+# rest of a result before the shared sections are attached
+_decode_without_domain_sections = compile_decoder(
+    tuple(
+        spec for spec in ValidationResult.FIELDS
+        if spec.name not in ("provider_analysis", "dns_security")
+    ),
+    "ValidationResult",
+    init=False,
+)
+
+_PROVIDER_KEYS = _SECTIONS["provider_analysis"].keys
+_DNS_KEYS = _SECTIONS["dns_security"].keys
+
+
+def _raw_section(data: Dict[str, Any], keys: Tuple[str, ...]) -> Optional[Dict[str, Any]]:
+    """First non-empty section dictionary under ``keys``"""
+    for key in keys:
+        value: Optional[Dict[str, Any]] = data.get(key)
+        if value:
+            return value
+    return None
+
+
+class _ReadOnlyList(list):
+    """
+    List inside a shared section, refusing changes
+
+    Calling the class (as asdict() and copy do) builds an ordinary list, so
+    copies of a shared section are editable.
+    """
+
+    __slots__ = ()
+
+    def __new__(cls, *args: Any) -> Any:
+        return list(*args)
+
+    @classmethod
+    def of(cls, items: Iterable[Any]) -> "_ReadOnlyList":
+        obj = list.__new__(cls)
+        list.extend(obj, items)
+        return obj
+
+    def _refuse(self, *args: Any, **kwargs: Any) -> None:
+        raise TypeError("sections shared by DomainSectionCache are read-only")
+
+    append = extend = insert = _refuse  # type: ignore[assignment]
+    pop = remove = clear = sort = reverse = _refuse  # type: ignore[assignment]
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _refuse  # type: ignore[assignment]
+
+
+def _refuse_change(self: Any, name: str, *value: Any) -> None:
+    raise FrozenInstanceError(
+        f"cannot change {name!r}: sections shared by DomainSectionCache are read-only"
+    )
+
+
+_READ_ONLY_TYPES: Dict[type, type] = {}
+
+
+def _read_only_type(cls: type) -> type:
+    """
+    Subclass of a section dataclass whose instances refuse changes
+
+    Instances compare equal to the editable class, and copying one (or
+    dataclasses.replace()) gives an editable ``cls`` instance.
+    """
+    read_only = _READ_ONLY_TYPES.get(cls)
+    if read_only is not None:
+        return read_only
+
+    names = tuple(f.name for f in fields(cls))
+
+    def __eq__(self: Any, other: Any) -> Any:
+        if not isinstance(other, cls):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in names)
+
+    def __reduce__(self: Any) -> Any:
+        return cls, tuple(getattr(self, name) for name in names)
+
+    read_only = type(cls.__name__, (cls,), {
+        "__slots__": (),
+        "__module__": cls.__module__,
+        "__qualname__": cls.__qualname__,
+        "__doc__": cls.__doc__,
+        # Looked up on the class itself by some serializers (orjson)
+        "__dataclass_fields__": cls.__dataclass_fields__,  # type: ignore[attr-defined]
+        "__new__": lambda klass, *args, **kwargs: cls(*args, **kwargs),
+        "__setattr__": _refuse_change,
+        "__delattr__": _refuse_change,
+        "__eq__": __eq__,
+        "__hash__": None,
+        "__reduce__": __reduce__,
+    })
+    return _READ_ONLY_TYPES.setdefault(cls, read_only)
+
+
+def _freeze(value: Any) -> Any:
+    """Read-only copy of a section, its nested sections and lists"""
+    if isinstance(value, list):
+        return _ReadOnlyList.of(_freeze(item) for item in value)
+    if not is_dataclass(value) or isinstance(value, type):
+        return value
+
+    frozen: Any = object.__new__(_read_only_type(type(value)))
+    for f in fields(value):
+        object.__setattr__(frozen, f.name, _freeze(getattr(value, f.name)))
+    return frozen
+
+
+class _DomainEntry:
+    """Sections last seen for one domain and the responses they came from"""
+
+    __slots__ = ("provider_raw", "provider", "dns_raw", "dns", "resolved_at")
+
+    def __init__(self) -> None:
+        self.provider_raw: Optional[Dict[str, Any]] = None
+        self.provider: Optional[ProviderAnalysis] = None
+        self.dns_raw: Optional[Dict[str, Any]] = None
+        self.dns: Optional[DNSInfo] = None
+        self.resolved_at = 0.0
+
+
+class DomainSectionCache:
+    """
+    Per-domain cache sharing provider and DNS sections across results
+
+    Results for the same domain carry identical ``provider_analysis`` and
+    ``dns_security`` sections. When decoding through this cache, a section
+    whose response dictionary equals the one last seen for the domain reuses
+    the object built then, so a batch of 10k gmail.com results holds one
+    DNSInfo instead of 10k. Shared sections are read-only: assigning to them
+    raises ``dataclasses.FrozenInstanceError`` (copy one to edit it).
+
+    DNS resolved within ``ttl`` seconds is also used to fill in
+    ``dns_security`` when the client skips ``include_raw_dns`` for a request
+    whose domains are all fresh (see ``all_fresh``).
+
+    Args:
+        max_domains: Maximum number of domains kept before the least
+            recently used is evicted
+        ttl: Seconds DNS sections stay fresh enough to skip include_raw_dns
+        clock: Monotonic time source (overridable for tests)
+
+    Examples:
+        >>> domains = DomainSectionCache(ttl=600)
+        >>> validator = MailSafePro(api_key="key_xxx", domain_cache=domains)
+        >>> batch = validator.validate_batch(emails, include_raw_dns=True)
+        >>> domains.stats()["shared"]
+        9982
+    """
+
+    def __init__(
+        self,
+        max_domains: int = 10000,
+        ttl: float = 3600.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if max_domains < 1:
+            raise ValueError("max_domains must be at least 1")
+        if ttl <= 0:
+            raise ValueError("ttl must be positive")
+
+        self.max_domains = max_domains
+        self.ttl = ttl
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, _DomainEntry]" = OrderedDict()
+        self._shared = 0
+        self._built = 0
+        self._filled = 0
+        self._evictions = 0
+
+    def decode(
+        self,
+        data: Dict[str, Any],
+        result_type: Type[ValidationResult] = ValidationResult,
+        fill_dns: bool = False,
+    ) -> ValidationResult:
+        """
+        Decode a result, sharing its domain-level sections
+
+        Args:
+            data: API response dictionary for one email
+            result_type: Class to build (ValidationResult, LazyValidationResult
+                or a subclass)
+            fill_dns: Use the domain's fresh DNS when the response has none
+
+        Returns:
+            ``result_type`` instance
+        """
+        if issubclass(result_type, LazyValidationResult):
+            result = result_type.from_dict(data)
+        else:
+            result = _decode_without_domain_sections(result_type, data)
+
+        domain = result.email.rpartition("@")[2].strip().lower()
+        provider_raw = _raw_section(data, _PROVIDER_KEYS)
+        dns_raw = _raw_section(data, _DNS_KEYS)
+        now = self._clock()
+
+        with self._lock:
+            entry = self._entries.get(domain)
+            if entry is None:
+                entry = self._entries[domain] = _DomainEntry()
+                while len(self._entries) > self.max_domains:
+                    self._entries.popitem(last=False)
+                    self._evictions += 1
+            else:
+                self._entries.move_to_end(domain)
+
+            if entry.provider is not None and entry.provider_raw == provider_raw:
+                self._shared += 1
+            else:
+                entry.provider_raw = provider_raw
+                entry.provider = _freeze(ProviderAnalysis.from_dict(provider_raw or {}))
+                self._built += 1
+            provider = entry.provider
+
+            if dns_raw:
+                if entry.dns is not None and entry.dns_raw == dns_raw:
+                    self._shared += 1
+                else:
+                    entry.dns_raw = dns_raw
+                    entry.dns = _freeze(DNSInfo.from_dict(dns_raw))
+                    self._built += 1
+                entry.resolved_at = now
+                dns = entry.dns
+            elif fill_dns and entry.dns is not None and now - entry.resolved_at < self.ttl:
+                self._filled += 1
+                dns = entry.dns
+            else:
+                dns = None
+
+        result.provider_analysis = provider
+        result.dns_security = dns
+        return result
+
+    def decoder(
+        self,
+        result_type: Type[ValidationResult] = ValidationResult,
+        fill_dns: bool = False,
+    ) -> Callable[[Dict[str, Any]], ValidationResult]:
+        """decode() bound to ``result_type`` and ``fill_dns``, for BatchResult.from_dict"""
+        return lambda data: self.decode(data, result_type, fill_dns)
+
+    def all_fresh(self, emails: Iterable[str]) -> bool:
+        """
+        Check whether DNS for every email's domain was resolved within ``ttl``
+
+        Args:
+            emails: Email addresses
+
+        Returns:
+            True if ``include_raw_dns`` can be skipped for these emails
+        """
+        now = self._clock()
+        with self._lock:
+            for email in emails:
+                entry = self._entries.get(email.rpartition("@")[2].strip().lower())
+                if entry is None or entry.dns is None or now - entry.resolved_at >= self.ttl:
+                    return False
+        return True
+
+    def clear(self) -> None:
+        """Remove all domains (counters are kept)"""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Get cache counters
+
+        Returns:
+            Dictionary with sections shared and built, DNS sections filled in
+            for skipped include_raw_dns, evictions and domains held
+        """
+        with self._lock:
+            return {
+                "shared": self._shared,
+                "built": self._built,
+                "filled": self._filled,
+                "evictions": self._evictions,
+                "domains": len(self._entries),
+            }
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def __repr__(self) -> str:
+        return f"<DomainSectionCache(domains={len(self)}, ttl={self.ttl})>"
@@ -0,0 +1,403 @@
+"""
+Offline classification of disposable, no-reply and role addresses
+
+Some addresses need no round trip to judge: anything at a throwaway-mail
+domain is rejected whatever the mailbox. :class:`OfflineClassifier` answers
+those from local data and builds a ValidationResult marked as decided
+offline, leaving everything else to the API. No-reply (``noreply@``) and
+role (``info@``, ``support@``) addresses are recognized too, but only
+flagged: whether they can receive mail is still up to the API's checks.
+"""
+
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from .models import (
+    OFFLINE_TIER,
+    Metadata,
+    ProviderAnalysis,
+    SMTPInfo,
+    ValidationResult,
+)
+
+
+# Verdicts returned by OfflineClassifier.classify(); only DISPOSABLE is
+# answered offline, the others are flags
+DISPOSABLE = "disposable"
+NO_REPLY = "no_reply"
+ROLE = "role"
+
+BUILTIN_VERSION = "2025.11"
+
+# Well-known throwaway-mail services; load a maintained list with DomainSet.load()
+BUILTIN_DISPOSABLE_DOMAINS = (
+    "10minutemail.com", "10minutemail.net", "20minutemail.com", "burnermail.io",
+    "discard.email", "dispostable.com", "dropmail.me", "emailfake.com",
+    "emailondeck.com", "fakeinbox.com", "fakemail.net", "getairmail.com",
+    "getnada.com", "grr.la", "guerrillamail.biz", "guerrillamail.com",
+    "guerrillamail.de", "guerrillamail.info", "guerrillamail.net",
+    "guerrillamail.org", "guerrillamailblock.com", "harakirimail.com",
+    "inboxkitten.com", "incognitomail.org", "mailcatch.com", "maildrop.cc",
+    "mailforspam.com", "mailinator.com", "mailinator.net", "mailinator2.com",
+    "mailnesia.com", "mailpoof.com", "mintemail.com", "moakt.com", "mohmal.com",
+    "mytemp.email", "sharklasers.com", "spam4.me", "spamgourmet.com",
+    "temp-mail.io", "temp-mail.org", "tempail.com", "tempinbox.com",
+    "tempmailo.com", "tempr.email", "throwawaymail.com", "trashmail.com",
+    "trashmail.de", "trashmail.net", "yopmail.com", "yopmail.fr", "yopmail.net",
+)
+
+# Local-part prefixes of addresses that never read replies, compared after
+# lowercasing and removing ".", "-" and "_" ("No-Reply.billing" -> "noreplybilling")
+NO_REPLY_PREFIXES = (
+    "noreply", "donotreply", "dontreply", "noresponse", "donotrespond", "mailerdaemon",
+)
+
+# Local-part prefixes of shared team mailboxes. Unlike no-reply prefixes
+# these must end the word: "info", "info2" and "info.eu" match, "infotech"
+# doesn't
+ROLE_PREFIXES = (
+    "abuse", "accounts", "admin", "billing", "careers", "contact", "enquiries",
+    "feedback", "hello", "help", "helpdesk", "hostmaster", "hr", "info", "inquiries",
+    "jobs", "legal", "marketing", "media", "office", "orders", "postmaster", "press",
+    "privacy", "sales", "security", "service", "support", "team", "webmaster",
+)
+
+# Characters skipped when matching prefixes, and those that may follow a
+# role prefix
+_SEPARATORS = frozenset(".-_")
+_WORD_ENDS = frozenset(".-_+0123456789")
+
+# Free-mail domains and the provider name the API reports for them
+KNOWN_PROVIDERS = {
+    "gmail.com": "gmail",
+    "googlemail.com": "gmail",
+    "outlook.com": "outlook",
+    "hotmail.com": "outlook",
+    "live.com": "outlook",
+    "msn.com": "outlook",
+    "yahoo.com": "yahoo",
+    "ymail.com": "yahoo",
+    "icloud.com": "icloud",
+    "me.com": "icloud",
+    "mac.com": "icloud",
+    "aol.com": "aol",
+    "proton.me": "proton",
+    "protonmail.com": "proton",
+    "gmx.com": "gmx",
+    "gmx.de": "gmx",
+    "yandex.com": "yandex",
+    "yandex.ru": "yandex",
+    "zoho.com": "zoho",
+}
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+def _squash(local: str) -> str:
+    """Local part as compared with NO_REPLY_PREFIXES"""
+    return local.strip().lower().replace(".", "").replace("-", "").replace("_", "")
+
+
+def _build_trie(prefixes: Iterable[Tuple[str, Iterable[str]]]) -> Dict[str, Any]:
+    """
+    Character trie of squashed prefixes
+
+    Each node maps a character to the next node; the ``""`` key of a node
+    holds the verdict of the prefix ending there. When two lists share a
+    prefix, the first one listed keeps it.
+    """
+    root: Dict[str, Any] = {}
+    for verdict, words in prefixes:
+        for word in words:
+            node = root
+            for char in _squash(word):
+                node = node.setdefault(char, {})
+            if node is not root:
+                node.setdefault("", verdict)
+    return root
+
+
+def _match_prefix(trie: Dict[str, Any], local: str) -> Optional[str]:
+    """Verdict of the prefix ``local`` starts with, walking the trie once"""
+    local = local.strip().lower()
+    node = trie
+    for i, char in enumerate(local):
+        if char in _SEPARATORS:
+            continue
+        child: Optional[Dict[str, Any]] = node.get(char)
+        if child is None:
+            return None
+        node = child
+        verdict: Optional[str] = node.get("")
+        if verdict is None:
+            continue
+        if verdict != ROLE:
+            return verdict
+        following = local[i + 1:i + 2]
+        if not following or following in _WORD_ENDS:
+            return verdict
+    return None
+
+
+class DomainSet:
+    """
+    Versioned set of domains, matching subdomains of its members too
+
+    Membership is an exact hash lookup, so a hit is never a false positive.
+    ``"in.mailinator.com" in domains`` is True when ``mailinator.com`` is a
+    member; bare top-level domains never match.
+
+    Args:
+        domains: Domain names (case-insensitive)
+        version: Label identifying the list, recorded on offline results
+
+    Examples:
+        >>> domains = DomainSet(["mailinator.com"], version="2025.11")
+        >>> "x.mailinator.com" in domains
+        True
+    """
+
+    def __init__(self, domains: Iterable[str], version: str = "custom") -> None:
+        self._domains = frozenset(d.strip().lower() for d in domains if d.strip())
+        self.version = version
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> "DomainSet":
+        """
+        Read a domain list file
+
+        One domain per line; blank lines and lines starting with ``#`` are
+        skipped, except a ``# version: ...`` line, which sets the version.
+
+        Args:
+            path: Path to the list
+
+        Returns:
+            DomainSet with the file's domains
+        """
+        version = "custom"
+        domains = []
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if line.startswith("#"):
+                    key, _, value = line[1:].partition(":")
+                    if key.strip().lower() == "version" and value.strip():
+                        version = value.strip()
+                elif line:
+                    domains.append(line)
+        return cls(domains, version)
+
+    def save(self, path: Union[str, Path]) -> None:
+        """Write the set in the format read by load()"""
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(f"# version: {self.version}\n")
+            for domain in sorted(self._domains):
+                f.write(f"{domain}\n")
+
+    def __contains__(self, domain: object) -> bool:
+        domains = self._domains
+        if domain in domains:
+            return True
+        if not isinstance(domain, str):
+            return False
+
+        # Walk up the parents: a.b.example.com -> b.example.com -> example.com
+        dot = domain.find(".")
+        while dot != -1:
+            domain = domain[dot + 1:]
+            dot = domain.find(".")
+            if dot != -1 and domain in domains:
+                return True
+        return False
+
+    def __len__(self) -> int:
+        return len(self._domains)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._domains)
+
+    def __repr__(self) -> str:
+        return f"<DomainSet(version={self.version!r}, domains={len(self._domains)})>"
+
+
+class OfflineClassifier:
+    """
+    Answer plainly disposable addresses without calling the API
+
+    Only a domain in the disposable set (or a subdomain of one) is answered
+    offline. :meth:`classify` also flags local parts starting with a
+    no-reply or role prefix, matched with one walk of a prefix trie, but
+    those still go to the API: a ``support@`` mailbox may well exist. Known
+    free-mail providers only fill in ``provider_analysis`` on offline
+    results; knowing the provider alone doesn't decide deliverability.
+
+    Offline results have ``validation_tier == "offline"`` (see
+    ``ValidationResult.locally_decided``), ``processing_time`` 0.0, an SMTP
+    section with ``skip_reason="offline"`` and a ``validation_id`` naming the
+    domain list version.
+
+    Args:
+        disposable_domains: Disposable domain set (default: built-in list)
+        no_reply_prefixes: Local-part prefixes flagged as no-reply
+        role_prefixes: Local-part words flagged as role addresses
+        providers: Domain to provider name mapping (default: KNOWN_PROVIDERS)
+
+    Examples:
+        >>> classifier = OfflineClassifier()
+        >>> classifier.classify("someone@mailinator.com")
+        'disposable'
+        >>> classifier.classify("No-Reply@github.com")
+        'no_reply'
+        >>> classifier.classify("support@github.com")
+        'role'
+        >>> validator = MailSafePro(api_key="key_xxx", classifier=classifier)
+    """
+
+    def __init__(
+        self,
+        disposable_domains: Optional[DomainSet] = None,
+        no_reply_prefixes: Iterable[str] = NO_REPLY_PREFIXES,
+        role_prefixes: Iterable[str] = ROLE_PREFIXES,
+        providers: Optional[Dict[str, str]] = None,
+    ) -> None:
+        if disposable_domains is None:
+            disposable_domains = DomainSet(BUILTIN_DISPOSABLE_DOMAINS, BUILTIN_VERSION)
+        self.disposable_domains = disposable_domains
+        self.no_reply_prefixes = tuple(_squash(p) for p in no_reply_prefixes)
+        self.role_prefixes = tuple(_squash(p) for p in role_prefixes)
+        self.providers = KNOWN_PROVIDERS if providers is None else providers
+        self._prefixes = _build_trie(
+            ((NO_REPLY, self.no_reply_prefixes), (ROLE, self.role_prefixes))
+        )
+
+        # Only local parts starting with one of these can match a prefix, so
+        # the rest skip the trie
+        heads = set(self._prefixes)
+        self._heads = frozenset(heads | {h.upper() for h in heads} | set(".-_ \t\r\n"))
+
+    @property
+    def version(self) -> str:
+        """Version of the disposable domain list"""
+        return self.disposable_domains.version
+
+    def classify(self, email: str) -> Optional[str]:
+        """
+        Classify an email from local data alone
+
+        Args:
+            email: Email address
+
+        Returns:
+            DISPOSABLE, NO_REPLY, ROLE, or None if nothing is known offline
+        """
+        local, _, domain = email.rpartition("@")
+        if domain.strip().lower() in self.disposable_domains:
+            return DISPOSABLE
+        if local[:1] in self._heads:
+            return _match_prefix(self._prefixes, local)
+        return None
+
+    def classify_many(self, emails: Iterable[str]) -> List[Optional[str]]:
+        """
+        classify() for many emails, looking each distinct domain up once
+
+        Args:
+            emails: Email addresses
+
+        Returns:
+            One verdict (or None) per email, in order
+        """
+        domains = self.disposable_domains
+        heads = self._heads
+        prefixes = self._prefixes
+        disposable: Dict[str, bool] = {}
+        verdicts: List[Optional[str]] = []
+        append = verdicts.append
+
+        for email in emails:
+            local, _, domain = email.rpartition("@")
+            hit = disposable.get(domain)
+            if hit is None:
+                hit = disposable[domain] = domain.strip().lower() in domains
+
+            if hit:
+                append(DISPOSABLE)
+            elif local[:1] in heads:
+                append(_match_prefix(prefixes, local))
+            else:
+                append(None)
+
+        return verdicts
+
+    def provider(self, domain: str) -> Optional[str]:
+        """Provider name for a known free-mail domain, else None"""
+        return self.providers.get(domain.lower())
+
+    def result_for(self, email: str) -> Optional[ValidationResult]:
+        """
+        Build an offline ValidationResult for a confident verdict
+
+        Args:
+            email: Email address
+
+        Returns:
+            ValidationResult decided offline, or None if the API has to decide
+        """
+        if self.classify(email) != DISPOSABLE:
+            return None
+        return self._build(email)
+
+    def results_for(self, emails: List[str]) -> List[Optional[ValidationResult]]:
+        """
+        result_for() for many emails
+
+        Args:
+            emails: Email addresses
+
+        Returns:
+            One offline ValidationResult (or None) per email, in order
+        """
+        timestamp = _now()
+        return [
+            self._build(email, timestamp) if verdict == DISPOSABLE else None
+            for email, verdict in zip(emails, self.classify_many(emails))
+        ]
+
+    def _build(self, email: str, timestamp: Optional[str] = None) -> ValidationResult:
+        """ValidationResult for an email at a disposable domain"""
+        email = email.strip()
+        domain = email.rpartition("@")[2].lower()
+        provider = self.providers.get(domain) or domain.split(".")[0] or "unknown"
+
+        return ValidationResult(
+            email=email,
+            valid=False,
+            detail="Disposable email domain (decided offline)",
+            processing_time=0.0,
+            risk_score=1.0,
+            quality_score=0.0,
+            validation_tier=OFFLINE_TIER,
+            suggested_action="reject",
+            status="risky",
+            provider_analysis=ProviderAnalysis(provider=provider, reputation=0.0),
+            # Results are mutable, so each gets its own section
+            smtp=SMTPInfo(checked=False, skip_reason=OFFLINE_TIER),
+            metadata=Metadata(
+                timestamp=timestamp or _now(),
+                validation_id=f"{OFFLINE_TIER}-{self.version}",
+                cache_used=False,
+                client_plan="UNKNOWN",
+            ),
+        )
+
+    def __repr__(self) -> str:
+        return (
+            f"<OfflineClassifier(version={self.version!r}, "
+            f"disposable_domains={len(self.disposable_domains)}, "
+            f"no_reply_prefixes={len(self.no_reply_prefixes)}, "
+            f"role_prefixes={len(self.role_prefixes)})>"
+        )
@@ -3,13 +3,20 @@ MailSafePro Client - Main API client with authentication support
 """
 
 import logging
+import math
+import threading
 import time
-from datetime import datetime, timedelta
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from datetime import datetime, timedelta, timezone
+from email.utils import parsedate_to_datetime
+from itertools import islice
 from pathlib import Path
-from typing import List, Optional, Dict, Any, Union
+from typing import (
+    Callable, Deque, Generator, Iterable, Iterator, List, Optional, Dict, Any, Tuple, Union,
+)
 
 import requests
-from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
 from .exceptions import (
@@ -21,12 +28,157 @@ from .exceptions import (
     ServerError,
     NetworkError,
 )
-from .models import ValidationResult, BatchResult
+from .cache import CacheBackend, DomainSectionCache, cache_key
+from .classifier import OfflineClassifier
+from .compression import BodyCompression, CompressedBody
+from .concurrency import AdaptiveConcurrencyLimiter
+from .http2 import HTTP2Adapter, _require_http2
+from .pool import PooledHTTPAdapter, PoolStats
+from .transport import LeanTransport
+from .files import (
+    FileChunk,
+    FileJobSummary,
+    FileJournal,
+    JsonLinesSink,
+    OutputSink,
+    iter_file_chunks,
+)
+from .models import ValidationResult, LazyValidationResult, ValidationFailure, BatchResult
+from .preflight import preflight as run_preflight
+from .ratelimit import TokenBucket
+from .retry import RetryPolicy, transport_retries
+from .serialization import JSONSerializer, default_serializer
+from .singleflight import SingleFlight
+from .streaming import BatchResultStream
 from .utils import validate_email_format, validate_file_path
 
 
 logger = logging.getLogger(__name__)
 
+# /batch takes no priority; the API validates batches at standard priority,
+# so batch results are cached (and looked up) under that priority
+_BATCH_PRIORITY = "standard"
+
+
+def _retry_after(response: Any) -> Optional[float]:
+    """
+    Seconds from a response's Retry-After header
+    
+    The header is either a number of seconds (integer or, from some
+    proxies, decimal) or an HTTP date. Returns None when it is missing or
+    can't be read; a date in the past gives 0.
+    """
+    value = response.headers.get("Retry-After")
+    if not value:
+        return None
+    try:
+        seconds = float(value)
+    except ValueError:
+        try:
+            when = parsedate_to_datetime(value)
+        except (TypeError, ValueError, IndexError, OverflowError):
+            return None
+        if when is None:
+            return None
+        if when.tzinfo is None:
+            when = when.replace(tzinfo=timezone.utc)
+        seconds = (when - datetime.now(timezone.utc)).total_seconds()
+    if not math.isfinite(seconds):
+        return None
+    return max(seconds, 0.0)
+
+
+def _network_error(error: requests.exceptions.RequestException) -> NetworkError:
+    """SDK exception for a requests timeout or connection error"""
+    if isinstance(error, requests.exceptions.Timeout):
+        return NetworkError(f"Request timeout: {str(error)}")
+    return NetworkError(f"Connection error: {str(error)}")
+
+
+def _wire_size(response: requests.Response, decoded: int) -> int:
+    """
+    Bytes of a response body read off the wire
+    
+    urllib3 doesn't count chunked bodies; those fall back to Content-Length
+    and then to the decoded size.
+    """
+    tell = getattr(response.raw, "tell", None)
+    read = tell() if tell is not None else 0
+    if read:
+        return read
+    length = response.headers.get("Content-Length", "")
+    return int(length) if length.isdigit() else decoded
+
+
+def _raise_for_api_error(response: Any) -> None:
+    """
+    Map an API error response to the SDK exception hierarchy
+    
+    Works with any response object exposing ``status_code``, ``headers`` and
+    ``json()``, so the sync and async clients share one error mapping.
+    
+    Raises:
+        Various EmailValidatorError subclasses
+    """
+    # Handle rate limiting
+    if response.status_code == 429:
+        seconds = _retry_after(response)
+        retry_after = 60 if seconds is None else int(math.ceil(seconds))
+        raise RateLimitError(
+            f"Rate limit exceeded. Retry after {retry_after} seconds",
+            retry_after=retry_after,
+        )
+    
+    # Handle authentication errors
+    if response.status_code in (401, 403):
+        raise AuthenticationError(
+            response.json().get("detail", "Authentication failed")
+        )
+    
+    # Handle validation errors
+    if response.status_code == 422:
+        error_detail = response.json().get("detail", "Validation error")
+        raise ValidationError(error_detail)
+    
+    # Handle quota exceeded
+    if response.status_code == 403:
+        error_detail = response.json().get("detail", "")
+        if "quota" in error_detail.lower() or "limit" in error_detail.lower():
+            raise QuotaExceededError(error_detail)
+    
+    # Handle server errors
+    if response.status_code >= 500:
+        raise ServerError(
+            f"Server error: {response.status_code}",
+            status_code=response.status_code,
+        )
+
+
+def _merge_batch(
+    results: List[Optional[ValidationResult]],
+    fetched: Optional[BatchResult],
+) -> BatchResult:
+    """
+    Combine locally answered results with the /batch response for the rest
+    
+    Args:
+        results: Results in input order, with the fetched ones filled in
+            (None entries are dropped)
+        fetched: BatchResult for the emails that were sent (None if none were)
+    """
+    merged = [result for result in results if result is not None]
+    valid_count = sum(1 for result in merged if result.valid)
+    
+    return BatchResult(
+        count=len(merged),
+        valid_count=valid_count,
+        invalid_count=len(merged) - valid_count,
+        processing_time=fetched.processing_time if fetched else 0.0,
+        average_time=fetched.average_time if fetched else 0.0,
+        results=merged,
+        summary=fetched.summary if fetched else None,
+    )
+
 
 class MailSafePro:
     """
@@ -40,8 +192,44 @@ class MailSafePro:
         api_key: API key for authentication (optional if using JWT)
         base_url: Base URL of the API (default: production)
         timeout: Request timeout in seconds (default: 30)
-        max_retries: Maximum number of retries for failed requests (default: 3)
+        max_retries: Maximum number of retries for failed requests (default: 3;
+            ignored when ``retry_policy`` is given)
         enable_logging: Enable debug logging (default: False)
+        cache: Client-side result cache backend (default: None, no caching)
+        coalesce_requests: Share one request between concurrent identical
+            validate() calls (default: True)
+        background_refresh: Renew JWT tokens from a background thread before
+            they expire, so requests never wait on auth (default: False)
+        rate_limiter: Client-side token bucket shared by all requests
+            (default: None, no client-side limiting)
+        concurrency_limiter: Adaptive limit on concurrent requests, raised
+            while the API keeps up and cut on 429/5xx or rising latency
+            (default: None, no limit)
+        lazy_results: Return LazyValidationResult objects, which build
+            nested sections only when accessed (default: False)
+        serializer: JSON codec for request and response bodies (default:
+            orjson or ujson when installed, else the standard library)
+        classifier: Answer addresses at disposable domains
+            offline, without an API call (default: None, send everything)
+        domain_cache: Share provider and DNS sections between results for
+            the same domain, and skip include_raw_dns for domains resolved
+            recently (default: None)
+        http2: Multiplex requests over HTTP/2 connections, falling back to
+            HTTP/1.1 for servers without HTTP/2 (default: False; requires
+            the ``http2`` extra)
+        compression: Compress large request bodies and record the bytes
+            saved per request (default: None, send bodies as-is)
+        pool_size: Keep-alive connections kept per host (default: 10,
+            grown on demand for validate_many() workers)
+        pool_block: Make threads wait for a pooled connection instead of
+            opening extra ones that are discarded after use; the pool then
+            keeps its size (default: False)
+        lean_transport: Send JSON requests straight through urllib3,
+            skipping the per-call overhead of ``requests`` (default:
+            False; not with ``http2=True`` or proxies)
+        retry_policy: Backoff, retry budget and deadlines for retries
+            (default: a RetryPolicy with ``max_retries``); share one
+            between clients to share its budget
     
     Examples:
         >>> # API Key authentication
@@ -59,6 +247,15 @@ class MailSafePro:
     
     DEFAULT_BASE_URL = "https://api.mailsafepro.com"
     USER_AGENT = "MailSafePro-Python-SDK/1.0.0"
+    MAX_BATCH_SIZE = 10000
+    
+    # Connections kept per host; grown on demand to cover fan-out workers
+    DEFAULT_POOL_SIZE = 10
+    
+    # Background refresh runs this long before the token's refresh deadline
+    # (capped at half the token lifetime), and retries this often on failure
+    REFRESH_AHEAD = 30.0
+    REFRESH_RETRY_DELAY = 5.0
     
     def __init__(
         self,
@@ -67,43 +264,81 @@ class MailSafePro:
         timeout: int = 30,
         max_retries: int = 3,
         enable_logging: bool = False,
+        cache: Optional[CacheBackend] = None,
+        coalesce_requests: bool = True,
+        background_refresh: bool = False,
+        rate_limiter: Optional[TokenBucket] = None,
+        concurrency_limiter: Optional[AdaptiveConcurrencyLimiter] = None,
+        lazy_results: bool = False,
+        serializer: Optional[JSONSerializer] = None,
+        classifier: Optional[OfflineClassifier] = None,
+        domain_cache: Optional[DomainSectionCache] = None,
+        http2: bool = False,
+        compression: Optional[BodyCompression] = None,
+        pool_size: Optional[int] = None,
+        pool_block: bool = False,
+        lean_transport: bool = False,
+        retry_policy: Optional[RetryPolicy] = None,
     ):
         """Initialize MailSafePro client with API key"""
+        if http2:
+            _require_http2()
+            if lean_transport:
+                raise ValueError("lean_transport cannot be combined with http2")
+        
         self.base_url = (base_url or self.DEFAULT_BASE_URL).rstrip("/")
         self.timeout = timeout
-        self.max_retries = max_retries
+        self.retry_policy = retry_policy or RetryPolicy(max_retries=max_retries)
+        self.max_retries = self.retry_policy.max_retries
+        self.cache = cache
+        self.rate_limiter = rate_limiter
+        self.concurrency_limiter = concurrency_limiter
+        self._result_type = LazyValidationResult if lazy_results else ValidationResult
+        self.serializer = serializer or default_serializer()
+        self.classifier = classifier
+        self.domain_cache = domain_cache
+        self.http2 = http2
+        self.compression = compression
         self._api_key = api_key
+        self._single_flight = SingleFlight() if coalesce_requests else None
+        self._pool_size = pool_size or self.DEFAULT_POOL_SIZE
+        self._pool_block = pool_block
+        self._pool_stats = PoolStats()
+        self._pool_lock = threading.Lock()
+        # Adapters and transports replaced by a pool resize stay open until
+        # no request is in flight
+        self._in_flight = 0
+        self._retired: List[Any] = []
         
-        # JWT token management
+        # JWT token management; _token_lock serializes refreshes
         self._access_token: Optional[str] = None
         self._refresh_token: Optional[str] = None
         self._token_expires_at: Optional[datetime] = None
+        self._token_lifetime = 0.0
+        self._token_lock = threading.Lock()
+        self._background_refresh = background_refresh
+        self._refresher: Optional[threading.Thread] = None
+        self._refresher_stop = threading.Event()
         
         # Setup logging
         if enable_logging:
             logging.basicConfig(level=logging.DEBUG)
             logger.setLevel(logging.DEBUG)
         
-        # Setup session with retry strategy
+        # Setup session and connection pools
         self._session = self._create_session()
         
+        # The session still serves auth calls and file uploads
+        self._transport: Optional[LeanTransport] = None
+        if lean_transport:
+            self._transport = self._create_transport()
+        
         logger.debug(f"MailSafePro initialized: base_url={self.base_url}")
     
     def _create_session(self) -> requests.Session:
-        """Create requests session with retry strategy and exponential backoff"""
+        """Create requests session; retries are left to retry_policy"""
         session = requests.Session()
-        
-        # Retry on 429 (rate limit), 500, 502, 503, 504
-        retry_strategy = Retry(
-            total=self.max_retries,
-            backoff_factor=1,  # 1s, 2s, 4s
-            status_forcelist=[429, 500, 502, 503, 504],
-            allowed_methods=["GET", "POST", "PUT", "DELETE"],
-        )
-        
-        adapter = HTTPAdapter(max_retries=retry_strategy)
-        session.mount("http://", adapter)
-        session.mount("https://", adapter)
+        self._mount_adapter(session, transport_retries())
         
         # Default headers
         session.headers.update({
@@ -114,6 +349,114 @@ class MailSafePro:
         
         return session
     
+    def _create_transport(self) -> Optional[LeanTransport]:
+        """
+        Create the lean transport, with the session's retries and TLS settings
+        
+        Returns None, leaving requests to the session, when a proxy applies
+        to the API URL.
+        """
+        if self._proxy_configured(self._session):
+            logger.debug("Proxy configured, lean transport disabled")
+            return None
+        settings = self._session.merge_environment_settings(self.base_url, {}, None, None, None)
+        
+        headers = {
+            "User-Agent": self.USER_AGENT,
+            "Content-Type": "application/json",
+            "Accept": "application/json",
+        }
+        if self._api_key:
+            headers["X-API-Key"] = self._api_key
+        
+        return LeanTransport(
+            headers,
+            self._session.get_adapter(self.base_url).max_retries,  # type: ignore[attr-defined]
+            pool_size=self._pool_size,
+            pool_block=self._pool_block,
+            stats=self._pool_stats,
+            verify=settings["verify"],
+            cert=settings["cert"],
+        )
+    
+    def _proxy_configured(self, session: requests.Session) -> bool:
+        """Whether the session or environment sends API requests through a proxy"""
+        settings = session.merge_environment_settings(self.base_url, {}, None, None, None)
+        return bool(requests.utils.select_proxy(self.base_url, settings["proxies"]))
+    
+    def _mount_adapter(self, session: requests.Session, retry_strategy: Retry) -> None:
+        """
+        Mount an HTTPAdapter keeping up to _pool_size connections per host
+        
+        With ``http2`` the HTTP/2 adapter is mounted instead, unless a proxy
+        applies to the API URL: it can't send through one.
+        """
+        adapter: Union[PooledHTTPAdapter, HTTP2Adapter]
+        use_http2 = self.http2
+        if use_http2 and self._proxy_configured(session):
+            logger.debug("Proxy configured, HTTP/2 disabled")
+            use_http2 = False
+        if use_http2:
+            adapter = HTTP2Adapter(max_connections=self._pool_size, max_retries=retry_strategy)
+        else:
+            adapter = PooledHTTPAdapter(
+                stats=self._pool_stats,
+                pool_connections=self._pool_size,
+                pool_maxsize=self._pool_size,
+                pool_block=self._pool_block,
+                max_retries=retry_strategy,
+            )
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+    
+    def _ensure_pool_size(self, size: int) -> None:
+        """
+        Grow the connection pool to hold at least ``size`` connections
+        
+        Without this, threads beyond the pool size open connections that are
+        discarded after each request instead of being reused. A blocking
+        pool keeps its configured size, and HTTP/2 needs no more connections
+        for more threads. The replaced adapter is closed once no request is
+        in flight, as other threads may still be sending through it.
+        """
+        with self._pool_lock:
+            if size <= self._pool_size or self._pool_block:
+                return
+            
+            old_adapter = self._session.get_adapter(self.base_url)
+            if not isinstance(old_adapter, PooledHTTPAdapter):
+                return
+            
+            self._pool_size = size
+            self._mount_adapter(self._session, old_adapter.max_retries)
+            self._retired.append(old_adapter)
+            if self._transport is not None:
+                self._retired.append(self._transport)
+                self._transport = self._create_transport()
+        
+        self._close_retired()
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Connection pool grown to {size}")
+    
+    def _begin_request(self) -> None:
+        with self._pool_lock:
+            self._in_flight += 1
+    
+    def _end_request(self) -> None:
+        with self._pool_lock:
+            self._in_flight -= 1
+        if self._retired:
+            self._close_retired()
+    
+    def _close_retired(self) -> None:
+        """Close adapters replaced by a resize, unless a request is in flight"""
+        with self._pool_lock:
+            if self._in_flight or not self._retired:
+                return
+            retired, self._retired = self._retired, []
+        for old in retired:
+            old.close()
+    
     @classmethod
     def login(
         cls,
@@ -123,6 +466,7 @@ class MailSafePro:
         timeout: int = 30,
         max_retries: int = 3,
         enable_logging: bool = False,
+        **options: Any,
     ) -> "MailSafePro":
         """
         Create MailSafePro instance with JWT authentication
@@ -134,6 +478,7 @@ class MailSafePro:
             timeout: Request timeout in seconds
             max_retries: Maximum number of retries
             enable_logging: Enable debug logging
+            **options: Additional constructor options (e.g. ``cache``)
         
         Returns:
             MailSafePro instance with JWT tokens
@@ -153,13 +498,13 @@ class MailSafePro:
             timeout=timeout,
             max_retries=max_retries,
             enable_logging=enable_logging,
+            **options,
         )
         
         # Perform login
         try:
-            url = f"{instance.base_url}/auth/login"
-            response = instance._session.post(
-                url,
+            response = instance._post_auth(
+                "/auth/login",
                 json={"email": username, "password": password},
                 timeout=timeout,
             )
@@ -168,19 +513,17 @@ class MailSafePro:
                 raise AuthenticationError("Invalid credentials")
             
             response.raise_for_status()
-            data = response.json()
             
-            instance._access_token = data.get("access_token")
-            instance._refresh_token = data.get("refresh_token")
+            with instance._token_lock:
+                instance._store_tokens(response.json())
             
-            # Calculate token expiration (default 15 minutes - 1 minute buffer)
-            expires_in = data.get("expires_in", 900)
-            instance._token_expires_at = datetime.now() + timedelta(seconds=expires_in - 60)
+            if instance._background_refresh:
+                instance._start_refresher()
             
             logger.info(f"Successfully logged in as {username}")
             return instance
             
-        except requests.exceptions.RequestException as e:
+        except (requests.exceptions.RequestException, NetworkError) as e:
             raise AuthenticationError(f"Login failed: {str(e)}") from e
     
     def logout(self) -> None:
@@ -197,66 +540,178 @@ class MailSafePro:
         if not self._access_token:
             raise AuthenticationError("Not authenticated with JWT")
         
+        self._stop_refresher()
+        
         try:
             headers = self._get_auth_headers()
-            url = f"{self.base_url}/auth/logout"
-            
-            response = self._session.post(url, headers=headers, timeout=self.timeout)
+            response = self._post_auth("/auth/logout", headers=headers)
             response.raise_for_status()
             
-            # Clear tokens
-            self._access_token = None
-            self._refresh_token = None
-            self._token_expires_at = None
+            self._clear_tokens()
             
             logger.info("Successfully logged out")
             
-        except requests.exceptions.RequestException as e:
+        except (requests.exceptions.RequestException, NetworkError) as e:
             logger.error(f"Logout failed: {str(e)}")
             # Still clear tokens even if logout request fails
+            self._clear_tokens()
+    
+    def warmup(self, connections: Optional[int] = None) -> int:
+        """
+        Open keep-alive connections to the API ahead of the first requests
+        
+        Connections are opened concurrently, so the DNS lookups, TCP
+        connects and TLS handshakes are paid once up front rather than by
+        the first requests. Asking for more than the pool holds grows the
+        pool, replacing its connections, unless ``pool_block`` is set.
+        
+        Args:
+            connections: Connections to have open (default: the pool size)
+        
+        Returns:
+            Number of connections opened; idle ones already open are
+            counted towards ``connections`` but not returned. Always 0 with
+            ``http2=True``, where requests share one connection.
+        
+        Examples:
+            >>> validator = MailSafePro(api_key="key_xxx", pool_size=32)
+            >>> validator.warmup(32)
+            32
+        """
+        count = self._pool_size if connections is None else connections
+        self._ensure_pool_size(count)
+        
+        transport = self._transport
+        if transport is not None:
+            return transport.warmup(self.base_url, count)
+        
+        adapter = self._session.get_adapter(self.base_url)
+        if not isinstance(adapter, PooledHTTPAdapter):
+            return 0
+        
+        # The verify/cert/proxy settings requests would apply, so the
+        # connections land in the pool requests will use
+        settings = self._session.merge_environment_settings(self.base_url, {}, None, None, None)
+        return adapter.warmup(
+            self.base_url,
+            count,
+            verify=settings["verify"],
+            cert=settings["cert"],
+            proxies=settings["proxies"],
+        )
+    
+    def close(self) -> None:
+        """Stop the background token refresher and close pooled connections"""
+        self._stop_refresher()
+        self._session.close()
+        if self._transport is not None:
+            self._transport.close()
+        with self._pool_lock:
+            retired, self._retired = self._retired, []
+        for old in retired:
+            old.close()
+    
+    def _store_tokens(self, data: Dict[str, Any]) -> None:
+        """Store tokens from a login/refresh response (caller holds _token_lock)"""
+        # Calculate token expiration (default 15 minutes - 1 minute buffer)
+        expires_in = data.get("expires_in", 900)
+        self._token_lifetime = max(expires_in - 60, 0)
+        
+        self._access_token = data.get("access_token")
+        self._refresh_token = data.get("refresh_token")
+        self._token_expires_at = datetime.now() + timedelta(seconds=self._token_lifetime)
+    
+    def _clear_tokens(self) -> None:
+        with self._token_lock:
             self._access_token = None
             self._refresh_token = None
             self._token_expires_at = None
     
+    def _token_expired(self) -> bool:
+        expires_at = self._token_expires_at
+        return expires_at is not None and datetime.now() >= expires_at
+    
     def _refresh_access_token(self) -> None:
-        """Refresh access token using refresh token"""
+        """Refresh access token using refresh token (caller holds _token_lock)"""
         if not self._refresh_token:
             raise AuthenticationError("No refresh token available")
         
         try:
-            url = f"{self.base_url}/auth/refresh"
-            response = self._session.post(
-                url,
+            response = self._post_auth(
+                "/auth/refresh",
                 headers={"Authorization": f"Bearer {self._refresh_token}"},
-                timeout=self.timeout,
             )
             
             if response.status_code == 401:
                 raise AuthenticationError("Refresh token expired, please login again")
             
             response.raise_for_status()
-            data = response.json()
-            
-            self._access_token = data.get("access_token")
-            self._refresh_token = data.get("refresh_token")
-            
-            expires_in = data.get("expires_in", 900)
-            self._token_expires_at = datetime.now() + timedelta(seconds=expires_in - 60)
+            self._store_tokens(response.json())
             
             logger.debug("Access token refreshed successfully")
             
-        except requests.exceptions.RequestException as e:
+        except (requests.exceptions.RequestException, NetworkError) as e:
             raise AuthenticationError(f"Token refresh failed: {str(e)}") from e
     
+    def _start_refresher(self) -> None:
+        """Start the background token refresh thread if it isn't running"""
+        if self._refresher is not None and self._refresher.is_alive():
+            return
+        
+        self._refresher_stop.clear()
+        self._refresher = threading.Thread(
+            target=self._refresh_loop,
+            name="mailsafepro-token-refresh",
+            daemon=True,
+        )
+        self._refresher.start()
+    
+    def _stop_refresher(self) -> None:
+        self._refresher_stop.set()
+        refresher = self._refresher
+        if refresher is not None and refresher is not threading.current_thread():
+            refresher.join()
+        self._refresher = None
+    
+    def _refresh_loop(self) -> None:
+        """Renew the token shortly before its refresh deadline until stopped"""
+        while not self._refresher_stop.is_set():
+            with self._token_lock:
+                expires_at = self._token_expires_at
+                ahead = min(self.REFRESH_AHEAD, self._token_lifetime / 2)
+            
+            if expires_at is None:
+                return
+            
+            delay = (expires_at - datetime.now()).total_seconds() - ahead
+            if delay > 0 and self._refresher_stop.wait(delay):
+                return
+            
+            try:
+                with self._token_lock:
+                    if self._access_token is None or self._refresher_stop.is_set():
+                        return
+                    # A request thread may have refreshed while we slept
+                    if self._token_expires_at == expires_at:
+                        self._refresh_access_token()
+            
+            except AuthenticationError as e:
+                logger.warning(f"Background token refresh failed: {str(e)}")
+                if self._refresher_stop.wait(self.REFRESH_RETRY_DELAY):
+                    return
+    
     def _get_auth_headers(self) -> Dict[str, str]:
         """Get authentication headers (API Key or JWT)"""
         headers = {}
         
         if self._access_token:
             # Check if token needs refresh (1 minute before expiration)
-            if self._token_expires_at and datetime.now() >= self._token_expires_at:
-                logger.debug("Token expired, refreshing...")
-                self._refresh_access_token()
+            if self._token_expired():
+                with self._token_lock:
+                    # Only the first thread through refreshes; the rest reuse its token
+                    if self._token_expired():
+                        logger.debug("Token expired, refreshing...")
+                        self._refresh_access_token()
             
             headers["Authorization"] = f"Bearer {self._access_token}"
         
@@ -273,7 +728,7 @@ class MailSafePro:
         method: str,
         endpoint: str,
         **kwargs
-    ) -> Dict[str, Any]:
+    ) -> Any:
         """
         Make HTTP request with error handling and retries
         
@@ -289,64 +744,202 @@ class MailSafePro:
             Various EmailValidatorError subclasses
         """
         url = f"{self.base_url}{endpoint}"
-        headers = {**self._get_auth_headers(), **kwargs.pop("headers", {})}
+        extra = kwargs.pop("headers", None)
+        transport = self._transport
+        if transport is None or "files" in kwargs:
+            headers = {**self._get_auth_headers(), **(extra or {})}
+        elif self._access_token is None and self._api_key and not extra:
+            # The transport's static headers already carry the API key
+            headers = transport.headers
+        else:
+            headers = {**transport.headers, **self._get_auth_headers(), **(extra or {})}
         
-        try:
-            logger.debug(f"{method} {url}")
-            response = self._session.request(
-                method,
-                url,
-                headers=headers,
-                timeout=kwargs.pop("timeout", self.timeout),
-                **kwargs
-            )
-            
-            # Handle rate limiting
-            if response.status_code == 429:
-                retry_after = int(response.headers.get("Retry-After", 60))
-                raise RateLimitError(
-                    f"Rate limit exceeded. Retry after {retry_after} seconds",
-                    retry_after=retry_after,
+        # Encoded once up front; retries resend the same bytes (compressed
+        # afresh on each attempt, as the body is sent)
+        if "json" in kwargs:
+            encoded = self.serializer.dumps(kwargs.pop("json"))
+            body: Union[bytes, CompressedBody] = encoded
+            if self.compression is not None:
+                body = self.compression.encode(encoded)
+                if isinstance(body, CompressedBody):
+                    headers = {**headers, "Content-Encoding": body.encoding}
+            kwargs["data"] = body
+        
+        stream = kwargs.get("stream", False)
+        timeout = kwargs.pop("timeout", self.timeout)
+        deadline = kwargs.pop("deadline", None)
+        
+        def send(attempt_timeout: Any) -> Any:
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire()
+            return self._send_request(method, url, headers, timeout=attempt_timeout, **kwargs)
+        
+        response = self._retrying(send, timeout, deadline, paced=self.rate_limiter is not None)
+        return self._read_response(response, stream)
+    
+    def _retrying(
+        self,
+        send: Callable[[Any], Any],
+        timeout: Any,
+        deadline: Optional[float] = None,
+        paced: bool = False,
+    ) -> Any:
+        """
+        Call ``send(timeout)`` until it returns a final response
+        
+        Responses with a retryable status and NetworkErrors are retried as
+        ``retry_policy`` decides; once it gives up, the last response is
+        returned or the last NetworkError raised.
+        
+        Args:
+            send: Sends one attempt with the given timeout
+            timeout: Per-attempt timeout, cut to what is left of the deadline
+            deadline: Total seconds for the call (default: the policy's)
+            paced: The rate limiter spaces attempts, so don't sleep as well
+        """
+        call = self.retry_policy.begin(deadline)
+        while True:
+            try:
+                response = send(call.timeout(timeout))
+            except NetworkError:
+                cause = "network"
+                delay = call.next_delay(cause)
+                if delay is None:
+                    raise
+            else:
+                status = response.status_code
+                if status not in self.retry_policy.retry_statuses:
+                    call.finish()
+                    return response
+                cause = str(status)
+                # A 429 under a rate limiter has penalized it, and the
+                # limiter holds the next attempt instead of a sleep here
+                delay = call.next_delay(
+                    cause, _retry_after(response), deferred=paced and status == 429
                 )
+                if delay is None:
+                    return response
+                response.close()
             
-            # Handle authentication errors
-            if response.status_code in (401, 403):
-                raise AuthenticationError(
-                    response.json().get("detail", "Authentication failed")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Retry {call.retries} after {cause} in {delay:.2f}s")
+            if delay > 0:
+                time.sleep(delay)
+    
+    def _send_request(
+        self,
+        method: str,
+        url: str,
+        headers: Dict[str, str],
+        **kwargs
+    ) -> Any:
+        """
+        Send one attempt, holding a concurrency slot
+        
+        Goes through the lean transport when there is one, except for file
+        uploads, which the session encodes. Returns the response whatever
+        its status.
+        
+        Raises:
+            NetworkError: On timeouts and connection errors
+        """
+        stream = kwargs.pop("stream", False)
+        timeout = kwargs.pop("timeout", self.timeout)
+        limiter = self.concurrency_limiter
+        started = limiter.acquire() if limiter is not None else 0.0
+        
+        self._begin_request()
+        try:
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"{method} {url}")
+            response: Any
+            transport = self._transport
+            if transport is not None and "files" not in kwargs:
+                response = transport.request(
+                    method, url, headers, kwargs.get("data"), timeout, stream
                 )
-            
-            # Handle validation errors
-            if response.status_code == 422:
-                error_detail = response.json().get("detail", "Validation error")
-                raise ValidationError(error_detail)
-            
-            # Handle quota exceeded
-            if response.status_code == 403:
-                error_detail = response.json().get("detail", "")
-                if "quota" in error_detail.lower() or "limit" in error_detail.lower():
-                    raise QuotaExceededError(error_detail)
-            
-            # Handle server errors
-            if response.status_code >= 500:
-                raise ServerError(
-                    f"Server error: {response.status_code}",
-                    status_code=response.status_code,
+            else:
+                response = self._session.request(
+                    method,
+                    url,
+                    headers=headers,
+                    timeout=timeout,
+                    stream=stream,
+                    **kwargs
                 )
-            
-            response.raise_for_status()
-            return response.json()
-            
-        except requests.exceptions.Timeout as e:
-            raise NetworkError(f"Request timeout: {str(e)}") from e
         
-        except requests.exceptions.ConnectionError as e:
-            raise NetworkError(f"Connection error: {str(e)}") from e
+        except (requests.exceptions.Timeout, requests.exceptions.ConnectionError) as e:
+            error = _network_error(e)
+            if limiter is not None:
+                limiter.release_error(started, error)
+            raise error from e
         
         except requests.exceptions.RequestException as e:
-            if isinstance(e, requests.exceptions.HTTPError):
-                # Already handled above
-                raise
+            if limiter is not None:
+                limiter.release(started, sample=False)
             raise EmailValidatorError(f"Request failed: {str(e)}") from e
+        
+        except BaseException:
+            if limiter is not None:
+                limiter.release(started, sample=False)
+            raise
+        
+        finally:
+            self._end_request()
+        
+        status = response.status_code
+        if limiter is not None:
+            limiter.release(started, dropped=status == 429 or status >= 500)
+        if status == 429 and self.rate_limiter is not None:
+            self.rate_limiter.penalize(_retry_after(response))
+        return response
+    
+    def _read_response(self, response: Any, stream: bool) -> Any:
+        """
+        Map the final response to SDK exceptions and decode it
+        
+        Returns the decoded JSON body, or the response itself with its body
+        unread when ``stream`` is set.
+        """
+        _raise_for_api_error(response)
+        
+        response.raise_for_status()
+        if stream:
+            return response
+        
+        body = response.content
+        self._record_transfer(response, len(body))
+        try:
+            return self.serializer.loads(body)
+        except ValueError as e:
+            raise EmailValidatorError(f"Invalid JSON response: {str(e)}") from e
+    
+    def _post_auth(self, endpoint: str, **kwargs: Any) -> requests.Response:
+        """POST to an auth endpoint through the session, retried like any request"""
+        url = f"{self.base_url}{endpoint}"
+        timeout = kwargs.pop("timeout", self.timeout)
+        
+        def send(attempt_timeout: Any) -> requests.Response:
+            self._begin_request()
+            try:
+                return self._session.post(url, timeout=attempt_timeout, **kwargs)
+            except (requests.exceptions.Timeout, requests.exceptions.ConnectionError) as e:
+                raise _network_error(e) from e
+            finally:
+                self._end_request()
+        
+        response: requests.Response = self._retrying(send, timeout)
+        return response
+    
+    def _record_transfer(self, response: requests.Response, size: int) -> None:
+        """Add an exchange whose ``size``-byte body has been read to the compression stats"""
+        if self.compression is not None:
+            self.compression.record(
+                response.request.path_url.split("?", 1)[0],
+                response.request.body,
+                size,
+                _wire_size(response, size),
+            )
     
     def validate(
         self,
@@ -354,6 +947,7 @@ class MailSafePro:
         check_smtp: bool = False,
         include_raw_dns: bool = False,
         priority: str = "standard",
+        deadline: Optional[float] = None,
     ) -> ValidationResult:
         """
         Validate a single email address
@@ -363,6 +957,8 @@ class MailSafePro:
             check_smtp: Perform SMTP mailbox verification (requires PREMIUM plan)
             include_raw_dns: Include raw DNS records in response (requires PREMIUM plan)
             priority: Validation priority level ("low", "standard", "high")
+            deadline: Seconds for the call, retries included (default: the
+                retry policy's); coalesced callers share the first caller's
         
         Returns:
             ValidationResult object with validation details
@@ -383,15 +979,154 @@ class MailSafePro:
         """
         validate_email_format(email)
         
+        if self.classifier is not None:
+            local = self.classifier.result_for(email)
+            if local is not None:
+                return local
+        
+        key = cache_key(email, check_smtp, include_raw_dns, priority)
+        
+        if self.cache is not None:
+            cached = self.cache.get(key)
+            if cached is not None:
+                return cached
+        
+        if self._single_flight is None:
+            return self._fetch_result(key, email, check_smtp, include_raw_dns, priority, deadline)
+        
+        # Concurrent identical calls wait for this one instead of sending their own
+        result: ValidationResult = self._single_flight.do(
+            key, self._fetch_result, key, email, check_smtp, include_raw_dns, priority, deadline
+        )
+        return result
+    
+    def _fetch_result(
+        self,
+        key: str,
+        email: str,
+        check_smtp: bool,
+        include_raw_dns: bool,
+        priority: str,
+        deadline: Optional[float] = None,
+    ) -> ValidationResult:
+        """POST to /validate/email and store the result in the cache"""
         payload = {
             "email": email,
             "check_smtp": check_smtp,
-            "include_raw_dns": include_raw_dns,
+            "include_raw_dns": self._send_raw_dns([email], include_raw_dns),
             "priority": priority,
         }
         
-        data = self._make_request("POST", "/validate/email", json=payload)
-        return ValidationResult.from_dict(data)
+        data = self._make_request("POST", "/validate/email", json=payload, deadline=deadline)
+        if self.domain_cache is None:
+            result = self._result_type.from_dict(data)
+        else:
+            result = self.domain_cache.decode(data, self._result_type, fill_dns=include_raw_dns)
+        
+        if self.cache is not None:
+            self.cache.set(key, result)
+        
+        return result
+    
+    def validate_many(
+        self,
+        emails: Iterable[str],
+        workers: int = 8,
+        ordered: bool = True,
+        check_smtp: bool = False,
+        include_raw_dns: bool = False,
+        priority: str = "standard",
+    ) -> List[Union[ValidationResult, ValidationFailure]]:
+        """
+        Validate many emails through /validate/email on a thread pool
+        
+        Unlike validate_batch(), every email gets the full single-email
+        response (including ``priority``). The connection pool is grown to
+        ``workers`` so each thread keeps its own keep-alive connection.
+        
+        Args:
+            emails: Email addresses to validate
+            workers: Number of concurrent validate() calls
+            ordered: Return results in input order (True) or completion order (False)
+            check_smtp: Perform SMTP verification for all emails
+            include_raw_dns: Include raw DNS records in responses
+            priority: Validation priority level ("low", "standard", "high")
+        
+        Returns:
+            One ValidationResult per email, or a ValidationFailure for emails
+            whose validation raised (invalid format, server error, ...)
+        
+        Raises:
+            ValidationError: If workers is less than 1
+            AuthenticationError: If authentication fails
+            QuotaExceededError: If daily quota is exceeded
+        
+        Examples:
+            >>> validator = MailSafePro(api_key="key_xxx")
+            >>> results = validator.validate_many(emails, workers=16, priority="high")
+            >>> failed = [r for r in results if isinstance(r, ValidationFailure)]
+        """
+        return list(self.validate_many_iter(
+            emails, workers, ordered, check_smtp, include_raw_dns, priority
+        ))
+    
+    def validate_many_iter(
+        self,
+        emails: Iterable[str],
+        workers: int = 8,
+        ordered: bool = True,
+        check_smtp: bool = False,
+        include_raw_dns: bool = False,
+        priority: str = "standard",
+    ) -> Iterator[Union[ValidationResult, ValidationFailure]]:
+        """
+        Streaming form of validate_many()
+        
+        The input is consumed lazily, at most two emails per worker ahead of
+        the consumer, so arbitrarily long streams can be validated in
+        bounded memory.
+        
+        Args:
+            emails: Any iterable of email addresses (list, generator, file, ...)
+            workers: Number of concurrent validate() calls
+            ordered: Yield results in input order (True) or completion order (False)
+            check_smtp: Perform SMTP verification for all emails
+            include_raw_dns: Include raw DNS records in responses
+            priority: Validation priority level ("low", "standard", "high")
+        
+        Yields:
+            ValidationResult or ValidationFailure objects, one per input email
+        
+        Raises:
+            ValidationError: If workers is less than 1
+            AuthenticationError: If authentication fails
+            QuotaExceededError: If daily quota is exceeded
+        
+        Examples:
+            >>> validator = MailSafePro(api_key="key_xxx")
+            >>> for result in validator.validate_many_iter(emails, workers=16):
+            ...     print(f"{result.email}: {result.valid}")
+        """
+        if workers < 1:
+            raise ValidationError("workers must be at least 1")
+        
+        def validate_one(email: str) -> Union[ValidationResult, ValidationFailure]:
+            try:
+                return self.validate(email, check_smtp, include_raw_dns, priority)
+            except (AuthenticationError, QuotaExceededError):
+                # Not specific to this email: every other one would fail too
+                raise
+            except EmailValidatorError as e:
+                return ValidationFailure(email=email, error=e)
+        
+        return self._run_windowed(
+            validate_one,
+            iter(emails),
+            workers=workers,
+            window=2 * workers,
+            ordered=ordered,
+            thread_name_prefix="mailsafepro-many",
+        )
     
     def validate_batch(
         self,
@@ -400,6 +1135,8 @@ class MailSafePro:
         include_raw_dns: bool = False,
         batch_size: int = 100,
         concurrent_requests: int = 5,
+        preflight: bool = False,
+        deadline: Optional[float] = None,
     ) -> BatchResult:
         """
         Validate multiple email addresses in batch
@@ -410,6 +1147,13 @@ class MailSafePro:
             include_raw_dns: Include raw DNS records in responses
             batch_size: Number of emails per batch (1-1000)
             concurrent_requests: Maximum concurrent validation requests (1-50)
+            preflight: Strip, syntax-check and deduplicate the emails locally
+                and send only the unique well-formed ones. Results are
+                returned in input order; emails rejected locally are
+                ValidationFailure entries, and the 10,000 limit applies to
+                the unique emails.
+            deadline: Seconds for the request, retries included (default:
+                the retry policy's)
         
         Returns:
             BatchResult object with validation results
@@ -425,23 +1169,400 @@ class MailSafePro:
             >>> print(f"Valid: {result.valid_count}/{result.count}")
             >>> for res in result.results:
             ...     print(f"{res.email}: {res.valid}")
+            
+            >>> # Drop blanks, typos and duplicates before sending
+            >>> result = validator.validate_batch(uploaded_rows, preflight=True)
+            >>> print(f"Saved {result.preflight.emails_saved} validations")
         """
         if not emails:
             raise ValidationError("Email list cannot be empty")
         
-        if len(emails) > 10000:
+        if preflight:
+            return self._preflight_batch(
+                emails, check_smtp, include_raw_dns, batch_size, concurrent_requests, deadline
+            )
+        
+        if len(emails) > self.MAX_BATCH_SIZE:
             raise ValidationError("Cannot process more than 10,000 emails in a single batch")
         
+        return self._post_batch(
+            emails, check_smtp, include_raw_dns, batch_size, concurrent_requests, deadline
+        )
+    
+    def _preflight_batch(
+        self,
+        emails: List[str],
+        check_smtp: bool,
+        include_raw_dns: bool,
+        batch_size: int,
+        concurrent_requests: int,
+        deadline: Optional[float] = None,
+    ) -> BatchResult:
+        """Send only the unique well-formed emails and expand the results"""
+        plan = run_preflight(emails, batch_size)
+        
+        if len(plan.emails) > self.MAX_BATCH_SIZE:
+            raise ValidationError("Cannot process more than 10,000 emails in a single batch")
+        
+        logger.debug(f"Batch pre-flight: {plan.report}")
+        
+        fetched = None
+        if plan.emails:
+            fetched = self._post_batch(
+                plan.emails, check_smtp, include_raw_dns, batch_size, concurrent_requests, deadline
+            )
+        return plan.merge(fetched)
+    
+    def _post_batch(
+        self,
+        emails: List[str],
+        check_smtp: bool,
+        include_raw_dns: bool,
+        batch_size: int,
+        concurrent_requests: int,
+        deadline: Optional[float] = None,
+    ) -> BatchResult:
+        """
+        Validate one already-checked chunk through the cache and /batch endpoint
+        
+        Emails answered offline by the classifier or found in the cache are
+        answered locally and only the rest are sent. When every email has to
+        be sent, the server's BatchResult is returned unchanged.
+        """
+        cache = self.cache
+        if cache is None and self.classifier is None:
+            return self._send_batch(
+                emails, check_smtp, include_raw_dns, batch_size, concurrent_requests, deadline
+            )
+        
+        results, keys = self._answer_locally(emails, check_smtp, include_raw_dns)
+        misses = [email for email, result in zip(emails, results) if result is None]
+        
+        if len(misses) == len(emails):
+            batch = self._send_batch(
+                emails, check_smtp, include_raw_dns, batch_size, concurrent_requests, deadline
+            )
+            if cache is not None:
+                for key, sent in zip(keys, batch.results):
+                    cache.set(key, sent)
+            return batch
+        
+        fetched: Optional[BatchResult] = None
+        if misses:
+            fetched = self._send_batch(
+                misses, check_smtp, include_raw_dns, batch_size, concurrent_requests, deadline
+            )
+            fetched_results = iter(fetched.results)
+            for i, result in enumerate(results):
+                if result is None:
+                    result = results[i] = next(fetched_results, None)
+                    if result is not None and cache is not None:
+                        cache.set(keys[i], result)
+        
+        return _merge_batch(results, fetched)
+    
+    def _answer_locally(
+        self,
+        emails: List[str],
+        check_smtp: bool,
+        include_raw_dns: bool,
+    ) -> Tuple[List[Optional[ValidationResult]], List[str]]:
+        """
+        Results the offline classifier or the cache can give without a request
+        
+        Returns:
+            Results in input order (None for emails to send), and the cache
+            key of each email (empty without a cache)
+        """
+        results: List[Optional[ValidationResult]]
+        if self.classifier is not None:
+            results = self.classifier.results_for(emails)
+        else:
+            results = [None] * len(emails)
+        
+        keys: List[str] = []
+        if self.cache is not None:
+            keys = [
+                cache_key(email, check_smtp, include_raw_dns, _BATCH_PRIORITY) for email in emails
+            ]
+            for i, key in enumerate(keys):
+                if results[i] is None:
+                    results[i] = self.cache.get(key)
+        
+        return results, keys
+    
+    def _send_batch(
+        self,
+        emails: List[str],
+        check_smtp: bool,
+        include_raw_dns: bool,
+        batch_size: int,
+        concurrent_requests: int,
+        deadline: Optional[float] = None,
+    ) -> BatchResult:
+        """POST one chunk to the /batch endpoint"""
         payload = {
             "emails": emails,
             "check_smtp": check_smtp,
-            "include_raw_dns": include_raw_dns,
+            "include_raw_dns": self._send_raw_dns(emails, include_raw_dns),
+            "batch_size": batch_size,
+            "concurrent_requests": concurrent_requests,
+        }
+        
+        data = self._make_request("POST", "/batch", json=payload, deadline=deadline)
+        if self.domain_cache is None:
+            return BatchResult.from_dict(data, self._result_type)
+        return BatchResult.from_dict(
+            data, decode=self.domain_cache.decoder(self._result_type, fill_dns=include_raw_dns)
+        )
+    
+    def _send_raw_dns(self, emails: List[str], include_raw_dns: bool) -> bool:
+        """include_raw_dns to send: False if the domain cache has fresh DNS for all emails"""
+        if not include_raw_dns or self.domain_cache is None:
+            return include_raw_dns
+        return not self.domain_cache.all_fresh(emails)
+    
+    def validate_batch_stream(
+        self,
+        emails: List[str],
+        check_smtp: bool = False,
+        include_raw_dns: bool = False,
+        batch_size: int = 100,
+        concurrent_requests: int = 5,
+        read_size: int = 64 * 1024,
+    ) -> BatchResultStream:
+        """
+        Validate a batch and decode the response while it downloads
+        
+        Like validate_batch(), but each result is parsed from the response
+        body as soon as its bytes arrive and yielded on its own, so peak
+        memory stays flat however many results the batch has. The
+        batch-level fields of the returned stream are filled in once it has
+        been consumed.
+        
+        As with validate_batch(), emails the offline classifier or the cache
+        can answer are not sent; their results are yielded in input order
+        with the streamed ones.
+        
+        Args:
+            emails: List of email addresses to validate (max 10,000)
+            check_smtp: Perform SMTP verification for all emails
+            include_raw_dns: Include raw DNS records in responses
+            batch_size: Number of emails per batch (1-1000)
+            concurrent_requests: Maximum concurrent validation requests (1-50)
+            read_size: Bytes read from the connection at a time
+        
+        Returns:
+            BatchResultStream yielding ValidationResult objects
+        
+        Raises:
+            ValidationError: If batch is invalid or too large
+            QuotaExceededError: If daily quota is exceeded
+            NetworkError: If the connection fails while streaming
+        
+        Examples:
+            >>> validator = MailSafePro(api_key="key_xxx")
+            >>> with validator.validate_batch_stream(emails) as stream:
+            ...     for result in stream:
+            ...         print(f"{result.email}: {result.valid}")
+            >>> print(f"Valid: {stream.valid_count}/{stream.count}")
+        """
+        if not emails:
+            raise ValidationError("Email list cannot be empty")
+        
+        if len(emails) > self.MAX_BATCH_SIZE:
+            raise ValidationError("Cannot process more than 10,000 emails in a single batch")
+        
+        cache = self.cache
+        local: Optional[List[Optional[ValidationResult]]] = None
+        store: Optional[Callable[[int, ValidationResult], Any]] = None
+        misses = emails
+        if cache is not None or self.classifier is not None:
+            local, keys = self._answer_locally(emails, check_smtp, include_raw_dns)
+            misses = [email for email, result in zip(emails, local) if result is None]
+            if len(misses) == len(emails):
+                local = None
+            if cache is not None:
+                def cache_result(i: int, result: ValidationResult) -> None:
+                    cache.set(keys[i], result)
+                store = cache_result
+        
+        decode = None
+        if self.domain_cache is not None:
+            decode = self.domain_cache.decoder(self._result_type, fill_dns=include_raw_dns)
+        
+        if not misses:
+            return BatchResultStream(None, result_type=self._result_type, local=local)
+        
+        payload = {
+            "emails": misses,
+            "check_smtp": check_smtp,
+            "include_raw_dns": self._send_raw_dns(misses, include_raw_dns),
             "batch_size": batch_size,
             "concurrent_requests": concurrent_requests,
         }
         
-        data = self._make_request("POST", "/batch", json=payload)
-        return BatchResult.from_dict(data)
+        response = self._make_request("POST", "/batch", json=payload, stream=True)
+        
+        def read_body() -> Iterator[bytes]:
+            size = 0
+            try:
+                for chunk in response.iter_content(chunk_size=read_size):
+                    size += len(chunk)
+                    yield chunk
+            except requests.exceptions.RequestException as e:
+                raise NetworkError(f"Connection error while streaming: {str(e)}") from e
+            self._record_transfer(response, size)
+        
+        return BatchResultStream(
+            read_body(),
+            close=response.close,
+            result_type=self._result_type,
+            decode=decode,
+            local=local,
+            store=store,
+        )
+    
+    def validate_batch_iter(
+        self,
+        emails: Iterable[str],
+        chunk_size: int = 1000,
+        max_in_flight: Optional[int] = None,
+        ordered: bool = True,
+        check_smtp: bool = False,
+        include_raw_dns: bool = False,
+        batch_size: int = 100,
+        concurrent_requests: int = 5,
+    ) -> Iterator[ValidationResult]:
+        """
+        Validate an arbitrarily large stream of emails in pipelined batches
+        
+        The input is consumed lazily and split into API-sized chunks. Up to
+        ``max_in_flight`` ``/batch`` requests run at once, and results are
+        yielded as chunks finish, so memory stays bounded by the in-flight
+        window rather than by the size of the input. With a
+        ``concurrency_limiter`` the window opens up to the limiter's
+        ``max_limit`` and the limiter decides how many requests are sent.
+        
+        Args:
+            emails: Any iterable of email addresses (list, generator, file, ...)
+            chunk_size: Emails per /batch request (1-10,000)
+            max_in_flight: Maximum concurrent /batch requests (default: 4, or
+                the concurrency limiter's max_limit)
+            ordered: Yield results in input order (True) or chunk completion order (False)
+            check_smtp: Perform SMTP verification for all emails
+            include_raw_dns: Include raw DNS records in responses
+            batch_size: Server-side batch size per request (1-1000)
+            concurrent_requests: Server-side concurrency per request (1-50)
+        
+        Yields:
+            ValidationResult objects, one per input email
+        
+        Raises:
+            ValidationError: If chunk_size or max_in_flight is out of range
+            QuotaExceededError: If daily quota is exceeded
+        
+        Examples:
+            >>> validator = MailSafePro(api_key="key_xxx")
+            >>> with open("emails.txt") as f:
+            ...     emails = (line.strip() for line in f)
+            ...     for result in validator.validate_batch_iter(emails, chunk_size=5000):
+            ...         print(f"{result.email}: {result.valid}")
+        """
+        if not 1 <= chunk_size <= self.MAX_BATCH_SIZE:
+            raise ValidationError(f"chunk_size must be between 1 and {self.MAX_BATCH_SIZE}")
+        
+        max_in_flight = self._resolve_in_flight(max_in_flight)
+        
+        return self._iter_batches(
+            iter(emails),
+            chunk_size,
+            max_in_flight,
+            ordered,
+            (check_smtp, include_raw_dns, batch_size, concurrent_requests),
+        )
+    
+    def _resolve_in_flight(self, max_in_flight: Optional[int]) -> int:
+        """Default and check the number of concurrent /batch requests"""
+        if max_in_flight is None:
+            limiter = self.concurrency_limiter
+            max_in_flight = limiter.max_limit if limiter is not None else 4
+        
+        if max_in_flight < 1:
+            raise ValidationError("max_in_flight must be at least 1")
+        
+        return max_in_flight
+    
+    def _iter_batches(
+        self,
+        emails: Iterator[str],
+        chunk_size: int,
+        max_in_flight: int,
+        ordered: bool,
+        batch_options: tuple,
+    ) -> Iterator[ValidationResult]:
+        """Generator behind validate_batch_iter (arguments already validated)"""
+        chunks = iter(lambda: list(islice(emails, chunk_size)), [])
+        batches = self._run_windowed(
+            lambda chunk: self._post_batch(chunk, *batch_options),
+            chunks,
+            workers=max_in_flight,
+            window=max_in_flight,
+            ordered=ordered,
+            thread_name_prefix="mailsafepro-batch",
+        )
+        for batch in batches:
+            yield from batch.results
+    
+    def _run_windowed(
+        self,
+        fn: Callable[[Any], Any],
+        items: Iterator[Any],
+        workers: int,
+        window: int,
+        ordered: bool,
+        thread_name_prefix: str,
+    ) -> Generator[Any, None, None]:
+        """
+        Map ``fn`` over ``items`` on a thread pool, at most ``window`` at a time
+        
+        Items are pulled from the iterator only as the window has room, so
+        memory stays bounded however long the input is. Results are yielded
+        in input order, or in completion order when ``ordered`` is False.
+        """
+        self._ensure_pool_size(workers)
+        executor = ThreadPoolExecutor(
+            max_workers=workers,
+            thread_name_prefix=thread_name_prefix,
+        )
+        pending: Deque["Future[Any]"] = deque()
+        
+        def fill_window() -> None:
+            for item in islice(items, window - len(pending)):
+                pending.append(executor.submit(fn, item))
+        
+        try:
+            fill_window()
+            
+            while pending:
+                if ordered:
+                    future = pending.popleft()
+                else:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    future = done.pop()
+                    pending.remove(future)
+                
+                result = future.result()
+                
+                # Keep the window full while the caller consumes this result
+                fill_window()
+                
+                yield result
+        
+        finally:
+            for future in pending:
+                future.cancel()
+            executor.shutdown(wait=True)
     
     def validate_file(
         self,
@@ -477,8 +1598,9 @@ class MailSafePro:
         """
         file_path = validate_file_path(file_path)
         
-        # Prepare multipart form data
-        files = {"file": (file_path.name, open(file_path, "rb"))}
+        # Read once so every retry uploads the whole file; files are capped
+        # at 5MB by validate_file_path, and requests buffers the body anyway
+        files = {"file": (file_path.name, file_path.read_bytes())}
         
         data_params = {
             "check_smtp": str(check_smtp).lower(),
@@ -488,24 +1610,167 @@ class MailSafePro:
         if column:
             data_params["column"] = column
         
-        try:
-            # Note: multipart/form-data doesn't need Content-Type header
-            headers = self._get_auth_headers()
-            headers.pop("Content-Type", None)  # Let requests set it
-            
-            response_data = self._make_request(
-                "POST",
-                "/batch/upload",
-                files=files,
-                data=data_params,
-                headers=headers,
+        # Note: multipart/form-data doesn't need Content-Type header
+        headers = self._get_auth_headers()
+        headers.pop("Content-Type", None)  # Let requests set it
+        
+        response_data = self._make_request(
+            "POST",
+            "/batch/upload",
+            files=files,
+            data=data_params,
+            headers=headers,
+        )
+        
+        return BatchResult.from_dict(response_data, self._result_type)
+    
+    def validate_file_stream(
+        self,
+        file_path: Union[str, Path],
+        output: OutputSink,
+        column: Optional[str] = None,
+        chunk_size: int = 1000,
+        max_in_flight: Optional[int] = None,
+        journal: Optional[Union[str, Path]] = None,
+        check_smtp: bool = False,
+        include_raw_dns: bool = False,
+        batch_size: int = 100,
+        concurrent_requests: int = 5,
+        encoding: str = "utf-8",
+    ) -> FileJobSummary:
+        """
+        Validate a CSV or TXT file of any size, resumably
+        
+        The file is read in chunks of ``chunk_size`` emails, which are sent
+        to /batch with up to ``max_in_flight`` requests at once. Results are
+        appended to ``output`` in file order as chunks finish, so memory use
+        doesn't grow with the file. The email column is auto-detected like
+        validate_file() unless ``column`` is given.
+        
+        After every chunk a checkpoint journal records how far the job got.
+        Running the same call again after a crash resumes from the last
+        finished chunk, dropping any output written after it.
+        
+        Args:
+            file_path: Path to CSV or TXT file (no size limit)
+            output: Path of a JSON Lines file to append results to, or a
+                callable receiving each chunk's list of ValidationResult
+            column: Column name for CSV files (optional, auto-detects if not provided)
+            chunk_size: Emails per /batch request (1-10,000)
+            max_in_flight: Maximum concurrent /batch requests (default: 4, or
+                the concurrency limiter's max_limit)
+            journal: Checkpoint journal path (default: ``<output>.journal``
+                for file outputs, none for callables)
+            check_smtp: Perform SMTP verification for all emails
+            include_raw_dns: Include raw DNS records in responses
+            batch_size: Server-side batch size per request (1-1000)
+            concurrent_requests: Server-side concurrency per request (1-50)
+            encoding: Text encoding of the file
+        
+        Returns:
+            FileJobSummary with counts across this and any resumed runs
+        
+        Raises:
+            ValidationError: If the file, column or journal is invalid
+            FileNotFoundError: If file doesn't exist
+            QuotaExceededError: If daily quota is exceeded
+        
+        Examples:
+            >>> validator = MailSafePro(api_key="key_xxx")
+            >>> summary = validator.validate_file_stream("export.csv", "results.jsonl")
+            >>> print(f"Valid: {summary.valid_count}/{summary.count}")
+        """
+        path = validate_file_path(file_path, max_size=None)
+        
+        if not 1 <= chunk_size <= self.MAX_BATCH_SIZE:
+            raise ValidationError(f"chunk_size must be between 1 and {self.MAX_BATCH_SIZE}")
+        
+        max_in_flight = self._resolve_in_flight(max_in_flight)
+        
+        if journal is None and isinstance(output, (str, Path)):
+            journal = f"{output}.journal"
+        
+        checkpoint = None
+        resume_offset: Optional[int] = None
+        summary = FileJobSummary()
+        if journal is not None:
+            stat = path.stat()
+            checkpoint = FileJournal(journal, job={
+                "source": str(path.resolve()),
+                "source_size": stat.st_size,
+                "source_mtime_ns": stat.st_mtime_ns,
+                "column": column,
+                "chunk_size": chunk_size,
+                "check_smtp": check_smtp,
+                "include_raw_dns": include_raw_dns,
+            })
+            resumed = checkpoint.load()
+            summary = checkpoint.summary
+            if resumed:
+                # Only a resumed job knows where its own output ends
+                resume_offset = checkpoint.output_offset
+                summary.resumed_chunks = summary.chunks
+                logger.debug(f"Resuming {path.name} after {summary.chunks} chunks")
+                if checkpoint.complete:
+                    return summary
+        
+        summary.column, chunks = iter_file_chunks(
+            path,
+            chunk_size,
+            column,
+            start_offset=checkpoint.input_offset if checkpoint else 0,
+            start_index=summary.chunks,
+            encoding=encoding,
+        )
+        
+        sink: Optional[JsonLinesSink] = None
+        deliver: Callable[[List[ValidationResult]], Any]
+        if isinstance(output, (str, Path)):
+            sink = JsonLinesSink(output, resume_offset)
+            deliver = sink.write
+        else:
+            deliver = output
+        
+        def validate_chunk(chunk: FileChunk) -> tuple:
+            batch = self._post_batch(
+                chunk.emails, check_smtp, include_raw_dns, batch_size, concurrent_requests
             )
+            return chunk, batch
+        
+        batches = self._run_windowed(
+            validate_chunk,
+            chunks,
+            workers=max_in_flight,
+            window=max_in_flight,
+            ordered=True,  # checkpoints require chunks to finish in file order
+            thread_name_prefix="mailsafepro-file",
+        )
+        
+        try:
+            for chunk, batch in batches:
+                deliver(batch.results)
+                
+                valid_count = sum(1 for result in batch.results if result.valid)
+                summary.count += len(batch.results)
+                summary.valid_count += valid_count
+                summary.invalid_count += len(batch.results) - valid_count
+                summary.chunks += 1
+                
+                if checkpoint is not None:
+                    checkpoint.input_offset = chunk.end_offset
+                    checkpoint.output_offset = sink.flush() if sink is not None else 0
+                    checkpoint.save()
             
-            return BatchResult.from_dict(response_data)
-            
+            if checkpoint is not None:
+                checkpoint.complete = True
+                checkpoint.save()
+        
         finally:
-            # Close file
-            files["file"][1].close()
+            batches.close()
+            if sink is not None:
+                sink.close()
+        
+        return summary
     
     def get_quota(self) -> Dict[str, Any]:
         """
@@ -521,6 +1786,71 @@ class MailSafePro:
         """
         return self._make_request("GET", "/v1/quota")
     
+    def coalescing_stats(self) -> Dict[str, int]:
+        """
+        Get counters for coalesced validate() calls
+        
+        Returns:
+            Dictionary with executed and coalesced call counts and keys in
+            flight (empty if coalescing is disabled)
+        """
+        if self._single_flight is None:
+            return {}
+        return self._single_flight.stats()
+    
+    def concurrency_stats(self) -> Dict[str, Any]:
+        """
+        Get the adaptive concurrency limiter's current limit and latency
+        
+        Returns:
+            Dictionary from AdaptiveConcurrencyLimiter.stats() (empty if no
+            concurrency limiter is configured)
+        """
+        if self.concurrency_limiter is None:
+            return {}
+        return self.concurrency_limiter.stats()
+    
+    def pool_stats(self) -> Dict[str, Any]:
+        """
+        Get connection pool counters for sizing the pool
+        
+        A high ``discarded`` count means threads outnumber pooled
+        connections: raise ``pool_size`` or set ``pool_block``. A high
+        ``new_connections`` count relative to ``requests`` means requests
+        keep paying for handshakes.
+        
+        Returns:
+            Dictionary from PoolStats.stats() plus ``max_size`` and
+            ``block`` (empty with ``http2=True``)
+        
+        Examples:
+            >>> stats = validator.pool_stats()
+            >>> print(f"Reused {stats['reused']}/{stats['requests']} connections")
+        """
+        if self.http2:
+            return {}
+        stats: Dict[str, Any] = self._pool_stats.stats()
+        stats["max_size"] = self._pool_size
+        stats["block"] = self._pool_block
+        return stats
+    
+    def retry_stats(self) -> Dict[str, Any]:
+        """
+        Get retry counters and the remaining retry budget
+        
+        A high ``retry_ratio`` or ``gave_up["budget"]`` count means the API
+        is failing often enough that retries were being rationed.
+        
+        Returns:
+            Dictionary from RetryPolicy.stats() (shared with every client
+            using the same policy)
+        
+        Examples:
+            >>> stats = validator.retry_stats()
+            >>> print(f"{stats['retries']} retries, {stats['recovered']} recovered")
+        """
+        return self.retry_policy.stats()
+    
     def __repr__(self) -> str:
         auth_type = "JWT" if self._access_token else "API Key"
         return f"<MailSafePro(auth={auth_type}, base_url={self.base_url})>"
@@ -0,0 +1,596 @@
+"""
+Columnar views of many validation results for fast filtering and aggregation
+"""
+
+import operator
+from array import array
+from bisect import bisect_left, bisect_right
+from itertools import compress, repeat
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover - optional dependency
+    numpy = None  # type: ignore[assignment]
+
+from .decoding import canonical
+from .exceptions import ValidationError
+from .models import ValidationFailure, _read_scalars
+
+
+NUMERIC_COLUMNS = ("risk_score", "quality_score", "processing_time")
+BOOLEAN_COLUMNS = ("valid",)
+CATEGORICAL_COLUMNS = ("status", "suggested_action", "validation_tier", "provider")
+
+_OPERATORS = {
+    "==": operator.eq,
+    "!=": operator.ne,
+    "<": operator.lt,
+    "<=": operator.le,
+    ">": operator.gt,
+    ">=": operator.ge,
+}
+_AGGREGATES = ("count", "sum", "mean", "min", "max")
+
+# (column, operator, value), e.g. ("risk_score", ">", 0.7) or ("status", "in", {...})
+Condition = Tuple[str, str, Any]
+
+# Without NumPy, categorical codes are kept one byte wide while there are at
+# most 256 distinct values, so masks and counts can use bytes operations
+_BYTE_CODES = 256
+# Stdlib group-bys scan the column once per group up to this many groups
+_SCAN_PER_GROUP = 64
+
+
+def _code_mask(codes: array, wanted: Any) -> array:
+    """Stdlib mask of the rows whose code is in ``wanted``"""
+    if codes.typecode == "B":
+        table = bytes(1 if code in wanted else 0 for code in range(_BYTE_CODES))
+        return array("b", codes.tobytes().translate(table))
+    return array("b", [code in wanted for code in codes])
+
+
+def _and_masks(first: Any, second: Any) -> array:
+    """AND two stdlib masks of 0/1 bytes as one big-integer operation"""
+    size = len(first)
+    combined = int.from_bytes(bytes(first), "little") & int.from_bytes(bytes(second), "little")
+    return array("b", combined.to_bytes(size, "little"))
+
+
+class _ColumnBuilder:
+    """Appends results to stdlib arrays, dictionary-encoding categorical fields"""
+
+    def __init__(self) -> None:
+        self.emails: List[str] = []
+        self.numeric = {name: array("d") for name in NUMERIC_COLUMNS}
+        self.valid = array("b")
+        self.codes = {name: array("B") for name in CATEGORICAL_COLUMNS}
+        self.index: Dict[str, Dict[Optional[str], int]] = {
+            name: {} for name in CATEGORICAL_COLUMNS
+        }
+
+    def add(
+        self,
+        email: str,
+        valid: bool,
+        numbers: Sequence[float],
+        categories: Sequence[Optional[str]],
+    ) -> None:
+        self.emails.append(email)
+        self.valid.append(1 if valid else 0)
+        for name, value in zip(NUMERIC_COLUMNS, numbers):
+            self.numeric[name].append(value)
+        for name, category in zip(CATEGORICAL_COLUMNS, categories):
+            index = self.index[name]
+            code = index.get(category)
+            if code is None:
+                code = index[category] = len(index)
+                if code == _BYTE_CODES:
+                    self.codes[name] = array("i", self.codes[name])
+            self.codes[name].append(code)
+
+    def finish(self, use_numpy: Optional[bool]) -> "ResultColumns":
+        if use_numpy is None:
+            use_numpy = numpy is not None
+        elif use_numpy and numpy is None:
+            raise ImportError("use_numpy=True requires numpy. Install it with: pip install numpy")
+
+        columns: Dict[str, Any] = dict(self.numeric)
+        columns["valid"] = self.valid
+        columns.update(self.codes)
+        if use_numpy:
+            # Zero-copy views; the builder's arrays are never appended to again
+            dtypes: Dict[str, Any] = dict.fromkeys(NUMERIC_COLUMNS, numpy.float64)
+            dtypes["valid"] = numpy.bool_
+            for name, codes in self.codes.items():
+                dtypes[name] = numpy.uint8 if codes.typecode == "B" else numpy.intc
+            columns = {
+                name: numpy.frombuffer(values, dtype=dtypes[name])
+                if values else numpy.empty(0, dtype=dtypes[name])
+                for name, values in columns.items()
+            }
+
+        categories = {name: list(index) for name, index in self.index.items()}
+        return ResultColumns(self.emails, columns, categories)
+
+
+class ResultColumns:
+    """
+    Column-oriented container for many validation results
+
+    Numeric fields (``risk_score``, ``quality_score``, ``processing_time``)
+    and ``valid`` are stored as contiguous arrays. ``status``,
+    ``suggested_action``, ``validation_tier`` and ``provider`` are
+    dictionary-encoded: each is an integer code array plus a list of the
+    distinct values. Filtering and aggregation then run over arrays instead
+    of Python objects.
+
+    Columns are NumPy arrays when NumPy is installed, otherwise stdlib
+    ``array.array`` objects; the methods below behave the same either way.
+    Indexing returns the raw array (codes for categorical columns)::
+
+        columns["risk_score"]          # float64 ndarray / array('d')
+
+    Build one with :meth:`from_results`, :meth:`from_dicts` or
+    :meth:`BatchResult.columns`. A ResultColumns is immutable.
+
+    Examples:
+        >>> columns = batch.columns()
+        >>> risky = columns.mask(("status", "==", "risky"))
+        >>> columns.count(risky) / len(columns)
+        0.12
+        >>> columns.emails(columns.mask(("suggested_action", "==", "reject")))
+        ['bad@example.com', ...]
+        >>> columns.group_by("provider", "risk_score", "mean")
+        {'gmail': 0.08, 'outlook': 0.11, ...}
+    """
+
+    def __init__(
+        self,
+        emails: List[str],
+        columns: Dict[str, Any],
+        categories: Dict[str, List[Optional[str]]],
+    ):
+        self._emails = emails
+        self._columns = columns
+        self._categories = categories
+        self.uses_numpy = numpy is not None and isinstance(columns["valid"], numpy.ndarray)
+
+    @classmethod
+    def from_results(
+        cls,
+        results: Iterable[Any],
+        use_numpy: Optional[bool] = None,
+    ) -> "ResultColumns":
+        """
+        Build columns from validation results
+
+        Args:
+            results: ValidationResult objects (any iterable, e.g. a
+                BatchResultStream); ValidationFailure entries are skipped
+            use_numpy: Force NumPy on or off (default: use it if installed)
+
+        Returns:
+            ResultColumns holding one row per result
+        """
+        builder = _ColumnBuilder()
+        for result in results:
+            if isinstance(result, ValidationFailure):
+                continue
+            builder.add(
+                result.email,
+                result.valid,
+                (result.risk_score, result.quality_score, result.processing_time),
+                (
+                    result.status,
+                    result.suggested_action,
+                    result.validation_tier,
+                    result.provider_analysis.provider,
+                ),
+            )
+        return builder.finish(use_numpy)
+
+    @classmethod
+    def from_dicts(
+        cls,
+        items: Iterable[Dict[str, Any]],
+        use_numpy: Optional[bool] = None,
+    ) -> "ResultColumns":
+        """
+        Build columns straight from API response dictionaries
+
+        Skips building ValidationResult objects, e.g. for the elements of a
+        decoded /batch response.
+
+        Args:
+            items: Result dictionaries shaped like a /validate/email response
+            use_numpy: Force NumPy on or off (default: use it if installed)
+
+        Returns:
+            ResultColumns holding one row per dictionary
+        """
+        builder = _ColumnBuilder()
+        for data in items:
+            (email, valid, _, processing_time, risk_score, quality_score,
+             validation_tier, suggested_action, status) = _read_scalars(data)
+            provider = data.get("provider_analysis") or data.get("provideranalysis") or {}
+            provider_name = canonical(provider.get("provider") or "unknown")
+            builder.add(
+                email,
+                valid,
+                (risk_score, quality_score, processing_time),
+                (status, suggested_action, validation_tier, provider_name),
+            )
+        return builder.finish(use_numpy)
+
+    def __len__(self) -> int:
+        return len(self._emails)
+
+    def __getitem__(self, column: str) -> Any:
+        self._check_column(column)
+        return self._columns[column]
+
+    def categories(self, column: str) -> List[Optional[str]]:
+        """
+        Distinct values of a categorical column, indexed by code
+
+        Raises:
+            ValidationError: If the column is not categorical
+        """
+        self._check_column(column, CATEGORICAL_COLUMNS)
+        return list(self._categories[column])
+
+    def _check_column(self, column: str, allowed: Optional[Sequence[str]] = None) -> None:
+        if column not in self._columns:
+            raise ValidationError(f"Unknown column: {column}")
+        if allowed is not None and column not in allowed:
+            raise ValidationError(f"Column {column} must be one of: {', '.join(allowed)}")
+
+    # ------------------------------------------------------------------
+    # Masks
+    # ------------------------------------------------------------------
+
+    def mask(self, *conditions: Condition) -> Any:
+        """
+        Boolean mask of the rows matching every condition
+
+        Each condition is ``(column, operator, value)`` where operator is one
+        of ``==``, ``!=``, ``<``, ``<=``, ``>``, ``>=`` or ``in`` (value is a
+        collection). Categorical columns accept ``==``, ``!=`` and ``in``.
+
+        Args:
+            *conditions: Conditions combined with AND; none selects every row
+
+        Returns:
+            Boolean ndarray, or ``array('b')`` without NumPy
+
+        Raises:
+            ValidationError: If a column or operator is not supported
+
+        Examples:
+            >>> columns.mask(("valid", "==", True), ("risk_score", "<", 0.3))
+        """
+        result = None
+        for column, op, value in conditions:
+            matched = self._compare(column, op, value)
+            if result is None:
+                result = matched
+            elif self.uses_numpy:
+                result = result & matched
+            else:
+                result = _and_masks(result, matched)
+
+        if result is None:
+            if self.uses_numpy:
+                return numpy.ones(len(self), dtype=numpy.bool_)
+            return array("b", bytes([1]) * len(self))
+        return result
+
+    def _compare(self, column: str, op: str, value: Any) -> Any:
+        self._check_column(column)
+        values = self._columns[column]
+
+        if column in CATEGORICAL_COLUMNS:
+            if op not in ("==", "!=", "in"):
+                raise ValidationError(f"Operator {op} is not supported on column {column}")
+            # Compare codes; values never seen have no code and match nothing
+            index = {category: code for code, category in enumerate(self._categories[column])}
+            wanted = [index[v] for v in (value if op == "in" else [value]) if v in index]
+            matched: Any
+            if self.uses_numpy:
+                matched = numpy.isin(values, wanted)
+            else:
+                matched = _code_mask(values, set(wanted))
+            return self._invert(matched) if op == "!=" else matched
+
+        if op == "in":
+            members = set(value)
+            if self.uses_numpy:
+                return numpy.isin(values, list(members))
+            return array("b", [v in members for v in values])
+
+        if op not in _OPERATORS:
+            raise ValidationError(f"Unknown operator: {op}")
+        compare = _OPERATORS[op]
+        if self.uses_numpy:
+            return compare(values, value)
+        return array("b", map(compare, values, repeat(value)))
+
+    def _invert(self, mask: Any) -> Any:
+        if self.uses_numpy:
+            return ~mask
+        return array("b", bytes(mask).translate(bytes([1, 0]) + bytes(254)))
+
+    def _as_mask(self, mask: Any) -> Any:
+        if self.uses_numpy:
+            return numpy.asarray(mask, dtype=numpy.bool_)
+        return mask
+
+    # ------------------------------------------------------------------
+    # Selection and aggregation
+    # ------------------------------------------------------------------
+
+    def count(self, mask: Any = None) -> int:
+        """Number of rows selected by a mask (all rows if None)"""
+        if mask is None:
+            return len(self)
+        if self.uses_numpy:
+            return int(numpy.count_nonzero(self._as_mask(mask)))
+        if isinstance(mask, array):
+            return mask.count(1)
+        return sum(1 for selected in mask if selected)
+
+    def emails(self, mask: Any = None) -> List[str]:
+        """Email addresses of the rows selected by a mask (all rows if None)"""
+        if mask is None:
+            return list(self._emails)
+        return list(compress(self._emails, mask))
+
+    def select(self, mask: Any) -> "ResultColumns":
+        """
+        Rows selected by a mask, as a new ResultColumns
+
+        Categories are shared with this instance, so codes stay comparable.
+        """
+        if self.uses_numpy:
+            mask = self._as_mask(mask)
+            columns = {name: values[mask] for name, values in self._columns.items()}
+        else:
+            columns = {
+                name: array(values.typecode, compress(values, mask))
+                for name, values in self._columns.items()
+            }
+        return ResultColumns(self.emails(mask), columns, self._categories)
+
+    def value_counts(self, column: str, mask: Any = None) -> Dict[Optional[str], int]:
+        """
+        Occurrences of each value of a categorical column, most common first
+
+        Args:
+            column: Categorical column, e.g. ``"status"``
+            mask: Only count these rows (all rows if None)
+
+        Returns:
+            Dictionary of value to count, omitting values that don't occur
+        """
+        self._check_column(column, CATEGORICAL_COLUMNS)
+        codes = self._columns[column]
+        categories = self._categories[column]
+
+        if self.uses_numpy:
+            if mask is not None:
+                codes = codes[self._as_mask(mask)]
+            counts = numpy.bincount(codes, minlength=len(categories)).tolist()
+        else:
+            if mask is not None:
+                codes = array(codes.typecode, compress(codes, mask))
+            if codes.typecode == "B":
+                data = codes.tobytes()
+                counts = [data.count(code) for code in range(len(categories))]
+            else:
+                counts = [0] * len(categories)
+                for code in codes:
+                    counts[code] += 1
+
+        pairs = sorted(zip(categories, counts), key=lambda pair: -pair[1])
+        return {category: count for category, count in pairs if count}
+
+    def group_by(
+        self,
+        by: str,
+        column: Optional[str] = None,
+        agg: str = "count",
+        mask: Any = None,
+    ) -> Dict[Optional[str], float]:
+        """
+        Aggregate a numeric column per value of a categorical column
+
+        Args:
+            by: Categorical column to group on, e.g. ``"provider"``
+            column: Numeric or ``valid`` column to aggregate (not needed for
+                ``count``)
+            agg: One of ``count``, ``sum``, ``mean``, ``min``, ``max``
+            mask: Only aggregate these rows (all rows if None)
+
+        Returns:
+            Dictionary of group value to aggregate, for groups with rows
+
+        Raises:
+            ValidationError: If a column or aggregate is not supported
+
+        Examples:
+            >>> columns.group_by("suggested_action")
+            {'accept': 9120, 'reject': 880}
+            >>> columns.group_by("provider", "valid", "mean")
+            {'gmail': 0.97, 'yahoo': 0.91}
+        """
+        self._check_column(by, CATEGORICAL_COLUMNS)
+        if agg not in _AGGREGATES:
+            raise ValidationError(f"agg must be one of: {', '.join(_AGGREGATES)}")
+        if agg == "count":
+            return dict(self.value_counts(by, mask))
+        if column is None:
+            raise ValidationError(f"agg={agg} needs a column to aggregate")
+        self._check_column(column, NUMERIC_COLUMNS + BOOLEAN_COLUMNS)
+
+        codes = self._columns[by]
+        values = self._columns[column]
+        categories = self._categories[by]
+
+        if self.uses_numpy:
+            return self._group_by_numpy(codes, values, categories, agg, mask)
+
+        if len(categories) <= _SCAN_PER_GROUP:
+            return self._group_by_scans(codes, values, categories, agg, mask)
+
+        if mask is not None:
+            codes = compress(codes, mask)
+            values = compress(values, mask)
+        counts: Dict[int, int] = {}
+        totals: Dict[int, float] = {}
+        for code, value in zip(codes, values):
+            counts[code] = counts.get(code, 0) + 1
+            if agg in ("sum", "mean"):
+                totals[code] = totals.get(code, 0.0) + value
+            elif code not in totals:
+                totals[code] = value
+            elif agg == "min":
+                totals[code] = min(totals[code], value)
+            else:
+                totals[code] = max(totals[code], value)
+
+        if agg == "mean":
+            return {categories[code]: totals[code] / counts[code] for code in totals}
+        return {categories[code]: float(totals[code]) for code in totals}
+
+    def _group_by_scans(
+        self, codes: array, values: array, categories: List[Optional[str]], agg: str, mask: Any
+    ) -> Dict[Optional[str], float]:
+        # One C-level pass per group beats one Python-level pass over rows
+        functions: Dict[str, Callable[..., Any]] = {"sum": sum, "mean": sum, "min": min, "max": max}
+        aggregate = functions[agg]
+        groups: Dict[Optional[str], float] = {}
+        for code, category in enumerate(categories):
+            selected = _code_mask(codes, {code})
+            if mask is not None:
+                selected = _and_masks(selected, mask)
+            size = selected.count(1)
+            if size:
+                total = float(aggregate(compress(values, selected)))
+                groups[category] = total / size if agg == "mean" else total
+        return groups
+
+    def _group_by_numpy(
+        self, codes: Any, values: Any, categories: List[Optional[str]], agg: str, mask: Any
+    ) -> Dict[Optional[str], float]:
+        if mask is not None:
+            mask = self._as_mask(mask)
+            codes, values = codes[mask], values[mask]
+        values = values.astype(numpy.float64)
+        groups = len(categories)
+        counts = numpy.bincount(codes, minlength=groups)
+
+        totals: Any
+        if agg in ("sum", "mean"):
+            totals = numpy.bincount(codes, weights=values, minlength=groups)
+            if agg == "mean":
+                totals = totals / numpy.maximum(counts, 1)
+        else:
+            fill = numpy.inf if agg == "min" else -numpy.inf
+            totals = numpy.full(groups, fill)
+            extreme: Any = numpy.minimum if agg == "min" else numpy.maximum
+            extreme.at(totals, codes, values)
+
+        return {
+            categories[code]: float(totals[code])
+            for code in numpy.flatnonzero(counts).tolist()
+        }
+
+    def histogram(
+        self,
+        column: str,
+        bins: int = 10,
+        value_range: Tuple[float, float] = (0.0, 1.0),
+        mask: Any = None,
+    ) -> Tuple[List[int], List[float]]:
+        """
+        Histogram of a numeric column over equal-width bins
+
+        Matches ``numpy.histogram``: the last bin includes its upper edge and
+        values outside ``value_range`` are not counted.
+
+        Args:
+            column: Numeric column, e.g. ``"risk_score"``
+            bins: Number of bins
+            value_range: (low, high) covered by the bins
+            mask: Only count these rows (all rows if None)
+
+        Returns:
+            Tuple of (counts per bin, bin edges); there is one more edge than bins
+        """
+        self._check_column(column, NUMERIC_COLUMNS)
+        if bins < 1:
+            raise ValidationError("bins must be at least 1")
+        low, high = value_range
+        if not high > low:
+            raise ValidationError("value_range must be (low, high) with high > low")
+        values = self._columns[column]
+
+        if self.uses_numpy:
+            if mask is not None:
+                values = values[self._as_mask(mask)]
+            hist, hist_edges = numpy.histogram(values, bins=bins, range=(low, high))
+            return hist.tolist(), hist_edges.tolist()
+
+        if mask is not None:
+            values = compress(values, mask)
+        width = (high - low) / bins
+        edges = [low + width * i for i in range(bins)] + [high]
+        # Sorting runs in C; each bin is then the gap between two bisections
+        ordered = sorted(values)
+        positions = [bisect_left(ordered, edge) for edge in edges[:-1]]
+        positions.append(bisect_right(ordered, high))
+        counts = [positions[i + 1] - positions[i] for i in range(bins)]
+        return counts, edges
+
+    # ------------------------------------------------------------------
+    # Export
+    # ------------------------------------------------------------------
+
+    def to_dict(self) -> Dict[str, List[Any]]:
+        """
+        Plain lists per column, with categorical columns decoded
+
+        Suitable for ``pandas.DataFrame(columns.to_dict())`` or csv.DictWriter.
+        """
+        data: Dict[str, List[Any]] = {"email": list(self._emails)}
+        for name in NUMERIC_COLUMNS:
+            data[name] = list(map(float, self._columns[name]))
+        data["valid"] = list(map(bool, self._columns["valid"]))
+        for name in CATEGORICAL_COLUMNS:
+            categories = self._categories[name]
+            data[name] = [categories[code] for code in self._columns[name]]
+        return data
+
+    def to_numpy(self) -> Dict[str, Any]:
+        """
+        NumPy arrays per column, with categorical columns decoded to object arrays
+
+        Raises:
+            ImportError: If NumPy is not installed
+        """
+        if numpy is None:
+            raise ImportError("to_numpy() requires numpy. Install it with: pip install numpy")
+
+        data = {"email": numpy.array(self._emails, dtype=object)}
+        for name in NUMERIC_COLUMNS:
+            data[name] = numpy.array(self._columns[name], dtype=numpy.float64)
+        data["valid"] = numpy.array(self._columns["valid"], dtype=numpy.bool_)
+        for name in CATEGORICAL_COLUMNS:
+            categories = numpy.array(self._categories[name], dtype=object)
+            data[name] = categories[numpy.array(self._columns[name], dtype=numpy.intp)]
+        return data
+
+    def __repr__(self) -> str:
+        backend = "numpy" if self.uses_numpy else "array"
+        return f"<ResultColumns(rows={len(self)}, backend={backend})>"
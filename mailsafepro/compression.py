@@ -0,0 +1,347 @@
+"""
+Compression of request and response bodies
+
+Batch payloads are long runs of near-identical JSON, which gzip and zstd
+shrink several-fold. :class:`BodyCompression` compresses request bodies
+above a size threshold as they are sent, and keeps per-request statistics on
+how many bytes compression saved in each direction.
+"""
+
+import threading
+import zlib
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Deque, Dict, Iterator, List, Optional, Union
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - optional dependency
+    zstandard = None  # type: ignore[assignment]
+
+
+GZIP = "gzip"
+ZSTD = "zstd"
+
+ENCODINGS = (GZIP, ZSTD)
+
+# zlib window bits selecting the gzip container (header and CRC trailer)
+_GZIP_WBITS = 31
+
+
+def _require_encoding(encoding: str) -> None:
+    if encoding not in ENCODINGS:
+        raise ValueError(f"Unsupported encoding {encoding!r}; use one of {ENCODINGS}")
+    if encoding == ZSTD and zstandard is None:
+        raise ImportError(
+            "zstd compression requires zstandard. "
+            "Install it with: pip install 'mailsafepro-sdk[zstd]'"
+        )
+
+
+def _compressor(encoding: str, level: Optional[int]) -> Any:
+    """Incremental compressor with ``compress()`` and ``flush()``"""
+    if encoding == ZSTD:
+        return zstandard.ZstdCompressor(level=3 if level is None else level).compressobj()
+    return zlib.compressobj(
+        zlib.Z_DEFAULT_COMPRESSION if level is None else level, zlib.DEFLATED, _GZIP_WBITS
+    )
+
+
+def compress(data: bytes, encoding: str = GZIP, level: Optional[int] = None) -> bytes:
+    """
+    Compress a whole body in one go
+
+    Args:
+        data: Raw bytes
+        encoding: ``"gzip"`` or ``"zstd"``
+        level: Compression level (default: the library's default)
+
+    Returns:
+        Compressed bytes
+
+    Raises:
+        ValueError: If the encoding is unknown
+        ImportError: If zstd is requested and zstandard is not installed
+    """
+    _require_encoding(encoding)
+    compressor = _compressor(encoding, level)
+    compressed: bytes = compressor.compress(data) + compressor.flush()
+    return compressed
+
+
+def decompress(data: bytes, encoding: str) -> bytes:
+    """
+    Decompress a body sent with ``Content-Encoding: <encoding>``
+
+    Raises:
+        ValueError: If the encoding is unknown or the data is corrupt
+        ImportError: If the body is zstd and zstandard is not installed
+    """
+    _require_encoding(encoding)
+    if encoding == ZSTD:
+        try:
+            # decompressobj() copes with frames that don't record their size
+            return zstandard.ZstdDecompressor().decompressobj().decompress(data)
+        except zstandard.ZstdError as e:
+            raise ValueError(f"Invalid zstd data: {e}") from e
+    try:
+        return zlib.decompress(data, _GZIP_WBITS)
+    except zlib.error as e:
+        raise ValueError(f"Invalid gzip data: {e}") from e
+
+
+class CompressedBody:
+    """
+    Request body compressed chunk by chunk while it is sent
+
+    Only the raw bytes are held; each iteration runs a fresh compressor over
+    them and yields the output as it comes, so the full compressed body is
+    never in memory and a retried request can send the body again. With no
+    length known up front, the request goes out with chunked transfer
+    encoding (or as HTTP/2 data frames).
+
+    Args:
+        data: Raw body
+        encoding: ``"gzip"`` or ``"zstd"``
+        level: Compression level (default: the library's default)
+        chunk_size: Raw bytes fed to the compressor at a time
+
+    Attributes:
+        bytes_sent: Compressed size, known once the body has been sent
+    """
+
+    def __init__(
+        self,
+        data: bytes,
+        encoding: str = GZIP,
+        level: Optional[int] = None,
+        chunk_size: int = 64 * 1024,
+    ):
+        _require_encoding(encoding)
+        self.data = data
+        self.encoding = encoding
+        self.level = level
+        self.chunk_size = chunk_size
+        self.bytes_sent: Optional[int] = None
+
+    def __iter__(self) -> Iterator[bytes]:
+        compressor = _compressor(self.encoding, self.level)
+        view = memoryview(self.data)
+        sent = 0
+        for start in range(0, len(view), self.chunk_size):
+            chunk = compressor.compress(view[start:start + self.chunk_size])
+            if chunk:
+                sent += len(chunk)
+                yield chunk
+        chunk = compressor.flush()
+        sent += len(chunk)
+        self.bytes_sent = sent
+        yield chunk
+
+    async def aiter(self) -> AsyncIterator[bytes]:
+        """
+        The compressed body as an async iterator
+
+        httpx's AsyncClient only streams async iterables; call this once
+        per attempt, as each call compresses the body afresh.
+        """
+        for chunk in self:
+            yield chunk
+
+    def __repr__(self) -> str:
+        return (
+            f"<CompressedBody(encoding={self.encoding!r}, bytes={len(self.data)}, "
+            f"bytes_sent={self.bytes_sent})>"
+        )
+
+
+@dataclass(frozen=True)
+class TransferStats:
+    """
+    Body sizes of one request/response exchange
+
+    Attributes:
+        path: URL path of the request
+        encoding: Content-Encoding the request body was sent with, or None
+        request_bytes: Request body size before compression
+        request_bytes_sent: Request body bytes put on the wire
+        response_bytes: Response body size after decompression
+        response_bytes_received: Response body bytes read off the wire
+    """
+
+    path: str
+    encoding: Optional[str]
+    request_bytes: int
+    request_bytes_sent: int
+    response_bytes: int
+    response_bytes_received: int
+
+    @property
+    def bytes_saved(self) -> int:
+        """Bytes compression kept off the wire, both directions"""
+        return (
+            self.request_bytes - self.request_bytes_sent
+            + self.response_bytes - self.response_bytes_received
+        )
+
+
+class BodyCompression:
+    """
+    Compress request bodies above a threshold and track bytes saved
+
+    Bodies of at least ``min_size`` bytes are sent compressed with
+    ``Content-Encoding: <encoding>``; smaller ones go out as-is, since the
+    compression overhead outweighs the savings. Compressed responses need
+    nothing from this class: both clients advertise the encodings they can
+    decode in ``Accept-Encoding`` (gzip and deflate always, zstd when
+    ``zstandard`` is installed) and decode responses as they are read.
+
+    Every exchange is recorded as a :class:`TransferStats`, comparing raw
+    and on-the-wire sizes of the request and response bodies. The most
+    recent ``history`` are kept, plus running totals in :meth:`stats`.
+    Response wire sizes come from the transport; when it can't report them
+    (chunked HTTP/1.1 responses through ``requests``), the decoded size is
+    counted and the response shows no savings.
+
+    The API must accept compressed request bodies; check with your plan
+    before enabling this against production.
+
+    Args:
+        encoding: ``"gzip"`` or ``"zstd"`` (zstd requires the ``zstd``
+            extra)
+        min_size: Smallest request body, in bytes, that is compressed
+        level: Compression level (default: the library's default)
+        chunk_size: Raw bytes compressed at a time while sending
+        history: Number of recent exchanges kept
+
+    Raises:
+        ValueError: If the encoding is unknown
+        ImportError: If zstd is requested and zstandard is not installed
+
+    Examples:
+        >>> compression = BodyCompression(min_size=1024)
+        >>> validator = MailSafePro(api_key="key_xxx", compression=compression)
+        >>> validator.validate_batch(emails)
+        >>> compression.last.bytes_saved
+        183402
+    """
+
+    def __init__(
+        self,
+        encoding: str = GZIP,
+        min_size: int = 1024,
+        level: Optional[int] = None,
+        chunk_size: int = 64 * 1024,
+        history: int = 100,
+    ):
+        _require_encoding(encoding)
+        self.encoding = encoding
+        self.min_size = min_size
+        self.level = level
+        self.chunk_size = chunk_size
+        self._lock = threading.Lock()
+        self._history: Deque[TransferStats] = deque(maxlen=history)
+        self._requests = 0
+        self._compressed = 0
+        self._request_bytes = 0
+        self._request_bytes_sent = 0
+        self._response_bytes = 0
+        self._response_bytes_received = 0
+
+    def encode(self, data: bytes) -> Union[bytes, CompressedBody]:
+        """
+        Request body to send for ``data``
+
+        Returns:
+            ``data`` itself below ``min_size``, else a CompressedBody
+        """
+        if len(data) < self.min_size:
+            return data
+        return CompressedBody(data, self.encoding, self.level, self.chunk_size)
+
+    def record(
+        self,
+        path: str,
+        body: Any,
+        response_bytes: int,
+        response_bytes_received: int,
+    ) -> TransferStats:
+        """
+        Record one exchange
+
+        Args:
+            path: URL path of the request
+            body: Request body as sent (bytes, CompressedBody or None)
+            response_bytes: Decoded response body size
+            response_bytes_received: Response body bytes read off the wire
+
+        Returns:
+            The recorded TransferStats
+        """
+        encoding = None
+        if isinstance(body, CompressedBody):
+            encoding = body.encoding
+            request_bytes = len(body.data)
+            request_bytes_sent = body.bytes_sent if body.bytes_sent is not None else request_bytes
+        elif isinstance(body, (bytes, bytearray)):
+            request_bytes = request_bytes_sent = len(body)
+        else:
+            request_bytes = request_bytes_sent = 0
+
+        stats = TransferStats(
+            path=path,
+            encoding=encoding,
+            request_bytes=request_bytes,
+            request_bytes_sent=request_bytes_sent,
+            response_bytes=response_bytes,
+            response_bytes_received=response_bytes_received,
+        )
+        with self._lock:
+            self._history.append(stats)
+            self._requests += 1
+            self._compressed += encoding is not None
+            self._request_bytes += request_bytes
+            self._request_bytes_sent += request_bytes_sent
+            self._response_bytes += response_bytes
+            self._response_bytes_received += response_bytes_received
+        return stats
+
+    @property
+    def last(self) -> Optional[TransferStats]:
+        """The most recent exchange, or None before the first"""
+        with self._lock:
+            return self._history[-1] if self._history else None
+
+    def history(self) -> List[TransferStats]:
+        """Recent exchanges, oldest first"""
+        with self._lock:
+            return list(self._history)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Totals over every recorded exchange
+
+        Returns:
+            Dictionary with ``requests``, ``compressed_requests``, raw and
+            wire byte counts for both directions, and ``bytes_saved``
+        """
+        with self._lock:
+            return {
+                "encoding": self.encoding,
+                "requests": self._requests,
+                "compressed_requests": self._compressed,
+                "request_bytes": self._request_bytes,
+                "request_bytes_sent": self._request_bytes_sent,
+                "response_bytes": self._response_bytes,
+                "response_bytes_received": self._response_bytes_received,
+                "bytes_saved": (
+                    self._request_bytes - self._request_bytes_sent
+                    + self._response_bytes - self._response_bytes_received
+                ),
+            }
+
+    def __repr__(self) -> str:
+        return (
+            f"<BodyCompression(encoding={self.encoding!r}, min_size={self.min_size}, "
+            f"requests={self._requests})>"
+        )
@@ -0,0 +1,279 @@
+"""
+Adaptive (AIMD) concurrency limiting
+"""
+
+import asyncio
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, List, Optional
+
+from .exceptions import NetworkError, RateLimitError, ServerError
+
+
+# Failures that mean "too much load" and shrink the limit. Other errors
+# (bad input, auth) say nothing about capacity and are ignored.
+OVERLOAD_ERRORS = (RateLimitError, ServerError, NetworkError)
+
+
+class _Waiter:
+    """A caller queued for a slot; ``wake`` is called once one is granted"""
+
+    __slots__ = ("wake", "granted", "started")
+
+    def __init__(self, wake: Callable[[], Any]) -> None:
+        self.wake = wake
+        self.granted = False
+        self.started = 0.0
+
+
+class AdaptiveConcurrencyLimiter:
+    """
+    Concurrency limit that adapts to the API like TCP congestion control
+
+    Every request holds one slot between :meth:`acquire` and :meth:`release`.
+    The number of slots follows an AIMD (additive increase, multiplicative
+    decrease) rule:
+
+    * each successful request while the limit is in use adds
+      ``increase / limit``, so the limit grows by about ``increase`` per
+      round trip
+    * a request failing with :data:`OVERLOAD_ERRORS` (429, 5xx, timeouts)
+      multiplies the limit by ``backoff``
+    * every ``window`` successful requests the p95 latency is compared with
+      a slowly tracking baseline; a p95 above ``latency_tolerance`` times the
+      baseline also multiplies the limit by ``backoff``
+
+    Only outcomes of requests started after the last decrease can cut the
+    limit again, so a burst of failures from one round trip cuts it once.
+
+    One limiter may be shared by several clients and used from threads and
+    event loops at the same time.
+
+    Args:
+        initial_limit: Starting number of concurrent requests
+        min_limit: Lowest limit (default: 1)
+        max_limit: Highest limit (default: 50)
+        increase: Additive increase per round trip
+        backoff: Multiplicative decrease factor on overload (0-1)
+        latency_tolerance: p95 / baseline latency ratio treated as overload
+        window: Successful requests per latency evaluation
+        clock: Monotonic time source (overridable for tests)
+
+    Examples:
+        >>> limiter = AdaptiveConcurrencyLimiter(initial_limit=4, max_limit=32)
+        >>> validator = MailSafePro(api_key="key_xxx", concurrency_limiter=limiter)
+        >>> for result in validator.validate_batch_iter(emails):
+        ...     pass
+        >>> limiter.stats()["limit"]
+        11
+    """
+
+    # Fraction of the gap to a window's p95 the baseline moves each window,
+    # so a lasting change in server latency becomes the new normal
+    BASELINE_DRIFT = 0.1
+
+    def __init__(
+        self,
+        initial_limit: int = 4,
+        min_limit: int = 1,
+        max_limit: int = 50,
+        increase: float = 1.0,
+        backoff: float = 0.5,
+        latency_tolerance: float = 2.0,
+        window: int = 20,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if not 1 <= min_limit <= max_limit:
+            raise ValueError("limits must satisfy 1 <= min_limit <= max_limit")
+        if not 0 < backoff < 1:
+            raise ValueError("backoff must be between 0 and 1")
+
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.increase = increase
+        self.backoff = backoff
+        self.latency_tolerance = latency_tolerance
+        self.window = window
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._limit = float(min(max(initial_limit, min_limit), max_limit))
+        self._in_flight = 0
+        self._waiters: Deque[_Waiter] = deque()
+        self._samples: List[float] = []
+        self._p95: Optional[float] = None
+        self._baseline: Optional[float] = None
+        self._last_decrease = float("-inf")
+        self._last_full = float("-inf")
+        self._succeeded = 0
+        self._dropped = 0
+        self._increases = 0
+        self._decreases = 0
+
+    @property
+    def limit(self) -> int:
+        """Current number of requests allowed in flight"""
+        return max(self.min_limit, int(self._limit))
+
+    def _take_slot(self) -> float:
+        """Count one more request in flight (caller holds the lock)"""
+        started = self._clock()
+        self._in_flight += 1
+        if self._in_flight >= self.limit:
+            self._last_full = started
+        return started
+
+    def _try_acquire(self, wake: Callable[[], Any]) -> _Waiter:
+        """Take a free slot or queue for one; the waiter is granted either way"""
+        waiter = _Waiter(wake)
+        with self._lock:
+            if not self._waiters and self._in_flight < self.limit:
+                waiter.started = self._take_slot()
+                waiter.granted = True
+            else:
+                self._waiters.append(waiter)
+                self._last_full = self._clock()
+        return waiter
+
+    def _grant_waiters(self) -> None:
+        """Hand free slots to queued callers (caller holds the lock)"""
+        while self._waiters and self._in_flight < self.limit:
+            waiter = self._waiters.popleft()
+            waiter.started = self._take_slot()
+            waiter.granted = True
+            waiter.wake()
+
+    def acquire(self) -> float:
+        """
+        Take a slot, blocking until one is free
+
+        Returns:
+            Start time to pass to :meth:`release`
+        """
+        event = threading.Event()
+        waiter = self._try_acquire(event.set)
+        if not waiter.granted:
+            event.wait()
+        return waiter.started
+
+    async def acquire_async(self) -> float:
+        """
+        Take a slot, awaiting until one is free
+
+        Returns:
+            Start time to pass to :meth:`release`
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+
+        def resolve() -> None:
+            if not future.done():
+                future.set_result(None)
+
+        def wake() -> None:
+            loop.call_soon_threadsafe(resolve)
+
+        waiter = self._try_acquire(wake)
+        if not waiter.granted:
+            try:
+                await future
+            except asyncio.CancelledError:
+                with self._lock:
+                    if waiter.granted:
+                        self._in_flight -= 1
+                        self._grant_waiters()
+                    else:
+                        self._waiters.remove(waiter)
+                raise
+        return waiter.started
+
+    def release(self, started: float, dropped: bool = False, sample: bool = True) -> None:
+        """
+        Return a slot and feed the request's outcome to the limit
+
+        Args:
+            started: Value returned by :meth:`acquire`
+            dropped: The request failed from overload (429, 5xx, timeout)
+            sample: Use the request's latency (False for unrelated failures)
+        """
+        now = self._clock()
+        with self._lock:
+            self._in_flight -= 1
+
+            if dropped:
+                self._dropped += 1
+                self._decrease(started, now)
+            elif sample:
+                self._succeeded += 1
+                self._samples.append(now - started)
+                if len(self._samples) >= self.window:
+                    self._evaluate_latency(started, now)
+                # Only grow if the limit was used up while this request ran
+                if self._last_full >= started and started >= self._last_decrease:
+                    self._grow()
+
+            self._grant_waiters()
+
+    def release_error(self, started: float, error: BaseException) -> None:
+        """
+        Return a slot after a request raised ``error``
+
+        Args:
+            started: Value returned by :meth:`acquire`
+            error: The exception the request raised
+        """
+        self.release(started, dropped=isinstance(error, OVERLOAD_ERRORS), sample=False)
+
+    def _grow(self) -> None:
+        if self._limit < self.max_limit:
+            self._limit = min(float(self.max_limit), self._limit + self.increase / self._limit)
+            self._increases += 1
+
+    def _decrease(self, started: float, now: float) -> None:
+        # Outcomes of requests sent before the last cut reflect the old limit
+        if started < self._last_decrease:
+            return
+        self._limit = max(float(self.min_limit), self._limit * self.backoff)
+        self._last_decrease = now
+        self._decreases += 1
+
+    def _evaluate_latency(self, started: float, now: float) -> None:
+        samples = sorted(self._samples)
+        self._samples.clear()
+        self._p95 = samples[int(0.95 * (len(samples) - 1))]
+
+        if self._baseline is None or self._p95 < self._baseline:
+            self._baseline = self._p95
+            return
+
+        if self._p95 > self._baseline * self.latency_tolerance:
+            self._decrease(started, now)
+        self._baseline += (self._p95 - self._baseline) * self.BASELINE_DRIFT
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get limiter state and counters
+
+        Returns:
+            Dictionary with the current limit, requests in flight and
+            waiting, the last window's p95 latency and the baseline latency
+            (seconds), and counts of successes, drops and limit changes
+        """
+        with self._lock:
+            return {
+                "limit": self.limit,
+                "in_flight": self._in_flight,
+                "waiting": len(self._waiters),
+                "latency_p95": self._p95,
+                "latency_baseline": self._baseline,
+                "succeeded": self._succeeded,
+                "dropped": self._dropped,
+                "increases": self._increases,
+                "decreases": self._decreases,
+            }
+
+    def __repr__(self) -> str:
+        return (
+            f"<AdaptiveConcurrencyLimiter(limit={self.limit}, "
+            f"min_limit={self.min_limit}, max_limit={self.max_limit})>"
+        )
@@ -0,0 +1,211 @@
+"""
+Schema-compiled decoders for API response dictionaries
+
+Each model declares its fields once as a tuple of :class:`FieldSpec`. The
+schema is compiled into a plain Python function (the same technique
+``dataclasses`` uses for ``__init__``) that reads every field with a single
+``dict.get`` when the canonical key is present, falls back through the
+legacy key spellings only when it isn't, and calls the model constructor
+positionally.
+
+Key resolution rules:
+
+- Keys are tried in order; the first one holding a non-null value wins, so
+  falsy values such as ``0.0``, ``False`` or ``[]`` are kept as sent.
+- A key holding ``null`` counts as missing and the field gets its default.
+- Nested sections are decoded only when their dictionary is non-empty;
+  otherwise they are None (or decoded from ``{}`` if ``required``).
+- Fields marked ``canonical`` hold values from a small vocabulary (status,
+  suggested action, ...). Their strings are replaced by one shared copy, so
+  10k results hold one ``"deliverable"`` instead of 10k.
+"""
+
+import sys
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional, Sequence, Tuple
+
+
+@dataclass(frozen=True)
+class FieldSpec:
+    """
+    How one model field is read from a response dictionary
+
+    Attributes:
+        name: Attribute name
+        keys: Response keys to try, in order (default: just ``name``)
+        default: Value used when no key holds a non-null value
+        default_factory: Called for the default instead, e.g. ``list``
+        section: Decoder for a nested dictionary, e.g. ``SMTPInfo.from_dict``
+        required: Decode a missing section from ``{}`` instead of using None
+        canonical: Replace string values with their shared copy (see canonical())
+    """
+    name: str
+    keys: Tuple[str, ...] = ()
+    default: Any = None
+    default_factory: Optional[Callable[[], Any]] = None
+    section: Optional[Callable[[Dict[str, Any]], Any]] = None
+    required: bool = False
+    canonical: bool = False
+
+
+_EMPTY: Dict[str, Any] = {}
+
+# Upper bound on distinct canonical values, so a misbehaving server sending
+# free text in an enum-like field can't grow the table without limit
+VOCABULARY_LIMIT = 4096
+
+_VOCABULARY: Dict[str, str] = {}
+
+
+def canonical(value: str) -> str:
+    """
+    Shared copy of an enum-like string value
+
+    Equal values decoded from different responses come back as the same
+    object, which is also the interned string, so they can be compared by
+    identity and their hash is computed once. Once VOCABULARY_LIMIT distinct
+    values are known, new ones are returned unchanged.
+
+    Args:
+        value: String decoded from a response
+
+    Returns:
+        The canonical copy of ``value``
+
+    Examples:
+        >>> status = canonical("".join(["deliver", "able"]))
+        >>> status is canonical("deliverable")
+        True
+    """
+    known = _VOCABULARY.get(value)
+    if known is None:
+        if len(_VOCABULARY) >= VOCABULARY_LIMIT:
+            return value
+        # setdefault keeps the first copy if two threads add the same value
+        known = _VOCABULARY.setdefault(value, sys.intern(value))
+    return known
+
+
+def vocabulary_size() -> int:
+    """Number of distinct canonical values seen so far"""
+    return len(_VOCABULARY)
+
+
+def _compile(
+    specs: Sequence[FieldSpec],
+    name: str,
+    params: str,
+    tail: Sequence[str],
+    doc: str,
+) -> Callable[..., Any]:
+    """Generate and exec a function reading ``specs`` from ``data``"""
+    namespace: Dict[str, Any] = {
+        "_EMPTY": _EMPTY,
+        "_str": str,
+        "_known": _VOCABULARY.get,
+        "_canonical": canonical,
+    }
+    lines = [f"def {name}({params}):", "    get = data.get"]
+
+    for i, spec in enumerate(specs):
+        var = f"v{i}"
+        keys = spec.keys or (spec.name,)
+        # Sections also skip empty dictionaries when falling back
+        missing = f"not {var}" if spec.section is not None else f"{var} is None"
+
+        lines.append(f"    {var} = get({keys[0]!r})")
+        for key in keys[1:]:
+            lines.append(f"    if {missing}:")
+            lines.append(f"        {var} = get({key!r})")
+
+        if spec.section is not None:
+            namespace[f"section{i}"] = spec.section
+            if spec.required:
+                lines.append(f"    {var} = section{i}({var} or _EMPTY)")
+            else:
+                lines.append(f"    {var} = section{i}({var}) if {var} else None")
+        elif spec.default_factory is not None:
+            namespace[f"factory{i}"] = spec.default_factory
+            lines.append(f"    if {var} is None:")
+            lines.append(f"        {var} = factory{i}()")
+        elif spec.default is not None:
+            namespace[f"default{i}"] = spec.default
+            lines.append(f"    if {var} is None:")
+            lines.append(f"        {var} = default{i}")
+
+        if spec.canonical:
+            # Hot path is one dict lookup; only unseen values (and "") call out
+            lines.append(f"    if {var}.__class__ is _str:")
+            lines.append(f"        {var} = _known({var}) or _canonical({var})")
+
+    values = ", ".join(f"v{i}" for i in range(len(specs)))
+    lines.extend("    " + line.format(values=values) for line in tail)
+
+    exec("\n".join(lines), namespace)
+    function: Callable[..., Any] = namespace[name]
+    function.__doc__ = doc
+    return function
+
+
+def compile_decoder(
+    specs: Sequence[FieldSpec],
+    model: str,
+    init: bool = True,
+) -> Callable[..., Any]:
+    """
+    Compile a ``from_dict(cls, data)`` function for a model
+
+    The result is meant to be wrapped in ``classmethod`` in the class body.
+    Values are passed to ``cls`` positionally, so ``specs`` must list every
+    field in the model's declaration order.
+
+    Args:
+        specs: Field schema, in field order
+        model: Model name, used for the docstring
+        init: If False, create the object with ``cls.__new__`` and only
+            assign the fields in ``specs``, which may then be a subset
+
+    Returns:
+        Function building ``cls`` from a response dictionary
+
+    Examples:
+        >>> class ProviderAnalysis:
+        ...     FIELDS = (FieldSpec("provider", default="unknown"), ...)
+        ...     from_dict = classmethod(compile_decoder(FIELDS, "ProviderAnalysis"))
+    """
+    if init:
+        tail = ["return cls({values})"]
+    else:
+        targets = "".join(f"obj.{spec.name}, " for spec in specs)
+        tail = ["obj = cls.__new__(cls)", f"{targets}= {{values}},", "return obj"]
+    return _compile(
+        specs, "from_dict", "cls, data", tail,
+        f"Create {model} from API response dictionary",
+    )
+
+
+def compile_values(specs: Sequence[FieldSpec]) -> Callable[[Dict[str, Any]], Tuple[Any, ...]]:
+    """
+    Compile a function returning the values of ``specs`` as a tuple
+
+    Args:
+        specs: Field schema
+
+    Returns:
+        Function mapping a response dictionary to a tuple in ``specs`` order
+    """
+    names = ", ".join(spec.name for spec in specs)
+    return _compile(specs, "read_values", "data", ["return ({values},)"], f"Read ({names})")
+
+
+def compile_value(spec: FieldSpec) -> Callable[[Dict[str, Any]], Any]:
+    """
+    Compile a function returning the value of a single field
+
+    Args:
+        spec: Field schema
+
+    Returns:
+        Function mapping a response dictionary to the field's value
+    """
+    return _compile([spec], "read_value", "data", ["return {values}"], f"Read {spec.name}")
@@ -0,0 +1,305 @@
+"""
+Streaming helpers for validating large CSV/TXT files
+"""
+
+import csv
+import json
+import os
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Union
+
+from .exceptions import ValidationError
+from .models import ValidationResult
+from .utils import EMAIL_REGEX
+
+
+# Header names recognized as the email column, checked in this order before
+# falling back to any header containing "mail"
+EMAIL_COLUMN_NAMES = ("email", "e-mail", "email_address", "emailaddress", "mail")
+
+
+@dataclass
+class FileChunk:
+    """
+    A run of emails read from a file
+
+    Attributes:
+        index: Position of the chunk in the file (0-based)
+        emails: Email addresses in the chunk
+        end_offset: Byte offset in the file just past the chunk
+    """
+    index: int
+    emails: List[str]
+    end_offset: int
+
+
+@dataclass
+class FileJobSummary:
+    """
+    Outcome of a streaming file validation
+
+    Attributes:
+        count: Emails validated, including chunks finished by earlier runs
+        valid_count: Number of valid emails
+        invalid_count: Number of invalid emails
+        chunks: Chunks finished, including earlier runs
+        resumed_chunks: Chunks skipped because an earlier run finished them
+        column: Email column used (None for TXT files)
+    """
+    count: int = 0
+    valid_count: int = 0
+    invalid_count: int = 0
+    chunks: int = 0
+    resumed_chunks: int = 0
+    column: Optional[str] = None
+
+    def __repr__(self) -> str:
+        return (
+            f"<FileJobSummary(count={self.count}, valid={self.valid_count}, "
+            f"invalid={self.invalid_count}, resumed_chunks={self.resumed_chunks})>"
+        )
+
+
+def _looks_like_email(value: str) -> bool:
+    return bool(EMAIL_REGEX.match(value.strip()))
+
+
+def detect_email_column(first_row: List[str]) -> Tuple[Optional[int], bool]:
+    """
+    Find the email column from a CSV file's first row
+
+    A row that already contains an email address is treated as data (no
+    header) and that cell's position is used. Otherwise the row is a header
+    and the column is chosen by name.
+
+    Args:
+        first_row: Cells of the first row
+
+    Returns:
+        Tuple of (column index, whether the first row is a header); the
+        index is None if no column could be identified
+
+    Examples:
+        >>> detect_email_column(["id", "Email", "name"])
+        (1, True)
+        >>> detect_email_column(["1", "user@example.com"])
+        (1, False)
+    """
+    for i, cell in enumerate(first_row):
+        if _looks_like_email(cell):
+            return i, False
+
+    names = [cell.strip().lower() for cell in first_row]
+    for candidate in EMAIL_COLUMN_NAMES:
+        if candidate in names:
+            return names.index(candidate), True
+    for i, name in enumerate(names):
+        if "mail" in name:
+            return i, True
+
+    return None, True
+
+
+_BOM = b"\xef\xbb\xbf"
+
+
+def iter_file_chunks(
+    path: Path,
+    chunk_size: int,
+    column: Optional[str] = None,
+    start_offset: int = 0,
+    start_index: int = 0,
+    encoding: str = "utf-8",
+) -> Tuple[Optional[str], Iterator[FileChunk]]:
+    """
+    Read emails from a CSV or TXT file in bounded chunks
+
+    The file is read incrementally, so memory use depends on ``chunk_size``
+    and not on the size of the file. Each chunk records the byte offset just
+    past it, which can be passed back as ``start_offset`` to resume reading
+    there. Blank cells are skipped.
+
+    Args:
+        path: CSV or TXT file
+        chunk_size: Emails per chunk
+        column: CSV column name (auto-detected if not provided)
+        start_offset: Byte offset to resume from (0 starts at the beginning)
+        start_index: Index of the first chunk yielded
+        encoding: Text encoding of the file
+
+    Returns:
+        Tuple of (column name used, iterator of FileChunk)
+
+    Raises:
+        ValidationError: If the email column can't be found
+    """
+    is_csv = path.suffix.lower() == ".csv"
+    column_index = 0
+    column_name: Optional[str] = None
+
+    with open(path, "rb") as f:
+        data_start = len(_BOM) if f.read(len(_BOM)) == _BOM else 0
+        f.seek(data_start)
+        first_line = f.readline()
+
+    if is_csv:
+        # The first row decides the column on every run, including resumes
+        first_row = next(csv.reader([first_line.decode(encoding)]), [])
+        header = [cell.strip() for cell in first_row]
+
+        if column is not None:
+            if column not in header:
+                raise ValidationError(f"Column not found in {path.name}: {column}")
+            column_index, has_header = header.index(column), True
+        else:
+            found, has_header = detect_email_column(first_row)
+            if found is None:
+                raise ValidationError(f"Could not detect an email column in {path.name}")
+            column_index = found
+
+        if has_header:
+            column_name = header[column_index]
+            data_start += len(first_line)
+
+    def chunks() -> Iterator[FileChunk]:
+        with open(path, "rb") as f:
+            offset = max(start_offset, data_start)
+            f.seek(offset)
+
+            def lines() -> Iterator[str]:
+                # Track the offset line by line; csv.reader never reads ahead
+                # of the row it returns, so after each row it is exact
+                nonlocal offset
+                for raw in f:
+                    offset += len(raw)
+                    yield raw.decode(encoding)
+
+            rows = csv.reader(lines()) if is_csv else ([line] for line in lines())
+            index = start_index
+            batch: List[str] = []
+
+            for row in rows:
+                if column_index < len(row):
+                    email = row[column_index].strip()
+                    if email:
+                        batch.append(email)
+                if len(batch) == chunk_size:
+                    yield FileChunk(index, batch, offset)
+                    index += 1
+                    batch = []
+
+            if batch:
+                yield FileChunk(index, batch, offset)
+
+    return column_name, chunks()
+
+
+class FileJournal:
+    """
+    Checkpoint journal for a streaming file validation
+
+    After each chunk is written to the output, the journal records how far
+    the input and output got. It is a small JSON file replaced atomically,
+    so a job killed at any point resumes from its last finished chunk.
+
+    Args:
+        path: Journal file location
+        job: Identity of the job (source file, chunking and options); a
+            journal written for a different job is refused rather than
+            resumed
+    """
+
+    def __init__(self, path: Union[str, Path], job: Dict[str, Any]):
+        self.path = Path(path)
+        self.job = job
+        self.input_offset = 0
+        self.output_offset = 0
+        self.summary = FileJobSummary()
+        self.complete = False
+
+    def load(self) -> bool:
+        """
+        Read an existing journal
+
+        Returns:
+            True if there was a journal to resume from
+
+        Raises:
+            ValidationError: If the journal belongs to a different job
+        """
+        if not self.path.exists():
+            return False
+
+        with open(self.path, encoding="utf-8") as f:
+            state = json.load(f)
+
+        if state.get("job") != self.job:
+            raise ValidationError(
+                f"Journal {self.path} was written for a different job; "
+                "delete it to start over"
+            )
+
+        self.input_offset = state["input_offset"]
+        self.output_offset = state["output_offset"]
+        self.summary = FileJobSummary(**state["summary"])
+        self.complete = state.get("complete", False)
+        return True
+
+    def save(self) -> None:
+        """Write the journal atomically"""
+        state = {
+            "job": self.job,
+            "input_offset": self.input_offset,
+            "output_offset": self.output_offset,
+            "summary": asdict(self.summary),
+            "complete": self.complete,
+        }
+        tmp_path = self.path.with_name(self.path.name + ".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(state, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.path)
+
+
+class JsonLinesSink:
+    """
+    Output sink appending one JSON object per result to a file
+
+    Args:
+        path: Output file; created if missing, appended to if not
+        offset: When resuming, truncate the file to this many bytes before
+            appending, which drops results written after the last checkpoint
+    """
+
+    def __init__(self, path: Union[str, Path], offset: Optional[int] = None):
+        self.path = Path(path)
+        self._file = open(self.path, "ab")
+        if offset is not None:
+            self._file.truncate(offset)
+            self._file.seek(offset)
+
+    def write(self, results: List[ValidationResult]) -> None:
+        """Append results, one JSON line each"""
+        self._file.write(b"".join(
+            json.dumps(result.to_dict()).encode("utf-8") + b"\n" for result in results
+        ))
+
+    def flush(self) -> int:
+        """
+        Make written results durable
+
+        Returns:
+            Byte offset of the end of the output
+        """
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        return self._file.tell()
+
+    def close(self) -> None:
+        self._file.close()
+
+
+# A sink is a path (JSON Lines file) or a callable receiving each chunk's results
+OutputSink = Union[str, Path, Callable[[List[ValidationResult]], Any]]
@@ -0,0 +1,387 @@
+"""
+HTTP/2 transport for the synchronous client
+
+:class:`HTTP2Adapter` is a ``requests`` transport adapter backed by an
+httpx client with HTTP/2 enabled. Mounted on the client's session, it
+multiplexes concurrent requests from many threads as streams over a few
+connections instead of holding one connection (and one TLS handshake) per
+in-flight request. Servers that don't offer HTTP/2 during the TLS
+handshake are spoken to over HTTP/1.1 by the same adapter.
+"""
+
+import asyncio
+import logging
+import os
+import ssl
+import threading
+from typing import (
+    Any, AsyncIterator, Coroutine, Dict, Iterable, Iterator, List, Optional, Tuple, TypeVar,
+    Union,
+)
+
+import requests
+from requests.adapters import BaseAdapter
+from requests.structures import CaseInsensitiveDict
+from requests.utils import DEFAULT_CA_BUNDLE_PATH, get_encoding_from_headers, select_proxy
+from urllib3.exceptions import MaxRetryError
+from urllib3.util.retry import Retry
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover - optional dependency
+    httpx = None  # type: ignore[assignment]
+
+try:
+    import h2  # noqa: F401
+except ImportError:  # pragma: no cover - optional dependency
+    h2 = None  # type: ignore[assignment]
+
+
+logger = logging.getLogger(__name__)
+
+# Connection-specific headers are forbidden in HTTP/2; httpx manages the
+# connection itself either way
+_HOP_BY_HOP = frozenset({
+    "connection", "keep-alive", "proxy-connection", "transfer-encoding", "upgrade", "te",
+})
+
+TimeoutType = Union[None, float, Tuple[Optional[float], Optional[float]]]
+
+T = TypeVar("T")
+
+
+def _require_http2() -> None:
+    if httpx is None or h2 is None:
+        raise ImportError(
+            "HTTP/2 support requires httpx and h2. "
+            "Install them with: pip install 'mailsafepro-sdk[http2]'"
+        )
+
+
+async def _iterate(body: Iterable[bytes]) -> AsyncIterator[bytes]:
+    """Streamed request body as the async iterable httpx's AsyncClient expects"""
+    for chunk in body:
+        yield chunk
+
+
+async def _next_chunk(chunks: AsyncIterator[bytes]) -> bytes:
+    """Next chunk of a streamed response body, as a coroutine for the loop thread"""
+    return await chunks.__anext__()
+
+
+class _LoopThread:
+    """
+    Event loop running in a daemon thread, driving the shared connections
+
+    httpcore's thread-based HTTP/2 connection can put streams on the wire
+    out of stream-ID order when many threads start requests at once, which
+    servers reject as a protocol error. Running every request on one event
+    loop keeps each connection's state single-threaded.
+    """
+
+    def __init__(self) -> None:
+        self.loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(
+            target=self.loop.run_forever, name="mailsafepro-http2", daemon=True
+        )
+        self._thread.start()
+
+    def run(self, coroutine: Coroutine[Any, Any, T]) -> T:
+        """Run a coroutine on the loop and wait for its result"""
+        future = asyncio.run_coroutine_threadsafe(coroutine, self.loop)
+        return future.result()
+
+    def stop(self) -> None:
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self._thread.join()
+        self.loop.close()
+
+
+class _ResponseBody:
+    """
+    File-like ``Response.raw`` over an httpx response
+
+    Implements the parts of urllib3's response that ``requests`` uses:
+    ``stream()`` for ``iter_content``, ``read()``, ``tell()``, ``close()``
+    and ``release_conn()``. Content is already decoded by httpx. Bodies of
+    streamed responses are pulled from the event loop chunk by chunk.
+    """
+
+    def __init__(self, response: "httpx.Response", loop: _LoopThread):
+        self._response = response
+        self._loop = loop
+        self._chunks: Optional[Iterator[bytes]] = None
+        self._buffer = b""
+        self.http_version = response.http_version
+
+    def stream(self, amt: int = 65536, decode_content: bool = True) -> Iterator[bytes]:
+        if self._response.is_closed:
+            # Read in full by the adapter already
+            yield from self._response.iter_bytes(amt)
+            return
+
+        chunks: AsyncIterator[bytes] = self._response.aiter_bytes(amt)
+        try:
+            while True:
+                try:
+                    yield self._loop.run(_next_chunk(chunks))
+                except StopAsyncIteration:
+                    return
+        except httpx.TimeoutException as e:
+            raise requests.exceptions.ReadTimeout(str(e)) from e
+        except httpx.TransportError as e:
+            raise requests.exceptions.ConnectionError(str(e)) from e
+
+    def read(self, amt: Optional[int] = None, decode_content: bool = True) -> bytes:
+        if self._chunks is None:
+            self._chunks = self.stream()
+        if amt is None:
+            data, self._buffer = self._buffer + b"".join(self._chunks), b""
+            return data
+        while len(self._buffer) < amt:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                break
+            self._buffer += chunk
+        data, self._buffer = self._buffer[:amt], self._buffer[amt:]
+        return data
+
+    def tell(self) -> int:
+        """Body bytes read off the wire so far, before decoding"""
+        return self._response.num_bytes_downloaded
+
+    def close(self) -> None:
+        if not self._response.is_closed:
+            self._loop.run(self._response.aclose())
+
+    def release_conn(self) -> None:
+        self.close()
+
+
+class HTTP2Adapter(BaseAdapter):
+    """
+    ``requests`` transport adapter speaking HTTP/2 through httpx
+
+    Requests from all threads share one connection pool; over HTTP/2 they
+    run as concurrent streams on a single connection per host (a second one
+    is opened only beyond the server's stream limit). The connections are
+    driven by an event loop in a background thread, which calling threads
+    hand their requests to. Retries follow the same urllib3 ``Retry`` policy
+    as requests' own HTTPAdapter. Requires the ``http2`` extra (``httpx``
+    and ``h2``).
+
+    HTTP/2 is negotiated during the TLS handshake (ALPN), so plain
+    ``http://`` URLs use HTTP/1.1 unless ``prior_knowledge`` is set for a
+    server known to accept cleartext HTTP/2.
+
+    Proxies are not supported: a request a proxy applies to (from the
+    session or ``HTTP(S)_PROXY``) raises instead of bypassing the proxy.
+    ``MailSafePro(http2=True)`` mounts requests' own adapter instead when a
+    proxy is configured.
+
+    Args:
+        max_connections: Maximum open connections per pool
+        max_retries: urllib3 Retry policy (or a retry count)
+        prior_knowledge: Speak HTTP/2 without negotiation on ``http://`` URLs
+
+    Examples:
+        >>> session = requests.Session()
+        >>> session.mount("https://", HTTP2Adapter(max_retries=Retry(total=3)))
+    """
+
+    def __init__(
+        self,
+        max_connections: int = 10,
+        max_retries: Union[Retry, int, None] = 0,
+        prior_knowledge: bool = False,
+    ):
+        _require_http2()
+        super().__init__()
+        self.max_connections = max_connections
+        self.max_retries = (
+            max_retries if isinstance(max_retries, Retry) else Retry.from_int(max_retries)
+        )
+        self.prior_knowledge = prior_knowledge
+        self._lock = threading.Lock()
+        self._loop: Optional[_LoopThread] = None
+        # One client per TLS configuration; in practice there's just one
+        self._clients: Dict[Any, "httpx.AsyncClient"] = {}
+
+    def _client_for(
+        self,
+        verify: Union[bool, str],
+        cert: Any,
+    ) -> Tuple[_LoopThread, "httpx.AsyncClient"]:
+        key = (verify, cert if not isinstance(cert, list) else tuple(cert))
+        with self._lock:
+            if self._loop is None:
+                self._loop = _LoopThread()
+            client = self._clients.get(key)
+            if client is None:
+                client = self._clients[key] = self._create_client(verify, cert)
+            return self._loop, client
+
+    def _create_client(self, verify: Union[bool, str], cert: Any) -> "httpx.AsyncClient":
+        """httpx client honoring requests' ``verify`` and ``cert`` arguments"""
+        if verify is False:
+            context = ssl.SSLContext(ssl.PROTOCOL_TLS_CLIENT)
+            context.check_hostname = False
+            context.verify_mode = ssl.CERT_NONE
+        elif isinstance(verify, str) and os.path.isdir(verify):
+            context = ssl.create_default_context(capath=verify)
+        else:
+            # Same CA bundle requests would use (REQUESTS_CA_BUNDLE arrives as a path)
+            cafile = verify if isinstance(verify, str) else DEFAULT_CA_BUNDLE_PATH
+            context = ssl.create_default_context(cafile=cafile)
+        if cert:
+            context.load_cert_chain(*((cert,) if isinstance(cert, str) else cert))
+
+        limits = httpx.Limits(
+            max_connections=self.max_connections,
+            max_keepalive_connections=self.max_connections,
+        )
+        # Retries are applied in send(), with the requests-level policy
+        return httpx.AsyncClient(
+            http1=not self.prior_knowledge,
+            http2=True,
+            verify=context,
+            limits=limits,
+            timeout=None,
+            trust_env=False,
+        )
+
+    @staticmethod
+    def _timeout(timeout: TimeoutType) -> "httpx.Timeout":
+        if isinstance(timeout, tuple):
+            connect, read = timeout
+            return httpx.Timeout(read, connect=connect)
+        return httpx.Timeout(timeout)
+
+    def send(
+        self,
+        request: requests.PreparedRequest,
+        stream: bool = False,
+        timeout: TimeoutType = None,
+        verify: Union[bool, str] = True,
+        cert: Any = None,
+        proxies: Optional[Dict[str, str]] = None,
+    ) -> requests.Response:
+        """
+        Send a prepared request, retrying per ``max_retries``
+
+        Raises:
+            requests.exceptions.ProxyError: If a proxy applies to the URL
+        """
+        proxy = select_proxy(request.url or "", proxies or {})
+        if proxy:
+            raise requests.exceptions.ProxyError(
+                f"HTTP2Adapter can't send through a proxy ({proxy}); "
+                "mount requests' HTTPAdapter instead",
+                request=request,
+            )
+        loop, client = self._client_for(verify, cert)
+        # Encoded the way http.client does for requests' own adapter
+        headers: List[Tuple[bytes, bytes]] = [
+            (name.encode("latin-1"), value if isinstance(value, bytes) else value.encode("latin-1"))
+            for name, value in request.headers.items()
+            if name.lower() not in _HOP_BY_HOP
+        ]
+        body = request.body.encode("utf-8") if isinstance(request.body, str) else request.body
+        method = request.method or "GET"
+        url = request.url or ""
+        retries = self.max_retries
+
+        while True:
+            # Streamed bodies (generators, compressed bodies) are iterated
+            # again on each attempt
+            content = (
+                body if body is None or isinstance(body, bytes)
+                else _iterate(body)  # type: ignore[arg-type]
+            )
+            outgoing = client.build_request(
+                method, url, headers=headers, content=content, timeout=self._timeout(timeout)
+            )
+            try:
+                response = loop.run(self._send(client, outgoing, stream))
+            except httpx.TransportError as e:
+                try:
+                    retries = retries.increment(method, url, error=e)
+                except MaxRetryError:
+                    raise self._translate(e, request) from e
+                logger.debug(f"Retrying {method} {url} after {type(e).__name__}")
+                retries.sleep()
+                continue
+
+            has_retry_after = "Retry-After" in response.headers
+            if not retries.is_retry(method, response.status_code, has_retry_after):
+                break
+            try:
+                retries = retries.increment(method, url)
+            except MaxRetryError:
+                # raise_on_status=False: hand the final response to the caller
+                if retries.raise_on_status:
+                    loop.run(response.aclose())
+                    raise requests.exceptions.RetryError(
+                        f"Max retries exceeded with url: {url}", request=request
+                    )
+                break
+            loop.run(response.aclose())
+            logger.debug(f"Retrying {method} {url} after status {response.status_code}")
+            retries.sleep(response)  # type: ignore[arg-type]  # only reads headers
+
+        return self.build_response(request, response, loop)
+
+    @staticmethod
+    async def _send(
+        client: "httpx.AsyncClient",
+        request: "httpx.Request",
+        stream: bool,
+    ) -> "httpx.Response":
+        response = await client.send(request, stream=True)
+        if not stream:
+            await response.aread()
+        return response
+
+    @staticmethod
+    def _translate(error: Exception, request: requests.PreparedRequest) -> Exception:
+        """requests exception matching an httpx transport error"""
+        if isinstance(error, httpx.ConnectTimeout):
+            return requests.exceptions.ConnectTimeout(str(error), request=request)
+        if isinstance(error, httpx.TimeoutException):
+            return requests.exceptions.ReadTimeout(str(error), request=request)
+        return requests.exceptions.ConnectionError(str(error), request=request)
+
+    def build_response(
+        self,
+        request: requests.PreparedRequest,
+        response: "httpx.Response",
+        loop: _LoopThread,
+    ) -> requests.Response:
+        """Wrap an httpx response as a requests Response"""
+        built = requests.Response()
+        built.status_code = response.status_code
+        built.headers = CaseInsensitiveDict(response.headers)
+        built.encoding = get_encoding_from_headers(built.headers)
+        built.raw = _ResponseBody(response, loop)
+        built.reason = response.reason_phrase
+        built.url = request.url or ""
+        built.request = request
+        built.connection = self  # type: ignore[assignment]
+        return built
+
+    def close(self) -> None:
+        """Close every pooled connection and stop the event loop thread"""
+        with self._lock:
+            loop, self._loop = self._loop, None
+            clients, self._clients = list(self._clients.values()), {}
+        if loop is None:
+            return
+        for client in clients:
+            loop.run(client.aclose())
+        loop.stop()
+
+    def __repr__(self) -> str:
+        return (
+            f"<HTTP2Adapter(max_connections={self.max_connections}, "
+            f"prior_knowledge={self.prior_knowledge})>"
+        )
@@ -2,11 +2,35 @@
 Data Models for API responses
 """
 
-from dataclasses import dataclass, field
+from dataclasses import asdict, dataclass, field, fields
 from datetime import datetime
-from typing import List, Optional, Dict, Any
+from typing import TYPE_CHECKING, Callable, List, Optional, Dict, Any, Type
 
+from .decoding import FieldSpec, compile_decoder, compile_value, compile_values
+from .exceptions import EmailValidatorError
 
+if TYPE_CHECKING:  # pragma: no cover
+    from .columnar import ResultColumns
+    from .preflight import PreflightReport
+
+
+def _slotted(cls: type) -> type:
+    """
+    Rebuild a dataclass with ``__slots__`` instead of a per-instance ``__dict__``
+    
+    Equivalent to ``@dataclass(slots=True)``, which needs Python 3.10. Field
+    defaults are dropped from the class namespace (they would clash with the
+    slot descriptors); the generated ``__init__`` already holds them.
+    """
+    field_names = tuple(f.name for f in fields(cls))
+    namespace = dict(cls.__dict__)
+    for name in field_names + ("__dict__", "__weakref__"):
+        namespace.pop(name, None)
+    namespace["__slots__"] = field_names
+    return type(cls)(cls.__name__, cls.__bases__, namespace)
+
+
+@_slotted
 @dataclass
 class DNSRecordSPF:
     """SPF DNS record information"""
@@ -15,16 +39,16 @@ class DNSRecordSPF:
     mechanism: Optional[str] = None
     domain: Optional[str] = None
     
-    @classmethod
-    def from_dict(cls, data: Dict[str, Any]) -> "DNSRecordSPF":
-        return cls(
-            status=data.get("status"),
-            record=data.get("record"),
-            mechanism=data.get("mechanism"),
-            domain=data.get("domain"),
-        )
+    FIELDS = (
+        FieldSpec("status", canonical=True),
+        FieldSpec("record"),
+        FieldSpec("mechanism"),
+        FieldSpec("domain"),
+    )
+    from_dict = classmethod(compile_decoder(FIELDS, "DNSRecordSPF"))
 
 
+@_slotted
 @dataclass
 class DNSRecordDKIM:
     """DKIM DNS record information"""
@@ -34,17 +58,17 @@ class DNSRecordDKIM:
     key_length: Optional[int] = None
     record: Optional[str] = None
     
-    @classmethod
-    def from_dict(cls, data: Dict[str, Any]) -> "DNSRecordDKIM":
-        return cls(
-            status=data.get("status"),
-            selector=data.get("selector"),
-            key_type=data.get("keytype") or data.get("key_type"),
-            key_length=data.get("keylength") or data.get("key_length"),
-            record=data.get("record"),
-        )
+    FIELDS = (
+        FieldSpec("status", canonical=True),
+        FieldSpec("selector"),
+        FieldSpec("key_type", ("key_type", "keytype"), canonical=True),
+        FieldSpec("key_length", ("key_length", "keylength")),
+        FieldSpec("record"),
+    )
+    from_dict = classmethod(compile_decoder(FIELDS, "DNSRecordDKIM"))
 
 
+@_slotted
 @dataclass
 class DNSRecordDMARC:
     """DMARC DNS record information"""
@@ -53,16 +77,16 @@ class DNSRecordDMARC:
     record: Optional[str] = None
     pct: Optional[int] = None
     
-    @classmethod
-    def from_dict(cls, data: Dict[str, Any]) -> "DNSRecordDMARC":
-        return cls(
-            status=data.get("status"),
-            policy=data.get("policy"),
-            record=data.get("record"),
-            pct=data.get("pct"),
-        )
+    FIELDS = (
+        FieldSpec("status", canonical=True),
+        FieldSpec("policy", canonical=True),
+        FieldSpec("record"),
+        FieldSpec("pct"),
+    )
+    from_dict = classmethod(compile_decoder(FIELDS, "DNSRecordDMARC"))
 
 
+@_slotted
 @dataclass
 class DNSInfo:
     """Comprehensive DNS information for email validation"""
@@ -72,17 +96,17 @@ class DNSInfo:
     mx_records: List[str] = field(default_factory=list)
     ns_records: List[str] = field(default_factory=list)
     
-    @classmethod
-    def from_dict(cls, data: Dict[str, Any]) -> "DNSInfo":
-        return cls(
-            spf=DNSRecordSPF.from_dict(data.get("spf", {})) if data.get("spf") else None,
-            dkim=DNSRecordDKIM.from_dict(data.get("dkim", {})) if data.get("dkim") else None,
-            dmarc=DNSRecordDMARC.from_dict(data.get("dmarc", {})) if data.get("dmarc") else None,
-            mx_records=data.get("mx_records", []) or data.get("mxrecords", []),
-            ns_records=data.get("ns_records", []) or data.get("nsrecords", []),
-        )
+    FIELDS = (
+        FieldSpec("spf", section=DNSRecordSPF.from_dict),
+        FieldSpec("dkim", section=DNSRecordDKIM.from_dict),
+        FieldSpec("dmarc", section=DNSRecordDMARC.from_dict),
+        FieldSpec("mx_records", ("mx_records", "mxrecords"), default_factory=list),
+        FieldSpec("ns_records", ("ns_records", "nsrecords"), default_factory=list),
+    )
+    from_dict = classmethod(compile_decoder(FIELDS, "DNSInfo"))
 
 
+@_slotted
 @dataclass
 class SMTPInfo:
     """SMTP verification results"""
@@ -94,19 +118,19 @@ class SMTPInfo:
     skip_reason: Optional[str] = None
     detail: Optional[str] = None
     
-    @classmethod
-    def from_dict(cls, data: Dict[str, Any]) -> "SMTPInfo":
-        return cls(
-            checked=data.get("checked", False),
-            mailbox_exists=data.get("mailbox_exists") or data.get("mailboxexists"),
-            mx_server=data.get("mx_server") or data.get("mxserver"),
-            response_time=data.get("response_time") or data.get("responsetime"),
-            error_message=data.get("error_message") or data.get("errormessage"),
-            skip_reason=data.get("skip_reason") or data.get("skipreason"),
-            detail=data.get("detail"),
-        )
+    FIELDS = (
+        FieldSpec("checked", default=False),
+        FieldSpec("mailbox_exists", ("mailbox_exists", "mailboxexists")),
+        FieldSpec("mx_server", ("mx_server", "mxserver")),
+        FieldSpec("response_time", ("response_time", "responsetime")),
+        FieldSpec("error_message", ("error_message", "errormessage")),
+        FieldSpec("skip_reason", ("skip_reason", "skipreason")),
+        FieldSpec("detail"),
+    )
+    from_dict = classmethod(compile_decoder(FIELDS, "SMTPInfo"))
 
 
+@_slotted
 @dataclass
 class ProviderAnalysis:
     """Email provider analysis"""
@@ -114,15 +138,15 @@ class ProviderAnalysis:
     reputation: float
     fingerprint: Optional[str] = None
     
-    @classmethod
-    def from_dict(cls, data: Dict[str, Any]) -> "ProviderAnalysis":
-        return cls(
-            provider=data.get("provider", "unknown"),
-            reputation=data.get("reputation", 0.5),
-            fingerprint=data.get("fingerprint"),
-        )
+    FIELDS = (
+        FieldSpec("provider", default="unknown", canonical=True),
+        FieldSpec("reputation", default=0.5),
+        FieldSpec("fingerprint"),
+    )
+    from_dict = classmethod(compile_decoder(FIELDS, "ProviderAnalysis"))
 
 
+@_slotted
 @dataclass
 class SecurityInfo:
     """Security breach information"""
@@ -133,18 +157,18 @@ class SecurityInfo:
     cached: bool = False
     recent_breaches: List[str] = field(default_factory=list)
     
-    @classmethod
-    def from_dict(cls, data: Dict[str, Any]) -> "SecurityInfo":
-        return cls(
-            in_breach=data.get("in_breach") or data.get("inbreach", False),
-            breach_count=data.get("breach_count") or data.get("breachcount", 0),
-            risk_level=data.get("risk_level") or data.get("risklevel"),
-            checked_at=data.get("checked_at") or data.get("checkedat"),
-            cached=data.get("cached", False),
-            recent_breaches=data.get("recent_breaches") or data.get("recentbreaches", []),
-        )
+    FIELDS = (
+        FieldSpec("in_breach", ("in_breach", "inbreach"), default=False),
+        FieldSpec("breach_count", ("breach_count", "breachcount"), default=0),
+        FieldSpec("risk_level", ("risk_level", "risklevel"), canonical=True),
+        FieldSpec("checked_at", ("checked_at", "checkedat")),
+        FieldSpec("cached", default=False),
+        FieldSpec("recent_breaches", ("recent_breaches", "recentbreaches"), default_factory=list),
+    )
+    from_dict = classmethod(compile_decoder(FIELDS, "SecurityInfo"))
 
 
+@_slotted
 @dataclass
 class SpamTrapCheck:
     """Spam trap detection results"""
@@ -155,18 +179,18 @@ class SpamTrapCheck:
     source: str
     details: str
     
-    @classmethod
-    def from_dict(cls, data: Dict[str, Any]) -> "SpamTrapCheck":
-        return cls(
-            checked=data.get("checked", False),
-            is_spam_trap=data.get("is_spam_trap") or data.get("isspamtrap", False),
-            confidence=data.get("confidence", 0.0),
-            trap_type=data.get("trap_type") or data.get("traptype", "unknown"),
-            source=data.get("source", "unknown"),
-            details=data.get("details", ""),
-        )
+    FIELDS = (
+        FieldSpec("checked", default=False),
+        FieldSpec("is_spam_trap", ("is_spam_trap", "isspamtrap"), default=False),
+        FieldSpec("confidence", default=0.0),
+        FieldSpec("trap_type", ("trap_type", "traptype"), default="unknown", canonical=True),
+        FieldSpec("source", default="unknown", canonical=True),
+        FieldSpec("details", default=""),
+    )
+    from_dict = classmethod(compile_decoder(FIELDS, "SpamTrapCheck"))
 
 
+@_slotted
 @dataclass
 class RoleEmailInfo:
     """Role email detection results"""
@@ -175,16 +199,18 @@ class RoleEmailInfo:
     deliverability_risk: Optional[str] = None
     confidence: float = 0.0
     
-    @classmethod
-    def from_dict(cls, data: Dict[str, Any]) -> "RoleEmailInfo":
-        return cls(
-            is_role_email=data.get("is_role_email") or data.get("isroleemail", False),
-            role_type=data.get("role_type") or data.get("roletype"),
-            deliverability_risk=data.get("deliverability_risk") or data.get("deliverabilityrisk"),
-            confidence=data.get("confidence", 0.0),
-        )
+    FIELDS = (
+        FieldSpec("is_role_email", ("is_role_email", "isroleemail"), default=False),
+        FieldSpec("role_type", ("role_type", "roletype"), canonical=True),
+        FieldSpec(
+            "deliverability_risk", ("deliverability_risk", "deliverabilityrisk"), canonical=True
+        ),
+        FieldSpec("confidence", default=0.0),
+    )
+    from_dict = classmethod(compile_decoder(FIELDS, "RoleEmailInfo"))
 
 
+@_slotted
 @dataclass
 class BreachInfo:
     """Data breach information (PREMIUM/ENTERPRISE)"""
@@ -195,18 +221,11 @@ class BreachInfo:
     cached: bool = False
     recent_breaches: List[str] = field(default_factory=list)
     
-    @classmethod
-    def from_dict(cls, data: Dict[str, Any]) -> "BreachInfo":
-        return cls(
-            in_breach=data.get("in_breach") or data.get("inbreach", False),
-            breach_count=data.get("breach_count") or data.get("breachcount", 0),
-            risk_level=data.get("risk_level") or data.get("risklevel"),
-            checked_at=data.get("checked_at") or data.get("checkedat"),
-            cached=data.get("cached", False),
-            recent_breaches=data.get("recent_breaches") or data.get("recentbreaches", []),
-        )
+    FIELDS = SecurityInfo.FIELDS
+    from_dict = classmethod(compile_decoder(FIELDS, "BreachInfo"))
 
 
+@_slotted
 @dataclass
 class SuggestedFixes:
     """Suggested email fixes for typos"""
@@ -215,16 +234,16 @@ class SuggestedFixes:
     confidence: float = 0.0
     reason: Optional[str] = None
     
-    @classmethod
-    def from_dict(cls, data: Dict[str, Any]) -> "SuggestedFixes":
-        return cls(
-            typo_detected=data.get("typo_detected") or data.get("typodetected", False),
-            suggested_email=data.get("suggested_email") or data.get("suggestedemail"),
-            confidence=data.get("confidence", 0.0),
-            reason=data.get("reason"),
-        )
+    FIELDS = (
+        FieldSpec("typo_detected", ("typo_detected", "typodetected"), default=False),
+        FieldSpec("suggested_email", ("suggested_email", "suggestedemail")),
+        FieldSpec("confidence", default=0.0),
+        FieldSpec("reason"),
+    )
+    from_dict = classmethod(compile_decoder(FIELDS, "SuggestedFixes"))
 
 
+@_slotted
 @dataclass
 class Metadata:
     """Validation metadata"""
@@ -233,16 +252,65 @@ class Metadata:
     cache_used: bool
     client_plan: str = "UNKNOWN"
     
-    @classmethod
-    def from_dict(cls, data: Dict[str, Any]) -> "Metadata":
-        return cls(
-            timestamp=data.get("timestamp", ""),
-            validation_id=data.get("validation_id") or data.get("validationid", ""),
-            cache_used=data.get("cache_used") or data.get("cacheused", False),
-            client_plan=data.get("client_plan") or data.get("clientplan", "UNKNOWN"),
-        )
+    FIELDS = (
+        FieldSpec("timestamp", default=""),
+        FieldSpec("validation_id", ("validation_id", "validationid"), default=""),
+        FieldSpec("cache_used", ("cache_used", "cacheused"), default=False),
+        FieldSpec("client_plan", ("client_plan", "clientplan"), default="UNKNOWN", canonical=True),
+    )
+    from_dict = classmethod(compile_decoder(FIELDS, "Metadata"))
+
+
+# validation_tier of results decided by the SDK without calling the API
+OFFLINE_TIER = "offline"
+
 
+# Top-level ValidationResult fields, accepting legacy key spellings
+_SCALAR_FIELDS = (
+    FieldSpec("email", default=""),
+    FieldSpec("valid", default=False),
+    FieldSpec("detail", default=""),
+    FieldSpec("processing_time", ("processing_time", "processingtime"), default=0.0),
+    FieldSpec("risk_score", ("risk_score", "riskscore"), default=0.5),
+    FieldSpec("quality_score", ("quality_score", "qualityscore"), default=0.5),
+    FieldSpec(
+        "validation_tier", ("validation_tier", "validationtier"), default="basic", canonical=True
+    ),
+    FieldSpec(
+        "suggested_action", ("suggested_action", "suggestedaction"), default="review",
+        canonical=True,
+    ),
+    FieldSpec("status", default="unknown", canonical=True),
+)
 
+# Nested ValidationResult sections and the response keys they're read from
+_SECTION_FIELDS = (
+    FieldSpec(
+        "provider_analysis", ("provider_analysis", "provideranalysis"),
+        section=ProviderAnalysis.from_dict, required=True,
+    ),
+    FieldSpec(
+        "smtp", ("smtp_validation", "smtpvalidation", "smtp"),
+        section=SMTPInfo.from_dict, required=True,
+    ),
+    FieldSpec("dns_security", ("dns_security", "dnssecurity"), section=DNSInfo.from_dict),
+    FieldSpec(
+        "spam_trap_check", ("spam_trap_check", "spamtrapcheck"), section=SpamTrapCheck.from_dict
+    ),
+    FieldSpec("role_email_info", ("email_type", "emailtype"), section=RoleEmailInfo.from_dict),
+    FieldSpec("breach_info", ("security",), section=BreachInfo.from_dict),
+    FieldSpec(
+        "suggested_fixes", ("suggested_fixes", "suggestedfixes"), section=SuggestedFixes.from_dict
+    ),
+    FieldSpec("metadata", section=Metadata.from_dict),
+)
+
+_SECTIONS = {spec.name: spec for spec in _SECTION_FIELDS}
+
+_read_scalars = compile_values(_SCALAR_FIELDS)
+
+
+@_slotted
 @dataclass
 class ValidationResult:
     """
@@ -255,7 +323,8 @@ class ValidationResult:
         processing_time: Total processing time in seconds
         risk_score: Risk assessment score (0.0-1.0, higher = riskier)
         quality_score: Email quality score (0.0-1.0, higher = better)
-        validation_tier: Validation level performed (basic/standard/premium)
+        validation_tier: Validation level performed (basic/standard/premium,
+            or offline for results decided by an OfflineClassifier)
         suggested_action: Recommended action (accept/review/monitor/reject)
         status: Email status (deliverable/risky/undeliverable/unknown)
         provider_analysis: Email provider information
@@ -285,44 +354,29 @@ class ValidationResult:
     suggested_fixes: Optional[SuggestedFixes] = None
     metadata: Optional[Metadata] = None
     
-    @classmethod
-    def from_dict(cls, data: Dict[str, Any]) -> "ValidationResult":
-        """Create ValidationResult from API response dictionary"""
-        return cls(
-            email=data.get("email", ""),
-            valid=data.get("valid", False),
-            detail=data.get("detail", ""),
-            processing_time=data.get("processing_time") or data.get("processingtime", 0.0),
-            risk_score=data.get("risk_score") or data.get("riskscore", 0.5),
-            quality_score=data.get("quality_score") or data.get("qualityscore", 0.5),
-            validation_tier=data.get("validation_tier") or data.get("validationtier", "basic"),
-            suggested_action=data.get("suggested_action") or data.get("suggestedaction", "review"),
-            status=data.get("status", "unknown"),
-            provider_analysis=ProviderAnalysis.from_dict(
-                data.get("provider_analysis") or data.get("provideranalysis", {})
-            ),
-            smtp=SMTPInfo.from_dict(
-                data.get("smtp_validation") or data.get("smtpvalidation") or data.get("smtp", {})
-            ),
-            dns_security=DNSInfo.from_dict(
-                data.get("dns_security") or data.get("dnssecurity", {})
-            ) if data.get("dns_security") or data.get("dnssecurity") else None,
-            spam_trap_check=SpamTrapCheck.from_dict(
-                data.get("spam_trap_check") or data.get("spamtrapcheck", {})
-            ) if data.get("spam_trap_check") or data.get("spamtrapcheck", {}).get("checked") else None,
-            role_email_info=RoleEmailInfo.from_dict(
-                data.get("email_type") or data.get("emailtype", {})
-            ) if data.get("email_type") or data.get("emailtype") else None,
-            breach_info=BreachInfo.from_dict(
-                data.get("security") or {}
-            ) if data.get("security") else None,
-            suggested_fixes=SuggestedFixes.from_dict(
-                data.get("suggested_fixes") or data.get("suggestedfixes", {})
-            ) if data.get("suggested_fixes") or data.get("suggestedfixes") else None,
-            metadata=Metadata.from_dict(
-                data.get("metadata", {})
-            ) if data.get("metadata") else None,
-        )
+    FIELDS = _SCALAR_FIELDS + _SECTION_FIELDS
+    
+    if TYPE_CHECKING:  # pragma: no cover
+        @classmethod
+        def from_dict(cls, data: Dict[str, Any]) -> "ValidationResult": ...
+    else:
+        from_dict = classmethod(compile_decoder(FIELDS, "ValidationResult"))
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize to an API-shaped dictionary accepted by from_dict"""
+        data = asdict(self)
+        
+        # Sections whose API key differs from the attribute name
+        data["smtp_validation"] = data.pop("smtp")
+        data["email_type"] = data.pop("role_email_info")
+        data["security"] = data.pop("breach_info")
+        
+        return {key: value for key, value in data.items() if value is not None}
+    
+    @property
+    def locally_decided(self) -> bool:
+        """True if the SDK decided this result offline, without an API call"""
+        return self.validation_tier == OFFLINE_TIER
     
     def __repr__(self) -> str:
         return (
@@ -331,6 +385,126 @@ class ValidationResult:
         )
 
 
+class _LazySection:
+    """
+    Descriptor building one nested section on first access
+    
+    The built value is cached in the slot ValidationResult declares for the
+    same name, so later reads only cost a slot lookup. Assigning the
+    attribute writes the slot directly.
+    """
+    
+    def __init__(self, spec: FieldSpec) -> None:
+        self.build = compile_value(spec)
+    
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.name = name
+        self.slot = next(
+            base.__dict__[name] for base in owner.__mro__[1:] if name in base.__dict__
+        )
+    
+    def __get__(self, instance: Any, owner: type) -> Any:
+        if instance is None:
+            return self
+        try:
+            return self.slot.__get__(instance, owner)
+        except AttributeError:
+            value = self.build(instance._data)
+            self.slot.__set__(instance, value)
+            return value
+    
+    def __set__(self, instance: Any, value: Any) -> None:
+        self.slot.__set__(instance, value)
+
+
+class LazyValidationResult(ValidationResult):
+    """
+    ValidationResult that builds its nested sections on first access
+    
+    Top-level fields (``valid``, ``status``, ``risk_score``, ...) are read
+    from the response immediately; sections such as ``smtp``,
+    ``dns_security`` or ``metadata`` are only turned into objects when first
+    accessed, then cached. Code that only reads top-level fields never pays
+    for the rest.
+    
+    Attribute-compatible with ValidationResult and an instance of it. The
+    raw response dictionary is kept for as long as the result is.
+    
+    Examples:
+        >>> result = LazyValidationResult.from_dict(data)
+        >>> result.valid          # no nested objects built yet
+        True
+        >>> result.smtp.checked   # SMTPInfo built now and cached
+        False
+    """
+    
+    __slots__ = ("_data",)
+    _data: Dict[str, Any]
+    
+    provider_analysis = _LazySection(_SECTIONS["provider_analysis"])
+    smtp = _LazySection(_SECTIONS["smtp"])
+    dns_security = _LazySection(_SECTIONS["dns_security"])
+    spam_trap_check = _LazySection(_SECTIONS["spam_trap_check"])
+    role_email_info = _LazySection(_SECTIONS["role_email_info"])
+    breach_info = _LazySection(_SECTIONS["breach_info"])
+    suggested_fixes = _LazySection(_SECTIONS["suggested_fixes"])
+    metadata = _LazySection(_SECTIONS["metadata"])
+    
+    _from_scalars = classmethod(
+        compile_decoder(_SCALAR_FIELDS, "LazyValidationResult", init=False)
+    )
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "LazyValidationResult":
+        """Wrap an API response dictionary without building nested sections"""
+        result: LazyValidationResult = cls._from_scalars(data)
+        result._data = data
+        return result
+
+
+@_slotted
+@dataclass
+class ValidationFailure:
+    """
+    An email whose validation raised instead of returning a result
+    
+    Returned in place of a ValidationResult by fan-out methods such as
+    MailSafePro.validate_many(), so one failing email doesn't abort the run.
+    
+    Attributes:
+        email: Email address that failed
+        error: Exception raised while validating it
+    """
+    email: str
+    error: EmailValidatorError
+    
+    @property
+    def valid(self) -> bool:
+        """Always False, so failures can be filtered like invalid results"""
+        return False
+    
+    def __repr__(self) -> str:
+        return (
+            f"<ValidationFailure(email={self.email!r}, "
+            f"error={type(self.error).__name__}: {self.error})>"
+        )
+
+
+# Batch-level fields of a /batch response; a missing count is filled in by
+# the caller from the number of results
+_BATCH_HEADER_FIELDS = (
+    FieldSpec("count"),
+    FieldSpec("valid_count", ("valid_count", "validcount"), default=0),
+    FieldSpec("invalid_count", ("invalid_count", "invalidcount"), default=0),
+    FieldSpec("processing_time", ("processing_time", "processingtime"), default=0.0),
+    FieldSpec("average_time", ("average_time", "averagetime"), default=0.0),
+    FieldSpec("summary"),
+)
+
+_read_batch_header = compile_values(_BATCH_HEADER_FIELDS)
+
+
+@_slotted
 @dataclass
 class BatchResult:
     """
@@ -342,8 +516,10 @@ class BatchResult:
         invalid_count: Number of invalid emails
         processing_time: Total processing time in seconds
         average_time: Average processing time per email
-        results: List of individual validation results
+        results: List of individual validation results (with pre-flight,
+            emails rejected locally are ValidationFailure entries)
         summary: Batch summary with additional statistics
+        preflight: What the local pre-flight stage removed, if it ran
     """
     count: int
     valid_count: int
@@ -352,23 +528,55 @@ class BatchResult:
     average_time: float
     results: List[ValidationResult]
     summary: Optional[Dict[str, Any]] = None
+    preflight: Optional["PreflightReport"] = None
     
     @classmethod
-    def from_dict(cls, data: Dict[str, Any]) -> "BatchResult":
-        """Create BatchResult from API response dictionary"""
-        results_data = data.get("results", [])
-        results = [ValidationResult.from_dict(r) for r in results_data]
+    def from_dict(
+        cls,
+        data: Dict[str, Any],
+        result_type: Type[ValidationResult] = ValidationResult,
+        decode: Optional[Callable[[Dict[str, Any]], ValidationResult]] = None,
+    ) -> "BatchResult":
+        """
+        Create BatchResult from API response dictionary
+        
+        Args:
+            data: API response dictionary
+            result_type: Class used for each result (e.g. LazyValidationResult)
+            decode: Function building each result instead of
+                ``result_type.from_dict`` (e.g. DomainSectionCache.decoder())
+        """
+        results_data = data.get("results") or []
+        decode = decode or result_type.from_dict
+        results = [decode(r) for r in results_data]
+        count, valid_count, invalid_count, processing_time, average_time, summary = (
+            _read_batch_header(data)
+        )
         
         return cls(
-            count=data.get("count", len(results)),
-            valid_count=data.get("valid_count") or data.get("validcount", 0),
-            invalid_count=data.get("invalid_count") or data.get("invalidcount", 0),
-            processing_time=data.get("processing_time") or data.get("processingtime", 0.0),
-            average_time=data.get("average_time") or data.get("averagetime", 0.0),
+            count=len(results) if count is None else count,
+            valid_count=valid_count,
+            invalid_count=invalid_count,
+            processing_time=processing_time,
+            average_time=average_time,
             results=results,
-            summary=data.get("summary"),
+            summary=summary,
         )
     
+    def columns(self, use_numpy: Optional[bool] = None) -> "ResultColumns":
+        """
+        Columnar view of the results for vectorized filtering and aggregation
+        
+        Args:
+            use_numpy: Force NumPy on or off (default: use it if installed)
+        
+        Returns:
+            ResultColumns built from ``results``
+        """
+        from .columnar import ResultColumns
+        
+        return ResultColumns.from_results(self.results, use_numpy)
+    
     def __repr__(self) -> str:
         return (
             f"<BatchResult(count={self.count}, valid={self.valid_count}, "
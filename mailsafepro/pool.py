@@ -0,0 +1,338 @@
+"""
+Connection pool instrumentation and pre-warming for the synchronous client
+
+:class:`PooledHTTPAdapter` is the ``requests`` HTTPAdapter the client
+mounts. Its urllib3 pools report every checkout to a shared
+:class:`PoolStats`, recording whether it reused a keep-alive connection or
+opened a new one (TCP connect and TLS handshake), and every connection
+discarded because the pool was full. The adapter can also open connections
+ahead of the first request (:meth:`PooledHTTPAdapter.warmup`).
+"""
+
+import logging
+import queue
+import ssl
+import threading
+import time
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Union
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.poolmanager import PoolManager
+from urllib3.util.wait import wait_for_read
+
+
+logger = logging.getLogger(__name__)
+
+
+class PoolStats:
+    """
+    Thread-safe connection pool counters shared by an adapter's pools
+
+    Counters accumulate over the client's lifetime, including pools replaced
+    when the client grows its pool. ``open`` and ``idle`` are measured when
+    :meth:`stats` is called.
+
+    Examples:
+        >>> validator = MailSafePro(api_key="key_xxx", pool_size=32)
+        >>> validator.warmup(8)
+        >>> validator.pool_stats()["idle"]
+        8
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._pools: "weakref.WeakSet[HTTPConnectionPool]" = weakref.WeakSet()
+        self.requests = 0
+        self.reused = 0
+        self.new_connections = 0
+        self.discarded = 0
+        self.in_use = 0
+
+    def _track(self, pool: HTTPConnectionPool) -> None:
+        with self._lock:
+            self._pools.add(pool)
+
+    def _checked_out(self, reused: bool) -> None:
+        with self._lock:
+            self.requests += 1
+            self.in_use += 1
+            if reused:
+                self.reused += 1
+            else:
+                self.new_connections += 1
+
+    def _opened(self, count: int) -> None:
+        with self._lock:
+            self.new_connections += count
+
+    def _checked_in(self) -> None:
+        with self._lock:
+            self.in_use -= 1
+
+    def _discarded(self) -> None:
+        with self._lock:
+            self.discarded += 1
+
+    def _idle(self) -> int:
+        """Connected connections waiting in the pools"""
+        with self._lock:
+            pools = list(self._pools)
+        idle = 0
+        for pool in pools:
+            waiting = pool.pool
+            if waiting is None:  # pool closed
+                continue
+            with waiting.mutex:
+                idle += sum(1 for conn in waiting.queue if conn is not None and not conn.is_closed)
+        return idle
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Current counters
+
+        Returns:
+            Dictionary with ``open`` (idle plus in use), ``idle``,
+            ``in_use``, ``requests`` (connection checkouts), ``reused``,
+            ``new_connections`` (each a TCP connect, plus a TLS handshake
+            over HTTPS, including warm-up) and ``discarded`` (closed because
+            the pool was full)
+        """
+        idle = self._idle()
+        with self._lock:
+            return {
+                "open": idle + self.in_use,
+                "idle": idle,
+                "in_use": self.in_use,
+                "requests": self.requests,
+                "reused": self.reused,
+                "new_connections": self.new_connections,
+                "discarded": self.discarded,
+            }
+
+    def __repr__(self) -> str:
+        return (
+            f"<PoolStats(requests={self.requests}, reused={self.reused}, "
+            f"new_connections={self.new_connections}, discarded={self.discarded})>"
+        )
+
+
+def _drain_session_tickets(conn: Any, wait: float) -> None:
+    """
+    Read the TLS 1.3 session tickets a server sends after the handshake
+
+    Normally they are consumed along with the first response. On a
+    connection left idle right after connecting they make the socket
+    readable, which urllib3 takes for a dropped connection and replaces.
+    """
+    sock = conn.sock
+    version = getattr(sock, "version", None)
+    if version is None or version() != "TLSv1.3":
+        return
+
+    timeout = sock.gettimeout()
+    sock.settimeout(0)
+    try:
+        # Tickets arrive about a round trip after connect() returns
+        while wait_for_read(sock, timeout=wait):
+            try:
+                if not sock.recv(1):
+                    return  # closed by the server; urllib3 will reconnect
+            except (ssl.SSLWantReadError, BlockingIOError):
+                pass
+            wait = 0.01
+    finally:
+        sock.settimeout(timeout)
+
+
+def warm_pool(pool: HTTPConnectionPool, count: int) -> int:
+    """
+    Open up to ``count`` keep-alive connections in a urllib3 pool
+
+    Connections are opened concurrently and left idle in the pool. Already
+    idle connections count towards ``count``, and no more than the pool's
+    free slots are opened. Connections that fail to open are logged and
+    left for requests to retry.
+
+    Args:
+        pool: Pool to fill (its stats, if tracked, count the connections)
+        count: Connections to have open
+
+    Returns:
+        Number of connections opened
+    """
+    # Take slots straight from the pool's queue: going through
+    # _get_conn() would block or open overflow connections when the
+    # pool is busy. Idle connections come first (LIFO), then empty slots.
+    waiting = pool.pool
+    if waiting is None:  # pool closed
+        return 0
+    conns: List[Any] = []
+    while len(conns) < count:
+        try:
+            conns.append(waiting.get(block=False))
+        except queue.Empty:
+            break
+    conns = [conn or pool._new_conn() for conn in conns]
+    fresh = [conn for conn in conns if conn.is_closed]
+
+    def connect(conn: Any) -> bool:
+        try:
+            started = time.monotonic()
+            if pool.proxy is not None:
+                pool._prepare_proxy(conn)
+            if conn.is_closed:
+                conn.connect()
+            _drain_session_tickets(conn, max(time.monotonic() - started, 0.05))
+            return True
+        except Exception as e:
+            logger.debug(f"Warm-up connection to {pool.host} failed: {e}")
+            conn.close()
+            return False
+
+    opened = 0
+    try:
+        if fresh:
+            with ThreadPoolExecutor(max_workers=len(fresh)) as executor:
+                opened = sum(executor.map(connect, fresh))
+    finally:
+        for conn in conns:
+            waiting.put(conn, block=False)
+    stats = getattr(pool, "stats", None)
+    if stats is not None:
+        stats._opened(opened)
+
+    logger.debug(f"Warmed up {opened} connections to {pool.host}")
+    return opened
+
+
+class _CountingQueue(queue.LifoQueue):
+    """Pool queue reporting connections turned away because it is full"""
+
+    stats: Optional[PoolStats] = None
+
+    def put(self, item: Any, block: bool = True, timeout: Optional[float] = None) -> None:
+        try:
+            super().put(item, block, timeout)
+        except queue.Full:
+            if item is not None and self.stats is not None:
+                self.stats._discarded()
+            raise
+
+
+class _TrackedPoolMixin:
+    """Report connection checkouts and returns to a PoolStats"""
+
+    QueueCls = _CountingQueue
+    stats: Optional[PoolStats] = None
+
+    def _get_conn(self, timeout: Optional[float] = None) -> Any:
+        conn = super()._get_conn(timeout)  # type: ignore[misc]
+        if self.stats is not None:
+            # Fresh connections and dropped ones urllib3 just closed connect on use
+            self.stats._checked_out(reused=not conn.is_closed)
+        return conn
+
+    def _put_conn(self, conn: Any) -> None:
+        super()._put_conn(conn)  # type: ignore[misc]
+        if self.stats is not None:
+            self.stats._checked_in()
+
+
+class _TrackedHTTPConnectionPool(_TrackedPoolMixin, HTTPConnectionPool):
+    pass
+
+
+class _TrackedHTTPSConnectionPool(_TrackedPoolMixin, HTTPSConnectionPool):
+    pass
+
+
+class _TrackedPoolManager(PoolManager):
+    """PoolManager whose pools report to a PoolStats"""
+
+    def __init__(self, *args: Any, stats: PoolStats, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self.stats = stats
+        self.pool_classes_by_scheme = {
+            "http": _TrackedHTTPConnectionPool,
+            "https": _TrackedHTTPSConnectionPool,
+        }
+
+    def _new_pool(self, scheme: str, host: str, port: int, request_context: Any = None) -> Any:
+        pool = super()._new_pool(scheme, host, port, request_context)
+        if isinstance(pool, _TrackedPoolMixin):
+            pool.stats = self.stats
+            if isinstance(pool.pool, _CountingQueue):
+                pool.pool.stats = self.stats
+            self.stats._track(pool)
+        return pool
+
+
+class PooledHTTPAdapter(HTTPAdapter):
+    """
+    HTTPAdapter recording connection reuse in a :class:`PoolStats`
+
+    Args:
+        stats: Counters to report to (default: a new PoolStats); pass the
+            same object to a replacement adapter to keep counting
+        **kwargs: HTTPAdapter arguments (``pool_connections``,
+            ``pool_maxsize``, ``pool_block``, ``max_retries``)
+
+    Examples:
+        >>> adapter = PooledHTTPAdapter(pool_maxsize=32, pool_block=True)
+        >>> session.mount("https://", adapter)
+        >>> adapter.stats.stats()["reused"]
+        0
+    """
+
+    def __init__(self, stats: Optional[PoolStats] = None, **kwargs: Any):
+        # Set before HTTPAdapter.__init__, which calls init_poolmanager()
+        self.stats = stats if stats is not None else PoolStats()
+        super().__init__(**kwargs)
+
+    def init_poolmanager(
+        self,
+        connections: int,
+        maxsize: int,
+        block: bool = False,
+        **pool_kwargs: Any,
+    ) -> None:
+        self._pool_connections = connections
+        self._pool_maxsize = maxsize
+        self._pool_block = block
+        self.poolmanager = _TrackedPoolManager(
+            num_pools=connections,
+            maxsize=maxsize,
+            block=block,
+            stats=self.stats,
+            **pool_kwargs,
+        )
+
+    def warmup(
+        self,
+        url: str,
+        count: int,
+        verify: Union[bool, str] = True,
+        cert: Any = None,
+        proxies: Optional[Dict[str, str]] = None,
+    ) -> int:
+        """
+        Open up to ``count`` keep-alive connections to ``url``'s host
+
+        Fills the pool that requests to ``url`` with these TLS settings
+        will use; see :func:`warm_pool`.
+
+        Returns:
+            Number of connections opened
+        """
+        request = requests.Request("GET", url).prepare()
+        get_pool = getattr(self, "get_connection_with_tls_context", None)
+        if get_pool is not None:
+            pool = get_pool(request, verify, proxies, cert)
+        else:  # pragma: no cover - requests < 2.32.2
+            pool = self.get_connection(url, proxies)
+
+        return warm_pool(pool, count)
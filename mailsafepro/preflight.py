@@ -0,0 +1,214 @@
+"""
+Local pre-flight stage for batch validation
+
+Cleans a batch before it is sent: addresses are stripped and their domains
+lowercased, syntax failures are rejected locally, and duplicates are
+collapsed so each distinct address is validated (and billed) once. The API
+results are then expanded back to the caller's original positions.
+"""
+
+import json
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Union
+
+from .exceptions import EmailValidatorError, ValidationError
+from .models import BatchResult, ValidationFailure, ValidationResult
+from .utils import EMAIL_REGEX, email_format_error
+
+
+# Marks a position whose email was rejected locally
+_REJECTED = -1
+
+
+@dataclass
+class PreflightReport:
+    """
+    What the pre-flight stage removed from a batch
+
+    Attributes:
+        total: Emails passed in
+        sent: Unique, well-formed emails sent to the API
+        rejected: Emails rejected locally for their syntax
+        duplicates: Well-formed emails that repeated an earlier one
+        requests_saved: Server-side batches avoided, at the chunk size given
+            (the client's ``batch_size``)
+        bytes_saved: Request body bytes avoided (compact JSON)
+    """
+    total: int = 0
+    sent: int = 0
+    rejected: int = 0
+    duplicates: int = 0
+    requests_saved: int = 0
+    bytes_saved: int = 0
+
+    @property
+    def emails_saved(self) -> int:
+        """Validations not sent to the API (and not charged to the quota)"""
+        return self.total - self.sent
+
+    def __repr__(self) -> str:
+        return (
+            f"<PreflightReport(total={self.total}, sent={self.sent}, "
+            f"rejected={self.rejected}, duplicates={self.duplicates}, "
+            f"bytes_saved={self.bytes_saved})>"
+        )
+
+
+@dataclass
+class PreflightBatch:
+    """
+    A batch after pre-flight, ready to send
+
+    Attributes:
+        emails: Unique, normalized, well-formed emails to send, in first-seen order
+        positions: For each input email, its index in ``emails`` (-1 if rejected)
+        failures: ValidationFailure for each rejected input position
+        report: Counts of what was removed
+    """
+    emails: List[str]
+    positions: List[int]
+    failures: Dict[int, ValidationFailure] = field(default_factory=dict)
+    report: PreflightReport = field(default_factory=PreflightReport)
+
+    def expand(
+        self,
+        results: Sequence[ValidationResult],
+    ) -> List[Union[ValidationResult, ValidationFailure]]:
+        """
+        Map results for ``emails`` back to the original input positions
+
+        Duplicate inputs share one result object; rejected inputs get their
+        ValidationFailure.
+
+        Args:
+            results: One result per sent email, in ``emails`` order
+
+        Returns:
+            One entry per input email
+
+        Raises:
+            EmailValidatorError: If ``results`` doesn't match ``emails``
+        """
+        if len(results) != len(self.emails):
+            raise EmailValidatorError(
+                f"Batch response has {len(results)} results for {len(self.emails)} emails"
+            )
+
+        failures = self.failures
+        return [
+            results[index] if index != _REJECTED else failures[i]
+            for i, index in enumerate(self.positions)
+        ]
+
+    def merge(self, fetched: Optional[BatchResult]) -> BatchResult:
+        """
+        Build the caller's BatchResult from the API's answer for ``emails``
+
+        Args:
+            fetched: BatchResult for ``emails`` (None if nothing was sent)
+
+        Returns:
+            BatchResult with one entry per input email and ``preflight`` set
+
+        Raises:
+            EmailValidatorError: If ``fetched`` doesn't match ``emails``
+        """
+        results = self.expand(fetched.results if fetched is not None else [])
+        valid_count = sum(1 for result in results if result.valid)
+
+        return BatchResult(
+            count=len(results),
+            valid_count=valid_count,
+            invalid_count=len(results) - valid_count,
+            processing_time=fetched.processing_time if fetched else 0.0,
+            average_time=fetched.average_time if fetched else 0.0,
+            results=results,  # type: ignore[arg-type]
+            summary=fetched.summary if fetched else None,
+            preflight=self.report,
+        )
+
+
+# Same bytes StdlibJSONSerializer sends, for the bytes_saved count
+_ENCODER = json.JSONEncoder(separators=(",", ":"), ensure_ascii=False, default=str)
+
+
+def _encoded_size(values: List[Any]) -> int:
+    """Bytes ``values`` takes as a compact JSON array"""
+    return len(_ENCODER.encode(values).encode("utf-8"))
+
+
+def _chunks(count: int, chunk_size: int) -> int:
+    return -(-count // max(chunk_size, 1))
+
+
+def preflight(emails: Iterable[Any], chunk_size: int = 100) -> PreflightBatch:
+    """
+    Normalize, syntax-check and deduplicate a batch locally
+
+    Each email is stripped and its domain lowercased; the local part keeps
+    its case in what is sent. Emails failing the same checks as
+    ``validate()`` are rejected without a request. Duplicates are detected
+    case-insensitively over the whole address and only the first occurrence
+    is sent.
+
+    Args:
+        emails: Email addresses as given by the caller
+        chunk_size: Emails per server-side batch (the client's ``batch_size``),
+            used for ``requests_saved``
+
+    Returns:
+        PreflightBatch with the emails to send and how to expand the results
+
+    Examples:
+        >>> batch = preflight([" User@Example.COM", "user@example.com", "oops"])
+        >>> batch.emails
+        ['User@example.com']
+        >>> batch.positions
+        [0, 0, -1]
+    """
+    emails = emails if isinstance(emails, list) else list(emails)
+    match = EMAIL_REGEX.match
+    unique: List[str] = []
+    positions: List[int] = []
+    failures: Dict[int, ValidationFailure] = {}
+    seen: Dict[str, int] = {}
+    duplicates = 0
+
+    for i, raw in enumerate(emails):
+        email = raw.strip() if isinstance(raw, str) else ""
+        key = email.lower()
+        index = seen.get(key)
+
+        if index is None:
+            # Fast path: one length check and one regex match per new address;
+            # the error message is only worked out for failures
+            if 5 <= len(email) <= 254 and match(email):
+                if email != key:
+                    local, _, domain = email.rpartition("@")
+                    email = f"{local}@{domain.lower()}"
+                index = seen[key] = len(unique)
+                unique.append(email)
+            else:
+                index = seen[key] = _REJECTED
+        elif index != _REJECTED:
+            duplicates += 1
+
+        if index == _REJECTED:
+            failures[i] = ValidationFailure(
+                email=raw if isinstance(raw, str) else str(raw),
+                error=ValidationError(email_format_error(raw) or "Invalid email format"),
+            )
+
+        positions.append(index)
+
+    total = len(positions)
+
+    report = PreflightReport(
+        total=total,
+        sent=len(unique),
+        rejected=len(failures),
+        duplicates=duplicates,
+        requests_saved=_chunks(total, chunk_size) - _chunks(len(unique), chunk_size),
+        bytes_saved=_encoded_size(emails) - _encoded_size(unique),
+    )
+    return PreflightBatch(emails=unique, positions=positions, failures=failures, report=report)
@@ -0,0 +1,182 @@
+"""
+Client-side rate limiting
+"""
+
+import asyncio
+import math
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
+
+from .exceptions import RateLimitError
+
+
+class TokenBucket:
+    """
+    Thread-safe token-bucket rate limiter shared by every request of a client
+
+    Each request takes one token. Tokens refill at ``rate`` per second up to
+    ``burst``. When the bucket is empty a caller either waits for its token
+    (up to ``max_wait`` seconds) or fails fast with :class:`RateLimitError`.
+
+    When the API answers 429, :meth:`penalize` pauses the bucket for the
+    ``Retry-After`` period and halves the refill rate; the rate then recovers
+    linearly to ``rate`` over ``recovery_time`` seconds.
+
+    Args:
+        rate: Requests per second to allow (set just under your plan's limit)
+        burst: Bucket capacity (default: one second's worth of tokens)
+        max_wait: Longest a caller may wait for a token; None waits as long
+            as needed, 0 never waits (fail fast)
+        min_rate: Floor for the rate after repeated penalties
+        recovery_time: Seconds to climb back from a penalty to ``rate``
+        clock: Monotonic time source (overridable for tests)
+        sleep: Sleep function used by :meth:`acquire` (overridable for tests)
+
+    Examples:
+        >>> limiter = TokenBucket(rate=50, burst=10)
+        >>> validator = MailSafePro(api_key="key_xxx", rate_limiter=limiter)
+        >>> limiter.stats()["rate"]
+        50.0
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        burst: Optional[int] = None,
+        max_wait: Optional[float] = None,
+        min_rate: float = 0.1,
+        recovery_time: float = 60.0,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], Any] = time.sleep,
+    ):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+
+        self.rate = float(rate)
+        self.burst = burst if burst is not None else max(1, int(math.ceil(rate)))
+        self.max_wait = max_wait
+        self.min_rate = min(min_rate, self.rate)
+        self.recovery_time = recovery_time
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self._current_rate = self.rate
+        self._tokens = float(self.burst)
+        self._last = clock()
+        self._acquired = 0
+        self._waited = 0
+        self._rejected = 0
+        self._penalties = 0
+        self._total_wait = 0.0
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self._last
+        if elapsed <= 0:
+            # Paused by a penalty (or clock didn't move)
+            return
+
+        if self._current_rate < self.rate:
+            self._current_rate = min(
+                self.rate,
+                self._current_rate + self.rate * elapsed / self.recovery_time,
+            )
+
+        self._tokens = min(float(self.burst), self._tokens + elapsed * self._current_rate)
+        self._last = now
+
+    def reserve(self) -> float:
+        """
+        Take one token, possibly from the future
+
+        Returns:
+            Seconds the caller must wait before sending its request
+
+        Raises:
+            RateLimitError: If the wait would exceed ``max_wait``
+        """
+        with self._lock:
+            now = self._clock()
+            self._refill(now)
+
+            self._tokens -= 1
+            wait = max(self._last - now, 0.0) + max(-self._tokens, 0.0) / self._current_rate
+
+            if self.max_wait is not None and wait > self.max_wait:
+                self._tokens += 1
+                self._rejected += 1
+                raise RateLimitError(
+                    f"Client-side rate limit reached. Retry after {wait:.2f} seconds",
+                    retry_after=int(math.ceil(wait)),
+                )
+
+            self._acquired += 1
+            if wait > 0:
+                self._waited += 1
+                self._total_wait += wait
+            return wait
+
+    def acquire(self) -> None:
+        """
+        Take one token, sleeping until it is available
+
+        Raises:
+            RateLimitError: If the wait would exceed ``max_wait``
+        """
+        wait = self.reserve()
+        if wait > 0:
+            self._sleep(wait)
+
+    async def acquire_async(self) -> None:
+        """
+        Take one token, awaiting until it is available
+
+        Raises:
+            RateLimitError: If the wait would exceed ``max_wait``
+        """
+        wait = self.reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    def penalize(self, retry_after: Optional[float]) -> None:
+        """
+        React to a 429: pause for ``retry_after`` seconds and halve the rate
+
+        Args:
+            retry_after: Seconds from the response's Retry-After header, or
+                None when it was missing or unreadable (no pause)
+        """
+        with self._lock:
+            now = self._clock()
+            self._refill(now)
+
+            self._penalties += 1
+            self._current_rate = max(self.min_rate, self._current_rate / 2)
+            self._tokens = min(self._tokens, 0.0)
+            if retry_after is not None:
+                self._last = max(self._last, now + max(retry_after, 0.0))
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get limiter state and counters
+
+        Returns:
+            Dictionary with the current rate, available tokens, and counts of
+            acquired, waited, rejected and penalized requests
+        """
+        with self._lock:
+            self._refill(self._clock())
+            return {
+                "rate": self._current_rate,
+                "max_rate": self.rate,
+                "burst": self.burst,
+                "tokens": self._tokens,
+                "acquired": self._acquired,
+                "waited": self._waited,
+                "rejected": self._rejected,
+                "penalties": self._penalties,
+                "total_wait": self._total_wait,
+            }
+
+    def __repr__(self) -> str:
+        return f"<TokenBucket(rate={self.rate}, burst={self.burst})>"
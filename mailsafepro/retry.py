@@ -0,0 +1,257 @@
+"""
+Client-side retries: jittered backoff, a retry budget and call deadlines
+
+Every request the clients send goes through one :class:`RetryPolicy`. The
+transports underneath (urllib3, httpx, HTTP/2) don't retry on their own,
+so a failed request is retried exactly once per decision made here.
+"""
+
+import random
+import threading
+import time
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from urllib3.util.retry import Retry
+
+
+# Given up because the call ran out of attempts, the server asked to wait
+# longer than max_delay, the next attempt would miss the deadline, or the
+# client-wide retry budget was spent
+GIVE_UP_REASONS = ("attempts", "retry_after", "deadline", "budget")
+
+
+def transport_retries() -> Retry:
+    """
+    urllib3 policy for transports under a RetryPolicy
+
+    Connection errors and retryable statuses are surfaced on the first
+    attempt instead of being retried in the pool; redirects are still
+    followed.
+    """
+    return Retry(total=None, connect=0, read=False, other=0, redirect=3)
+
+
+class RetryCall:
+    """
+    Retry state of one client call, from :meth:`RetryPolicy.begin`
+
+    Attributes:
+        retries: Retries made so far
+        deadline_at: Clock time after which no attempt is started, or None
+    """
+
+    __slots__ = ("policy", "retries", "deadline_at", "_last_delay")
+
+    def __init__(self, policy: "RetryPolicy", deadline: Optional[float]):
+        self.policy = policy
+        self.retries = 0
+        self.deadline_at = None if deadline is None else policy._clock() + deadline
+        self._last_delay = policy.base_delay
+
+    def remaining(self) -> Optional[float]:
+        """Seconds left before the deadline (None without one)"""
+        if self.deadline_at is None:
+            return None
+        return self.deadline_at - self.policy._clock()
+
+    def timeout(self, timeout: Any) -> Any:
+        """Per-attempt timeout: ``timeout``, cut to what is left of the deadline"""
+        remaining = self.remaining()
+        if remaining is None or timeout is None:
+            return timeout
+        return min(timeout, max(remaining, 0.001))
+
+    def next_delay(
+        self,
+        cause: str,
+        retry_after: Optional[float] = None,
+        deferred: bool = False,
+    ) -> Optional[float]:
+        """
+        Decide whether to retry after a failed attempt
+
+        The delay follows decorrelated jitter: a random value between
+        ``base_delay`` and three times the previous delay, capped at
+        ``max_delay``. A ``Retry-After`` from the server replaces it, plus up
+        to ``base_delay`` of jitter so clients told the same value don't
+        come back together.
+
+        Args:
+            cause: What failed, for the stats (status code or "network")
+            retry_after: Seconds from the response's Retry-After header
+            deferred: The wait is left to a rate limiter that was told about
+                it; the retry is decided as usual, but 0.0 is returned and
+                nothing is added to ``total_delay``
+
+        Returns:
+            Seconds to wait before retrying, or None to give up
+        """
+        policy = self.policy
+        if self.retries >= policy.max_retries:
+            policy._give_up("attempts")
+            return None
+
+        if retry_after is None:
+            delay = min(policy.max_delay, random.uniform(policy.base_delay, self._last_delay * 3))
+        elif retry_after > policy.max_delay:
+            policy._give_up("retry_after")
+            return None
+        else:
+            delay = retry_after + random.uniform(0, policy.base_delay)
+        self._last_delay = max(delay, policy.base_delay)
+
+        remaining = self.remaining()
+        if remaining is not None and delay >= remaining:
+            policy._give_up("deadline")
+            return None
+
+        if deferred:
+            delay = 0.0
+        if not policy._withdraw(cause, delay):
+            policy._give_up("budget")
+            return None
+
+        self.retries += 1
+        return delay
+
+    def finish(self) -> None:
+        """Record that the call got its final response"""
+        if self.retries:
+            self.policy._recovered()
+
+
+class RetryPolicy:
+    """
+    Thread-safe retry policy shared by every request of a client
+
+    A failed attempt (a status in ``retry_statuses``, or a connection
+    error or timeout) is retried up to ``max_retries`` times with
+    decorrelated-jitter backoff, honoring ``Retry-After``. Two limits stop
+    retries early:
+
+    * a retry budget: each call deposits ``budget_ratio`` tokens, up to
+      ``budget_burst``, and each retry spends one. Over time retries stay
+      under ``budget_ratio`` of calls, so an outage doesn't multiply the
+      load on the API.
+    * a deadline per call: no retry is scheduled that would start after
+      ``deadline`` seconds, and each attempt's timeout is cut to the time
+      left.
+
+    When a retry is refused the last error is raised as usual. One policy
+    may be shared by several clients, sync and async, to share a budget.
+
+    Args:
+        max_retries: Retries per call (default: 3)
+        base_delay: Shortest backoff in seconds
+        max_delay: Longest backoff; a longer Retry-After gives up instead
+        budget_ratio: Retries allowed per call, sustained (0-1)
+        budget_burst: Retries that may be spent at once (also the initial
+            balance)
+        deadline: Default total seconds per call, including retries (None:
+            no deadline)
+        retry_statuses: Response statuses to retry
+        clock: Monotonic time source (overridable for tests)
+
+    Examples:
+        >>> policy = RetryPolicy(max_retries=4, deadline=10.0, budget_ratio=0.1)
+        >>> validator = MailSafePro(api_key="key_xxx", retry_policy=policy)
+        >>> validator.validate("user@example.com", deadline=2.0)
+        >>> policy.stats()["retries"]
+        0
+    """
+
+    def __init__(
+        self,
+        max_retries: int = 3,
+        base_delay: float = 0.5,
+        max_delay: float = 30.0,
+        budget_ratio: float = 0.2,
+        budget_burst: int = 10,
+        deadline: Optional[float] = None,
+        retry_statuses: Tuple[int, ...] = (429, 500, 502, 503, 504),
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if max_retries < 0:
+            raise ValueError("max_retries must not be negative")
+        if not 0 <= budget_ratio <= 1:
+            raise ValueError("budget_ratio must be between 0 and 1")
+
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max(max_delay, base_delay)
+        self.budget_ratio = budget_ratio
+        self.budget_burst = budget_burst
+        self.deadline = deadline
+        self.retry_statuses = frozenset(retry_statuses)
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._tokens = float(budget_burst)
+        self._calls = 0
+        self._retries = 0
+        self._recovered_calls = 0
+        self._total_delay = 0.0
+        self._causes: Dict[str, int] = {}
+        self._gave_up = dict.fromkeys(GIVE_UP_REASONS, 0)
+
+    def begin(self, deadline: Optional[float] = None) -> RetryCall:
+        """
+        Start a call, depositing its share of the retry budget
+
+        Args:
+            deadline: Total seconds for this call (default: ``self.deadline``)
+
+        Returns:
+            RetryCall to consult after each failed attempt
+        """
+        with self._lock:
+            self._calls += 1
+            self._tokens = min(float(self.budget_burst), self._tokens + self.budget_ratio)
+        return RetryCall(self, self.deadline if deadline is None else deadline)
+
+    def _withdraw(self, cause: str, delay: float) -> bool:
+        with self._lock:
+            if self._tokens < 1:
+                return False
+            self._tokens -= 1
+            self._retries += 1
+            self._total_delay += delay
+            self._causes[cause] = self._causes.get(cause, 0) + 1
+            return True
+
+    def _give_up(self, reason: str) -> None:
+        with self._lock:
+            self._gave_up[reason] += 1
+
+    def _recovered(self) -> None:
+        with self._lock:
+            self._recovered_calls += 1
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get retry counters
+
+        Returns:
+            Dictionary with ``calls``, ``retries``, ``recovered`` (calls
+            answered after retrying), ``gave_up`` (count per reason:
+            attempts, retry_after, deadline, budget), ``causes`` (retries
+            per status code or "network"), ``total_delay`` (seconds spent
+            backing off), ``budget`` (retries available now) and
+            ``retry_ratio`` (retries per call)
+        """
+        with self._lock:
+            return {
+                "calls": self._calls,
+                "retries": self._retries,
+                "recovered": self._recovered_calls,
+                "gave_up": dict(self._gave_up),
+                "causes": dict(self._causes),
+                "total_delay": self._total_delay,
+                "budget": self._tokens,
+                "retry_ratio": self._retries / self._calls if self._calls else 0.0,
+            }
+
+    def __repr__(self) -> str:
+        return (
+            f"<RetryPolicy(max_retries={self.max_retries}, "
+            f"budget_ratio={self.budget_ratio}, deadline={self.deadline})>"
+        )
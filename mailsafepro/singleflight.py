@@ -0,0 +1,164 @@
+"""
+Coalescing of identical in-flight calls ("single flight")
+"""
+
+import asyncio
+import threading
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional
+
+
+class _Call:
+    """One in-flight call that followers wait on"""
+
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """
+    Run at most one call per key at a time; concurrent duplicates share its outcome
+
+    Threads calling :meth:`do` with a key that is already in flight block
+    until the first call finishes and then receive its result, or its
+    exception, instead of running ``fn`` themselves.
+
+    Examples:
+        >>> flight = SingleFlight()
+        >>> flight.do("user@example.com", fetch, "user@example.com")
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, _Call] = {}
+        self._executed = 0
+        self._coalesced = 0
+
+    def do(self, key: Hashable, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """
+        Call ``fn(*args, **kwargs)`` unless a call for ``key`` is already running
+
+        Args:
+            key: Identity of the call; equal keys are coalesced
+            fn: Function to run for the first caller
+
+        Returns:
+            The result of the (possibly shared) call
+
+        Raises:
+            Whatever the shared call raised
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            if call is None:
+                call = self._calls[key] = _Call()
+                self._executed += 1
+                leader = True
+            else:
+                self._coalesced += 1
+                leader = False
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn(*args, **kwargs)
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Get coalescing counters
+
+        Returns:
+            Dictionary with executed calls, coalesced calls and keys in flight
+        """
+        with self._lock:
+            return {
+                "executed": self._executed,
+                "coalesced": self._coalesced,
+                "in_flight": len(self._calls),
+            }
+
+
+class AsyncSingleFlight:
+    """
+    asyncio counterpart of :class:`SingleFlight`
+
+    Tasks awaiting :meth:`do` with a key that is already in flight await the
+    first task's outcome instead of running ``fn`` themselves. If the first
+    task is cancelled, the waiting tasks are cancelled too.
+    """
+
+    def __init__(self) -> None:
+        self._calls: Dict[Hashable, "asyncio.Future[Any]"] = {}
+        self._executed = 0
+        self._coalesced = 0
+
+    async def do(
+        self,
+        key: Hashable,
+        fn: Callable[..., Awaitable[Any]],
+        *args: Any,
+        **kwargs: Any,
+    ) -> Any:
+        """
+        Await ``fn(*args, **kwargs)`` unless a call for ``key`` is already running
+
+        Args:
+            key: Identity of the call; equal keys are coalesced
+            fn: Coroutine function to run for the first caller
+
+        Returns:
+            The result of the (possibly shared) call
+        """
+        future = self._calls.get(key)
+        if future is not None:
+            self._coalesced += 1
+            # Shield so one follower being cancelled doesn't cancel the others
+            return await asyncio.shield(future)
+
+        future = asyncio.get_running_loop().create_future()
+        self._calls[key] = future
+        self._executed += 1
+
+        try:
+            result = await fn(*args, **kwargs)
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            # Mark retrieved: with no followers nobody else will look at it
+            future.exception()
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            del self._calls[key]
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Get coalescing counters
+
+        Returns:
+            Dictionary with executed calls, coalesced calls and keys in flight
+        """
+        return {
+            "executed": self._executed,
+            "coalesced": self._coalesced,
+            "in_flight": len(self._calls),
+        }
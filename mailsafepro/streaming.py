@@ -0,0 +1,295 @@
+"""
+Incremental decoding of large /batch responses
+"""
+
+import codecs
+import json
+import re
+from typing import (
+    Any, Callable, Dict, Generator, Iterable, Iterator, List, Optional, Type,
+)
+
+from .exceptions import EmailValidatorError
+from .models import ValidationResult, _read_batch_header
+
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_NUMBER_START = "-0123456789"
+_NUMBER_CHARS = "0123456789.eE+-"
+
+# Parser states
+_START, _KEY, _COLON, _VALUE, _ARRAY, _DONE = range(6)
+
+
+class _Incomplete(Exception):
+    """The buffer ends before the next value does"""
+
+
+class BatchStreamParser:
+    """
+    Push parser for a /batch response body
+
+    Bytes are fed as they arrive. Each element of the top-level ``results``
+    array is decoded on its own as soon as it is complete, so only one
+    element (plus the unparsed tail of the last chunk) is held in memory at
+    a time. All other top-level fields are collected into :attr:`header`.
+
+    Examples:
+        >>> parser = BatchStreamParser()
+        >>> parser.feed(b'{"count": 1, "results": [{"email": "a@b.c"')
+        []
+        >>> parser.feed(b'}], "valid_count": 1}')
+        [{'email': 'a@b.c'}]
+        >>> parser.close()
+        {'count': 1, 'valid_count': 1}
+    """
+
+    def __init__(self, array_key: str = "results") -> None:
+        self.array_key = array_key
+        self.header: Dict[str, Any] = {}
+        self._decoder = codecs.getincrementaldecoder("utf-8")()
+        self._json = json.JSONDecoder()
+        self._buffer = ""
+        self._pos = 0
+        self._state = _START
+        self._key = ""
+
+    def feed(self, data: bytes) -> List[Dict[str, Any]]:
+        """
+        Add the next piece of the body
+
+        Args:
+            data: Raw bytes, split anywhere
+
+        Returns:
+            The ``results`` elements completed by this piece
+
+        Raises:
+            EmailValidatorError: If the body is not a JSON object
+        """
+        self._buffer = self._buffer[self._pos:] + self._decoder.decode(data)
+        self._pos = 0
+        return self._parse(final=False)
+
+    def close(self) -> Dict[str, Any]:
+        """
+        Finish parsing once the whole body has been fed
+
+        Returns:
+            The top-level fields other than ``results``
+
+        Raises:
+            EmailValidatorError: If the body ended early or was malformed
+        """
+        self._buffer = self._buffer[self._pos:] + self._decoder.decode(b"", final=True)
+        self._pos = 0
+        self._parse(final=True)
+        if self._state != _DONE:
+            raise EmailValidatorError("Batch response ended unexpectedly")
+        return self.header
+
+    def _skip_whitespace(self) -> str:
+        """Move past whitespace and return the next character ("" at the end)"""
+        # The pattern matches the empty string, so there is always a match
+        self._pos = _WHITESPACE.match(self._buffer, self._pos).end()  # type: ignore[union-attr]
+        return self._buffer[self._pos:self._pos + 1]
+
+    def _decode_value(self, final: bool) -> Any:
+        try:
+            value, end = self._json.raw_decode(self._buffer, self._pos)
+        except json.JSONDecodeError:
+            if final:
+                raise
+            raise _Incomplete
+        # A number that runs to the end of the buffer ("1" or "1." of "1.5")
+        # may continue in the next piece
+        if (
+            not final
+            and self._buffer[self._pos] in _NUMBER_START
+            and self._buffer[end:].lstrip(_NUMBER_CHARS) == ""
+        ):
+            raise _Incomplete
+        self._pos = end
+        return value
+
+    def _expect(self, char: str) -> None:
+        if self._buffer[self._pos:self._pos + 1] != char:
+            raise EmailValidatorError(
+                f"Malformed batch response: expected {char!r} at offset {self._pos}"
+            )
+        self._pos += 1
+
+    def _parse(self, final: bool) -> List[Dict[str, Any]]:
+        items: List[Dict[str, Any]] = []
+        try:
+            while self._state != _DONE:
+                char = self._skip_whitespace()
+                if not char:
+                    break
+
+                if self._state == _START:
+                    self._expect("{")
+                    self._state = _KEY
+
+                elif self._state == _KEY:
+                    if char == ",":
+                        self._pos += 1
+                    elif char == "}":
+                        self._pos += 1
+                        self._state = _DONE
+                    else:
+                        self._key = self._decode_value(final)
+                        self._state = _COLON
+
+                elif self._state == _COLON:
+                    self._expect(":")
+                    self._state = _VALUE
+
+                elif self._state == _VALUE:
+                    if self._key == self.array_key and char == "[":
+                        self._pos += 1
+                        self._state = _ARRAY
+                    else:
+                        self.header[self._key] = self._decode_value(final)
+                        self._state = _KEY
+
+                elif self._state == _ARRAY:
+                    if char == ",":
+                        self._pos += 1
+                    elif char == "]":
+                        self._pos += 1
+                        self._state = _KEY
+                    else:
+                        items.append(self._decode_value(final))
+
+        except _Incomplete:
+            pass
+        except json.JSONDecodeError as e:
+            raise EmailValidatorError(f"Malformed batch response: {e}") from e
+
+        return items
+
+
+class BatchResultStream:
+    """
+    Iterator over a /batch response's results, decoded while it downloads
+
+    Yields :class:`ValidationResult` objects one at a time. The batch-level
+    fields (``count``, ``valid_count``, ``invalid_count``,
+    ``processing_time``, ``average_time``, ``summary``) are None until the
+    stream has been fully consumed.
+
+    Use it as a context manager, or call :meth:`close`, to release the
+    connection if you stop iterating early.
+
+    Args:
+        chunks: Iterable of raw body pieces (None if nothing was sent)
+        close: Called once when the stream is finished or closed
+        result_type: Class used for each result (e.g. LazyValidationResult)
+        decode: Function building each result instead of
+            ``result_type.from_dict`` (e.g. DomainSectionCache.decoder())
+        local: Results answered without a request, in input order, with None
+            where the response supplies the result (None if it supplies all)
+        store: Called with the input position of each result taken from the
+            response, and the result (e.g. to cache it)
+
+    Examples:
+        >>> with validator.validate_batch_stream(emails) as stream:
+        ...     for result in stream:
+        ...         print(result.email, result.valid)
+        >>> print(stream.valid_count)
+    """
+
+    def __init__(
+        self,
+        chunks: Optional[Iterable[bytes]],
+        close: Optional[Callable[[], Any]] = None,
+        result_type: Type[ValidationResult] = ValidationResult,
+        decode: Optional[Callable[[Dict[str, Any]], ValidationResult]] = None,
+        local: Optional[List[Optional[ValidationResult]]] = None,
+        store: Optional[Callable[[int, ValidationResult], Any]] = None,
+    ):
+        self.count: Optional[int] = None
+        self.valid_count: Optional[int] = None
+        self.invalid_count: Optional[int] = None
+        self.processing_time: Optional[float] = None
+        self.average_time: Optional[float] = None
+        self.summary: Optional[Dict[str, Any]] = None
+        self._chunks = chunks
+        self._close = close
+        self._decode = decode or result_type.from_dict
+        self._local = local
+        self._store = store
+        self._results = self._iterate()
+
+    def _iterate(self) -> Generator[ValidationResult, None, None]:
+        try:
+            fetched = self._fetch()
+            if self._local is None:
+                yield from fetched
+                return
+
+            for i, result in enumerate(self._local):
+                if result is None:
+                    result = next(fetched, None)
+                    if result is None:
+                        continue
+                    if self._store is not None:
+                        self._store(i, result)
+                yield result
+            # Read the rest of the body for the batch-level fields
+            for _ in fetched:
+                pass
+            self._add_local()
+        finally:
+            self.close()
+
+    def _fetch(self) -> Iterator[ValidationResult]:
+        """Results decoded from the response body, then its batch-level fields"""
+        if self._chunks is None:
+            self.count, self.valid_count, self.invalid_count = 0, 0, 0
+            self.processing_time = self.average_time = 0.0
+            return
+
+        parser = BatchStreamParser()
+        received = 0
+        for chunk in self._chunks:
+            for item in parser.feed(chunk):
+                received += 1
+                yield self._decode(item)
+        self._set_header(parser.close(), received)
+
+    def _set_header(self, data: Dict[str, Any], received: int) -> None:
+        (count, self.valid_count, self.invalid_count, self.processing_time,
+         self.average_time, self.summary) = _read_batch_header(data)
+        self.count = received if count is None else count
+
+    def _add_local(self) -> None:
+        """Count the locally answered results in the batch-level fields"""
+        answered = [result for result in self._local or () if result is not None]
+        valid = sum(1 for result in answered if result.valid)
+        self.count = (self.count or 0) + len(answered)
+        self.valid_count = (self.valid_count or 0) + valid
+        self.invalid_count = (self.invalid_count or 0) + len(answered) - valid
+
+    def __iter__(self) -> Iterator[ValidationResult]:
+        return self._results
+
+    def __next__(self) -> ValidationResult:
+        return next(self._results)
+
+    def close(self) -> None:
+        """Release the underlying response"""
+        if self._close is not None:
+            close, self._close = self._close, None
+            close()
+
+    def __enter__(self) -> "BatchResultStream":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self._results.close()
+        self.close()
+
+    def __repr__(self) -> str:
+        return f"<BatchResultStream(count={self.count}, valid={self.valid_count})>"
@@ -0,0 +1,259 @@
+"""
+Lean HTTP transport for the synchronous client's hot path
+
+``requests`` spends more CPU per call than the request itself needs here:
+merging session and request settings, preparing a PreparedRequest, running
+hooks and cookie handling. :class:`LeanTransport` sends the client's JSON
+requests straight through a urllib3 PoolManager with headers built once,
+and answers with a :class:`LeanResponse` exposing the parts of
+``requests.Response`` the client reads. urllib3 errors are raised as the
+``requests`` exceptions they would have become, so the client maps errors
+the same way on either transport.
+"""
+
+import json
+import os
+from typing import Any, Dict, Iterator, NamedTuple, Optional, Tuple, Union
+
+import requests
+from requests.utils import DEFAULT_CA_BUNDLE_PATH
+from urllib3.exceptions import (
+    ConnectTimeoutError,
+    DecodeError,
+    HTTPError,
+    MaxRetryError,
+    NewConnectionError,
+    ProtocolError,
+    ProxyError,
+    ReadTimeoutError,
+    ResponseError,
+    SSLError,
+)
+from urllib3.util import Timeout, make_headers, parse_url
+from urllib3.util.retry import Retry
+
+from .pool import PoolStats, _TrackedPoolManager, warm_pool
+
+
+class _SentRequest(NamedTuple):
+    """The parts of the request a LeanResponse answers that the client reads"""
+
+    url: str
+    body: Any
+
+    @property
+    def path_url(self) -> str:
+        return parse_url(self.url).request_uri
+
+
+def _translate(error: Exception) -> requests.exceptions.RequestException:
+    """requests exception for a urllib3 error, chosen as HTTPAdapter.send() does"""
+    if isinstance(error, MaxRetryError):
+        reason = error.reason
+        if isinstance(reason, ConnectTimeoutError) and not isinstance(reason, NewConnectionError):
+            return requests.exceptions.ConnectTimeout(str(error))
+        if isinstance(reason, ResponseError):
+            return requests.exceptions.RetryError(str(error))
+        if isinstance(reason, ProxyError):
+            return requests.exceptions.ProxyError(str(error))
+        if isinstance(reason, SSLError):
+            return requests.exceptions.SSLError(str(error))
+        return requests.exceptions.ConnectionError(str(error))
+    if isinstance(error, SSLError):
+        return requests.exceptions.SSLError(str(error))
+    if isinstance(error, ReadTimeoutError):
+        return requests.exceptions.ReadTimeout(str(error))
+    if isinstance(error, ProxyError):
+        return requests.exceptions.ProxyError(str(error))
+    if isinstance(error, (ProtocolError, OSError)):
+        return requests.exceptions.ConnectionError(str(error))
+    return requests.exceptions.RequestException(str(error))
+
+
+class LeanResponse:
+    """
+    Response from :class:`LeanTransport`
+
+    Offers what the client reads from a ``requests.Response``:
+    ``status_code``, ``headers``, ``content``, ``json()``,
+    ``iter_content()``, ``raise_for_status()``, ``close()`` and ``raw``
+    (the urllib3 response).
+    """
+
+    __slots__ = ("raw", "status_code", "headers", "url", "request")
+
+    def __init__(self, raw: Any, url: str, request: _SentRequest):
+        self.raw = raw
+        self.status_code: int = raw.status
+        self.headers = raw.headers
+        self.url = url
+        self.request = request
+
+    @property
+    def reason(self) -> str:
+        return self.raw.reason or ""
+
+    @property
+    def content(self) -> bytes:
+        """The decoded body, read in full on first access"""
+        try:
+            data: bytes = self.raw.data
+        except (ProtocolError, ReadTimeoutError, DecodeError) as e:
+            raise _translate(e) from e
+        return data
+
+    def json(self) -> Any:
+        return json.loads(self.content)
+
+    def iter_content(self, chunk_size: int = 1) -> Iterator[bytes]:
+        """Stream the decoded body in chunks of up to ``chunk_size`` bytes"""
+        try:
+            yield from self.raw.stream(chunk_size, decode_content=True)
+        except ProtocolError as e:
+            raise requests.exceptions.ChunkedEncodingError(str(e)) from e
+        except DecodeError as e:
+            raise requests.exceptions.ContentDecodingError(str(e)) from e
+        except ReadTimeoutError as e:
+            raise requests.exceptions.ConnectionError(str(e)) from e
+
+    def raise_for_status(self) -> None:
+        """Raise ``requests.HTTPError`` for 4xx and 5xx statuses"""
+        status = self.status_code
+        if 400 <= status < 600:
+            kind = "Client" if status < 500 else "Server"
+            raise requests.exceptions.HTTPError(
+                f"{status} {kind} Error: {self.reason} for url: {self.url}", response=self
+            )
+
+    def close(self) -> None:
+        self.raw.close()
+        self.raw.release_conn()
+
+    def __repr__(self) -> str:
+        return f"<LeanResponse [{self.status_code}]>"
+
+
+class LeanTransport:
+    """
+    Send requests through a urllib3 PoolManager, skipping ``requests``
+
+    Connections, retries and certificate checks follow the same settings
+    as the ``requests`` session: ``Retry`` policy, pool size and blocking,
+    and the CA bundle requests would pick (``verify``). Its pools report to
+    the client's :class:`PoolStats`. Proxies aren't supported.
+
+    Args:
+        headers: Headers sent with every request (User-Agent, Accept, API
+            key, ...)
+        retries: urllib3 Retry policy
+        pool_size: Keep-alive connections kept per host
+        pool_block: Wait for a pooled connection instead of opening more
+        stats: Counters the pools report to
+        verify: True (default CA bundle), False, or a CA bundle path
+        cert: Client certificate path, or (cert, key) paths
+
+    Examples:
+        >>> validator = MailSafePro(api_key="key_xxx", lean_transport=True)
+    """
+
+    def __init__(
+        self,
+        headers: Dict[str, str],
+        retries: Retry,
+        pool_size: int = 10,
+        pool_block: bool = False,
+        stats: Optional[PoolStats] = None,
+        verify: Union[bool, str] = True,
+        cert: Any = None,
+    ):
+        # Same defaults as a requests session: keep-alive, decodable encodings
+        self.headers = {**make_headers(keep_alive=True, accept_encoding=True), **headers}
+        self.retries = retries
+        self.pool_size = pool_size
+        self.pool_block = pool_block
+        self.stats = stats if stats is not None else PoolStats()
+
+        tls: Dict[str, Any] = {"cert_reqs": "CERT_REQUIRED"}
+        if verify is False:
+            tls["cert_reqs"] = "CERT_NONE"
+        elif isinstance(verify, str) and os.path.isdir(verify):
+            tls["ca_cert_dir"] = verify
+        else:
+            tls["ca_certs"] = verify if isinstance(verify, str) else DEFAULT_CA_BUNDLE_PATH
+        if cert:
+            tls["cert_file"], tls["key_file"] = (cert, None) if isinstance(cert, str) else cert
+
+        self.poolmanager = _TrackedPoolManager(
+            num_pools=pool_size,
+            maxsize=pool_size,
+            block=pool_block,
+            stats=self.stats,
+            **tls,
+        )
+        # Only the last value is kept: calls under a deadline pass a
+        # different remaining time on every attempt
+        self._last_timeout: Tuple[Any, Optional[Timeout]] = (None, None)
+
+    def _timeout(self, timeout: Any) -> Timeout:
+        """urllib3 Timeout for a requests-style timeout, reused while it repeats"""
+        key, cached = self._last_timeout
+        if cached is None or key != timeout:
+            if isinstance(timeout, tuple):
+                cached = Timeout(connect=timeout[0], read=timeout[1])
+            else:
+                cached = Timeout(connect=timeout, read=timeout)
+            self._last_timeout = (timeout, cached)
+        return cached
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        headers: Dict[str, str],
+        body: Any = None,
+        timeout: Any = None,
+        stream: bool = False,
+    ) -> LeanResponse:
+        """
+        Send one request
+
+        Args:
+            method: HTTP method
+            url: Absolute URL
+            headers: Complete request headers (start from ``self.headers``)
+            body: Request body: bytes, an iterable of bytes, or None
+            timeout: Seconds, or a (connect, read) tuple
+            stream: Leave the body unread for ``iter_content()``
+
+        Returns:
+            LeanResponse (with the body read unless ``stream``)
+
+        Raises:
+            requests.exceptions.RequestException: Translated urllib3 errors
+        """
+        try:
+            raw = self.poolmanager.urlopen(
+                method,
+                url,
+                body=body,
+                headers=headers,
+                retries=self.retries,
+                timeout=self._timeout(timeout),
+                preload_content=not stream,
+                decode_content=True,
+            )
+        except (HTTPError, OSError) as e:
+            raise _translate(e) from e
+
+        return LeanResponse(raw, url, _SentRequest(url, body))
+
+    def warmup(self, url: str, count: int) -> int:
+        """Open up to ``count`` keep-alive connections to ``url``'s host (see warm_pool())"""
+        return warm_pool(self.poolmanager.connection_from_url(url), count)
+
+    def close(self) -> None:
+        """Close every pooled connection"""
+        self.poolmanager.clear()
+
+    def __repr__(self) -> str:
+        return f"<LeanTransport(pool_size={self.pool_size}, pool_block={self.pool_block})>"
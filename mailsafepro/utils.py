@@ -4,45 +4,89 @@ Utility functions for EmailValidator SDK
 
 import re
 from pathlib import Path
-from typing import Union
+from typing import Any, Optional, Union
 
 from .exceptions import ValidationError
 
 
 EMAIL_REGEX = re.compile(r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$")
 
+# Largest file /batch/upload accepts
+MAX_UPLOAD_SIZE = 5 * 1024 * 1024  # 5MB
 
-def validate_email_format(email: str) -> None:
+
+def email_format_error(email: Any) -> Optional[str]:
     """
-    Validate basic email format
+    Describe what is wrong with an email's format
     
     Args:
-        email: Email address to validate
+        email: Value to check
     
-    Raises:
-        ValidationError: If email format is invalid
+    Returns:
+        Error message, or None if the format is valid
     """
     if not email or not isinstance(email, str):
-        raise ValidationError("Email must be a non-empty string")
+        return "Email must be a non-empty string"
     
     email = email.strip()
     
     if len(email) < 5 or len(email) > 254:
-        raise ValidationError("Email length must be between 5 and 254 characters")
+        return "Email length must be between 5 and 254 characters"
     
     if "@" not in email:
-        raise ValidationError("Email must contain '@' symbol")
+        return "Email must contain '@' symbol"
     
     if not EMAIL_REGEX.match(email):
-        raise ValidationError(f"Invalid email format: {email}")
+        return f"Invalid email format: {email}"
+    
+    return None
+
+
+def validate_email_format(email: str) -> None:
+    """
+    Validate basic email format
+    
+    Args:
+        email: Email address to validate
+    
+    Raises:
+        ValidationError: If email format is invalid
+    """
+    error = email_format_error(email)
+    if error is not None:
+        raise ValidationError(error)
+
+
+def normalize_email(email: str) -> str:
+    """
+    Normalize an email address for comparison and caching
+    
+    Strips surrounding whitespace and lowercases the domain. The local part is
+    left as-is because it is case-sensitive per RFC 5321.
+    
+    Args:
+        email: Email address
+    
+    Returns:
+        Normalized email address
+    """
+    email = email.strip()
+    local, sep, domain = email.rpartition("@")
+    if not sep:
+        return email
+    return f"{local}@{domain.lower()}"
 
 
-def validate_file_path(file_path: Union[str, Path]) -> Path:
+def validate_file_path(
+    file_path: Union[str, Path],
+    max_size: Optional[int] = MAX_UPLOAD_SIZE,
+) -> Path:
     """
     Validate file path exists and is readable
     
     Args:
         file_path: Path to file
+        max_size: Largest accepted size in bytes (None for no limit)
     
     Returns:
         Path object
@@ -65,9 +109,10 @@ def validate_file_path(file_path: Union[str, Path]) -> Path:
             f"Unsupported file format: {path.suffix}. Only CSV and TXT files are supported."
         )
     
-    # Check file size (max 5MB)
-    max_size = 5 * 1024 * 1024  # 5MB
-    if path.stat().st_size > max_size:
-        raise ValidationError(f"File too large. Maximum size is 5MB.")
+    # Check file size (max 5MB for uploads)
+    if max_size is not None and path.stat().st_size > max_size:
+        raise ValidationError(
+            f"File too large. Maximum size is {max_size // (1024 * 1024)}MB."
+        )
     
     return path
@@ -42,9 +42,25 @@ setup(
         "urllib3>=2.0.0",
     ],
     extras_require={
+        "async": [
+            "httpx>=0.24.0",
+        ],
+        "http2": [
+            "httpx[http2]>=0.24.0",
+        ],
+        "numpy": [
+            "numpy>=1.20.0",
+        ],
+        "orjson": [
+            "orjson>=3.9.0",
+        ],
+        "zstd": [
+            "zstandard>=0.18.0",
+        ],
         "dev": [
             "pytest>=7.4.0",
             "pytest-cov>=4.1.0",
+            "httpx>=0.24.0",
             "black>=23.7.0",
             "flake8>=6.1.0",
             "mypy>=1.5.0",
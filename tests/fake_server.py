@@ -0,0 +1,665 @@
+"""
+Local stand-in for the MailSafePro API, for tests and benchmarks
+
+Not part of the installed package; benchmarks import it through
+benchmarks/_server.py.
+"""
+
+import json
+import re
+import shutil
+import socket
+import ssl
+import subprocess
+import sys
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+try:
+    import h2.config
+    import h2.connection
+    import h2.events
+    import h2.exceptions
+    import h2.settings
+except ImportError:  # pragma: no cover - optional dependency
+    h2 = None  # type: ignore[assignment]
+
+from mailsafepro.compression import GZIP, ZSTD, compress, decompress, zstandard
+
+
+_EMAIL_IN_BODY = re.compile(rb"[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}")
+
+
+def fake_result(
+    email: str,
+    check_smtp: bool = False,
+    include_raw_dns: bool = False,
+) -> Dict[str, Any]:
+    """
+    Build a deterministic API-shaped validation result for an email
+
+    Addresses whose local part starts with ``invalid`` are reported as
+    undeliverable, everything else as deliverable.
+
+    Args:
+        email: Email address
+        check_smtp: Include an SMTP section as if SMTP was checked
+        include_raw_dns: Include a DNS security section
+
+    Returns:
+        Dictionary shaped like a ``/validate/email`` response
+    """
+    local, _, domain = email.partition("@")
+    valid = not local.startswith("invalid")
+
+    result: Dict[str, Any] = {
+        "email": email,
+        "valid": valid,
+        "detail": "Valid email" if valid else "Mailbox not found",
+        "processing_time": 0.012,
+        "risk_score": 0.1 if valid else 0.9,
+        "quality_score": 0.9 if valid else 0.1,
+        "validation_tier": "standard" if check_smtp else "basic",
+        "suggested_action": "accept" if valid else "reject",
+        "status": "deliverable" if valid else "undeliverable",
+        "provider_analysis": {
+            "provider": domain.split(".")[0] or "unknown",
+            "reputation": 0.9,
+        },
+        "smtp_validation": {
+            "checked": check_smtp,
+            "mailbox_exists": valid if check_smtp else None,
+        },
+        "metadata": {
+            "timestamp": "2025-11-12T00:00:00Z",
+            "validation_id": f"val_{abs(hash(email)) % 10 ** 10:010d}",
+            "cache_used": False,
+            "client_plan": "PREMIUM",
+        },
+    }
+
+    if include_raw_dns:
+        result["dns_security"] = {
+            "spf": {"status": "valid", "record": "v=spf1 include:_spf." + domain + " ~all"},
+            "dmarc": {"status": "valid", "policy": "reject", "pct": 100},
+            "mx_records": [f"mx1.{domain}", f"mx2.{domain}"],
+            "ns_records": [f"ns1.{domain}", f"ns2.{domain}"],
+        }
+
+    return result
+
+
+class _FakeAPIHandler(BaseHTTPRequestHandler):
+    """Request handler backing FakeMailSafeProServer"""
+
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    server: "_FakeHTTPServer"
+
+    def log_message(self, format: str, *args: Any) -> None:  # noqa: A002
+        pass
+
+    def do_GET(self) -> None:
+        self._dispatch("GET")
+
+    def do_POST(self) -> None:
+        self._dispatch("POST")
+
+    def _read_body(self) -> bytes:
+        if "chunked" in (self.headers.get("Transfer-Encoding") or "").lower():
+            return self._read_chunked()
+        length = int(self.headers.get("Content-Length") or 0)
+        return self.rfile.read(length) if length else b""
+
+    def _read_chunked(self) -> bytes:
+        chunks = []
+        while True:
+            size = int(self.rfile.readline().split(b";", 1)[0], 16)
+            if not size:
+                break
+            chunks.append(self.rfile.read(size))
+            self.rfile.readline()
+        # Skip trailers up to the blank line ending the body
+        while self.rfile.readline() not in (b"\r\n", b"\n", b""):
+            pass
+        return b"".join(chunks)
+
+    def _dispatch(self, method: str) -> None:
+        body = self._read_body()
+        path = self.path.split("?", 1)[0]
+        status, payload, headers = self.server.owner._answer(method, path, body, self.headers)
+        self._send_json(status, payload, headers)
+
+    def _send_json(
+        self,
+        status: int,
+        payload: Any,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> None:
+        data, encoding = self.server.owner._encode(payload, self.headers)
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        if encoding is not None:
+            self.send_header("Content-Encoding", encoding)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+
+_HTTP2_PREFACE = b"PRI * HTTP/2.0\r\n\r\nSM\r\n\r\n"
+
+
+class _HTTP2Connection:
+    """One HTTP/2 connection of a FakeMailSafeProServer"""
+
+    def __init__(self, sock: socket.socket, owner: "FakeMailSafeProServer"):
+        self._sock = sock
+        self._owner = owner
+        self._conn = h2.connection.H2Connection(
+            h2.config.H2Configuration(client_side=False, header_encoding="utf-8")
+        )
+        # Guards the h2 state machine and the socket's write side, shared by
+        # the reading thread and the threads answering streams
+        self._lock = threading.Lock()
+        self._requests: Dict[int, Tuple[Dict[str, str], bytearray]] = {}
+        self._unsent: Dict[int, bytes] = {}
+
+    def serve(self) -> None:
+        """Read frames until the client closes the connection"""
+        with self._lock:
+            self._conn.initiate_connection()
+            limit = self._owner.max_concurrent_streams
+            self._conn.update_settings({h2.settings.SettingCodes.MAX_CONCURRENT_STREAMS: limit})
+            self._flush()
+
+        while True:
+            try:
+                data = self._sock.recv(65536)
+            except OSError:
+                return
+            if not data:
+                return
+
+            with self._lock:
+                try:
+                    events = self._conn.receive_data(data)
+                except h2.exceptions.ProtocolError:
+                    self._flush()
+                    return
+                for event in events:
+                    if not self._handle(event):
+                        self._flush()
+                        return
+                self._flush()
+
+    def _handle(self, event: Any) -> bool:
+        """Apply one h2 event (caller holds the lock); False ends the connection"""
+        if isinstance(event, h2.events.RequestReceived):
+            # header_encoding="utf-8" makes h2 hand over str names and values
+            headers: Dict[str, str] = dict(event.headers)  # type: ignore[arg-type]
+            self._requests[event.stream_id] = (headers, bytearray())
+            self._owner._record_stream()
+        elif isinstance(event, h2.events.DataReceived):
+            self._requests[event.stream_id][1].extend(event.data)
+            self._conn.acknowledge_received_data(event.flow_controlled_length, event.stream_id)
+        elif isinstance(event, h2.events.StreamEnded):
+            headers, body = self._requests.pop(event.stream_id)
+            threading.Thread(
+                target=self._respond, args=(event.stream_id, headers, bytes(body)), daemon=True
+            ).start()
+        elif isinstance(event, h2.events.WindowUpdated):
+            for stream_id in list(self._unsent):
+                self._send_body(stream_id)
+        elif isinstance(event, h2.events.StreamReset):
+            self._requests.pop(event.stream_id, None)
+            self._unsent.pop(event.stream_id, None)
+        elif isinstance(event, h2.events.ConnectionTerminated):
+            return False
+        return True
+
+    def _respond(self, stream_id: int, headers: Dict[str, str], body: bytes) -> None:
+        method = headers.get(":method", "GET")
+        path = headers.get(":path", "/").split("?", 1)[0]
+        status, payload, extra = self._owner._answer(method, path, body, headers)
+        data, encoding = self._owner._encode(payload, headers)
+        if encoding is not None:
+            extra = {**(extra or {}), "Content-Encoding": encoding}
+
+        with self._lock:
+            try:
+                self._conn.send_headers(stream_id, [
+                    (":status", str(status)),
+                    ("content-type", "application/json"),
+                    ("content-length", str(len(data))),
+                    *((name.lower(), value) for name, value in (extra or {}).items()),
+                ])
+            except h2.exceptions.ProtocolError:
+                return  # stream reset by the client meanwhile
+            self._unsent[stream_id] = data
+            self._send_body(stream_id)
+            self._flush()
+
+    def _send_body(self, stream_id: int) -> None:
+        """Send as much of a stream's body as flow control allows (lock held)"""
+        data = self._unsent.pop(stream_id)
+        conn = self._conn
+        try:
+            while data:
+                size = min(conn.local_flow_control_window(stream_id), conn.max_outbound_frame_size)
+                if size <= 0:
+                    self._unsent[stream_id] = data
+                    return
+                conn.send_data(stream_id, data[:size])
+                data = data[size:]
+            conn.end_stream(stream_id)
+        except h2.exceptions.ProtocolError:
+            pass
+
+    def _flush(self) -> None:
+        out = self._conn.data_to_send()
+        if out:
+            try:
+                self._sock.sendall(out)
+            except OSError:
+                pass
+
+
+class _FakeHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 1024
+
+    def __init__(
+        self,
+        address: Tuple[str, int],
+        owner: "FakeMailSafeProServer",
+        ssl_context: Optional[ssl.SSLContext] = None,
+    ):
+        self.owner = owner
+        self.ssl_context = ssl_context
+        super().__init__(address, _FakeAPIHandler)
+
+    def get_request(self) -> Tuple[socket.socket, Any]:
+        sock, address = super().get_request()
+        if self.ssl_context is not None:
+            # Handshake in the connection's own thread, not the accept loop
+            sock = self.ssl_context.wrap_socket(
+                sock, server_side=True, do_handshake_on_connect=False
+            )
+        return sock, address
+
+    def finish_request(self, request: Any, client_address: Any) -> None:
+        owner = self.owner
+        owner._record_connection()
+
+        if isinstance(request, ssl.SSLSocket):
+            request.do_handshake()
+            owner._record_handshake()
+            http2 = request.selected_alpn_protocol() == "h2"
+        elif owner.http2:
+            # Cleartext HTTP/2 with prior knowledge starts with the preface
+            preface = request.recv(len(_HTTP2_PREFACE), socket.MSG_PEEK | socket.MSG_WAITALL)
+            http2 = preface == _HTTP2_PREFACE
+        else:
+            http2 = False
+
+        if http2:
+            _HTTP2Connection(request, owner).serve()
+        else:
+            self.RequestHandlerClass(request, client_address, self)  # type: ignore[arg-type]
+
+    def handle_error(self, request: Any, client_address: Any) -> None:
+        # Clients dropping connections mid-handshake or mid-request are expected
+        if not isinstance(sys.exc_info()[1], OSError):
+            super().handle_error(request, client_address)
+
+
+class FakeMailSafeProServer:
+    """
+    Threaded HTTP/1.1 server that answers like the MailSafePro API
+
+    Implements ``/validate/email``, ``/batch``, ``/batch/upload``,
+    ``/v1/quota`` and the ``/auth`` endpoints with deterministic results from
+    :func:`fake_result`. Intended for tests and benchmarks only.
+
+    With ``certfile`` the server speaks TLS (see :func:`make_self_signed_cert`).
+    With ``http2`` it also speaks HTTP/2 (requires ``h2``): negotiated via
+    ALPN over TLS, or with prior knowledge over cleartext. Clients that don't
+    ask for HTTP/2 get HTTP/1.1 either way.
+
+    Request bodies sent with ``Content-Encoding`` gzip (or zstd, when
+    ``zstandard`` is installed) are decompressed before routing; other
+    encodings get a 415. With ``compress_responses`` the server also
+    compresses responses for clients whose ``Accept-Encoding`` allows it.
+    Body sizes on the wire are counted in ``request_bytes_received`` and
+    ``response_bytes_sent``.
+
+    Args:
+        latency: Seconds to sleep before answering each request
+        token_ttl: ``expires_in`` returned by the auth endpoints
+        capacity: Requests handled at once; extra concurrent requests get
+            an immediate 503 (default: None, unlimited). May be changed
+            while serving.
+        host: Interface to bind (default: loopback)
+        port: Port to bind (default: any free port)
+        http2: Accept HTTP/2 connections as well as HTTP/1.1
+        certfile: PEM certificate; serve over TLS when given
+        keyfile: PEM private key for ``certfile``
+        max_concurrent_streams: Streams per HTTP/2 connection advertised to clients
+        compress_responses: Compress responses with zstd or gzip when the
+            client accepts it
+
+    Examples:
+        >>> with FakeMailSafeProServer(latency=0.01) as server:
+        ...     client = MailSafePro(api_key="key_test", base_url=server.url)
+        ...     client.validate("user@example.com").valid
+        True
+    """
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        token_ttl: int = 900,
+        capacity: Optional[int] = None,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        http2: bool = False,
+        certfile: Optional[Union[str, Path]] = None,
+        keyfile: Optional[Union[str, Path]] = None,
+        max_concurrent_streams: int = 100,
+        compress_responses: bool = False,
+    ):
+        if http2 and h2 is None:
+            raise ImportError("FakeMailSafeProServer(http2=True) requires the h2 package")
+
+        self.latency = latency
+        self.token_ttl = token_ttl
+        self.capacity = capacity
+        self.active = 0
+        self.rejected = 0
+        self._lock = threading.Lock()
+        self._injected: List[Tuple[int, Any, Dict[str, str]]] = []
+        self._token_serial = 0
+        self.requests: Counter = Counter()
+        self.connections_opened = 0
+        self.handshakes = 0
+        self.streams_opened = 0
+        self.http2 = http2
+        self.max_concurrent_streams = max_concurrent_streams
+        self.compress_responses = compress_responses
+        self.compressed_requests = 0
+        self.compressed_responses = 0
+        self.request_bytes_received = 0
+        self.response_bytes_sent = 0
+
+        ssl_context = None
+        if certfile is not None:
+            ssl_context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+            ssl_context.load_cert_chain(str(certfile), str(keyfile) if keyfile else None)
+            ssl_context.set_alpn_protocols(["h2", "http/1.1"] if http2 else ["http/1.1"])
+        self._httpd = _FakeHTTPServer((host, port), self, ssl_context)
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        """Base URL to pass to the client"""
+        host, port = self._httpd.server_address[:2]
+        if isinstance(host, bytes):
+            host = host.decode("ascii")
+        scheme = "https" if self._httpd.ssl_context is not None else "http"
+        return f"{scheme}://{host}:{port}"
+
+    @property
+    def total_requests(self) -> int:
+        """Total number of requests served"""
+        with self._lock:
+            return sum(self.requests.values())
+
+    def start(self) -> "FakeMailSafeProServer":
+        """Start serving in a background thread"""
+        self._thread = threading.Thread(
+            target=self._httpd.serve_forever,
+            kwargs={"poll_interval": 0.05},
+            daemon=True,
+        )
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stop serving and release the socket"""
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self) -> "FakeMailSafeProServer":
+        return self.start()
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.stop()
+
+    def inject_error(
+        self,
+        status: int,
+        detail: str = "Injected error",
+        count: int = 1,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> None:
+        """
+        Answer the next ``count`` requests with an error response
+
+        Args:
+            status: HTTP status code to return
+            detail: Value of the ``detail`` field in the body
+            count: Number of requests to fail
+            headers: Extra response headers (e.g. ``Retry-After``)
+        """
+        with self._lock:
+            for _ in range(count):
+                self._injected.append((status, {"detail": detail}, dict(headers or {})))
+
+    def _record_connection(self) -> None:
+        with self._lock:
+            self.connections_opened += 1
+
+    def _record_handshake(self) -> None:
+        with self._lock:
+            self.handshakes += 1
+
+    def _record_stream(self) -> None:
+        with self._lock:
+            self.streams_opened += 1
+
+    def _enter(self) -> bool:
+        with self._lock:
+            if self.capacity is not None and self.active >= self.capacity:
+                self.rejected += 1
+                return False
+            self.active += 1
+            return True
+
+    def _leave(self) -> None:
+        with self._lock:
+            self.active -= 1
+
+    def _record_request(self, path: str) -> None:
+        with self._lock:
+            self.requests[path] += 1
+
+    def _decode(self, body: bytes, headers: Any) -> Optional[bytes]:
+        """Request body with its Content-Encoding removed; None if unsupported"""
+        encoding = (headers.get("content-encoding") or "identity").strip().lower()
+        with self._lock:
+            self.request_bytes_received += len(body)
+            self.compressed_requests += encoding != "identity"
+        if encoding == "identity":
+            return body
+        try:
+            return decompress(body, encoding)
+        except (ValueError, ImportError):
+            return None
+
+    def _encode(self, payload: Any, headers: Any) -> Tuple[bytes, Optional[str]]:
+        """Response body for a payload and the Content-Encoding it was given"""
+        data = json.dumps(payload).encode("utf-8")
+        encoding = None
+        if self.compress_responses:
+            accepted = {
+                token.split(";", 1)[0].strip().lower()
+                for token in (headers.get("accept-encoding") or "").split(",")
+            }
+            preferred = (ZSTD, GZIP) if zstandard is not None else (GZIP,)
+            encoding = next((e for e in preferred if e in accepted), None)
+            if encoding is not None:
+                data = compress(data, encoding)
+        with self._lock:
+            self.response_bytes_sent += len(data)
+            self.compressed_responses += encoding is not None
+        return data, encoding
+
+    def _next_injected_response(self) -> Optional[Tuple[int, Any, Dict[str, str]]]:
+        with self._lock:
+            return self._injected.pop(0) if self._injected else None
+
+    def _answer(
+        self,
+        method: str,
+        path: str,
+        body: bytes,
+        headers: Any,
+    ) -> Tuple[int, Any, Optional[Dict[str, str]]]:
+        """Status, JSON payload and extra headers for one request"""
+        self._record_request(path)
+
+        decoded = self._decode(body, headers)
+        if decoded is None:
+            return 415, {"detail": "Unsupported or corrupt Content-Encoding"}, None
+
+        if not self._enter():
+            return 503, {"detail": "Server over capacity"}, None
+
+        # Leave before answering so the client's next request isn't
+        # counted against the capacity while this one is still finishing
+        try:
+            if self.latency:
+                time.sleep(self.latency)
+
+            injected = self._next_injected_response()
+            if injected is not None:
+                return injected
+
+            try:
+                status, payload = self._route(method, path, decoded, headers)
+            except Exception as e:  # pragma: no cover - surfaced to the client as a 500
+                status, payload = 500, {"detail": str(e)}
+
+            return status, payload, None
+        finally:
+            self._leave()
+
+    def _issue_tokens(self) -> Dict[str, Any]:
+        with self._lock:
+            self._token_serial += 1
+            serial = self._token_serial
+        return {
+            "access_token": f"access_{serial}",
+            "refresh_token": f"refresh_{serial}",
+            "expires_in": self.token_ttl,
+        }
+
+    def _route(
+        self,
+        method: str,
+        path: str,
+        body: bytes,
+        headers: Any,
+    ) -> Tuple[int, Any]:
+        if method == "POST" and path == "/validate/email":
+            payload = json.loads(body or b"{}")
+            return 200, fake_result(
+                payload.get("email", ""),
+                check_smtp=payload.get("check_smtp", False),
+                include_raw_dns=payload.get("include_raw_dns", False),
+            )
+
+        if method == "POST" and path == "/batch":
+            payload = json.loads(body or b"{}")
+            return 200, self._batch_response(
+                payload.get("emails", []),
+                check_smtp=payload.get("check_smtp", False),
+                include_raw_dns=payload.get("include_raw_dns", False),
+            )
+
+        if method == "POST" and path == "/batch/upload":
+            emails = [m.decode("utf-8") for m in _EMAIL_IN_BODY.findall(body)]
+            return 200, self._batch_response(emails)
+
+        if method == "GET" and path == "/v1/quota":
+            return 200, {"used": self.total_requests, "limit": 1_000_000}
+
+        if method == "POST" and path in ("/auth/login", "/auth/refresh"):
+            return 200, self._issue_tokens()
+
+        if method == "POST" and path == "/auth/logout":
+            return 200, {"detail": "Logged out"}
+
+        return 404, {"detail": f"Not found: {path}"}
+
+    @staticmethod
+    def _batch_response(
+        emails: List[str],
+        check_smtp: bool = False,
+        include_raw_dns: bool = False,
+    ) -> Dict[str, Any]:
+        results = [fake_result(e, check_smtp, include_raw_dns) for e in emails]
+        valid_count = sum(1 for r in results if r["valid"])
+        return {
+            "count": len(results),
+            "valid_count": valid_count,
+            "invalid_count": len(results) - valid_count,
+            "processing_time": 0.012 * len(results),
+            "average_time": 0.012,
+            "results": results,
+            "summary": {"deliverable": valid_count},
+        }
+
+
+def make_self_signed_cert(directory: Union[str, Path], host: str = "127.0.0.1") -> Tuple[str, str]:
+    """
+    Create a self-signed certificate for ``host`` with the openssl CLI
+
+    Clients trust it when the certificate path is passed as the CA bundle,
+    e.g. through the ``REQUESTS_CA_BUNDLE`` and ``SSL_CERT_FILE`` variables.
+
+    Args:
+        directory: Where to write ``cert.pem`` and ``key.pem``
+        host: IP address or DNS name the certificate is valid for
+
+    Returns:
+        (certfile, keyfile) paths
+
+    Raises:
+        RuntimeError: If the openssl command isn't available
+    """
+    openssl = shutil.which("openssl")
+    if openssl is None:
+        raise RuntimeError("make_self_signed_cert requires the openssl command")
+
+    certfile = str(Path(directory) / "cert.pem")
+    keyfile = str(Path(directory) / "key.pem")
+    kind = "IP" if host.replace(".", "").isdigit() or ":" in host else "DNS"
+    subprocess.run(
+        [
+            openssl, "req", "-x509", "-newkey", "rsa:2048", "-nodes", "-days", "1",
+            "-keyout", keyfile, "-out", certfile, "-subj", f"/CN={host}",
+            "-addext", f"subjectAltName={kind}:{host}",
+        ],
+        check=True,
+        capture_output=True,
+    )
+    return certfile, keyfile
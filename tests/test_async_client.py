@@ -0,0 +1,173 @@
+"""
+Unit tests for the asyncio client
+"""
+
+import asyncio
+import unittest
+from datetime import datetime
+
+from mailsafepro import MailSafePro
+from mailsafepro.async_client import AsyncMailSafePro
+from mailsafepro.exceptions import (
+    AuthenticationError,
+    RateLimitError,
+    ServerError,
+    ValidationError,
+)
+from mailsafepro.models import BatchResult, ValidationResult
+from fake_server import FakeMailSafeProServer
+
+
+class TestAsyncMailSafePro(unittest.TestCase):
+    """Test AsyncMailSafePro against a local stand-in server"""
+
+    def setUp(self):
+        self.server = FakeMailSafeProServer().start()
+        self.addCleanup(self.server.stop)
+
+    def run_async(self, coro):
+        return asyncio.run(coro)
+
+    def make_client(self, **kwargs):
+        return AsyncMailSafePro(api_key="key_test", base_url=self.server.url, **kwargs)
+
+    def test_validate_success(self):
+        """Test single validation round trip"""
+        async def scenario():
+            async with self.make_client() as client:
+                return await client.validate("user@example.com")
+
+        result = self.run_async(scenario())
+
+        self.assertIsInstance(result, ValidationResult)
+        self.assertTrue(result.valid)
+        self.assertEqual(result.suggested_action, "accept")
+
+    def test_concurrent_validations_share_pool(self):
+        """Test many in-flight validations reuse a bounded connection pool"""
+        emails = [f"user{i}@example.com" for i in range(200)]
+
+        async def scenario():
+            async with self.make_client(max_connections=10) as client:
+                return await asyncio.gather(*(client.validate(e) for e in emails))
+
+        results = self.run_async(scenario())
+
+        self.assertEqual([r.email for r in results], emails)
+        self.assertLessEqual(self.server.connections_opened, 10)
+
+    def test_validate_batch(self):
+        """Test batch validation"""
+        async def scenario():
+            async with self.make_client() as client:
+                return await client.validate_batch(["ok@example.com", "invalid@example.com"])
+
+        result = self.run_async(scenario())
+
+        self.assertIsInstance(result, BatchResult)
+        self.assertEqual(result.count, 2)
+        self.assertEqual(result.valid_count, 1)
+
+    def test_validate_batch_empty(self):
+        """Test empty batch is rejected locally"""
+        async def scenario():
+            async with self.make_client() as client:
+                await client.validate_batch([])
+
+        with self.assertRaises(ValidationError):
+            self.run_async(scenario())
+
+    def test_validate_batch_too_large(self):
+        """Test batches over MAX_BATCH_SIZE are rejected locally"""
+        emails = [f"user{i}@example.com" for i in range(MailSafePro.MAX_BATCH_SIZE + 1)]
+
+        async def scenario():
+            async with self.make_client() as client:
+                await client.validate_batch(emails)
+
+        with self.assertRaises(ValidationError):
+            self.run_async(scenario())
+        self.assertEqual(self.server.requests["/batch"], 0)
+
+    def test_short_token_lifetime_clamped(self):
+        """Test a token living under a minute expires now, not in the past"""
+        client = self.make_client()
+        self.addCleanup(self.run_async, client.aclose())
+        before = datetime.now()
+
+        client._store_tokens({"access_token": "a", "refresh_token": "r", "expires_in": 30})
+
+        self.assertGreaterEqual(client._token_expires_at, before)
+        self.assertTrue(client._token_expired())
+
+    def test_rate_limit_maps_to_exception(self):
+        """Test 429 is retried, then mapped to RateLimitError"""
+        self.server.inject_error(429, count=2, headers={"Retry-After": "0"})
+
+        async def scenario():
+            async with self.make_client(max_retries=1) as client:
+                await client.validate("user@example.com")
+
+        with self.assertRaises(RateLimitError) as context:
+            self.run_async(scenario())
+
+        self.assertEqual(context.exception.retry_after, 0)
+        self.assertEqual(self.server.requests["/validate/email"], 2)
+
+    def test_server_error_retried(self):
+        """Test transient 5xx is retried transparently"""
+        self.server.inject_error(503, headers={"Retry-After": "0"})
+
+        async def scenario():
+            async with self.make_client() as client:
+                return await client.validate("user@example.com")
+
+        self.assertTrue(self.run_async(scenario()).valid)
+
+    def test_server_error_exhausted(self):
+        """Test 5xx without retries raises ServerError"""
+        self.server.inject_error(500)
+
+        async def scenario():
+            async with self.make_client(max_retries=0) as client:
+                await client.validate("user@example.com")
+
+        with self.assertRaises(ServerError):
+            self.run_async(scenario())
+
+    def test_authentication_error(self):
+        """Test 401 maps to AuthenticationError"""
+        self.server.inject_error(401, detail="Invalid API Key")
+
+        async def scenario():
+            async with self.make_client() as client:
+                await client.validate("user@example.com")
+
+        with self.assertRaises(AuthenticationError):
+            self.run_async(scenario())
+
+    def test_login_and_concurrent_refresh(self):
+        """Test expired JWT is refreshed exactly once under concurrency"""
+        async def scenario():
+            client = await AsyncMailSafePro.login(
+                username="user@example.com",
+                password="password",
+                base_url=self.server.url,
+            )
+            async with client:
+                self.assertEqual(client._access_token, "access_1")
+                client._token_expires_at = client._token_expires_at.replace(year=2000)
+                await asyncio.gather(
+                    *(client.validate(f"user{i}@example.com") for i in range(50))
+                )
+                self.assertEqual(client._access_token, "access_2")
+                await client.logout()
+                self.assertIsNone(client._access_token)
+
+        self.run_async(scenario())
+
+        self.assertEqual(self.server.requests["/auth/refresh"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
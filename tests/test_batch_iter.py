@@ -0,0 +1,83 @@
+"""
+Unit tests for pipelined batch validation
+"""
+
+import unittest
+
+from mailsafepro import MailSafePro
+from mailsafepro.exceptions import ValidationError
+from fake_server import FakeMailSafeProServer
+
+
+class TestValidateBatchIter(unittest.TestCase):
+    """Test MailSafePro.validate_batch_iter"""
+
+    def setUp(self):
+        self.server = FakeMailSafeProServer().start()
+        self.addCleanup(self.server.stop)
+        self.validator = MailSafePro(api_key="key_test", base_url=self.server.url)
+
+    def test_ordered_results_across_chunks(self):
+        """Test input order is preserved across chunk boundaries"""
+        emails = [f"user{i}@example.com" for i in range(25)]
+
+        results = list(self.validator.validate_batch_iter(emails, chunk_size=10))
+
+        self.assertEqual([r.email for r in results], emails)
+        self.assertEqual(self.server.requests["/batch"], 3)
+
+    def test_unordered_yields_every_result(self):
+        """Test completion-order mode yields each email exactly once"""
+        emails = [f"user{i}@example.com" for i in range(50)]
+
+        results = self.validator.validate_batch_iter(
+            emails, chunk_size=7, max_in_flight=3, ordered=False
+        )
+
+        self.assertEqual(sorted(r.email for r in results), sorted(emails))
+
+    def test_generator_consumed_lazily(self):
+        """Test the input is only read one window ahead of the consumer"""
+        consumed = []
+
+        def source():
+            for i in range(10000):
+                consumed.append(i)
+                yield f"user{i}@example.com"
+
+        results = self.validator.validate_batch_iter(
+            source(), chunk_size=100, max_in_flight=2
+        )
+        first = next(results)
+        results.close()
+
+        self.assertEqual(first.email, "user0@example.com")
+        # Two chunks in flight plus the one being yielded
+        self.assertLessEqual(len(consumed), 300)
+
+    def test_no_limit_on_total_size(self):
+        """Test more than MAX_BATCH_SIZE emails are accepted"""
+        emails = (f"user{i}@example.com" for i in range(MailSafePro.MAX_BATCH_SIZE + 1))
+
+        count = sum(1 for _ in self.validator.validate_batch_iter(emails, chunk_size=5000))
+
+        self.assertEqual(count, MailSafePro.MAX_BATCH_SIZE + 1)
+
+    def test_chunk_failure_propagates(self):
+        """Test a failed chunk raises from the iterator"""
+        self.server.inject_error(422, detail="Invalid batch")
+
+        with self.assertRaises(ValidationError):
+            list(self.validator.validate_batch_iter(["a@example.com"], chunk_size=1))
+
+    def test_invalid_arguments(self):
+        """Test chunk_size and max_in_flight are range-checked eagerly"""
+        with self.assertRaises(ValidationError):
+            self.validator.validate_batch_iter([], chunk_size=MailSafePro.MAX_BATCH_SIZE + 1)
+
+        with self.assertRaises(ValidationError):
+            self.validator.validate_batch_iter([], max_in_flight=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
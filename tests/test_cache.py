@@ -0,0 +1,381 @@
+"""
+Unit tests for client-side result caching
+"""
+
+import copy
+import multiprocessing
+import os
+import tempfile
+import threading
+import unittest
+from dataclasses import FrozenInstanceError
+
+from mailsafepro import MailSafePro
+from mailsafepro.cache import (
+    DomainSectionCache, ResultCache, SQLiteCache, TieredCache, cache_key,
+)
+from mailsafepro.models import DNSInfo, LazyValidationResult, ValidationResult
+from fake_server import FakeMailSafeProServer, fake_result
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def make_result(email):
+    return ValidationResult.from_dict(fake_result(email))
+
+
+class TestResultCache(unittest.TestCase):
+    """Test ResultCache"""
+
+    def test_hit_and_miss_counters(self):
+        """Test get/set updates hit and miss counters"""
+        cache = ResultCache()
+        self.assertIsNone(cache.get("a"))
+
+        cache.set("a", make_result("a@example.com"))
+        self.assertEqual(cache.get("a").email, "a@example.com")
+
+        stats = cache.stats()
+        self.assertEqual((stats["hits"], stats["misses"], stats["size"]), (1, 1, 1))
+
+    def test_lru_eviction(self):
+        """Test least recently used entry is evicted first"""
+        cache = ResultCache(max_entries=2)
+        cache.set("a", make_result("a@example.com"))
+        cache.set("b", make_result("b@example.com"))
+        cache.get("a")
+        cache.set("c", make_result("c@example.com"))
+
+        self.assertIsNotNone(cache.get("a"))
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.stats()["evictions"], 1)
+
+    def test_ttl_expiry(self):
+        """Test entries expire after ttl seconds"""
+        clock = FakeClock()
+        cache = ResultCache(ttl=10, clock=clock)
+        cache.set("a", make_result("a@example.com"))
+
+        clock.now = 9.9
+        self.assertIsNotNone(cache.get("a"))
+
+        clock.now = 10.0
+        self.assertIsNone(cache.get("a"))
+        self.assertEqual(cache.stats()["expirations"], 1)
+        self.assertEqual(len(cache), 0)
+
+    def test_concurrent_access(self):
+        """Test size bound holds under concurrent writers"""
+        cache = ResultCache(max_entries=100)
+        result = make_result("a@example.com")
+
+        def worker(n):
+            for i in range(1000):
+                cache.set(f"{n}-{i}", result)
+                cache.get(f"{n}-{i - 1}")
+
+        threads = [threading.Thread(target=worker, args=(n,)) for n in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(cache), 100)
+        self.assertEqual(cache.stats()["evictions"], 8 * 1000 - 100)
+
+    def test_cache_key_normalization(self):
+        """Test keys ignore whitespace and domain case but not options"""
+        self.assertEqual(cache_key(" User@Example.COM "), cache_key("User@example.com"))
+        self.assertNotEqual(cache_key("user@example.com"), cache_key("USER@example.com"))
+        self.assertNotEqual(
+            cache_key("user@example.com"),
+            cache_key("user@example.com", check_smtp=True),
+        )
+
+
+def write_entries(path, start, count):
+    cache = SQLiteCache(path, compact_every=0)
+    for i in range(start, start + count):
+        cache.set(f"key{i}", make_result(f"user{i}@example.com"))
+
+
+class TestSQLiteCache(unittest.TestCase):
+    """Test SQLiteCache and TieredCache"""
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.dir = tmp.name
+        self.path = os.path.join(self.dir, "results.db")
+
+    def test_round_trip_across_instances(self):
+        """Test a result written by one instance is read by another"""
+        result = ValidationResult.from_dict(fake_result("a@example.com", include_raw_dns=True))
+        SQLiteCache(self.path).set("a", result)
+
+        loaded = SQLiteCache(self.path).get("a")
+
+        self.assertEqual(loaded, result)
+        self.assertEqual(loaded.dns_security.mx_records, ["mx1.example.com", "mx2.example.com"])
+
+    def test_lazy_results(self):
+        """Test lazy_results decodes rows into LazyValidationResult"""
+        result = ValidationResult.from_dict(fake_result("a@example.com", include_raw_dns=True))
+        SQLiteCache(self.path).set("a", result)
+
+        loaded = SQLiteCache(self.path, lazy_results=True).get("a")
+
+        self.assertIsInstance(loaded, LazyValidationResult)
+        self.assertEqual(loaded.to_dict(), result.to_dict())
+        self.assertNotIsInstance(SQLiteCache(self.path).get("a"), LazyValidationResult)
+
+    def test_ttl_and_compaction(self):
+        """Test expired rows are skipped and compaction enforces the size bound"""
+        clock = FakeClock()
+        cache = SQLiteCache(self.path, ttl=10, max_entries=3, compact_every=0, clock=clock)
+        for i in range(5):
+            clock.now = i
+            cache.set(f"key{i}", make_result(f"user{i}@example.com"))
+
+        clock.now = 10.5
+        self.assertIsNone(cache.get("key0"))
+        self.assertIsNotNone(cache.get("key1"))
+
+        self.assertEqual(cache.compact(), 2)
+        self.assertEqual(cache.stats()["size"], 3)
+        self.assertIsNone(cache.get("key1"))
+        self.assertIsNotNone(cache.get("key4"))
+
+    def test_concurrent_processes(self):
+        """Test several processes can write the same database at once"""
+        SQLiteCache(self.path)
+        processes = [
+            multiprocessing.Process(target=write_entries, args=(self.path, n * 100, 100))
+            for n in range(4)
+        ]
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join()
+
+        cache = SQLiteCache(self.path)
+        self.assertEqual(cache.stats()["size"], 400)
+        self.assertEqual(cache.get("key399").email, "user399@example.com")
+
+    def test_export_and_warm_from(self):
+        """Test a cache can be preloaded from another cache's export"""
+        source = SQLiteCache(self.path)
+        for i in range(10):
+            source.set(f"key{i}", make_result(f"user{i}@example.com"))
+        export_path = os.path.join(self.dir, "export.jsonl")
+        self.assertEqual(source.export(export_path), 10)
+
+        target = SQLiteCache(os.path.join(self.dir, "warm.db"))
+
+        self.assertEqual(target.warm_from(export_path), 10)
+        self.assertEqual(target.get("key7").email, "user7@example.com")
+
+    def test_tiered_promotes_lower_tier_hits(self):
+        """Test a disk hit is copied into the memory tier"""
+        memory = ResultCache()
+        disk = SQLiteCache(self.path)
+        disk.set("a", make_result("a@example.com"))
+        cache = TieredCache(memory, disk)
+
+        self.assertEqual(cache.get("a").email, "a@example.com")
+        self.assertEqual(memory.get("a").email, "a@example.com")
+
+        cache.set("b", make_result("b@example.com"))
+        self.assertIsNotNone(disk.get("b"))
+
+
+class TestClientCaching(unittest.TestCase):
+    """Test MailSafePro with a ResultCache"""
+
+    def setUp(self):
+        self.server = FakeMailSafeProServer().start()
+        self.addCleanup(self.server.stop)
+        self.cache = ResultCache()
+        self.validator = MailSafePro(
+            api_key="key_test", base_url=self.server.url, cache=self.cache
+        )
+
+    def test_validate_served_from_cache(self):
+        """Test repeated validate() makes one round trip"""
+        self.validator.validate("user@example.com")
+        result = self.validator.validate("user@Example.com")
+
+        self.assertEqual(result.email, "user@example.com")
+        self.assertEqual(self.server.requests["/validate/email"], 1)
+
+        self.validator.validate("user@example.com", check_smtp=True)
+        self.assertEqual(self.server.requests["/validate/email"], 2)
+
+    def test_batch_sends_only_misses(self):
+        """Test validate_batch answers cached emails locally"""
+        self.validator.validate("b@example.com")
+
+        batch = self.validator.validate_batch(
+            ["a@example.com", "b@example.com", "invalid@example.com"]
+        )
+
+        self.assertEqual(
+            [r.email for r in batch.results],
+            ["a@example.com", "b@example.com", "invalid@example.com"],
+        )
+        self.assertEqual((batch.count, batch.valid_count, batch.invalid_count), (3, 2, 1))
+
+        batch = self.validator.validate_batch(["a@example.com", "b@example.com"])
+
+        self.assertEqual(batch.count, 2)
+        self.assertEqual(self.server.requests["/batch"], 1)
+
+    def test_batch_key_includes_priority(self):
+        """Test batches share cache entries with standard-priority validate() only"""
+        self.validator.validate("a@example.com", priority="high")
+        self.validator.validate_batch(["a@example.com"])
+        self.assertEqual(self.server.requests["/batch"], 1)
+
+        self.validator.validate("a@example.com")
+        self.assertEqual(self.server.requests["/validate/email"], 1)
+        self.assertIsNotNone(self.cache.get(cache_key("a@example.com", priority="standard")))
+
+
+
+class TestDomainSectionCache(unittest.TestCase):
+    """Test sharing of per-domain sections"""
+
+    def setUp(self):
+        self.clock = FakeClock()
+        self.domains = DomainSectionCache(max_domains=2, ttl=60, clock=self.clock)
+
+    def decode(self, email, result_type=ValidationResult, **kwargs):
+        data = fake_result(email, include_raw_dns=kwargs.pop("include_raw_dns", True))
+        return self.domains.decode(data, result_type, **kwargs)
+
+    def test_sections_shared_per_domain(self):
+        """Test equal sections for one domain decode to one object"""
+        first = self.decode("a@gmail.com")
+        second = self.decode("b@gmail.com")
+        other = self.decode("c@outlook.com")
+
+        self.assertIs(first.dns_security, second.dns_security)
+        self.assertIs(first.provider_analysis, second.provider_analysis)
+        self.assertIsNot(first.dns_security, other.dns_security)
+        plain = ValidationResult.from_dict(fake_result("a@gmail.com", include_raw_dns=True))
+        self.assertEqual(first, plain)
+        self.assertEqual(first.to_dict(), plain.to_dict())
+        self.assertEqual(self.domains.stats()["shared"], 2)
+
+    def test_changed_section_rebuilt(self):
+        """Test a section differing from the cached one is decoded afresh"""
+        first = self.decode("a@gmail.com")
+        data = fake_result("b@gmail.com", include_raw_dns=True)
+        data["dns_security"]["mx_records"] = ["mx9.gmail.com"]
+
+        second = self.domains.decode(data)
+
+        self.assertIsNot(first.dns_security, second.dns_security)
+        self.assertEqual(second.dns_security.mx_records, ["mx9.gmail.com"])
+        data["email"] = "c@gmail.com"
+        self.assertIs(self.domains.decode(data).dns_security, second.dns_security)
+
+    def test_fill_fresh_dns(self):
+        """Test DNS is filled in only when asked for and still fresh"""
+        resolved = self.decode("a@gmail.com").dns_security
+
+        self.assertIsNone(self.decode("b@gmail.com", include_raw_dns=False).dns_security)
+        filled = self.decode("b@gmail.com", include_raw_dns=False, fill_dns=True)
+        self.assertIs(filled.dns_security, resolved)
+        self.assertTrue(self.domains.all_fresh(["x@gmail.com", "y@Gmail.com"]))
+        self.assertFalse(self.domains.all_fresh(["x@gmail.com", "y@outlook.com"]))
+
+        self.clock.now = 61
+        self.assertFalse(self.domains.all_fresh(["x@gmail.com"]))
+        stale = self.decode("b@gmail.com", include_raw_dns=False, fill_dns=True)
+        self.assertIsNone(stale.dns_security)
+
+    def test_lazy_results_and_eviction(self):
+        """Test lazy results get shared sections and old domains are evicted"""
+        eager = self.decode("a@gmail.com")
+        lazy = self.decode("b@gmail.com", LazyValidationResult)
+
+        self.assertIsInstance(lazy, LazyValidationResult)
+        self.assertIs(lazy.dns_security, eager.dns_security)
+        self.assertFalse(lazy.smtp.checked)
+
+        self.decode("c@outlook.com")
+        self.decode("d@yahoo.com")
+        self.assertEqual(len(self.domains), 2)
+        self.assertEqual(self.domains.stats()["evictions"], 1)
+
+    def test_least_recently_used_evicted(self):
+        """Test a domain seen again is kept over one that wasn't"""
+        self.decode("a@gmail.com")
+        self.decode("b@outlook.com")
+        self.decode("c@gmail.com")
+        self.decode("d@yahoo.com")
+
+        self.assertTrue(self.domains.all_fresh(["x@gmail.com", "x@yahoo.com"]))
+        self.assertFalse(self.domains.all_fresh(["x@outlook.com"]))
+
+    def test_shared_sections_read_only(self):
+        """Test shared sections refuse changes, and copies of them don't"""
+        dns = self.decode("a@gmail.com").dns_security
+
+        with self.assertRaises(FrozenInstanceError):
+            dns.mx_records = []
+        with self.assertRaises(FrozenInstanceError):
+            dns.spf.status = "invalid"
+        with self.assertRaises(TypeError):
+            dns.mx_records.append("mx3.gmail.com")
+        self.assertIsInstance(dns, DNSInfo)
+
+        editable = copy.deepcopy(dns)
+        editable.mx_records.append("mx3.gmail.com")
+        editable.spf.status = "invalid"
+        self.assertEqual(self.decode("b@gmail.com").dns_security.spf.status, "valid")
+
+
+class TestClientDomainCache(unittest.TestCase):
+    """Test clients decoding through a DomainSectionCache"""
+
+    def setUp(self):
+        self.server = FakeMailSafeProServer().start()
+        self.addCleanup(self.server.stop)
+        self.domains = DomainSectionCache()
+        self.validator = MailSafePro(
+            api_key="key_test", base_url=self.server.url, domain_cache=self.domains
+        )
+
+    def test_batch_shares_sections(self):
+        """Test a batch holds one DNS section per domain"""
+        emails = [f"user{i}@gmail.com" for i in range(20)] + ["other@outlook.com"]
+
+        batch = self.validator.validate_batch(emails, include_raw_dns=True)
+
+        self.assertEqual(len({id(r.dns_security) for r in batch.results}), 2)
+        self.assertEqual(len({id(r.provider_analysis) for r in batch.results}), 2)
+
+    def test_raw_dns_skipped_when_fresh(self):
+        """Test include_raw_dns is skipped for recently resolved domains"""
+        first = self.validator.validate_batch(["a@gmail.com"], include_raw_dns=True)
+
+        batch = self.validator.validate_batch(["b@gmail.com", "c@gmail.com"], include_raw_dns=True)
+        single = self.validator.validate("d@gmail.com", include_raw_dns=True)
+        plain = self.validator.validate("e@gmail.com")
+
+        self.assertEqual(self.domains.stats()["filled"], 3)
+        self.assertIs(batch.results[1].dns_security, first.results[0].dns_security)
+        self.assertIs(single.dns_security, first.results[0].dns_security)
+        self.assertIsNone(plain.dns_security)
+
+
+if __name__ == "__main__":
+    unittest.main()
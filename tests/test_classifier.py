@@ -0,0 +1,171 @@
+"""
+Unit tests for the offline domain classifier
+"""
+
+import asyncio
+import os
+import tempfile
+import unittest
+
+from mailsafepro import AsyncMailSafePro, DomainSet, MailSafePro, OfflineClassifier
+from mailsafepro.classifier import DISPOSABLE, NO_REPLY, ROLE
+from fake_server import FakeMailSafeProServer
+
+
+class TestDomainSet(unittest.TestCase):
+    """Test domain membership and list files"""
+
+    def test_membership(self):
+        """Test exact, case-insensitive and subdomain matches"""
+        domains = DomainSet(["Mailinator.com", " yopmail.fr ", ""])
+
+        self.assertEqual(len(domains), 2)
+        self.assertIn("mailinator.com", domains)
+        self.assertIn("a.b.mailinator.com", domains)
+        self.assertIn("yopmail.fr", domains)
+        self.assertNotIn("notmailinator.com", domains)
+        self.assertNotIn("com", domains)
+        self.assertNotIn("mailinator.com.evil.org", domains)
+
+    def test_load_and_save(self):
+        """Test the list file round trip keeps the version"""
+        fd, path = tempfile.mkstemp(suffix=".txt")
+        os.close(fd)
+        self.addCleanup(os.remove, path)
+
+        with open(path, "w", encoding="utf-8") as f:
+            f.write("# Disposable domains\n# version: 2026.01\n\nmailinator.com\nTrashMail.de\n")
+
+        domains = DomainSet.load(path)
+        self.assertEqual(domains.version, "2026.01")
+        self.assertEqual(sorted(domains), ["mailinator.com", "trashmail.de"])
+
+        domains.save(path)
+        self.assertEqual(DomainSet.load(path).version, "2026.01")
+        self.assertEqual(len(DomainSet.load(path)), 2)
+
+
+class TestOfflineClassifier(unittest.TestCase):
+    """Test verdicts and the offline results built from them"""
+
+    def setUp(self):
+        self.classifier = OfflineClassifier()
+
+    def test_classify(self):
+        """Test disposable domains, no-reply and role prefixes are recognized"""
+        cases = {
+            "someone@mailinator.com": DISPOSABLE,
+            "x@in.YOPMAIL.com": DISPOSABLE,
+            "info@mailinator.com": DISPOSABLE,
+            "noreply@github.com": NO_REPLY,
+            "No-Reply.Billing@example.com": NO_REPLY,
+            "do_not_reply2@example.com": NO_REPLY,
+            "MAILER-DAEMON@example.com": NO_REPLY,
+            "info@example.com": ROLE,
+            "Support+eu@example.com": ROLE,
+            "sales2@example.com": ROLE,
+            "help.desk@example.com": ROLE,
+            "nancy@gmail.com": None,
+            "infotech@example.com": None,
+            "hristo@example.com": None,
+            "reply@example.com": None,
+        }
+        for email, verdict in cases.items():
+            with self.subTest(email=email):
+                self.assertEqual(self.classifier.classify(email), verdict)
+
+        self.assertEqual(self.classifier.classify_many(list(cases)), list(cases.values()))
+
+    def test_offline_result(self):
+        """Test offline results are complete and marked as decided offline"""
+        result = self.classifier.result_for("a@mailinator.com")
+
+        self.assertTrue(result.locally_decided)
+        self.assertFalse(result.valid)
+        self.assertEqual(result.suggested_action, "reject")
+        self.assertEqual(result.validation_tier, "offline")
+        self.assertEqual(result.provider_analysis.provider, "mailinator")
+        self.assertIsNone(result.role_email_info)
+        self.assertIn("Disposable", result.detail)
+        self.assertEqual(result.smtp.skip_reason, "offline")
+        self.assertEqual(result.metadata.validation_id, f"offline-{self.classifier.version}")
+
+        # Sections aren't shared, so changing one result leaves the next alone
+        result.smtp.detail = "changed"
+        self.assertIsNone(self.classifier.result_for("b@mailinator.com").smtp.detail)
+
+    def test_flags_not_decided(self):
+        """Test no-reply and role addresses are left to the API"""
+        emails = ["noreply@gmail.com", "info@example.com", "user@example.com"]
+        for email in emails:
+            self.assertIsNone(self.classifier.result_for(email))
+        self.assertEqual(self.classifier.results_for(emails), [None, None, None])
+
+    def test_custom_lists(self):
+        """Test custom domain sets and prefixes replace the built-in ones"""
+        classifier = OfflineClassifier(
+            DomainSet(["corp-temp.io"], "v1"), no_reply_prefixes=["bounce"], role_prefixes=["ops"]
+        )
+
+        self.assertEqual(classifier.classify("a@corp-temp.io"), DISPOSABLE)
+        self.assertEqual(classifier.classify("bounce-42@example.com"), NO_REPLY)
+        self.assertEqual(classifier.classify("ops@example.com"), ROLE)
+        self.assertIsNone(classifier.classify("a@mailinator.com"))
+        self.assertIsNone(classifier.classify("noreply@example.com"))
+        self.assertIsNone(classifier.classify("info@example.com"))
+
+
+class TestClientClassifier(unittest.TestCase):
+    """Test both clients skip the API for offline verdicts"""
+
+    EMAILS = ["a@example.com", "x@mailinator.com", "noreply@example.com", "invalid@example.com"]
+
+    def setUp(self):
+        self.server = FakeMailSafeProServer().start()
+        self.addCleanup(self.server.stop)
+
+    def check(self, batch):
+        self.assertEqual(batch.count, 4)
+        self.assertEqual([r.email for r in batch.results], self.EMAILS)
+        self.assertEqual([r.locally_decided for r in batch.results], [False, True, False, False])
+        self.assertEqual(batch.valid_count, 2)
+
+    def test_sync_client(self):
+        """Test validate() and validate_batch() answer offline hits locally"""
+        validator = MailSafePro(
+            api_key="key_test", base_url=self.server.url, classifier=OfflineClassifier()
+        )
+
+        self.assertTrue(validator.validate("someone@mailinator.com").locally_decided)
+        self.assertEqual(self.server.total_requests, 0)
+
+        self.check(validator.validate_batch(self.EMAILS))
+        self.assertEqual(self.server.requests["/batch"], 1)
+
+        batch = validator.validate_batch(["x@mailinator.com", "y@yopmail.com"])
+        self.assertEqual(batch.count, 2)
+        self.assertEqual(self.server.requests["/batch"], 1)
+
+        # Flagged, but left to the API
+        self.assertTrue(validator.validate("noreply@example.com").valid)
+        self.assertEqual(self.server.requests["/validate/email"], 1)
+
+    def test_async_client(self):
+        """Test the async client answers offline hits locally too"""
+        async def scenario():
+            async with AsyncMailSafePro(
+                api_key="key_test", base_url=self.server.url, classifier=OfflineClassifier()
+            ) as client:
+                single = await client.validate("someone@mailinator.com")
+                return single, await client.validate_batch(self.EMAILS)
+
+        single, batch = asyncio.run(scenario())
+
+        self.assertTrue(single.locally_decided)
+        self.check(batch)
+        self.assertEqual(self.server.requests["/batch"], 1)
+        self.assertEqual(self.server.requests["/validate/email"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
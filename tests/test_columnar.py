@@ -0,0 +1,165 @@
+"""
+Unit tests for the columnar result container
+"""
+
+import unittest
+
+from mailsafepro import BatchResult, ResultColumns, ValidationFailure
+from mailsafepro.columnar import numpy
+from mailsafepro.exceptions import ServerError, ValidationError
+from fake_server import fake_result
+
+
+def response(email, status, action, risk, provider):
+    data = fake_result(email)
+    data.update({
+        "status": status,
+        "suggested_action": action,
+        "risk_score": risk,
+        "valid": status == "deliverable",
+        "provider_analysis": {"provider": provider, "reputation": 0.9},
+    })
+    return data
+
+
+ROWS = [
+    response("a@gmail.com", "deliverable", "accept", 0.1, "gmail"),
+    response("b@gmail.com", "risky", "review", 0.6, "gmail"),
+    response("c@yahoo.com", "undeliverable", "reject", 0.9, "yahoo"),
+    response("d@yahoo.com", "risky", "reject", 0.8, "yahoo"),
+    response("e@corp.io", "deliverable", "accept", 0.2, "corp"),
+]
+
+
+class ColumnarTests:
+    """Behavior shared by the NumPy and stdlib array backends"""
+
+    use_numpy = False
+
+    def setUp(self):
+        batch = BatchResult.from_dict({"results": ROWS})
+        self.columns = batch.columns(use_numpy=self.use_numpy)
+
+    def test_encoding(self):
+        """Test numeric columns are arrays and categoricals are coded"""
+        self.assertEqual(len(self.columns), 5)
+        self.assertEqual(self.columns.uses_numpy, self.use_numpy)
+        self.assertEqual(
+            self.columns.categories("status"), ["deliverable", "risky", "undeliverable"]
+        )
+        self.assertEqual(list(self.columns["status"]), [0, 1, 2, 1, 0])
+        self.assertEqual(list(self.columns["risk_score"]), [0.1, 0.6, 0.9, 0.8, 0.2])
+
+    def test_masks(self):
+        """Test conditions, AND-combination and selection"""
+        risky = self.columns.mask(("status", "==", "risky"))
+        self.assertEqual(self.columns.count(risky), 2)
+
+        rejects = self.columns.mask(("suggested_action", "==", "reject"), ("risk_score", ">", 0.85))
+        self.assertEqual(self.columns.emails(rejects), ["c@yahoo.com"])
+
+        listed = self.columns.mask(("provider", "in", {"corp", "hotmail"}))
+        self.assertEqual(self.columns.emails(listed), ["e@corp.io"])
+
+        self.assertEqual(self.columns.count(self.columns.mask(("status", "==", "unknown"))), 0)
+        self.assertEqual(self.columns.count(self.columns.mask(("status", "!=", "risky"))), 3)
+        self.assertEqual(self.columns.count(self.columns.mask()), 5)
+
+        subset = self.columns.select(self.columns.mask(("valid", "==", False)))
+        self.assertEqual(subset.emails(), ["b@gmail.com", "c@yahoo.com", "d@yahoo.com"])
+        self.assertEqual(subset.value_counts("status"), {"risky": 2, "undeliverable": 1})
+
+    def test_aggregation(self):
+        """Test value counts, group-bys and histograms"""
+        self.assertEqual(
+            self.columns.value_counts("suggested_action"),
+            {"accept": 2, "reject": 2, "review": 1},
+        )
+        self.assertEqual(self.columns.group_by("provider"), {"gmail": 2, "yahoo": 2, "corp": 1})
+
+        means = self.columns.group_by("provider", "risk_score", "mean")
+        self.assertAlmostEqual(means["gmail"], 0.35)
+        self.assertAlmostEqual(means["yahoo"], 0.85)
+        self.assertEqual(self.columns.group_by("provider", "risk_score", "max")["yahoo"], 0.9)
+        self.assertEqual(self.columns.group_by("provider", "valid", "sum"), {
+            "gmail": 1.0, "yahoo": 0.0, "corp": 1.0,
+        })
+
+        risky = self.columns.mask(("status", "==", "risky"))
+        self.assertEqual(self.columns.group_by("provider", "risk_score", "min", risky), {
+            "gmail": 0.6, "yahoo": 0.8,
+        })
+
+        counts, edges = self.columns.histogram("risk_score", bins=4)
+        self.assertEqual(counts, [2, 0, 1, 2])
+        self.assertEqual(len(edges), 5)
+        self.assertEqual(edges[-1], 1.0)
+
+    def test_to_dict(self):
+        """Test export decodes categorical columns"""
+        data = self.columns.to_dict()
+
+        self.assertEqual(data["email"][2], "c@yahoo.com")
+        self.assertEqual(data["status"][2], "undeliverable")
+        self.assertEqual(data["valid"], [True, False, False, False, True])
+
+    def test_errors(self):
+        """Test unsupported columns, operators and aggregates are rejected"""
+        with self.assertRaises(ValidationError):
+            self.columns.mask(("status", ">", "risky"))
+        with self.assertRaises(ValidationError):
+            self.columns.mask(("detail", "==", "x"))
+        with self.assertRaises(ValidationError):
+            self.columns.group_by("provider", "risk_score", "median")
+        with self.assertRaises(ValidationError):
+            self.columns.group_by("risk_score")
+
+
+class TestArrayBackend(ColumnarTests, unittest.TestCase):
+    """Test the stdlib array backend"""
+
+    def test_from_dicts_and_failures(self):
+        """Test building from raw dictionaries and skipping failures"""
+        from_dicts = ResultColumns.from_dicts(ROWS, use_numpy=False)
+        self.assertEqual(from_dicts.to_dict(), self.columns.to_dict())
+
+        batch = BatchResult.from_dict({"results": ROWS[:2]})
+        mixed = batch.results + [ValidationFailure("x@y.io", ServerError("boom"))]
+        self.assertEqual(len(ResultColumns.from_results(mixed, use_numpy=False)), 2)
+
+    def test_many_categories(self):
+        """Test more than 256 distinct values widen the codes"""
+        rows = [response(f"u{i}@d{i}.io", "deliverable", "accept", 0.5, f"p{i % 300}")
+                for i in range(600)]
+        columns = ResultColumns.from_dicts(rows, use_numpy=False)
+
+        self.assertEqual(columns["provider"].typecode, "i")
+        self.assertEqual(columns.count(columns.mask(("provider", "==", "p299"))), 2)
+        self.assertEqual(columns.value_counts("provider")["p299"], 2)
+        self.assertEqual(columns.group_by("provider", "risk_score", "sum")["p0"], 1.0)
+
+    def test_empty(self):
+        """Test an empty container answers with empty aggregates"""
+        columns = ResultColumns.from_results([], use_numpy=False)
+
+        self.assertEqual(columns.count(columns.mask(("valid", "==", True))), 0)
+        self.assertEqual(columns.value_counts("status"), {})
+        self.assertEqual(columns.histogram("risk_score", bins=2)[0], [0, 0])
+
+
+@unittest.skipIf(numpy is None, "numpy not installed")
+class TestNumpyBackend(ColumnarTests, unittest.TestCase):
+    """Test the NumPy backend"""
+
+    use_numpy = True
+
+    def test_to_numpy(self):
+        """Test NumPy export decodes categorical columns"""
+        data = self.columns.to_numpy()
+
+        self.assertEqual(data["provider"].tolist(), ["gmail", "gmail", "yahoo", "yahoo", "corp"])
+        self.assertEqual(data["risk_score"].dtype, numpy.float64)
+
+
+if __name__ == "__main__":
+    unittest.main()
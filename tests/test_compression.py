@@ -0,0 +1,173 @@
+"""
+Unit tests for request and response body compression
+"""
+
+import asyncio
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+from mailsafepro import AsyncMailSafePro, BodyCompression, MailSafePro
+from mailsafepro.compression import CompressedBody, compress, decompress, zstandard
+from mailsafepro.http2 import h2
+from fake_server import FakeMailSafeProServer, make_self_signed_cert
+
+
+EMAILS = [f"user{i}@example.com" for i in range(500)]
+
+
+class TestCompressedBody(unittest.TestCase):
+    """Test streamed compression and the size threshold"""
+
+    def test_streams_in_chunks(self):
+        """Test the body compresses chunk by chunk and can be sent again"""
+        data = b'{"email":"user@example.com"},' * 10000
+        body = CompressedBody(data, chunk_size=4096)
+
+        first = list(body)
+        self.assertGreater(len(first), 1)
+        self.assertEqual(decompress(b"".join(first), "gzip"), data)
+        self.assertEqual(body.bytes_sent, sum(len(chunk) for chunk in first))
+        self.assertLess(body.bytes_sent, len(data) // 10)
+        self.assertEqual(b"".join(body), b"".join(first))
+
+    def test_threshold(self):
+        """Test bodies under min_size are sent as-is"""
+        compression = BodyCompression(min_size=100)
+
+        self.assertEqual(compression.encode(b"x" * 99), b"x" * 99)
+        self.assertIsInstance(compression.encode(b"x" * 100), CompressedBody)
+
+    def test_encodings(self):
+        """Test unknown encodings are rejected and zstd needs zstandard"""
+        with self.assertRaises(ValueError):
+            BodyCompression(encoding="br")
+        with self.assertRaises(ValueError):
+            decompress(b"not gzip", "gzip")
+        if zstandard is None:
+            with self.assertRaises(ImportError):
+                BodyCompression(encoding="zstd")
+        else:
+            self.assertEqual(decompress(compress(b"abc" * 100, "zstd"), "zstd"), b"abc" * 100)
+
+
+class TestClientCompression(unittest.TestCase):
+    """Test both clients against a stand-in server compressing both directions"""
+
+    def setUp(self):
+        self.server = FakeMailSafeProServer(compress_responses=True).start()
+        self.addCleanup(self.server.stop)
+
+    def check(self, compression):
+        stats = compression.last
+        self.assertEqual(stats.path, "/batch")
+        self.assertEqual(stats.encoding, "gzip")
+        self.assertEqual(stats.request_bytes_sent, self.server.request_bytes_received)
+        self.assertEqual(stats.response_bytes_received, self.server.response_bytes_sent)
+        self.assertLess(stats.request_bytes_sent * 5, stats.request_bytes)
+        self.assertLess(stats.response_bytes_received * 5, stats.response_bytes)
+        self.assertEqual(self.server.compressed_requests, 1)
+        self.assertEqual(self.server.compressed_responses, 1)
+        self.assertEqual(compression.stats()["bytes_saved"], stats.bytes_saved)
+
+    def test_sync_client(self):
+        """Test compressed batches, streamed batches and small uncompressed requests"""
+        compression = BodyCompression()
+        validator = MailSafePro(
+            api_key="key_test", base_url=self.server.url, compression=compression
+        )
+
+        self.assertEqual(validator.validate_batch(EMAILS, include_raw_dns=True).count, 500)
+        self.check(compression)
+
+        with validator.validate_batch_stream(EMAILS) as stream:
+            self.assertEqual(sum(1 for _ in stream), 500)
+        self.assertEqual(compression.last.encoding, "gzip")
+        self.assertGreater(compression.last.bytes_saved, 0)
+
+        validator.validate("user@example.com")
+        single = compression.last
+        self.assertIsNone(single.encoding)
+        self.assertEqual(single.request_bytes, single.request_bytes_sent)
+        self.assertEqual(self.server.compressed_requests, 2)
+        self.assertEqual(compression.stats()["requests"], 3)
+
+    def test_retry_resends_body(self):
+        """Test a retried request compresses and sends the full body again"""
+        compression = BodyCompression()
+        validator = MailSafePro(
+            api_key="key_test", base_url=self.server.url, compression=compression
+        )
+        self.server.inject_error(503, count=1)
+
+        with mock.patch("time.sleep"):
+            self.assertEqual(validator.validate_batch(EMAILS).count, 500)
+        self.assertEqual(self.server.compressed_requests, 2)
+        self.assertEqual(
+            self.server.request_bytes_received, 2 * compression.last.request_bytes_sent
+        )
+
+    def test_async_client(self):
+        """Test the async client streams compressed bodies too"""
+        compression = BodyCompression()
+
+        async def scenario():
+            async with AsyncMailSafePro(
+                api_key="key_test", base_url=self.server.url, compression=compression
+            ) as client:
+                return await client.validate_batch(EMAILS, include_raw_dns=True)
+
+        self.assertEqual(asyncio.run(scenario()).count, 500)
+        self.check(compression)
+
+    def test_uncompressed_server(self):
+        """Test responses from a server that doesn't compress count no savings"""
+        server = FakeMailSafeProServer().start()
+        self.addCleanup(server.stop)
+        compression = BodyCompression()
+        validator = MailSafePro(api_key="key_test", base_url=server.url, compression=compression)
+
+        validator.validate_batch(EMAILS)
+        stats = compression.last
+        self.assertEqual(stats.response_bytes, stats.response_bytes_received)
+        self.assertEqual(stats.bytes_saved, stats.request_bytes - stats.request_bytes_sent)
+
+
+@unittest.skipIf(h2 is None, "h2 not installed")
+@unittest.skipIf(shutil.which("openssl") is None, "openssl not available")
+class TestHTTP2Compression(unittest.TestCase):
+    """Test compressed bodies over the HTTP/2 transport"""
+
+    def test_sync_client(self):
+        """Test the HTTP/2 adapter streams compressed bodies and reports wire sizes"""
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        certfile, keyfile = make_self_signed_cert(directory.name)
+        patcher = mock.patch.dict(
+            os.environ, {"REQUESTS_CA_BUNDLE": certfile, "SSL_CERT_FILE": certfile}
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        server = FakeMailSafeProServer(
+            http2=True, certfile=certfile, keyfile=keyfile, compress_responses=True
+        ).start()
+        self.addCleanup(server.stop)
+        compression = BodyCompression()
+        validator = MailSafePro(
+            api_key="key_test", base_url=server.url, http2=True, compression=compression
+        )
+        self.addCleanup(validator.close)
+
+        self.assertEqual(validator.validate_batch(EMAILS).count, 500)
+        stats = compression.last
+        self.assertEqual(server.streams_opened, 1)
+        self.assertEqual(stats.request_bytes_sent, server.request_bytes_received)
+        self.assertEqual(stats.response_bytes_received, server.response_bytes_sent)
+        self.assertLess(stats.request_bytes_sent * 5, stats.request_bytes)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,230 @@
+"""
+Unit tests for the adaptive AIMD concurrency limiter
+"""
+
+import asyncio
+import threading
+import time
+import unittest
+
+from mailsafepro import AsyncMailSafePro, MailSafePro
+from mailsafepro.concurrency import AdaptiveConcurrencyLimiter
+from mailsafepro.exceptions import RateLimitError, ServerError, ValidationError
+from fake_server import FakeMailSafeProServer
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestAdaptiveConcurrencyLimiter(unittest.TestCase):
+    """Test AdaptiveConcurrencyLimiter"""
+
+    def setUp(self):
+        self.clock = FakeClock()
+
+    def make_limiter(self, **kwargs):
+        return AdaptiveConcurrencyLimiter(clock=self.clock, **kwargs)
+
+    def complete(self, limiter, latency=0.01, **release_options):
+        started = limiter.acquire()
+        self.clock.now += latency
+        limiter.release(started, **release_options)
+
+    def test_additive_increase_when_saturated(self):
+        """Test the limit grows by about one per round trip while in use"""
+        limiter = self.make_limiter(initial_limit=2, max_limit=10, window=1000)
+
+        for _ in range(3):
+            starts = [limiter.acquire() for _ in range(limiter.limit)]
+            self.clock.now += 0.01
+            for started in starts:
+                limiter.release(started)
+
+        self.assertEqual(limiter.limit, 4)
+
+    def test_no_increase_when_idle(self):
+        """Test sequential use of a large limit doesn't keep growing it"""
+        limiter = self.make_limiter(initial_limit=8, window=1000)
+
+        for _ in range(50):
+            self.complete(limiter)
+
+        self.assertEqual(limiter.limit, 8)
+
+    def test_overload_halves_once_per_round_trip(self):
+        """Test several drops from the same round trip cut the limit once"""
+        limiter = self.make_limiter(initial_limit=8)
+        starts = [limiter.acquire() for _ in range(8)]
+        self.clock.now += 0.01
+
+        for started in starts:
+            limiter.release_error(started, ServerError("Server error: 503", status_code=503))
+
+        stats = limiter.stats()
+        self.assertEqual(stats["limit"], 4)
+        self.assertEqual(stats["dropped"], 8)
+        self.assertEqual(stats["decreases"], 1)
+
+        self.complete(limiter, dropped=True)
+        self.assertEqual(limiter.limit, 2)
+
+    def test_unrelated_errors_ignored(self):
+        """Test errors that say nothing about load leave the limit alone"""
+        limiter = self.make_limiter(initial_limit=4)
+
+        started = limiter.acquire()
+        limiter.release_error(started, ValidationError("Invalid email"))
+        started = limiter.acquire()
+        limiter.release_error(started, RateLimitError("Slow down", retry_after=1))
+
+        self.assertEqual(limiter.stats()["decreases"], 1)
+        self.assertEqual(limiter.stats()["in_flight"], 0)
+
+    def test_rising_p95_latency_cuts_limit(self):
+        """Test a window whose p95 exceeds the baseline by the tolerance cuts the limit"""
+        limiter = self.make_limiter(initial_limit=4, window=10, latency_tolerance=2.0)
+        for _ in range(10):
+            self.complete(limiter, latency=0.010)
+
+        for _ in range(10):
+            self.complete(limiter, latency=0.050)
+
+        stats = limiter.stats()
+        self.assertEqual(stats["limit"], 2)
+        self.assertAlmostEqual(stats["latency_p95"], 0.050)
+        self.assertGreater(stats["latency_baseline"], 0.010)
+
+    def test_acquire_blocks_at_limit(self):
+        """Test callers beyond the limit wait for a released slot"""
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=1, max_limit=1)
+        started = limiter.acquire()
+        acquired = threading.Event()
+
+        thread = threading.Thread(target=lambda: (limiter.acquire(), acquired.set()))
+        thread.start()
+
+        self.assertFalse(acquired.wait(0.05))
+        self.assertEqual(limiter.stats()["waiting"], 1)
+
+        limiter.release(started)
+        self.assertTrue(acquired.wait(1))
+        thread.join()
+
+    def test_async_acquire_and_cancel(self):
+        """Test awaiting callers queue and a cancelled waiter gives up its place"""
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=1, max_limit=1)
+
+        async def scenario():
+            started = await limiter.acquire_async()
+            waiter = asyncio.ensure_future(limiter.acquire_async())
+            await asyncio.sleep(0.01)
+            waiter.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await waiter
+            limiter.release(started)
+            return limiter.stats()
+
+        stats = asyncio.run(scenario())
+
+        self.assertEqual(stats["waiting"], 0)
+        self.assertEqual(stats["in_flight"], 0)
+
+
+class TestClientConvergence(unittest.TestCase):
+    """Test the limiter tracks a fake server whose capacity changes"""
+
+    WORKERS = 10
+
+    def setUp(self):
+        self.server = FakeMailSafeProServer(latency=0.02, capacity=4).start()
+        self.addCleanup(self.server.stop)
+
+    def run_phase(self, validator, limiter, seconds):
+        """Drive the client from all workers and sample the limit"""
+        stop = threading.Event()
+        counter = iter(range(10 ** 9))
+        samples = []
+
+        def worker():
+            while not stop.is_set():
+                try:
+                    validator.validate(f"user{next(counter)}@example.com")
+                except ServerError:
+                    pass
+
+        threads = [threading.Thread(target=worker) for _ in range(self.WORKERS)]
+        for thread in threads:
+            thread.start()
+
+        deadline = time.monotonic() + seconds
+        while time.monotonic() < deadline:
+            samples.append(limiter.limit)
+            time.sleep(0.01)
+
+        stop.set()
+        for thread in threads:
+            thread.join()
+
+        # Skip the ramp-up: average over the settled second half
+        settled = samples[len(samples) // 2:]
+        return sum(settled) / len(settled)
+
+    def test_converges_to_changing_capacity(self):
+        """Test the limit settles near capacity and follows it up and down"""
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=1, max_limit=self.WORKERS)
+        validator = MailSafePro(
+            api_key="key_test",
+            base_url=self.server.url,
+            max_retries=0,
+            coalesce_requests=False,
+            concurrency_limiter=limiter,
+        )
+
+        at_four = self.run_phase(validator, limiter, 1.5)
+        self.assertGreaterEqual(at_four, 2)
+        self.assertLessEqual(at_four, 5)
+
+        self.server.capacity = 8
+        at_eight = self.run_phase(validator, limiter, 1.5)
+        self.assertGreater(at_eight, at_four)
+
+        self.server.capacity = 2
+        at_two = self.run_phase(validator, limiter, 1.5)
+        self.assertLessEqual(at_two, 3)
+
+        stats = validator.concurrency_stats()
+        self.assertGreater(stats["dropped"], 0)
+        self.assertEqual(stats["in_flight"], 0)
+        # Overload is rare once converged
+        self.assertLess(self.server.rejected, self.server.total_requests * 0.2)
+
+    def test_async_client_sheds_load(self):
+        """Test the async client feeds 503s to the limiter"""
+        self.server.capacity = 2
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=8, max_limit=8)
+
+        async def scenario():
+            async with AsyncMailSafePro(
+                api_key="key_test",
+                base_url=self.server.url,
+                max_retries=0,
+                concurrency_limiter=limiter,
+            ) as client:
+                return await asyncio.gather(
+                    *(client.validate(f"user{i}@example.com") for i in range(8)),
+                    return_exceptions=True,
+                )
+
+        results = asyncio.run(scenario())
+
+        self.assertTrue(any(isinstance(r, ServerError) for r in results))
+        self.assertLess(limiter.limit, 8)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,197 @@
+"""
+Unit tests for the schema-compiled response decoders
+"""
+
+import dataclasses
+import json
+import unittest
+from unittest import mock
+
+from mailsafepro import (
+    BatchResult, LazyValidationResult, ResultColumns, ValidationResult, models,
+)
+from mailsafepro import decoding
+from mailsafepro.decoding import (
+    FieldSpec, canonical, compile_decoder, compile_value, compile_values,
+)
+from fake_server import fake_result
+
+
+MODELS = [
+    getattr(models, name) for name in dir(models)
+    if dataclasses.is_dataclass(getattr(models, name)) and hasattr(getattr(models, name), "FIELDS")
+]
+
+
+class TestFieldResolution(unittest.TestCase):
+    """Test key aliases, defaults and sections"""
+
+    read = staticmethod(compile_values((
+        FieldSpec("score", ("score", "legacyscore"), default=0.5),
+        FieldSpec("tags", default_factory=list),
+        FieldSpec("section", ("section", "legacysection"), section=dict.copy),
+        FieldSpec("always", section=len, required=True),
+    )))
+
+    def test_canonical_key_wins(self):
+        """Test the first key holding a value is used"""
+        self.assertEqual(self.read({"score": 0.1, "legacyscore": 0.9})[0], 0.1)
+        self.assertEqual(self.read({"legacyscore": 0.9})[0], 0.9)
+
+    def test_falsy_values_kept(self):
+        """Test 0.0, False and [] don't fall through to aliases or defaults"""
+        self.assertEqual(self.read({"score": 0.0, "legacyscore": 0.9})[0], 0.0)
+        self.assertIs(self.read({"score": False})[0], False)
+
+        tags = []
+        self.assertIs(self.read({"tags": tags})[1], tags)
+
+    def test_null_counts_as_missing(self):
+        """Test null values fall through to the next key, then the default"""
+        self.assertEqual(self.read({"score": None, "legacyscore": 0.9})[0], 0.9)
+        self.assertEqual(self.read({"score": None})[0], 0.5)
+
+        first, second = self.read({})[1], self.read({})[1]
+        self.assertEqual(first, [])
+        self.assertIsNot(first, second)
+
+    def test_sections(self):
+        """Test sections decode non-empty dictionaries only"""
+        self.assertEqual(self.read({"section": {"a": 1}})[2], {"a": 1})
+        self.assertEqual(self.read({"section": {}, "legacysection": {"b": 2}})[2], {"b": 2})
+        self.assertIsNone(self.read({"section": {}})[2])
+        self.assertEqual(self.read({})[3], 0)
+
+    def test_single_value_and_partial_object(self):
+        """Test single-field readers and __new__-based construction"""
+        read_score = compile_value(FieldSpec("score", default=1.0))
+        self.assertEqual(read_score({}), 1.0)
+
+        class Point:
+            def __init__(self):
+                raise AssertionError("__init__ should be skipped")
+
+        from_dict = compile_decoder((FieldSpec("x", default=0),), "Point", init=False)
+        point = from_dict(Point, {"x": 3, "y": 4})
+        self.assertEqual(vars(point), {"x": 3})
+
+
+class TestModelSchemas(unittest.TestCase):
+    """Test every model's schema against its dataclass fields"""
+
+    def test_schema_matches_fields(self):
+        """Test FIELDS lists every field in declaration order"""
+        self.assertGreaterEqual(len(MODELS), 13)
+        for model in MODELS:
+            with self.subTest(model=model.__name__):
+                names = [spec.name for spec in model.FIELDS]
+                self.assertEqual(names, [f.name for f in dataclasses.fields(model)])
+
+    def test_falsy_response_values(self):
+        """Test falsy values from the API survive decoding"""
+        data = fake_result("user@example.com", check_smtp=True)
+        data.update({
+            "risk_score": 0.0,
+            "riskscore": 0.9,
+            "quality_score": 0.0,
+            "processing_time": 0.0,
+            "smtp_validation": {"checked": True, "mailbox_exists": False, "mailboxexists": True},
+            "security": {"in_breach": False, "inbreach": True, "breach_count": 0},
+            "metadata": {"timestamp": "t", "cache_used": False, "cacheused": True},
+        })
+
+        for result_type in (ValidationResult, LazyValidationResult):
+            with self.subTest(result_type=result_type.__name__):
+                result = result_type.from_dict(data)
+                self.assertEqual(result.risk_score, 0.0)
+                self.assertEqual(result.quality_score, 0.0)
+                self.assertEqual(result.processing_time, 0.0)
+                self.assertIs(result.smtp.mailbox_exists, False)
+                self.assertIs(result.breach_info.in_breach, False)
+                self.assertIs(result.metadata.cache_used, False)
+
+        columns = ResultColumns.from_dicts([data], use_numpy=False)
+        self.assertEqual(columns.to_dict()["risk_score"], [0.0])
+
+    def test_batch_header(self):
+        """Test batch-level fields keep falsy values and default the count"""
+        batch = BatchResult.from_dict({
+            "results": [fake_result("user@example.com")],
+            "valid_count": 0,
+            "validcount": 7,
+            "processing_time": 0.0,
+            "processingtime": 5.0,
+        })
+
+        self.assertEqual(batch.count, 1)
+        self.assertEqual(batch.valid_count, 0)
+        self.assertEqual(batch.processing_time, 0.0)
+
+    def test_legacy_keys(self):
+        """Test concatenated key spellings are still read"""
+        result = ValidationResult.from_dict({
+            "email": "user@example.com",
+            "valid": True,
+            "riskscore": 0.3,
+            "suggestedaction": "accept",
+            "smtpvalidation": {"checked": True, "mailboxexists": True},
+            "dnssecurity": {"mxrecords": ["mx.example.com"], "dkim": {"keylength": 2048}},
+        })
+
+        self.assertEqual(result.risk_score, 0.3)
+        self.assertEqual(result.suggested_action, "accept")
+        self.assertTrue(result.smtp.mailbox_exists)
+        self.assertEqual(result.dns_security.mx_records, ["mx.example.com"])
+        self.assertEqual(result.dns_security.dkim.key_length, 2048)
+        self.assertEqual(result.provider_analysis.provider, "unknown")
+        self.assertIsNone(result.metadata)
+
+    def test_subclass_from_dict(self):
+        """Test from_dict builds the class it is called on"""
+        class Tagged(ValidationResult):
+            pass
+
+        self.assertIsInstance(Tagged.from_dict(fake_result("user@example.com")), Tagged)
+
+
+
+class TestCanonicalValues(unittest.TestCase):
+    """Test enum-like values are shared between decoded results"""
+
+    def decode_all(self, result_type):
+        # A JSON round trip gives every response its own string objects
+        return [
+            result_type.from_dict(json.loads(json.dumps(fake_result(email, include_raw_dns=True))))
+            for email in ("a@gmail.com", "b@gmail.com")
+        ]
+
+    def test_results_share_values(self):
+        """Test canonical fields of separate results are the same object"""
+        for result_type in (ValidationResult, LazyValidationResult):
+            with self.subTest(result_type=result_type.__name__):
+                first, second = self.decode_all(result_type)
+
+                self.assertIs(first.status, second.status)
+                self.assertIs(first.suggested_action, second.suggested_action)
+                self.assertIs(first.validation_tier, second.validation_tier)
+                self.assertIs(first.provider_analysis.provider, second.provider_analysis.provider)
+                self.assertIs(first.metadata.client_plan, second.metadata.client_plan)
+                self.assertIs(first.dns_security.spf.status, second.dns_security.dmarc.status)
+                self.assertIsNot(first.metadata.timestamp, second.metadata.timestamp)
+                self.assertEqual(first.status, "deliverable")
+
+    def test_non_strings_and_limit(self):
+        """Test non-string values pass through and the vocabulary is bounded"""
+        read = compile_value(FieldSpec("status", canonical=True))
+        self.assertEqual(read({"status": 3}), 3)
+        self.assertIsNone(read({}))
+        self.assertIs(read({"status": "".join(["ri", "sky"])}), canonical("risky"))
+
+        with mock.patch.object(decoding, "VOCABULARY_LIMIT", decoding.vocabulary_size()):
+            unseen = "".join(["never", "-seen"])
+            self.assertIs(read({"status": unseen}), unseen)
+        self.assertNotIn(unseen, decoding._VOCABULARY)
+
+
+if __name__ == "__main__":
+    unittest.main()
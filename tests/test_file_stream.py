@@ -0,0 +1,171 @@
+"""
+Unit tests for streaming, resumable file validation
+"""
+
+import json
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+
+from mailsafepro import MailSafePro
+from mailsafepro.exceptions import ServerError, ValidationError
+from mailsafepro.files import detect_email_column
+from fake_server import FakeMailSafeProServer
+
+
+class TestDetectEmailColumn(unittest.TestCase):
+    """Test detect_email_column"""
+
+    def test_header_names(self):
+        """Test the email column is found by header name"""
+        self.assertEqual(detect_email_column(["id", "E-Mail", "name"]), (1, True))
+        self.assertEqual(detect_email_column(["id", "work_mail"]), (1, True))
+
+    def test_headerless_row(self):
+        """Test a first row holding an address is treated as data"""
+        self.assertEqual(detect_email_column(["7", "user@example.com"]), (1, False))
+
+    def test_not_found(self):
+        """Test no email column is reported as None"""
+        self.assertEqual(detect_email_column(["id", "name"]), (None, True))
+
+
+class TestValidateFileStream(unittest.TestCase):
+    """Test MailSafePro.validate_file_stream"""
+
+    def setUp(self):
+        self.server = FakeMailSafeProServer().start()
+        self.addCleanup(self.server.stop)
+        self.validator = MailSafePro(api_key="key_test", base_url=self.server.url)
+        self.tmp = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.tmp)
+
+    def write_csv(self, count, name="emails.csv"):
+        path = self.tmp / name
+        rows = ["id,Email,name"] + [f"{i},user{i}@example.com,User {i}" for i in range(count)]
+        path.write_text("\n".join(rows) + "\n", encoding="utf-8")
+        return path
+
+    def read_output(self, path):
+        with open(path, encoding="utf-8") as f:
+            return [json.loads(line)["email"] for line in f]
+
+    def test_csv_to_json_lines(self):
+        """Test results are appended in file order with the column auto-detected"""
+        source = self.write_csv(25)
+        output = self.tmp / "results.jsonl"
+
+        summary = self.validator.validate_file_stream(source, output, chunk_size=10)
+
+        self.assertEqual(self.read_output(output), [f"user{i}@example.com" for i in range(25)])
+        self.assertEqual(summary.count, 25)
+        self.assertEqual(summary.chunks, 3)
+        self.assertEqual(summary.column, "Email")
+        self.assertEqual(self.server.requests["/batch"], 3)
+
+    def test_existing_output_appended(self):
+        """Test a fresh job appends to an existing output file"""
+        source = self.write_csv(5)
+        output = self.tmp / "results.jsonl"
+        output.write_text('{"email": "earlier@example.com"}\n', encoding="utf-8")
+
+        self.validator.validate_file_stream(source, output, chunk_size=10)
+
+        self.assertEqual(
+            self.read_output(output),
+            ["earlier@example.com"] + [f"user{i}@example.com" for i in range(5)],
+        )
+
+    def test_batch_options_forwarded(self):
+        """Test server-side batch options reach every /batch request"""
+        source = self.write_csv(15)
+        post_batch = self.validator._post_batch
+        options = []
+
+        def record(emails, *args):
+            options.append(args)
+            return post_batch(emails, *args)
+
+        self.validator._post_batch = record
+        self.validator.validate_file_stream(
+            source, [].extend, chunk_size=10, batch_size=250, concurrent_requests=10
+        )
+
+        self.assertEqual(options, [(False, False, 250, 10)] * 2)
+
+    def test_txt_to_callable(self):
+        """Test TXT files with a BOM and blank lines stream into a callable"""
+        source = self.tmp / "emails.txt"
+        source.write_bytes(
+            b"\xef\xbb\xbfuser0@example.com\n\ninvalid1@example.com\r\nuser2@example.com"
+        )
+        received = []
+
+        summary = self.validator.validate_file_stream(source, received.extend, chunk_size=2)
+
+        self.assertEqual(
+            [r.email for r in received],
+            ["user0@example.com", "invalid1@example.com", "user2@example.com"],
+        )
+        self.assertEqual((summary.valid_count, summary.invalid_count), (2, 1))
+        self.assertIsNone(summary.column)
+
+    def test_resume_after_crash(self):
+        """Test a killed job resumes from its last finished chunk"""
+        source = self.write_csv(45)
+        output = self.tmp / "results.jsonl"
+        post_batch = self.validator._post_batch
+        calls = []
+
+        def crash_on_fourth_chunk(emails, *args):
+            calls.append(emails)
+            if len(calls) == 4:
+                raise ServerError("Server error: 503", status_code=503)
+            return post_batch(emails, *args)
+
+        self.validator._post_batch = crash_on_fourth_chunk
+        with self.assertRaises(ServerError):
+            self.validator.validate_file_stream(
+                source, output, chunk_size=10, max_in_flight=1
+            )
+        self.assertEqual(len(self.read_output(output)), 30)
+
+        # Output written after the last checkpoint is discarded on resume
+        with open(output, "ab") as f:
+            f.write(b'{"email": "partial')
+
+        self.validator._post_batch = post_batch
+        summary = self.validator.validate_file_stream(source, output, chunk_size=10)
+
+        self.assertEqual(self.read_output(output), [f"user{i}@example.com" for i in range(45)])
+        self.assertEqual(summary.resumed_chunks, 3)
+        self.assertEqual(summary.chunks, 5)
+        self.assertEqual(summary.count, 45)
+        self.assertEqual(self.server.requests["/batch"], 5)
+
+        # A finished job isn't run again
+        self.validator.validate_file_stream(source, output, chunk_size=10)
+        self.assertEqual(self.server.requests["/batch"], 5)
+
+    def test_journal_for_other_job_refused(self):
+        """Test a journal from different options is not resumed"""
+        source = self.write_csv(5)
+        output = self.tmp / "results.jsonl"
+        self.validator.validate_file_stream(source, output, chunk_size=10)
+
+        with self.assertRaises(ValidationError):
+            self.validator.validate_file_stream(source, output, chunk_size=5)
+
+    def test_missing_column(self):
+        """Test an unknown column is rejected before any request"""
+        source = self.write_csv(5)
+
+        with self.assertRaises(ValidationError):
+            self.validator.validate_file_stream(source, [].extend, column="address")
+
+        self.assertEqual(self.server.total_requests, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,142 @@
+"""
+Unit tests for the HTTP/2 transport
+"""
+
+import asyncio
+import os
+import shutil
+import subprocess
+import tempfile
+import threading
+import unittest
+from unittest import mock
+
+import requests
+
+from mailsafepro import AsyncMailSafePro, MailSafePro
+from mailsafepro.http2 import HTTP2Adapter, h2
+from fake_server import FakeMailSafeProServer, make_self_signed_cert
+
+
+@unittest.skipIf(h2 is None, "h2 not installed")
+@unittest.skipIf(shutil.which("openssl") is None, "openssl not available")
+class TestHTTP2(unittest.TestCase):
+    """Test both clients multiplexing over TLS and falling back to HTTP/1.1"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.directory = tempfile.TemporaryDirectory()
+        cls.certfile, cls.keyfile = make_self_signed_cert(cls.directory.name)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.directory.cleanup()
+
+    def setUp(self):
+        patcher = mock.patch.dict(
+            os.environ, {"REQUESTS_CA_BUNDLE": self.certfile, "SSL_CERT_FILE": self.certfile}
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def serve(self, **kwargs):
+        server = FakeMailSafeProServer(certfile=self.certfile, keyfile=self.keyfile, **kwargs)
+        server.start()
+        self.addCleanup(server.stop)
+        return server
+
+    def test_sync_client_multiplexes(self):
+        """Test concurrent sync requests share one HTTP/2 connection"""
+        server = self.serve(http2=True, latency=0.02)
+        validator = MailSafePro(api_key="key_test", base_url=server.url, http2=True)
+        self.addCleanup(validator.close)
+        validator.validate_many(["warm@example.com"], workers=40)
+        opened = server.connections_opened
+
+        results = validator.validate_many([f"user{i}@example.com" for i in range(80)], workers=40)
+
+        self.assertEqual(len(results), 80)
+        self.assertTrue(all(result.valid for result in results))
+        self.assertEqual(server.connections_opened, opened)
+        self.assertEqual(server.streams_opened, 81)
+
+        batch = validator.validate_batch([f"user{i}@example.com" for i in range(3000)])
+        self.assertEqual(batch.count, 3000)
+
+    def test_pool_not_resized(self):
+        """Test validate_many() keeps the HTTP/2 adapter other threads are using"""
+        server = self.serve(http2=True, latency=0.3)
+        validator = MailSafePro(api_key="key_test", base_url=server.url, http2=True, pool_size=2)
+        self.addCleanup(validator.close)
+        adapter = validator._session.get_adapter(server.url)
+
+        in_flight = []
+        thread = threading.Thread(
+            target=lambda: in_flight.append(validator.validate("slow@example.com")), daemon=True
+        )
+        thread.start()
+        results = validator.validate_many([f"user{i}@example.com" for i in range(16)], workers=8)
+        thread.join(timeout=10)
+
+        self.assertEqual(len(results), 16)
+        self.assertTrue(in_flight and in_flight[0].valid)
+        self.assertIs(validator._session.get_adapter(server.url), adapter)
+
+    def test_async_client_multiplexes(self):
+        """Test concurrent async requests share one HTTP/2 connection"""
+        server = self.serve(http2=True, latency=0.02)
+
+        async def scenario():
+            async with AsyncMailSafePro(
+                api_key="key_test", base_url=server.url, http2=True
+            ) as client:
+                return await asyncio.gather(
+                    *(client.validate(f"user{i}@example.com") for i in range(50))
+                )
+
+        self.assertEqual(len(asyncio.run(scenario())), 50)
+        self.assertEqual(server.connections_opened, 1)
+        self.assertEqual(server.streams_opened, 50)
+
+    def test_fallback_and_retries(self):
+        """Test HTTP/1.1-only servers still work, including status retries"""
+        server = self.serve()
+        validator = MailSafePro(api_key="key_test", base_url=server.url, http2=True)
+        self.addCleanup(validator.close)
+
+        server.inject_error(503, count=1)
+        self.assertTrue(validator.validate("user@example.com").valid)
+        self.assertEqual(server.total_requests, 2)
+        self.assertEqual(server.streams_opened, 0)
+
+    def test_ca_directory(self):
+        """Test a CA directory in REQUESTS_CA_BUNDLE is loaded as a capath"""
+        subject_hash = subprocess.run(
+            ["openssl", "x509", "-hash", "-noout", "-in", self.certfile],
+            check=True, capture_output=True, text=True,
+        ).stdout.strip()
+        with tempfile.TemporaryDirectory() as capath:
+            shutil.copy(self.certfile, os.path.join(capath, f"{subject_hash}.0"))
+            server = self.serve(http2=True)
+            with mock.patch.dict(os.environ, {"REQUESTS_CA_BUNDLE": capath}):
+                validator = MailSafePro(api_key="key_test", base_url=server.url, http2=True)
+                self.addCleanup(validator.close)
+                self.assertTrue(validator.validate("user@example.com").valid)
+        self.assertEqual(server.streams_opened, 1)
+
+    def test_proxy_disables_http2(self):
+        """Test a configured proxy mounts requests' adapter instead of bypassing it"""
+        with mock.patch.dict(os.environ, {"HTTPS_PROXY": "http://proxy.invalid:3128"}):
+            validator = MailSafePro(api_key="key_test", base_url="https://api.invalid", http2=True)
+            self.addCleanup(validator.close)
+        self.assertNotIsInstance(validator._session.get_adapter("https://api.invalid"), HTTP2Adapter)
+
+        adapter = HTTP2Adapter()
+        self.addCleanup(adapter.close)
+        request = requests.Request("GET", "https://api.invalid/health").prepare()
+        with self.assertRaises(requests.exceptions.ProxyError):
+            adapter.send(request, proxies={"https": "http://proxy.invalid:3128"})
+
+
+if __name__ == "__main__":
+    unittest.main()
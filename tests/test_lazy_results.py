@@ -0,0 +1,104 @@
+"""
+Unit tests for LazyValidationResult
+"""
+
+import dataclasses
+import pickle
+import unittest
+
+from mailsafepro import BatchResult, LazyValidationResult, MailSafePro, ValidationResult
+from fake_server import FakeMailSafeProServer, fake_result
+
+
+def full_response(email="user@example.com"):
+    data = fake_result(email, check_smtp=True, include_raw_dns=True)
+    data.update({
+        "spam_trap_check": {"checked": True, "is_spam_trap": False, "confidence": 0.9},
+        "email_type": {"is_role_email": True, "role_type": "admin"},
+        "security": {"checked": True, "in_breach": False, "breach_count": 0},
+        "suggested_fixes": {"typo_detected": False},
+    })
+    return data
+
+
+class TestLazyValidationResult(unittest.TestCase):
+    """Test LazyValidationResult"""
+
+    def test_matches_eager_result(self):
+        """Test every field equals the eager ValidationResult's"""
+        data = full_response()
+
+        lazy = LazyValidationResult.from_dict(data)
+        eager = ValidationResult.from_dict(data)
+
+        self.assertIsInstance(lazy, ValidationResult)
+        for field in dataclasses.fields(ValidationResult):
+            self.assertEqual(getattr(lazy, field.name), getattr(eager, field.name), field.name)
+        self.assertEqual(lazy.to_dict(), eager.to_dict())
+
+    def built(self, result, name):
+        """Whether a section has been cached in its ValidationResult slot"""
+        return hasattr(super(LazyValidationResult, result), name)
+
+    def test_sections_built_on_first_access(self):
+        """Test nested sections are built once, when first read"""
+        result = LazyValidationResult.from_dict(full_response())
+
+        self.assertTrue(result.valid)
+        self.assertEqual(result.status, "deliverable")
+        self.assertFalse(self.built(result, "smtp"))
+
+        smtp = result.smtp
+        self.assertTrue(self.built(result, "smtp"))
+        self.assertIs(result.smtp, smtp)
+        self.assertFalse(self.built(result, "dns_security"))
+
+    def test_missing_sections_are_none(self):
+        """Test absent optional sections read as None like the eager type"""
+        result = LazyValidationResult.from_dict(fake_result("user@example.com"))
+
+        self.assertIsNone(result.dns_security)
+        self.assertIsNone(result.breach_info)
+
+    def test_replace_and_pickle(self):
+        """Test dataclass helpers and pickling keep working"""
+        result = LazyValidationResult.from_dict(full_response())
+
+        replaced = dataclasses.replace(result, valid=False)
+        restored = pickle.loads(pickle.dumps(result))
+
+        self.assertFalse(replaced.valid)
+        self.assertEqual(replaced.smtp, result.smtp)
+        self.assertEqual(restored.to_dict(), result.to_dict())
+
+    def test_batch_result_type(self):
+        """Test BatchResult.from_dict can build lazy results"""
+        data = {"count": 2, "results": [full_response("a@x.io"), full_response("b@x.io")]}
+
+        batch = BatchResult.from_dict(data, LazyValidationResult)
+
+        self.assertTrue(all(isinstance(r, LazyValidationResult) for r in batch.results))
+
+
+class TestClientLazyResults(unittest.TestCase):
+    """Test MailSafePro(lazy_results=True)"""
+
+    def setUp(self):
+        self.server = FakeMailSafeProServer().start()
+        self.addCleanup(self.server.stop)
+        self.validator = MailSafePro(
+            api_key="key_test", base_url=self.server.url, lazy_results=True
+        )
+
+    def test_single_and_batch(self):
+        """Test validate() and validate_batch() return lazy results"""
+        single = self.validator.validate("user@example.com")
+        batch = self.validator.validate_batch(["a@example.com", "invalid@example.com"])
+
+        self.assertIsInstance(single, LazyValidationResult)
+        self.assertEqual([r.valid for r in batch.results], [True, False])
+        self.assertIsInstance(batch.results[0], LazyValidationResult)
+
+
+if __name__ == "__main__":
+    unittest.main()
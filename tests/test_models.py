@@ -0,0 +1,56 @@
+"""
+Unit tests for the slotted response models
+"""
+
+import dataclasses
+import pickle
+import unittest
+
+from mailsafepro import BatchResult, ValidationFailure, ValidationResult
+from mailsafepro.exceptions import ServerError
+from mailsafepro.models import DNSInfo, SecurityInfo
+from fake_server import fake_result
+
+
+class TestSlottedModels(unittest.TestCase):
+    """Test models keep their dataclass behavior without an instance __dict__"""
+
+    def setUp(self):
+        data = fake_result("user@example.com", check_smtp=True, include_raw_dns=True)
+        data["security"] = {"checked": True, "in_breach": True, "recent_breaches": ["a"]}
+        self.result = ValidationResult.from_dict(data)
+
+    def test_no_instance_dict(self):
+        """Test results and their sections are slotted"""
+        batch = BatchResult.from_dict({"results": [fake_result("user@example.com")]})
+        failure = ValidationFailure("user@example.com", ServerError("boom"))
+
+        for obj in (self.result, self.result.smtp, self.result.dns_security,
+                    self.result.provider_analysis, self.result.breach_info, batch, failure):
+            self.assertFalse(hasattr(obj, "__dict__"), type(obj).__name__)
+
+        with self.assertRaises(AttributeError):
+            self.result.not_a_field = 1
+
+    def test_defaults_and_factories(self):
+        """Test field defaults and default factories still apply"""
+        first, second = DNSInfo(), DNSInfo()
+        first.mx_records.append("mx.example.com")
+
+        self.assertEqual(second.mx_records, [])
+        self.assertEqual(SecurityInfo(in_breach=False).breach_count, 0)
+        self.assertEqual(ValidationResult.__name__, "ValidationResult")
+
+    def test_dataclass_helpers_and_pickle(self):
+        """Test replace, asdict, equality and pickling"""
+        replaced = dataclasses.replace(self.result, valid=False)
+        restored = pickle.loads(pickle.dumps(self.result))
+
+        self.assertFalse(replaced.valid)
+        self.assertEqual(restored, self.result)
+        self.assertEqual(dataclasses.asdict(restored)["breach_info"]["recent_breaches"], ["a"])
+        self.assertEqual(ValidationResult.from_dict(self.result.to_dict()), self.result)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,138 @@
+"""
+Unit tests for connection pool sizing, warm-up and statistics
+"""
+
+import os
+import shutil
+import tempfile
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+
+from mailsafepro import MailSafePro
+from fake_server import FakeMailSafeProServer, make_self_signed_cert
+
+
+class TestPoolStats(unittest.TestCase):
+    """Test pool counters, blocking pools and warm-up over plain HTTP"""
+
+    def setUp(self):
+        self.server = FakeMailSafeProServer(latency=0.01).start()
+        self.addCleanup(self.server.stop)
+
+    def client(self, **kwargs):
+        validator = MailSafePro(api_key="key_test", base_url=self.server.url, **kwargs)
+        self.addCleanup(validator.close)
+        return validator
+
+    def hammer(self, validator, threads=12, requests=48):
+        with ThreadPoolExecutor(threads) as executor:
+            emails = [f"user{i}@example.com" for i in range(requests)]
+            list(executor.map(validator.validate, emails))
+
+    def test_overflow_is_discarded(self):
+        """Test threads beyond the pool size open connections that are discarded"""
+        validator = self.client(pool_size=3)
+        self.hammer(validator)
+        stats = validator.pool_stats()
+
+        self.assertEqual(stats["requests"], 48)
+        self.assertEqual(stats["reused"] + stats["new_connections"], 48)
+        self.assertEqual(stats["new_connections"], self.server.connections_opened)
+        self.assertGreater(stats["discarded"], 0)
+        self.assertEqual(stats["new_connections"] - stats["discarded"], stats["open"])
+        self.assertEqual(stats["in_use"], 0)
+        self.assertEqual(stats["idle"], 3)
+        self.assertEqual(stats["max_size"], 3)
+
+    def test_blocking_pool(self):
+        """Test a blocking pool never opens more than pool_size connections"""
+        validator = self.client(pool_size=3, pool_block=True)
+        self.hammer(validator)
+        validator.validate_many([f"many{i}@example.com" for i in range(20)], workers=10)
+        stats = validator.pool_stats()
+
+        self.assertEqual(self.server.connections_opened, 3)
+        self.assertEqual(stats["new_connections"], 3)
+        self.assertEqual(stats["discarded"], 0)
+        self.assertEqual(stats["max_size"], 3)
+        self.assertTrue(stats["block"])
+
+    def test_resize_waits_for_in_flight(self):
+        """Test the adapter replaced by a resize is closed once requests drain"""
+        validator = self.client(pool_size=2)
+        adapter = validator._session.get_adapter(self.server.url)
+        started = threading.Event()
+        send = adapter.send
+
+        def slow_send(*args, **kwargs):
+            started.set()
+            time.sleep(0.2)
+            return send(*args, **kwargs)
+
+        with mock.patch.object(adapter, "send", side_effect=slow_send), \
+                mock.patch.object(adapter, "close", wraps=adapter.close) as close:
+            thread = threading.Thread(target=validator.validate, args=("slow@example.com",))
+            thread.start()
+            started.wait(5)
+            validator.validate_many([f"user{i}@example.com" for i in range(8)], workers=8)
+            close.assert_not_called()
+            thread.join(5)
+            close.assert_called_once()
+
+        self.assertIsNot(validator._session.get_adapter(self.server.url), adapter)
+
+    def test_warmup(self):
+        """Test warm-up opens idle connections that requests then reuse"""
+        validator = self.client(pool_size=4)
+
+        self.assertEqual(validator.warmup(), 4)
+        self.assertEqual(self.server.connections_opened, 4)
+        self.assertEqual(self.server.total_requests, 0)
+        self.assertEqual(validator.warmup(2), 0)
+
+        self.hammer(validator, threads=4, requests=16)
+        stats = validator.pool_stats()
+        self.assertEqual(self.server.connections_opened, 4)
+        self.assertEqual(stats["reused"], 16)
+        self.assertEqual(stats["new_connections"], 4)
+        self.assertEqual(stats["requests"], 16)
+
+        # Growing replaces the pool, so all six are opened afresh
+        self.assertEqual(validator.warmup(6), 6)
+        self.assertEqual(validator.pool_stats()["max_size"], 6)
+        self.assertEqual(validator.pool_stats()["idle"], 6)
+
+
+@unittest.skipIf(shutil.which("openssl") is None, "openssl not available")
+class TestTLSWarmup(unittest.TestCase):
+    """Test warmed-up TLS connections land in the pool requests use"""
+
+    def test_warmup_saves_handshakes(self):
+        """Test no handshakes are needed after warm-up"""
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        certfile, keyfile = make_self_signed_cert(directory.name)
+        patcher = mock.patch.dict(os.environ, {"REQUESTS_CA_BUNDLE": certfile})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        server = FakeMailSafeProServer(certfile=certfile, keyfile=keyfile).start()
+        self.addCleanup(server.stop)
+
+        validator = MailSafePro(api_key="key_test", base_url=server.url, pool_size=2)
+        self.addCleanup(validator.close)
+        self.assertEqual(validator.warmup(), 2)
+        # Idle long enough for session tickets to arrive; left unread they
+        # would make the connections look dropped
+        time.sleep(0.2)
+
+        for i in range(5):
+            validator.validate(f"user{i}@example.com")
+        self.assertEqual(server.handshakes, 2)
+        self.assertEqual(validator.pool_stats()["reused"], 5)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,161 @@
+"""
+Unit tests for the batch pre-flight stage
+"""
+
+import asyncio
+import json
+import unittest
+
+from mailsafepro import AsyncMailSafePro, MailSafePro, ValidationFailure, preflight
+from mailsafepro.exceptions import EmailValidatorError, ValidationError
+from mailsafepro.models import ValidationResult
+from fake_server import FakeMailSafeProServer, fake_result
+
+
+class TestPreflight(unittest.TestCase):
+    """Test normalization, local rejection and deduplication"""
+
+    def test_normalize_and_dedupe(self):
+        """Test domains are lowercased and duplicates matched case-insensitively"""
+        batch = preflight(
+            [" User@Example.COM\t", "user@example.com", "b@example.com", "USER@EXAMPLE.COM"]
+        )
+
+        self.assertEqual(batch.emails, ["User@example.com", "b@example.com"])
+        self.assertEqual(batch.positions, [0, 0, 1, 0])
+        self.assertEqual(batch.report.duplicates, 2)
+        self.assertEqual(batch.report.rejected, 0)
+
+    def test_rejections(self):
+        """Test syntax failures are rejected with validate()'s messages"""
+        batch = preflight(["", "   ", None, "no-at-sign.com", "a@b", "ok@example.com", "a@b"])
+
+        self.assertEqual(batch.emails, ["ok@example.com"])
+        self.assertEqual(batch.positions, [-1, -1, -1, -1, -1, 0, -1])
+        self.assertEqual(batch.report.rejected, 6)
+        self.assertEqual(batch.report.duplicates, 0)
+
+        failure = batch.failures[3]
+        self.assertEqual(failure.email, "no-at-sign.com")
+        self.assertIsInstance(failure.error, ValidationError)
+        self.assertIn("'@'", str(failure.error))
+        self.assertIn("non-empty", str(batch.failures[0].error))
+        self.assertEqual(batch.failures[2].email, "None")
+
+    def test_report(self):
+        """Test the saved request and byte counts"""
+        emails = [f"user{i % 50}@example.com" for i in range(150)] + ["bad"] * 10
+
+        batch = preflight(emails, chunk_size=40)
+        sent = json.dumps(batch.emails, separators=(",", ":"))
+        given = json.dumps(emails, separators=(",", ":"))
+
+        self.assertEqual(batch.report.sent, 50)
+        self.assertEqual(batch.report.emails_saved, 110)
+        self.assertEqual(batch.report.requests_saved, 4 - 2)
+        self.assertEqual(batch.report.bytes_saved, len(given) - len(sent))
+
+    def test_bytes_saved_escaped_input(self):
+        """Test inputs needing JSON escapes are measured as encoded"""
+        emails = ['"quoted"@x', "tab\t@example.com", "jürgen@example.de", "a@example.com"]
+
+        batch = preflight(emails)
+        given = json.dumps(emails, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+        sent = json.dumps(batch.emails, separators=(",", ":"))
+
+        self.assertEqual(batch.report.bytes_saved, len(given) - len(sent))
+
+    def test_expand(self):
+        """Test results are mapped back to input positions"""
+        batch = preflight(["a@example.com", "bad", "A@example.com"])
+        result = ValidationResult.from_dict(fake_result("a@example.com"))
+
+        expanded = batch.expand([result])
+
+        self.assertIs(expanded[0], result)
+        self.assertIsInstance(expanded[1], ValidationFailure)
+        self.assertIs(expanded[2], result)
+
+        with self.assertRaises(EmailValidatorError):
+            batch.expand([])
+
+
+class TestClientPreflight(unittest.TestCase):
+    """Test validate_batch(preflight=True) on both clients"""
+
+    EMAILS = [
+        "first@example.com",
+        "  First@EXAMPLE.com ",
+        "",
+        "not-an-email",
+        "invalid@example.com",
+        "second@example.com",
+    ]
+
+    def setUp(self):
+        self.server = FakeMailSafeProServer().start()
+        self.addCleanup(self.server.stop)
+
+    def check(self, batch):
+        self.assertEqual(batch.count, 6)
+        self.assertEqual([r.valid for r in batch.results], [True, True, False, False, False, True])
+        self.assertIs(batch.results[0], batch.results[1])
+        self.assertIsInstance(batch.results[2], ValidationFailure)
+        self.assertIsInstance(batch.results[3], ValidationFailure)
+        self.assertEqual(batch.results[4].email, "invalid@example.com")
+        self.assertEqual(batch.valid_count, 3)
+        self.assertEqual(batch.invalid_count, 3)
+        self.assertEqual(batch.preflight.sent, 3)
+        self.assertEqual(batch.preflight.rejected, 2)
+        self.assertEqual(batch.preflight.duplicates, 1)
+
+    def test_sync_client(self):
+        """Test only unique well-formed emails are sent"""
+        validator = MailSafePro(api_key="key_test", base_url=self.server.url)
+
+        self.check(validator.validate_batch(self.EMAILS, preflight=True))
+        self.assertEqual(self.server.requests["/batch"], 1)
+
+    def test_async_client(self):
+        """Test the async client runs the same stage"""
+        async def scenario():
+            async with AsyncMailSafePro(api_key="key_test", base_url=self.server.url) as client:
+                return await client.validate_batch(self.EMAILS, preflight=True)
+
+        self.check(asyncio.run(scenario()))
+
+    def test_requests_saved_at_batch_size(self):
+        """Test saved requests are counted in batches of the caller's batch_size"""
+        validator = MailSafePro(api_key="key_test", base_url=self.server.url)
+        emails = [f"user{i % 5}@example.com" for i in range(20)]
+
+        batch = validator.validate_batch(emails, batch_size=5, preflight=True)
+
+        self.assertEqual(batch.preflight.requests_saved, 4 - 1)
+
+    def test_nothing_to_send(self):
+        """Test a batch rejected entirely never reaches the API"""
+        validator = MailSafePro(api_key="key_test", base_url=self.server.url)
+
+        batch = validator.validate_batch(["", "nope", "nope"], preflight=True)
+
+        self.assertEqual(batch.count, 3)
+        self.assertEqual(batch.valid_count, 0)
+        self.assertEqual(batch.preflight.requests_saved, 1)
+        self.assertEqual(self.server.total_requests, 0)
+
+    def test_limit_applies_to_unique_emails(self):
+        """Test duplicates don't count against the batch size limit"""
+        validator = MailSafePro(api_key="key_test", base_url=self.server.url)
+        emails = ["user@example.com"] * (MailSafePro.MAX_BATCH_SIZE + 1)
+
+        with self.assertRaises(ValidationError):
+            validator.validate_batch(emails)
+
+        batch = validator.validate_batch(emails, preflight=True)
+        self.assertEqual(batch.count, len(emails))
+        self.assertEqual(batch.preflight.sent, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,167 @@
+"""
+Unit tests for the client-side token-bucket rate limiter
+"""
+
+import unittest
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from types import SimpleNamespace
+
+from mailsafepro import MailSafePro
+from mailsafepro.client import _retry_after
+from mailsafepro.exceptions import RateLimitError
+from mailsafepro.ratelimit import TokenBucket
+from fake_server import FakeMailSafeProServer
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class TestRetryAfter(unittest.TestCase):
+    """Test Retry-After parsing"""
+
+    def parse(self, value):
+        headers = {} if value is None else {"Retry-After": value}
+        return _retry_after(SimpleNamespace(headers=headers))
+
+    def test_seconds(self):
+        """Test integer and decimal seconds"""
+        self.assertEqual(self.parse("30"), 30.0)
+        self.assertEqual(self.parse("1.5"), 1.5)
+        self.assertEqual(self.parse("-3"), 0.0)
+
+    def test_http_date(self):
+        """Test HTTP dates count down from now, past dates give 0"""
+        later = datetime.now(timezone.utc) + timedelta(seconds=120)
+        self.assertAlmostEqual(self.parse(format_datetime(later, usegmt=True)), 120, delta=2)
+        self.assertEqual(self.parse("Wed, 21 Oct 2015 07:28:00 GMT"), 0.0)
+
+    def test_unreadable(self):
+        """Test missing or malformed headers give None"""
+        for value in (None, "", "soon", "nan", "Wed, 99 Foo 2015"):
+            self.assertIsNone(self.parse(value))
+
+
+class TestTokenBucket(unittest.TestCase):
+    """Test TokenBucket"""
+
+    def setUp(self):
+        self.clock = FakeClock()
+
+    def make_bucket(self, **kwargs):
+        return TokenBucket(clock=self.clock, sleep=self.clock.sleep, **kwargs)
+
+    def test_burst_then_paced(self):
+        """Test burst tokens are free and later requests are spaced at 1/rate"""
+        bucket = self.make_bucket(rate=10, burst=2)
+
+        waits = [bucket.reserve() for _ in range(5)]
+
+        self.assertEqual(waits[:2], [0.0, 0.0])
+        for expected, wait in zip([0.1, 0.2, 0.3], waits[2:]):
+            self.assertAlmostEqual(wait, expected)
+
+    def test_refill_over_time(self):
+        """Test tokens refill up to burst"""
+        bucket = self.make_bucket(rate=10, burst=3)
+        for _ in range(3):
+            bucket.acquire()
+
+        self.clock.now += 10
+        self.assertAlmostEqual(bucket.stats()["tokens"], 3.0)
+
+    def test_fail_fast(self):
+        """Test max_wait=0 raises instead of waiting"""
+        bucket = self.make_bucket(rate=2, burst=1, max_wait=0)
+        bucket.acquire()
+
+        with self.assertRaises(RateLimitError) as context:
+            bucket.acquire()
+
+        self.assertEqual(context.exception.retry_after, 1)
+        self.assertEqual(bucket.stats()["rejected"], 1)
+        self.assertEqual(self.clock.sleeps, [])
+
+    def test_penalize_pauses_and_halves_rate(self):
+        """Test a 429 pauses for Retry-After and halves the rate, which then recovers"""
+        bucket = self.make_bucket(rate=10, burst=5, recovery_time=10)
+
+        bucket.penalize(retry_after=3)
+
+        self.assertEqual(bucket.stats()["rate"], 5.0)
+        self.assertAlmostEqual(bucket.reserve(), 3 + 1 / 5)
+
+        self.clock.now += 30
+        self.assertEqual(bucket.stats()["rate"], 10.0)
+
+
+class TestClientRateLimiting(unittest.TestCase):
+    """Test MailSafePro with a TokenBucket"""
+
+    def setUp(self):
+        self.server = FakeMailSafeProServer().start()
+        self.addCleanup(self.server.stop)
+
+    def test_429_penalizes_shared_limiter(self):
+        """Test a 429 is not retried by urllib3 and blocks follow-up requests locally"""
+        limiter = TokenBucket(rate=100, max_wait=0)
+        validator = MailSafePro(
+            api_key="key_test", base_url=self.server.url, rate_limiter=limiter
+        )
+        self.server.inject_error(429, headers={"Retry-After": "30"})
+
+        with self.assertRaises(RateLimitError):
+            validator.validate("a@example.com")
+        with self.assertRaises(RateLimitError) as context:
+            validator.validate("b@example.com")
+
+        self.assertGreaterEqual(context.exception.retry_after, 30)
+        self.assertEqual(self.server.requests["/validate/email"], 1)
+        self.assertEqual(limiter.stats()["penalties"], 1)
+
+    def test_unusual_retry_after(self):
+        """Test decimal and unreadable Retry-After values still map to RateLimitError"""
+        limiter = TokenBucket(rate=100, max_wait=0)
+        validator = MailSafePro(
+            api_key="key_test", base_url=self.server.url, max_retries=0, rate_limiter=limiter
+        )
+
+        self.server.inject_error(429, headers={"Retry-After": "1.5"})
+        with self.assertRaises(RateLimitError) as context:
+            validator.validate("a@example.com")
+        self.assertEqual(context.exception.retry_after, 2)
+
+        limiter = validator.rate_limiter = TokenBucket(rate=100, max_wait=0)
+        self.server.inject_error(429, headers={"Retry-After": "soon"})
+        with self.assertRaises(RateLimitError) as context:
+            validator.validate("b@example.com")
+        self.assertEqual(context.exception.retry_after, 60)
+        self.assertEqual(limiter.stats()["penalties"], 1)
+
+    def test_requests_paced_under_limit(self):
+        """Test requests through the limiter wait instead of failing"""
+        limiter = TokenBucket(rate=50, burst=1)
+        validator = MailSafePro(
+            api_key="key_test", base_url=self.server.url, rate_limiter=limiter
+        )
+
+        for i in range(5):
+            validator.validate(f"user{i}@example.com")
+
+        stats = limiter.stats()
+        self.assertEqual(stats["acquired"], 5)
+        self.assertGreaterEqual(stats["waited"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
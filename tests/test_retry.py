@@ -0,0 +1,249 @@
+"""
+Unit tests for the retry policy: backoff, retry budget and deadlines
+"""
+
+import asyncio
+import os
+import socket
+import tempfile
+import time
+import unittest
+from unittest import mock
+
+from mailsafepro import AsyncMailSafePro, MailSafePro, RetryPolicy, TokenBucket
+from mailsafepro.exceptions import NetworkError, ServerError
+from fake_server import FakeMailSafeProServer
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestRetryPolicy(unittest.TestCase):
+    """Test retry decisions without a server"""
+
+    def setUp(self):
+        self.clock = FakeClock()
+
+    def make_policy(self, **kwargs):
+        return RetryPolicy(clock=self.clock, **kwargs)
+
+    def test_decorrelated_jitter(self):
+        """Test delays stay between base_delay and 3x the previous delay, capped"""
+        policy = self.make_policy(max_retries=50, base_delay=0.1, max_delay=2.0, budget_burst=50)
+        call = policy.begin()
+
+        previous = 0.1
+        for _ in range(50):
+            delay = call.next_delay("503")
+            self.assertGreaterEqual(delay, 0.1)
+            self.assertLessEqual(delay, min(2.0, previous * 3))
+            previous = delay
+
+        self.assertIsNone(call.next_delay("503"))
+        stats = policy.stats()
+        self.assertEqual(stats["retries"], 50)
+        self.assertEqual(stats["gave_up"]["attempts"], 1)
+        self.assertEqual(stats["causes"], {"503": 50})
+
+    def test_retry_after(self):
+        """Test Retry-After is waited out plus jitter, and too long a wait gives up"""
+        policy = self.make_policy(base_delay=0.5, max_delay=10.0)
+
+        delay = policy.begin().next_delay("429", retry_after=4)
+        self.assertGreaterEqual(delay, 4)
+        self.assertLessEqual(delay, 4.5)
+
+        self.assertIsNone(policy.begin().next_delay("429", retry_after=60))
+        self.assertEqual(policy.stats()["gave_up"]["retry_after"], 1)
+
+        # A wait left to a rate limiter is not slept here or counted
+        total = policy.stats()["total_delay"]
+        self.assertEqual(policy.begin().next_delay("429", retry_after=4, deferred=True), 0.0)
+        self.assertEqual(policy.stats()["total_delay"], total)
+        self.assertIsNone(policy.begin().next_delay("429", retry_after=60, deferred=True))
+
+    def test_budget(self):
+        """Test retries are capped at the burst, then refill at budget_ratio per call"""
+        policy = self.make_policy(budget_ratio=0.25, budget_burst=2)
+
+        call = policy.begin()
+        self.assertIsNotNone(call.next_delay("503"))
+        self.assertIsNotNone(call.next_delay("503"))
+        self.assertIsNone(call.next_delay("503"))
+        self.assertEqual(policy.stats()["gave_up"]["budget"], 1)
+
+        # Three more calls bring the balance from 0.25 to 1
+        for _ in range(3):
+            policy.begin()
+        self.assertIsNotNone(policy.begin().next_delay("network"))
+        self.assertIsNone(policy.begin().next_delay("network"))
+
+        stats = policy.stats()
+        self.assertEqual(stats["calls"], 6)
+        self.assertEqual(stats["retries"], 3)
+        self.assertEqual(stats["retry_ratio"], 0.5)
+
+    def test_deadline(self):
+        """Test attempt timeouts shrink to the deadline and late retries are refused"""
+        policy = self.make_policy(base_delay=1.0, deadline=10.0)
+        call = policy.begin()
+
+        self.assertEqual(call.timeout(30), 10.0)
+        self.clock.now = 8.0
+        self.assertEqual(call.timeout(30), 2.0)
+        self.assertIsNone(call.next_delay("503", retry_after=3))
+        self.assertEqual(policy.stats()["gave_up"]["deadline"], 1)
+
+        # A per-call deadline replaces the default
+        self.assertEqual(policy.begin(deadline=1.0).timeout(30), 1.0)
+        self.assertEqual(self.make_policy().begin().timeout(30), 30)
+
+
+class TestClientRetries(unittest.TestCase):
+    """Test both clients retry through the policy, once per failed attempt"""
+
+    def setUp(self):
+        self.server = FakeMailSafeProServer().start()
+        self.addCleanup(self.server.stop)
+        patcher = mock.patch("time.sleep")
+        self.sleep = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def client(self, **kwargs):
+        validator = MailSafePro(api_key="key_test", base_url=self.server.url, **kwargs)
+        self.addCleanup(validator.close)
+        return validator
+
+    def test_recovers(self):
+        """Test transient errors are retried after the Retry-After wait"""
+        validator = self.client()
+        self.server.inject_error(503, count=2, headers={"Retry-After": "2"})
+
+        self.assertTrue(validator.validate("user@example.com").valid)
+        self.assertEqual(self.server.total_requests, 3)
+        self.assertEqual(len(self.sleep.call_args_list), 2)
+        self.assertTrue(all(call.args[0] >= 2 for call in self.sleep.call_args_list))
+
+        stats = validator.retry_stats()
+        self.assertEqual(stats["retries"], 2)
+        self.assertEqual(stats["recovered"], 1)
+        self.assertEqual(stats["causes"], {"503": 2})
+
+    def test_no_double_retries(self):
+        """Test a failing request is sent max_retries + 1 times, no more"""
+        for lean in (False, True):
+            self.server.inject_error(500, count=3)
+            before = self.server.total_requests
+            validator = self.client(max_retries=2, lean_transport=lean)
+
+            with self.assertRaises(ServerError):
+                validator.validate_batch(["a@example.com", "b@example.com"])
+            self.assertEqual(self.server.total_requests - before, 3)
+            self.assertEqual(validator.retry_stats()["gave_up"]["attempts"], 1)
+
+    def test_network_errors(self):
+        """Test connection failures are retried by the policy, not the pool"""
+        with socket.socket() as sock:
+            sock.bind(("127.0.0.1", 0))
+            port = sock.getsockname()[1]
+        validator = MailSafePro(api_key="key_test", base_url=f"http://127.0.0.1:{port}")
+
+        with self.assertRaises(NetworkError):
+            validator.validate("user@example.com")
+        self.assertEqual(validator.retry_stats()["causes"], {"network": 3})
+
+    def test_deadline(self):
+        """Test a retry that would overrun the call's deadline is not made"""
+        validator = self.client()
+        self.server.inject_error(503, count=2, headers={"Retry-After": "5"})
+
+        with self.assertRaises(ServerError):
+            validator.validate("user@example.com", deadline=3.0)
+        self.assertEqual(self.server.total_requests, 1)
+        self.sleep.assert_not_called()
+        self.assertEqual(validator.retry_stats()["gave_up"]["deadline"], 1)
+
+    def test_shared_budget(self):
+        """Test clients sharing a policy share its retry budget"""
+        policy = RetryPolicy(budget_ratio=0.0, budget_burst=1)
+        first = self.client(retry_policy=policy)
+        second = self.client(retry_policy=policy)
+        self.server.inject_error(503)
+        self.assertTrue(first.validate("a@example.com").valid)
+
+        self.server.inject_error(503)
+        with self.assertRaises(ServerError):
+            second.validate("b@example.com")
+        self.assertEqual(self.server.total_requests, 3)
+        self.assertEqual(policy.stats()["gave_up"]["budget"], 1)
+
+    def test_upload_resent(self):
+        """Test a retried upload sends the whole file again"""
+        emails = [f"user{i}@example.com" for i in range(20)]
+        handle, path = tempfile.mkstemp(suffix=".csv")
+        with os.fdopen(handle, "w") as f:
+            f.write("email\n" + "\n".join(emails) + "\n")
+        self.addCleanup(os.remove, path)
+
+        validator = self.client()
+        self.server.inject_error(503)
+        result = validator.validate_file(path)
+
+        self.assertEqual(self.server.requests["/batch/upload"], 2)
+        self.assertEqual([r.email for r in result.results], emails)
+
+    def test_login_retried(self):
+        """Test auth calls go through the policy too"""
+        self.server.inject_error(502)
+
+        validator = MailSafePro.login(
+            username="user@example.com", password="secret", base_url=self.server.url
+        )
+        self.addCleanup(validator.close)
+        self.assertEqual(validator.retry_stats()["recovered"], 1)
+
+    def test_async_client(self):
+        """Test the async client retries through the same policy"""
+        policy = RetryPolicy(base_delay=0.01)
+        self.server.inject_error(429, count=2, headers={"Retry-After": "0"})
+
+        async def scenario():
+            async with AsyncMailSafePro(
+                api_key="key_test", base_url=self.server.url, retry_policy=policy
+            ) as client:
+                return await client.validate("user@example.com"), client.retry_stats()
+
+        result, stats = asyncio.run(scenario())
+        self.assertTrue(result.valid)
+        self.assertEqual(self.server.total_requests, 3)
+        self.assertEqual(stats["causes"], {"429": 2})
+        self.assertEqual(stats["recovered"], 1)
+
+    def test_async_429_paced(self):
+        """Test an async 429 penalizes the rate limiter, which holds the retry"""
+        limiter = TokenBucket(rate=100)
+        self.server.inject_error(429, headers={"Retry-After": "1"})
+
+        async def scenario():
+            async with AsyncMailSafePro(
+                api_key="key_test", base_url=self.server.url, rate_limiter=limiter
+            ) as client:
+                start = time.monotonic()
+                result = await client.validate("user@example.com")
+                return result, time.monotonic() - start, client.retry_stats()
+
+        result, elapsed, stats = asyncio.run(scenario())
+        self.assertTrue(result.valid)
+        self.assertEqual(self.server.total_requests, 2)
+        self.assertEqual(limiter.stats()["penalties"], 1)
+        self.assertGreaterEqual(elapsed, 1.0)
+        self.assertEqual(stats["total_delay"], 0.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,122 @@
+"""
+Unit tests for pluggable JSON serializers
+"""
+
+import asyncio
+import unittest
+
+from mailsafepro import AsyncMailSafePro, MailSafePro, StdlibJSONSerializer, default_serializer
+from mailsafepro.exceptions import EmailValidatorError
+from mailsafepro.serialization import OrjsonSerializer, UjsonSerializer, orjson, ujson
+from fake_server import FakeMailSafeProServer
+
+
+class CountingSerializer(StdlibJSONSerializer):
+    """Stdlib serializer recording what passes through it"""
+
+    def __init__(self):
+        super().__init__()
+        self.encoded = []
+        self.decoded = 0
+
+    def dumps(self, obj):
+        data = super().dumps(obj)
+        self.encoded.append(data)
+        return data
+
+    def loads(self, data):
+        self.decoded += 1
+        return super().loads(data)
+
+
+class BrokenSerializer(StdlibJSONSerializer):
+    def loads(self, data):
+        raise ValueError("unexpected character")
+
+
+class TestSerializers(unittest.TestCase):
+    """Test the available JSON codecs"""
+
+    def available(self):
+        serializers = [StdlibJSONSerializer()]
+        if orjson is not None:
+            serializers.append(OrjsonSerializer())
+        if ujson is not None:
+            serializers.append(UjsonSerializer())
+        return serializers
+
+    def test_round_trip(self):
+        """Test every codec encodes compact UTF-8 bytes and decodes bytes"""
+        payload = {"emails": ["jürgen@example.de", "a@b.io"], "check_smtp": False, "n": 1.5}
+
+        for serializer in self.available():
+            with self.subTest(serializer=serializer.name):
+                data = serializer.dumps(payload)
+                self.assertIsInstance(data, bytes)
+                self.assertIn("jürgen".encode("utf-8"), data)
+                self.assertNotIn(b", ", data)
+                self.assertEqual(serializer.loads(data), payload)
+                self.assertEqual(serializer.loads(data.decode("utf-8")), payload)
+
+    def test_invalid_json_raises_value_error(self):
+        """Test every codec reports bad input as ValueError"""
+        for serializer in self.available():
+            with self.subTest(serializer=serializer.name):
+                with self.assertRaises(ValueError):
+                    serializer.loads(b'{"email": ')
+
+    def test_default_prefers_fast_library(self):
+        """Test the default codec is the fastest one installed"""
+        expected = "orjson" if orjson is not None else "ujson" if ujson is not None else "json"
+        self.assertEqual(default_serializer().name, expected)
+
+
+class TestClientSerializer(unittest.TestCase):
+    """Test both clients encode and decode through their serializer"""
+
+    def setUp(self):
+        self.server = FakeMailSafeProServer().start()
+        self.addCleanup(self.server.stop)
+
+    def test_sync_client(self):
+        """Test bodies are pre-encoded bytes and responses decoded from bytes"""
+        serializer = CountingSerializer()
+        validator = MailSafePro(api_key="key_test", base_url=self.server.url, serializer=serializer)
+
+        result = validator.validate("user@example.com")
+        batch = validator.validate_batch(["a@example.com", "invalid@example.com"])
+
+        self.assertTrue(result.valid)
+        self.assertEqual(batch.valid_count, 1)
+        self.assertEqual(len(serializer.encoded), 2)
+        self.assertIn(b'"emails":["a@example.com","invalid@example.com"]', serializer.encoded[1])
+        self.assertEqual(serializer.decoded, 2)
+
+    def test_async_client(self):
+        """Test the async client uses its serializer too"""
+        serializer = CountingSerializer()
+
+        async def scenario():
+            async with AsyncMailSafePro(
+                api_key="key_test", base_url=self.server.url, serializer=serializer
+            ) as client:
+                return await client.validate_batch(["a@example.com", "b@example.com"])
+
+        batch = asyncio.run(scenario())
+
+        self.assertEqual(batch.count, 2)
+        self.assertEqual(len(serializer.encoded), 1)
+        self.assertEqual(serializer.decoded, 1)
+
+    def test_invalid_response_body(self):
+        """Test undecodable bodies surface as EmailValidatorError"""
+        validator = MailSafePro(
+            api_key="key_test", base_url=self.server.url, serializer=BrokenSerializer()
+        )
+
+        with self.assertRaisesRegex(EmailValidatorError, "Invalid JSON response"):
+            validator.validate("user@example.com")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,117 @@
+"""
+Unit tests for coalescing of identical in-flight calls
+"""
+
+import asyncio
+import threading
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from mailsafepro import AsyncMailSafePro, MailSafePro
+from mailsafepro.singleflight import AsyncSingleFlight, SingleFlight
+from fake_server import FakeMailSafeProServer
+
+
+class TestSingleFlight(unittest.TestCase):
+    """Test SingleFlight"""
+
+    def test_concurrent_calls_share_one_execution(self):
+        """Test followers receive the leader's result"""
+        flight = SingleFlight()
+        release = threading.Event()
+        calls = []
+
+        def fn():
+            calls.append(1)
+            release.wait()
+            return "result"
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            futures = [executor.submit(flight.do, "key", fn) for _ in range(8)]
+            while flight.stats()["coalesced"] < 7:
+                pass
+            release.set()
+            results = [f.result() for f in futures]
+
+        self.assertEqual(results, ["result"] * 8)
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(flight.stats(), {"executed": 1, "coalesced": 7, "in_flight": 0})
+
+    def test_error_shared_and_key_released(self):
+        """Test the leader's exception reaches followers and the key is freed"""
+        flight = SingleFlight()
+
+        def fail():
+            raise ValueError("boom")
+
+        with self.assertRaises(ValueError):
+            flight.do("key", fail)
+
+        self.assertEqual(flight.do("key", lambda: "ok"), "ok")
+
+    def test_async_calls_share_one_execution(self):
+        """Test AsyncSingleFlight coalesces concurrent awaits"""
+        flight = AsyncSingleFlight()
+        calls = []
+
+        async def fn():
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            return "result"
+
+        async def scenario():
+            return await asyncio.gather(*(flight.do("key", fn) for _ in range(10)))
+
+        self.assertEqual(asyncio.run(scenario()), ["result"] * 10)
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(flight.stats()["coalesced"], 9)
+
+
+class TestClientCoalescing(unittest.TestCase):
+    """Test validate() coalescing against a slow stand-in server"""
+
+    def setUp(self):
+        self.server = FakeMailSafeProServer(latency=0.2).start()
+        self.addCleanup(self.server.stop)
+
+    def test_threaded_duplicates_send_one_request(self):
+        """Test concurrent identical validate() calls make one round trip"""
+        validator = MailSafePro(api_key="key_test", base_url=self.server.url)
+
+        with ThreadPoolExecutor(max_workers=10) as executor:
+            results = list(executor.map(validator.validate, ["user@example.com"] * 10))
+
+        self.assertTrue(all(r.email == "user@example.com" for r in results))
+        self.assertEqual(self.server.requests["/validate/email"], 1)
+        self.assertEqual(validator.coalescing_stats()["coalesced"], 9)
+
+    def test_coalescing_disabled(self):
+        """Test every call is sent when coalescing is off"""
+        validator = MailSafePro(
+            api_key="key_test", base_url=self.server.url, coalesce_requests=False
+        )
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            list(executor.map(validator.validate, ["user@example.com"] * 4))
+
+        self.assertEqual(self.server.requests["/validate/email"], 4)
+        self.assertEqual(validator.coalescing_stats(), {})
+
+    def test_async_duplicates_send_one_request(self):
+        """Test concurrent identical async validate() calls make one round trip"""
+        async def scenario():
+            async with AsyncMailSafePro(api_key="key_test", base_url=self.server.url) as client:
+                await asyncio.gather(
+                    *(client.validate("user@example.com") for _ in range(10)),
+                    client.validate("other@example.com"),
+                )
+                return client.coalescing_stats()
+
+        stats = asyncio.run(scenario())
+
+        self.assertEqual(self.server.requests["/validate/email"], 2)
+        self.assertEqual(stats["coalesced"], 9)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,136 @@
+"""
+Unit tests for incremental /batch response decoding
+"""
+
+import json
+import unittest
+
+from mailsafepro import MailSafePro
+from mailsafepro.cache import ResultCache
+from mailsafepro.classifier import OfflineClassifier
+from mailsafepro.exceptions import EmailValidatorError
+from mailsafepro.streaming import BatchStreamParser
+from fake_server import FakeMailSafeProServer, fake_result
+
+
+def batch_body(emails):
+    results = [fake_result(email, include_raw_dns=True) for email in emails]
+    results[0]["detail"] = "Ünïcödé \"quoted\" \\ détail ✓"
+    return {
+        "count": len(results),
+        "results": results,
+        "valid_count": len(results),
+        "processing_time": 1.5,
+        "summary": {"deliverable": len(results)},
+    }
+
+
+class TestBatchStreamParser(unittest.TestCase):
+    """Test BatchStreamParser"""
+
+    def parse(self, body, piece_size):
+        parser = BatchStreamParser()
+        items = []
+        for i in range(0, len(body), piece_size):
+            items.extend(parser.feed(body[i:i + piece_size]))
+        return items, parser.close()
+
+    def test_any_split_matches_json_loads(self):
+        """Test results and header match a full decode however the body is split"""
+        data = batch_body([f"user{i}@example.com" for i in range(20)])
+        body = json.dumps(data, ensure_ascii=False, indent=1).encode("utf-8")
+
+        for piece_size in (1, 7, 64, len(body)):
+            items, header = self.parse(body, piece_size)
+            self.assertEqual(items, data["results"])
+            self.assertEqual(header, {k: v for k, v in data.items() if k != "results"})
+
+    def test_results_emitted_before_body_ends(self):
+        """Test each result is available as soon as its bytes arrive"""
+        parser = BatchStreamParser()
+
+        self.assertEqual(
+            parser.feed(b'{"results": [{"email": "a@x.io"}, {"em'), [{"email": "a@x.io"}]
+        )
+        self.assertEqual(parser.feed(b'ail": "b@x.io"}'), [{"email": "b@x.io"}])
+        self.assertEqual(parser.feed(b'], "count": 2'), [])
+        self.assertEqual(parser.feed(b"}"), [])
+        self.assertEqual(parser.close(), {"count": 2})
+
+    def test_truncated_body(self):
+        """Test a body cut short is reported on close"""
+        parser = BatchStreamParser()
+        parser.feed(b'{"results": [{"email": "a@x.io"}')
+
+        with self.assertRaises(EmailValidatorError):
+            parser.close()
+
+    def test_malformed_body(self):
+        """Test a body that isn't an object is rejected"""
+        with self.assertRaises(EmailValidatorError):
+            BatchStreamParser().feed(b'["not", "an", "object"]')
+
+
+class TestValidateBatchStream(unittest.TestCase):
+    """Test MailSafePro.validate_batch_stream"""
+
+    def setUp(self):
+        self.server = FakeMailSafeProServer().start()
+        self.addCleanup(self.server.stop)
+        self.validator = MailSafePro(api_key="key_test", base_url=self.server.url)
+        self.addCleanup(self.validator.close)
+
+    def test_stream_results_and_header(self):
+        """Test results stream in order and header fields fill in at the end"""
+        emails = [f"user{i}@example.com" for i in range(300)] + ["invalid@example.com"]
+
+        stream = self.validator.validate_batch_stream(emails, read_size=512)
+        self.assertIsNone(stream.count)
+
+        results = list(stream)
+
+        self.assertEqual([r.email for r in results], emails)
+        self.assertEqual(stream.count, 301)
+        self.assertEqual((stream.valid_count, stream.invalid_count), (300, 1))
+        self.assertEqual(stream.summary, {"deliverable": 300})
+
+    def test_prefilters(self):
+        """Test classifier and cache hits are answered locally, in input order"""
+        validator = MailSafePro(
+            api_key="key_test",
+            base_url=self.server.url,
+            cache=ResultCache(),
+            classifier=OfflineClassifier(),
+        )
+        self.addCleanup(validator.close)
+        validator.validate_batch(["cached@example.com"])
+        emails = ["a@example.com", "x@mailinator.com", "cached@example.com", "invalid@example.com"]
+
+        stream = validator.validate_batch_stream(emails)
+        results = list(stream)
+
+        self.assertEqual([r.email for r in results], emails)
+        self.assertTrue(results[1].locally_decided)
+        self.assertEqual((stream.count, stream.valid_count, stream.invalid_count), (4, 2, 2))
+        self.assertEqual(self.server.requests["/batch"], 2)
+
+        # Streamed results were cached; nothing is left to send
+        stream = validator.validate_batch_stream(emails)
+        self.assertEqual([r.email for r in stream], emails)
+        self.assertEqual((stream.count, stream.valid_count, stream.invalid_count), (4, 2, 2))
+        self.assertEqual(self.server.requests["/batch"], 2)
+
+    def test_early_close(self):
+        """Test closing a partly read stream leaves the client usable"""
+        emails = [f"user{i}@example.com" for i in range(100)]
+
+        with self.validator.validate_batch_stream(emails, read_size=256) as stream:
+            first = next(stream)
+
+        self.assertEqual(first.email, "user0@example.com")
+        self.assertIsNone(stream.count)
+        self.assertTrue(self.validator.validate("user@example.com").valid)
+
+
+if __name__ == "__main__":
+    unittest.main()
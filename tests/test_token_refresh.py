@@ -0,0 +1,82 @@
+"""
+Unit tests for thread-safe JWT refresh
+"""
+
+import threading
+import time
+import unittest
+from datetime import datetime, timedelta
+
+from mailsafepro import MailSafePro
+from fake_server import FakeMailSafeProServer
+
+
+class TestTokenRefresh(unittest.TestCase):
+    """Test JWT refresh under concurrency"""
+
+    def setUp(self):
+        self.server = FakeMailSafeProServer(latency=0.05).start()
+        self.addCleanup(self.server.stop)
+
+    def login(self, **options):
+        validator = MailSafePro.login(
+            username="user@example.com",
+            password="password",
+            base_url=self.server.url,
+            **options,
+        )
+        self.addCleanup(validator.close)
+        return validator
+
+    def test_single_refresh_under_heavy_concurrency(self):
+        """Test 64 threads seeing an expired token trigger one refresh"""
+        validator = self.login(coalesce_requests=False)
+        validator._token_expires_at = datetime.now() - timedelta(seconds=1)
+
+        barrier = threading.Barrier(64)
+        errors = []
+
+        def worker(n):
+            barrier.wait()
+            try:
+                validator.validate(f"user{n}@example.com")
+            except Exception as e:  # pragma: no cover - reported below
+                errors.append(e)
+
+        threads = [threading.Thread(target=worker, args=(n,)) for n in range(64)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(errors, [])
+        self.assertEqual(self.server.requests["/auth/refresh"], 1)
+        self.assertEqual(validator._access_token, "access_2")
+        self.assertEqual(validator._refresh_token, "refresh_2")
+        self.assertEqual(self.server.requests["/validate/email"], 64)
+
+    def test_background_refresh_renews_before_expiry(self):
+        """Test the background refresher renews the token ahead of time"""
+        self.server.token_ttl = 62  # refresh deadline 2s after issue
+        validator = self.login(background_refresh=True)
+
+        time.sleep(1.5)
+
+        self.assertEqual(self.server.requests["/auth/refresh"], 1)
+        self.assertEqual(validator._access_token, "access_2")
+        self.assertFalse(validator._token_expired())
+
+    def test_logout_stops_refresher(self):
+        """Test logout stops the background thread and clears tokens"""
+        validator = self.login(background_refresh=True)
+        refresher = validator._refresher
+
+        validator.logout()
+
+        self.assertFalse(refresher.is_alive())
+        self.assertIsNone(validator._access_token)
+        self.assertEqual(self.server.requests["/auth/refresh"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
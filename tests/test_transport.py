@@ -0,0 +1,146 @@
+"""
+Unit tests for the lean urllib3 transport
+"""
+
+import socket
+import unittest
+from unittest import mock
+
+import requests
+
+from mailsafepro import BodyCompression, MailSafePro
+from mailsafepro.exceptions import NetworkError, ServerError, ValidationError
+from mailsafepro.http2 import h2
+from fake_server import FakeMailSafeProServer
+
+
+EMAILS = [f"user{i}@example.com" for i in range(200)]
+
+
+class TestLeanTransport(unittest.TestCase):
+    """Test the lean transport answers exactly as the requests session does"""
+
+    def setUp(self):
+        self.server = FakeMailSafeProServer().start()
+        self.addCleanup(self.server.stop)
+
+    def client(self, **kwargs):
+        validator = MailSafePro(
+            api_key="key_test", base_url=self.server.url, lean_transport=True, **kwargs
+        )
+        self.addCleanup(validator.close)
+        # Every JSON request must go through the transport
+        patcher = mock.patch.object(validator._session, "request", side_effect=AssertionError)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        return validator
+
+    def test_round_trip(self):
+        """Test results match those returned through the session"""
+        lean = self.client()
+        plain = MailSafePro(api_key="key_test", base_url=self.server.url)
+        self.addCleanup(plain.close)
+
+        email = "someone@example.com"
+        self.assertEqual(
+            lean.validate(email, check_smtp=True).to_dict(),
+            plain.validate(email, check_smtp=True).to_dict(),
+        )
+        self.assertEqual(
+            [r.to_dict() for r in lean.validate_batch(EMAILS, include_raw_dns=True).results],
+            [r.to_dict() for r in plain.validate_batch(EMAILS, include_raw_dns=True).results],
+        )
+        with lean.validate_batch_stream(EMAILS) as stream:
+            self.assertEqual([r.email for r in stream], EMAILS)
+        self.assertEqual(lean.get_quota()["limit"], 1_000_000)
+
+        stats = lean.pool_stats()
+        self.assertEqual(stats["requests"], 4)
+        self.assertEqual(stats["new_connections"], 1)
+
+    def test_headers(self):
+        """Test static headers are shared and per-call ones are merged into a copy"""
+        validator = self.client(compression=BodyCompression())
+        transport = validator._transport
+        self.assertEqual(transport.headers["X-API-Key"], "key_test")
+        self.assertEqual(transport.headers["Content-Type"], "application/json")
+
+        with mock.patch.object(transport, "request", wraps=transport.request) as request:
+            validator.validate("user@example.com")
+            validator.validate_batch(EMAILS * 10)
+
+        self.assertIs(request.call_args_list[0].args[2], transport.headers)
+        self.assertEqual(request.call_args_list[1].args[2]["Content-Encoding"], "gzip")
+        self.assertNotIn("Content-Encoding", transport.headers)
+        self.assertEqual(self.server.compressed_requests, 1)
+        self.assertGreater(validator.compression.last.bytes_saved, 0)
+
+    def test_error_mapping(self):
+        """Test API errors, HTTP errors and connection failures map to the same exceptions"""
+        validator = self.client()
+
+        self.server.inject_error(422, detail="Bad email")
+        with self.assertRaises(ValidationError):
+            validator.validate("user@example.com")
+
+        self.server.inject_error(503, count=4)
+        with mock.patch("time.sleep"), self.assertRaises(ServerError):
+            validator.validate("user@example.com")
+        self.assertEqual(self.server.total_requests, 5)
+
+        with self.assertRaises(requests.exceptions.HTTPError) as caught:
+            validator._make_request("GET", "/missing")
+        self.assertEqual(caught.exception.response.status_code, 404)
+
+        with socket.socket() as sock:
+            sock.bind(("127.0.0.1", 0))
+            port = sock.getsockname()[1]
+        offline = MailSafePro(
+            api_key="key_test",
+            base_url=f"http://127.0.0.1:{port}",
+            max_retries=0,
+            lean_transport=True,
+        )
+        with self.assertRaises(NetworkError):
+            offline.validate("user@example.com")
+
+    def test_jwt_and_pool(self):
+        """Test JWT requests, pool growth and warm-up on the transport"""
+        validator = MailSafePro.login(
+            username="user@example.com",
+            password="secret",
+            base_url=self.server.url,
+            lean_transport=True,
+        )
+        self.addCleanup(validator.close)
+        self.assertEqual(validator.warmup(2), 2)
+
+        transport = validator._transport
+        with mock.patch.object(transport, "request", wraps=transport.request) as request:
+            validator.validate("user@example.com")
+        self.assertTrue(request.call_args.args[2]["Authorization"].startswith("Bearer "))
+
+        results = validator.validate_many(EMAILS[:40], workers=16)
+        self.assertEqual(len(results), 40)
+        self.assertIsNot(validator._transport, transport)
+        self.assertEqual(validator.pool_stats()["max_size"], 16)
+
+    def test_timeouts_not_accumulated(self):
+        """Test per-attempt timeouts under a deadline don't pile up in the transport"""
+        validator = self.client()
+        transport = validator._transport
+        for i in range(5):
+            validator.validate(f"user{i}@example.com", deadline=10.0 + i)
+
+        self.assertIs(transport._timeout(30), transport._timeout(30))
+        self.assertEqual(transport._last_timeout[0], 30)
+
+    @unittest.skipIf(h2 is None, "h2 not installed")
+    def test_not_with_http2(self):
+        """Test the lean transport can't be combined with HTTP/2"""
+        with self.assertRaises(ValueError):
+            MailSafePro(api_key="key_test", http2=True, lean_transport=True)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,94 @@
+"""
+Unit tests for thread-pooled fan-out over /validate/email
+"""
+
+import unittest
+
+from mailsafepro import MailSafePro, ValidationFailure
+from mailsafepro.exceptions import AuthenticationError, ServerError, ValidationError
+from fake_server import FakeMailSafeProServer
+
+
+class TestValidateMany(unittest.TestCase):
+    """Test MailSafePro.validate_many and validate_many_iter"""
+
+    def setUp(self):
+        self.server = FakeMailSafeProServer(latency=0.01).start()
+        self.addCleanup(self.server.stop)
+        self.validator = MailSafePro(
+            api_key="key_test", base_url=self.server.url, max_retries=0
+        )
+        self.addCleanup(self.validator.close)
+
+    def test_ordered_results(self):
+        """Test results come back in input order, one request per email"""
+        emails = [f"user{i}@example.com" for i in range(40)]
+
+        results = self.validator.validate_many(emails, workers=8)
+
+        self.assertEqual([r.email for r in results], emails)
+        self.assertEqual(self.server.requests["/validate/email"], 40)
+
+    def test_unordered_yields_every_result(self):
+        """Test completion-order mode returns each email exactly once"""
+        emails = [f"user{i}@example.com" for i in range(40)]
+
+        results = self.validator.validate_many(emails, workers=8, ordered=False)
+
+        self.assertEqual(sorted(r.email for r in results), sorted(emails))
+
+    def test_failures_returned_in_place(self):
+        """Test per-email errors become ValidationFailure results"""
+        self.server.inject_error(500)
+        emails = ["first@example.com", "not-an-email", "third@example.com"]
+
+        results = self.validator.validate_many(emails, workers=1)
+
+        failures = [r for r in results if isinstance(r, ValidationFailure)]
+        self.assertEqual(len(failures), 2)
+        self.assertIsInstance(results[0].error, ServerError)
+        self.assertIsInstance(results[1].error, ValidationError)
+        self.assertFalse(results[1].valid)
+        self.assertTrue(results[2].valid)
+
+    def test_authentication_error_aborts(self):
+        """Test failures that affect every email abort the run"""
+        self.server.inject_error(401, count=100)
+
+        with self.assertRaises(AuthenticationError):
+            self.validator.validate_many([f"user{i}@example.com" for i in range(20)])
+
+    def test_iterator_consumed_lazily(self):
+        """Test the iterator form reads at most two emails per worker ahead"""
+        consumed = []
+
+        def source():
+            for i in range(10000):
+                consumed.append(i)
+                yield f"user{i}@example.com"
+
+        results = self.validator.validate_many_iter(source(), workers=4)
+        first = next(results)
+        results.close()
+
+        self.assertEqual(first.email, "user0@example.com")
+        self.assertLessEqual(len(consumed), 9)
+
+    def test_pool_sized_to_workers(self):
+        """Test more workers than the default pool reuse their connections"""
+        workers = MailSafePro.DEFAULT_POOL_SIZE * 2
+        emails = [f"user{i}@example.com" for i in range(workers * 4)]
+
+        self.validator.validate_many(emails, workers=workers)
+        self.validator.validate_many(emails, workers=workers, ordered=False)
+
+        self.assertLessEqual(self.server.connections_opened, workers)
+
+    def test_invalid_workers(self):
+        """Test workers must be positive"""
+        with self.assertRaises(ValidationError):
+            self.validator.validate_many(["user@example.com"], workers=0)
+
+
+if __name__ == "__main__":
+    unittest.main()